@@ -376,6 +376,7 @@ icotoc = DataFiles(os.path.join(scipyen_dir, 'src'), ".ico", forAnalysis=True)
 xsltoc = DataFiles(os.path.join(scipyen_dir, 'src'), ".xsl", forAnalysis=True)
 shtoc = DataFiles(os.path.join(scipyen_dir, 'src'), ".sh", forAnalysis=True)
 qrctoc = DataFiles(os.path.join(scipyen_dir, 'src'), ".qrc", forAnalysis=True)
+rcctoc = DataFiles(os.path.join(scipyen_dir, 'src'), ".rcc", forAnalysis=True)
 readmetoc = DataFiles(os.path.join(scipyen_dir, 'src'), "README", as_ext=False, forAnalysis=True)
 pkltoc = DataFiles(os.path.join(scipyen_dir, 'src'), ".pkl", forAnalysis=True)
 hdftoc = DataFiles(os.path.join(scipyen_dir, 'src'), ".h5", forAnalysis=True)
@@ -535,6 +536,7 @@ datas.extend(icotoc)
 datas.extend(xsltoc)
 datas.extend(shtoc)
 datas.extend(qrctoc)
+datas.extend(rcctoc)
 datas.extend(readmetoc)
 datas.extend(pkltoc)
 datas.extend(hdftoc)
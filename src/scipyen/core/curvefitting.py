@@ -11,7 +11,7 @@ Harmonize the API (this is the role of the upcoming modelfitting.py module)
 """
 
 #### BEGIN core python modules
-import os, sys, traceback, warnings, numbers, collections, typing
+import os, sys, time, traceback, warnings, numbers, collections, typing
 #### END core python modules
 
 #### BEGIN 3rd party modules
@@ -215,6 +215,9 @@ def fit_compound_exp_rise_multi_decay(data, p0, bounds=(-np.inf, np.inf), method
     result["Fit"]: the result of the fitting routine
     result["Coefficients"]: fitted coefficients (same organization as p0)
     result["Rsq"]: the R2 of the entire EPSCaT fit
+    result["FitTime"]: the duration of the optimization, in seconds
+    result["Converged"]: bool, whether the optimizer reported convergence
+    result["nfev"]: the number of cost function evaluations
     
     """
     #from . import datatypes  
@@ -355,7 +358,7 @@ def fit_compound_exp_rise_multi_decay(data, p0, bounds=(-np.inf, np.inf), method
             raise TypeError("Upper bounds (bounds[1]) expected a real scalar, a sequence of real scalars, or a sequence of sequences of real scalars")
         
     elif all([isinstance(p_, numbers.Real) for p_ in p0]):
-        componentDecays[0] = models.check_rise_decay_params(p_init)
+        componentDecays[0] = models.check_rise_decay_params(p0)
         
         p_init = list()
         p_init[:] = p0[:]
@@ -422,10 +425,17 @@ def fit_compound_exp_rise_multi_decay(data, p0, bounds=(-np.inf, np.inf), method
     #print("x0: %s" % x0)
     # NOTE: 2017-07-03 15:42:26
     # res is a scipy.optimize.OptimizeResult
+    # NOTE: 2026-10-18 14:12:03
+    # time the optimization, for fit scheduling statistics (see 
+    # CaTanalysis.fitEPSCaTs)
+    fitStart = time.perf_counter()
+    
     res = optimize.least_squares(__cost_fun__, x0, args=(xdata, ydata), 
                                 method=method, loss=loss, bounds = bnds, 
                                 kwargs={"decays":componentDecays})
     
+    fitTime = time.perf_counter() - fitStart
+    
     if len(componentDecays) > 1:
         res_x = list()
         start = 0
@@ -460,6 +470,9 @@ def fit_compound_exp_rise_multi_decay(data, p0, bounds=(-np.inf, np.inf), method
     result["Fit"] = res
     result["Coefficients"] = res_x
     result["Rsq"] = rsq
+    result["FitTime"] = fitTime
+    result["Converged"] = bool(res.success)
+    result["nfev"] = int(res.nfev)
     
     initialSupport = np.full((data.shape[0],), np.NaN)
     
@@ -70,9 +70,12 @@ messaging API.
 # easily abused by importing into the remote namespace functions and modules 
 # that end up only being used by the client, in the local namespace.
 
-import os, sys, pickle, inspect, typing
+import os, sys, pickle, inspect, typing, ast, json
 from functools import wraps
 from core.traitcontainers import DataBag
+from core.sharedtransfer import (dumps_shared, loads_shared, is_local_kernel,
+                                 has_local_address, make_probe, release_probe,
+                                 SHARED_MEMORY_ATTR)
 #from contextlib import contextmanager
 #print(sys.path)
 
@@ -397,6 +400,13 @@ def pickle_wrap_expr(expr):
         raise TypeError("expecting a str, got %s" % type(expr).__name__)
     
     return "".join(["pickle.dumps(",expr,")"])
+
+def shared_wrap_expr(expr):
+    """Wraps expr for transfer via shared memory (see core.sharedtransfer)"""
+    if not isinstance(expr, str):
+        raise TypeError("expecting a str, got %s" % type(expr).__name__)
+    
+    return "".join(["hostutils.dumps_shared(",expr,")"])
     
 def define_foreign_data_props_getter_fun_str(dataname:str, namespace:str="Internal") -> str:
     """Defines a function to retieve object properties in the foreign namespace.
@@ -526,7 +536,7 @@ def cmds_get_foreign_data_props2(dataname:str, namespace:str="Internal") -> list
     
     return exec_calls
     
-def cmd_copy_from_foreign(varname:str, as_call=True) -> typing.Union[ForeignCall, dict]:
+def cmd_copy_from_foreign(varname:str, as_call=True, shared=False) -> typing.Union[ForeignCall, dict]:
     """Create user expression to fetch varname from a foreign kernel's namespace.
     
     The foreign kernel is the with which the kernel client executing this command
@@ -543,6 +553,14 @@ def cmd_copy_from_foreign(varname:str, as_call=True) -> typing.Union[ForeignCall
         ExternalIPython.execute(*call())
         
         Otherwise, return a dict usable as a user_expressions key/value mapping
+        
+    shared: bool, default False
+        When True, the data is transferred via shared memory (see 
+        core.sharedtransfer); use this only with kernels running on the same
+        machine as Scipyen (see core.sharedtransfer.is_local_kernel).
+        
+        The user expression then evaluates to a small descriptor of the data, 
+        instead of the pickled data itself.
     
     Returns:
     --------
@@ -581,9 +599,15 @@ def cmd_copy_from_foreign(varname:str, as_call=True) -> typing.Union[ForeignCall
     https://jupyter-client.readthedocs.io/en/latest/messaging.html
     
     """
-    special = "pickled_"
     remote_expr = "".join(["{'",varname,"':",varname,"}"])
-    expr = {"%s_%s" % (special,varname):pickle_wrap_expr(remote_expr)}
+    
+    if shared:
+        special = "shared_"
+        expr = {"%s_%s" % (special,varname):shared_wrap_expr(remote_expr)}
+        
+    else:
+        special = "pickled_"
+        expr = {"%s_%s" % (special,varname):pickle_wrap_expr(remote_expr)}
     
     if as_call:
         return ForeignCall(user_expressions = expr)
@@ -591,7 +615,7 @@ def cmd_copy_from_foreign(varname:str, as_call=True) -> typing.Union[ForeignCall
     else:
         return expr
 
-def cmd_copies_from_foreign(*args, as_call=True) -> typing.Union[ForeignCall, dict]:
+def cmd_copies_from_foreign(*args, as_call=True, shared=False) -> typing.Union[ForeignCall, dict]:
     """Create user expressions to fetch several variables from a foreign kernel.
     
     The foreign kernel is the with which the kernel client executing this command
@@ -608,6 +632,8 @@ def cmd_copies_from_foreign(*args, as_call=True) -> typing.Union[ForeignCall, di
             
     as_call: bool, optional (default True)
         Whe True, returns a ForeignCall; otherwise, returns a user-expresions dict
+        
+    shared: bool, optional (default False); see cmd_copy_from_foreign
             
     Returns:
     ---------
@@ -643,7 +669,7 @@ def cmd_copies_from_foreign(*args, as_call=True) -> typing.Union[ForeignCall, di
     """
     import itertools
 
-    vardicts = (cmd_copy_from_foreign(arg, as_call=False) for arg in args)
+    vardicts = (cmd_copy_from_foreign(arg, as_call=False, shared=shared) for arg in args)
     
     expr = dict((x for x in itertools.chain(*(a.items() for a in vardicts))))
     
@@ -652,7 +678,7 @@ def cmd_copies_from_foreign(*args, as_call=True) -> typing.Union[ForeignCall, di
 
     return expr
 
-def cmd_copy_to_foreign(dataname, data:typing.Any) -> str:
+def cmd_copy_to_foreign(dataname, data:typing.Any, shared=False) -> list:
     """Creates a user expression to place a copy of data to a remote kernel space.
     
     The data will be bound, in the remote namespace, to the identifier specified
@@ -662,6 +688,10 @@ def cmd_copy_to_foreign(dataname, data:typing.Any) -> str:
     -----------
     dataname: str
     data: typing.Any - Must be serializable.
+    shared: bool, default False
+        When True, the data is transferred via shared memory (see 
+        core.sharedtransfer); use this only with kernels running on the same
+        machine as Scipyen (see core.sharedtransfer.is_local_kernel).
     
     Unlike the result from cmd_copy_from_foreign(s), the command string 
     returned by this function can be passed to the remote kernel for evaluation
@@ -672,6 +702,15 @@ def cmd_copy_to_foreign(dataname, data:typing.Any) -> str:
     
     """
     exec_calls = list()
+    
+    if shared:
+        # NOTE: 2026-10-18 15:31:05
+        # the data buffers are placed in shared memory here; the code sent to
+        # the remote kernel only contains their descriptor
+        descriptor = dumps_shared({dataname:data}) # a JSON str
+        exec_calls.append(ForeignCall(code="".join(["hostutils.import_shared(", repr(descriptor), ")"])))
+        return exec_calls
+    
     #print("cmd_copy_to_foreign: dataname=%s , data=%s" % (dataname, data))
     pickle_str = str(pickle.dumps({dataname:data}))
     #print("cmd_copy_to_foreign: pickle_str = %s" % pickle_str)
@@ -724,6 +763,84 @@ def cmd_foreign_shell_ns_listing(namespace:str="Internal", as_call=True) -> dict
     
     return expr
     
+def cmd_foreign_namespace_delta(namespace:str="Internal", reset:bool=False, 
+                                properties:typing.Optional[typing.Sequence[str]]=None,
+                                as_call=True) -> typing.Union[ForeignCall, dict]:
+    """Creates a user_expression with the changes in a foreign namespace.
+    
+    The changes are calculated in the remote kernel against a digest table of
+    its namespace (see core.extipyutils_host.namespace_delta) and are returned 
+    in one reply, together with the properties of the added and modified
+    variables.
+    
+    Parameters:
+    -----------
+    namespace: str - the name of the foreign workspace
+    
+    reset: bool, default False; when True, the remote digest table is
+        re-created, and the reply lists all the symbols in the namespace
+        
+    properties: sequence of symbols, optional - the reply also contains the
+        properties of these variables
+        
+    as_call: bool, default True - return a ForeignCall or just the 
+        user_expressions dict
+    """
+    args = [repr(namespace), "reset=%s" % bool(reset)]
+    
+    if properties is not None:
+        args.append("properties=%s" % repr(sorted(properties)))
+    
+    expr = {"ns_delta_of_%s" % namespace : "".join(["hostutils.namespace_delta(", ", ".join(args), ")"])}
+    
+    if as_call:
+        return ForeignCall(user_expressions = expr)
+    
+    return expr
+
+# NOTE: 2026-10-18 16:22:40
+# namespace ↦ name of the shared memory segment of the pending probe
+_shared_memory_probes = dict()
+
+def cmd_probe_shared_memory(namespace:str, as_call=True) -> typing.Union[ForeignCall, dict]:
+    """Creates a user_expression checking that a foreign kernel can read 
+    shared memory segments created by Scipyen (see core.sharedtransfer).
+    
+    The reply (a bool, under the key "shm_probe_of_<namespace>") must be passed
+    to end_probe_shared_memory.
+    
+    Parameters:
+    -----------
+    namespace: str - the name of the foreign workspace
+    
+    as_call: bool, default True - return a ForeignCall or just the 
+        user_expressions dict
+    """
+    previous = _shared_memory_probes.pop(namespace, None)
+    if previous is not None:
+        release_probe(previous)
+        
+    name, token = make_probe()
+    _shared_memory_probes[namespace] = name
+    
+    expr = {"shm_probe_of_%s" % namespace: "hostutils.check_probe(%s, %s)" % (repr(name), repr(token))}
+    
+    if as_call:
+        return ForeignCall(user_expressions = expr)
+    
+    return expr
+
+def end_probe_shared_memory(namespace:str, client, result:bool):
+    """Releases the probe created by cmd_probe_shared_memory and stores its
+    result in the kernel client (see core.sharedtransfer.is_local_kernel)
+    """
+    name = _shared_memory_probes.pop(namespace, None)
+    if name is not None:
+        release_probe(name)
+        
+    if client is not None:
+        setattr(client, SHARED_MEMORY_ATTR, result is True)
+    
 #### END call generators
 
 
@@ -734,8 +851,9 @@ def unpack_shell_channel_data(msg:dict) -> dict:
     message, inside its "content"/"user_expressions" nested dictionary.
     
     Messages received in response to requests for variable transfer (copy) will
-    contain in the "user_expressions" keys named as "pickled_%s" where "%s" stands 
-    for the variable identifier in the remote kernel namespace. 
+    contain in the "user_expressions" keys named as "pickled_%s" (or 
+    "shared_%s", for transfer via shared memory) where "%s" stands for the 
+    variable identifier in the remote kernel namespace. 
     
     This is so that this function can decide whether the data received is a 
     string representation of the seriazied variable (as a byte string) or just 
@@ -766,10 +884,16 @@ def unpack_shell_channel_data(msg:dict) -> dict:
     #
     # "pickled_%s"          (varname)
     #
+    # "shared_%s"           (varname)
+    #
     # "properties_of_%s"    (varname)
     #
     # "ns_listing_of_%s"    (workspace_name)
     #
+    # "ns_delta_of_%s"      (workspace_name)
+    #
+    # "shm_probe_of_%s"     (workspace_name)
+    #
     # ATTENTION The specials are set by the functions than generate the commands
     # generating the user_expressions dictionaries.
     
@@ -783,7 +907,13 @@ def unpack_shell_channel_data(msg:dict) -> dict:
             if value_status == "ok":
                 data_str = value["data"]["text/plain"] # this nested dict exists only if value_status is OK
                 if key.startswith("pickled_"): # by OUR OWN convention, see cmd_copy_from_foreign
-                    data_dict = pickle.loads(eval(data_str))
+                    data_dict = pickle.loads(ast.literal_eval(data_str))
+                    
+                elif key.startswith("shared_"): # JSON str, see cmd_copy_from_foreign
+                    data_dict = loads_shared(ast.literal_eval(data_str))
+                    
+                elif key.startswith("ns_delta_of_"): # JSON str, see cmd_foreign_namespace_delta
+                    data_dict = {key: json.loads(ast.literal_eval(data_str))}
                     
                 else:
                     data_dict = {key:eval(data_str)}
@@ -27,7 +27,7 @@ NOTE: NeuronMagics are useful to start NEURON manually from an external IPython
 kernel, optionally with ('nrngui') or without NEURON GUI ('nrnpy')
 """
 
-import os, sys
+import os, sys, json, time, types, collections.abc
 
 # NOTE: 2023-04-03 19:27:55
 # don't need this anymore, do we?
@@ -79,8 +79,11 @@ from IPython.core.magic import (Magics, magics_class, line_magic,
 from ipykernel import (get_connection_file, get_connection_info, 
                        connect_qtconsole)
 
-from core.utilities import summarize_object_properties
+from core.utilities import (summarize_object_properties, 
+                            standard_obj_summary_headers)
 from core.prog import ContextExecutor
+from core.sharedtransfer import (dumps_shared, loads_shared, check_probe)
+from core.fingerprint import fingerprint
 
 
 __module_path__ = os.path.abspath(os.path.dirname(__file__))
@@ -115,5 +118,208 @@ class NeuronMagics(Magics):
 #get_ipython().register_magics(NeuronMagics)
 shell.register_magics(NeuronMagics)
 
+def import_shared(descriptor:str):
+    """Binds the objects sent by Scipyen via shared memory, in this kernel's
+    namespace.
+    
+    descriptor: str created by core.sharedtransfer.dumps_shared, from a dict
+        mapping variable names to objects (see 
+        core.extipyutils_client.cmd_copy_to_foreign)
+    """
+    shell.user_ns.update(loads_shared(descriptor))
+
+# NOTE: 2026-10-18 15:33:40
+# maps the workspace name used by Scipyen for this kernel to the digest table
+# of the namespace at the last call of namespace_delta, a dict with:
+# "keys": variable name ↦ cheap key (see _key)
+# "digests": variable name ↦ content fingerprint (see _digest)
+# "last": name of the last variable whose content was checked
+_namespace_digests = dict()
+
+# NOTE: 2026-10-18 18:10:52
+# time (in s) spent by each call of namespace_delta re-checking the content of
+# variables that otherwise look unchanged (in-place changes); the variables are
+# checked in turn, from one call to the next
+NAMESPACE_DIGEST_SECONDS = 0.05
+
+def _visible_symbols() -> dict:
+    """The variables in this kernel's namespace that are shown in Scipyen's
+    workspace (as in core.extipyutils_client.cmd_foreign_shell_ns_listing)
+    """
+    hidden = shell.user_ns_hidden
+    return dict((k, v) for k, v in shell.user_ns.items() if k not in hidden and not k.startswith("_"))
+
+def _key(value) -> tuple:
+    """Cheap check of a variable: its identity, type and size (shape and 
+    dtype, or length), or its mutation counter (see core.fingerprint)
+    """
+    ret = [id(value), type(value).__qualname__]
+    
+    try:
+        custom = getattr(value, "__fingerprint__", None)
+        
+        if callable(custom) and not isinstance(value, type):
+            ret.append(custom())
+            
+        shape = getattr(value, "shape", None)
+        
+        if isinstance(shape, tuple):
+            ret.extend((shape, str(getattr(value, "dtype", ""))))
+            
+        elif isinstance(value, collections.abc.Sized):
+            ret.append(len(value))
+            
+    except:
+        pass
+    
+    return tuple(ret)
+
+def _hasContent(value) -> bool:
+    """Whether a variable can change in place without changing its _key
+    """
+    if isinstance(value, (type(None), str, bytes, int, float, complex, type,
+                          types.ModuleType, types.FunctionType,
+                          types.BuiltinFunctionType, types.MethodType)):
+        return False
+    
+    custom = getattr(value, "__fingerprint__", None)
+    
+    return not callable(custom)
+
+def _digest(value):
+    try:
+        return fingerprint(value)
+    except:
+        return type(value).__qualname__
+        
+def _summary(name:str, value, namespace:str) -> dict:
+    ret = summarize_object_properties(name, value, namespace=namespace)
+    ret.pop("Icon", None) # a QIcon, when Qt is available here
+    return ret
+    
+def _placeholder_summary(name:str, value, namespace:str, error:Exception) -> dict:
+    """A minimal summary, for variables where _summary fails; the error is
+    shown in the tooltips.
+    """
+    tooltip = "Summary not available: %s: %s" % (type(error).__name__, error)
+    
+    ret = dict((h, {"display": "", "tooltip": tooltip}) for h in standard_obj_summary_headers if h != "Icon")
+    
+    ret["Name"] = {"display": name, "tooltip": tooltip}
+    ret["Workspace"] = {"display": namespace, "tooltip": "Location: %s kernel namespace" % namespace}
+    ret["Object Type"] = {"display": type(value).__name__, "tooltip": tooltip}
+    
+    return ret
+    
+def namespace_delta(namespace:str, reset:bool = False, properties=None) -> str:
+    """The changes in this kernel's namespace since the last call.
+    
+    Called remotely by Scipyen (see 
+    core.extipyutils_client.cmd_foreign_namespace_delta) to update its 
+    workspace table with one message, carrying only what has changed.
+    
+    Parameters:
+    -----------
+    namespace: str - the name of this kernel's workspace in Scipyen; a digest
+        table of the namespace is kept for each name
+        
+    reset: bool, default is False; when True, the digest table is re-created
+        and all the symbols are reported as "names"
+        
+    properties: sequence of str, optional - names of variables for which the
+        summary (see core.utilities.summarize_object_properties) is needed, 
+        in addition to the added and modified variables
+        
+    Returns:
+    --------
+    A JSON string with an object with the members:
+        "reset": bool
+        "names": list of all the symbols (when reset is True; otherwise, empty)
+        "added", "removed", "modified": lists of symbols changed since the last
+            call (all empty when reset is True)
+        "properties": object mapping symbols to their summary, for the added
+            and modified variables, and those in `properties`
+            
+    NOTE: The reply is JSON text rather than a python literal, because the 
+    text/plain representation of user expression values is truncated by
+    IPython's pretty printer for large collections.
+    
+    NOTE: Variables changed in place without changing their type and size 
+    (e.g. assigning to array elements) are reported by a later call, when 
+    their content is re-checked (see NAMESPACE_DIGEST_SECONDS).
+    """
+    symbols = _visible_symbols()
+    
+    previous = None if reset else _namespace_digests.get(namespace, None)
+    
+    # NOTE: 2026-10-18 18:10:52
+    # every variable gets the cheap check (_key); the content of a variable
+    # (_digest) is fingerprinted when the variable is added or its key 
+    # changes, and re-checked in turn within NAMESPACE_DIGEST_SECONDS
+    current = {"keys": dict((name, _key(value)) for name, value in symbols.items()),
+               "digests": dict(), "last": None}
+    
+    _namespace_digests[namespace] = current
+    
+    ret = {"reset": previous is None, "names": list(), 
+           "added": list(), "removed": list(), "modified": list(),
+           "properties": dict()}
+    
+    keys = current["keys"]
+    digests = current["digests"]
+    
+    if previous is None:
+        ret["names"] = sorted(keys)
+        
+    else:
+        ret["added"] = [n for n in keys if n not in previous["keys"]]
+        ret["removed"] = [n for n in previous["keys"] if n not in keys]
+        ret["modified"] = [n for n in keys if n in previous["keys"] and keys[n] != previous["keys"][n]]
+        
+        for name in ret["added"] + ret["modified"]:
+            if _hasContent(symbols[name]):
+                digests[name] = _digest(symbols[name])
+                
+        # unchanged variables keep their content digest, until re-checked below
+        digests.update((n, d) for n, d in previous["digests"].items() 
+                       if n in keys and n not in digests)
+        current["last"] = previous["last"]
+        
+    # re-check the content of the variables in turn, starting after the last
+    # one checked by the previous call
+    changed = set(ret["added"]) | set(ret["modified"]) # already digested
+    names = sorted(n for n, v in symbols.items() if n not in changed and _hasContent(v))
+    
+    if len(names):
+        start = next((k for k, n in enumerate(names) if current["last"] is not None and n > current["last"]), 0)
+        deadline = time.perf_counter() + NAMESPACE_DIGEST_SECONDS
+        
+        for name in names[start:] + names[:start]:
+            if time.perf_counter() > deadline:
+                break
+            
+            digest = _digest(symbols[name])
+            
+            if name in digests and digests[name] != digest:
+                ret["modified"].append(name)
+                
+            digests[name] = digest
+            current["last"] = name
+    
+    wanted = set(ret["added"]) | set(ret["modified"])
+    
+    if properties is not None:
+        wanted |= set(n for n in properties if n in symbols)
+        
+    for name in sorted(wanted):
+        try:
+            ret["properties"][name] = _summary(name, symbols[name], namespace)
+        except Exception as e:
+            # NOTE: 2026-10-18 16:26:03
+            # the variable must still be shown in Scipyen's workspace
+            ret["properties"][name] = _placeholder_summary(name, symbols[name], namespace, e)
+        
+    return json.dumps(ret, default=str)
+
 
         
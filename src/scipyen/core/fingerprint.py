@@ -0,0 +1,371 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Cezar M. Tigaret <cezar.tigaret@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+"""Content fingerprints of (possibly large, unhashable) objects.
+
+A fingerprint is a 64-bit int digest (blake2b) of the type and content of an
+object, used to detect changes in the value of a trait (see
+core.utilities.gethash); it is NOT suitable for secure code.
+
+The content is digested by type-specific strategies (see _digest):
+
+* immutable builtins (str, bytes, numbers and None): their hash; tuples and
+    frozensets are digested by their elements;
+
+* numpy arrays (including quantities, VigraArray and neo data objects): their
+    shape, dtype and data buffer - entirely for arrays up to
+    FINGERPRINT_FULL_NBYTES, and as FINGERPRINT_BLOCKS evenly spaced blocks
+    of FINGERPRINT_BLOCK_NBYTES otherwise; units, axistags, sampling and time
+    attributes are digested as well;
+
+* pandas objects: pandas.util.hash_pandas_object of (up to
+    FINGERPRINT_MAX_ITEMS evenly spaced) rows, and of the columns;
+
+* neo containers, mappings and sequences: their children (up to
+    FINGERPRINT_MAX_ITEMS evenly spaced children in each);
+
+* objects that keep a mutation counter: the object's identity and the value of
+    its counter (see `__fingerprint__`);
+
+* other objects: their attributes (`__dict__`); classes, modules and functions
+    are digested by their identity.
+
+The amount of content digested for an object is bounded by two budgets: 
+FINGERPRINT_MAX_NBYTES bytes of array data, and FINGERPRINT_MAX_OBJECTS 
+objects (the object itself, and the elements and attributes digested with it).
+When a budget is exhausted, the remaining objects are digested by their
+structure only (type, length or shape). The content that is digested depends
+only on the object, hence the fingerprint of an unchanged object is always the
+same.
+
+Objects that keep track of their own changes can define the method
+`__fingerprint__()` returning an int (e.g. a counter incremented on every
+change); this is used instead of digesting the object's content (see e.g.
+core.traitcontainers.DataBag).
+
+NOTE: In-place changes of large arrays outside the sampled blocks are not
+detected.
+"""
+
+import collections, hashlib, types, typing
+from functools import singledispatch
+import numpy as np
+import neo
+from neo.core.dataobject import DataObject as NeoDataObject
+from neo.core.container import Container as NeoContainer
+import pandas as pd
+import quantities as pq
+from core.vigra_patches import vigra
+
+from .prog import is_hashable
+
+# NOTE: 2026-10-18 16:14:05
+# bytes of array data, and number of objects, digested for the fingerprint of
+# an object
+FINGERPRINT_MAX_NBYTES = 2**23
+FINGERPRINT_MAX_OBJECTS = 2**14
+
+# arrays up to this size are digested entirely
+FINGERPRINT_FULL_NBYTES = 2**20
+
+# size and number of the blocks sampled from the buffer of larger arrays
+FINGERPRINT_BLOCK_NBYTES = 2**12
+FINGERPRINT_BLOCKS = 256
+
+# maximum number of elements digested in each collection, or of rows in
+# pandas objects
+FINGERPRINT_MAX_ITEMS = 1024
+
+# children of neo containers
+NEO_CONTAINERS = ("segments", "groups", "analogsignals",
+                  "irregularlysampledsignals", "spiketrains", "events",
+                  "epochs", "imagesequences")
+
+class _Fingerprinter(object):
+    """Digest state: the blake2b hash, the remaining budgets and the objects
+    visited.
+    """
+    def __init__(self, nbytes:int, nobjects:int):
+        self.hash = hashlib.blake2b(digest_size=8)
+        self.nbytes = nbytes
+        self.nobjects = nobjects
+        self.seen = set()
+
+    @property
+    def expired(self) -> bool:
+        """True when no more objects can be digested"""
+        return self.nobjects <= 0
+
+    def update(self, *values):
+        """Digests the repr() of small, non-container values"""
+        self.hash.update(repr(values).encode("utf-8", "backslashreplace"))
+
+    def digest(self, x):
+        """Digests x, using the strategy for its type"""
+        self.nobjects -= 1
+        self.update(type(x).__module__, type(x).__qualname__)
+
+        custom = getattr(x, "__fingerprint__", None)
+
+        if callable(custom) and not isinstance(x, type):
+            self.update(id(x), custom())
+            return
+
+        if id(x) in self.seen: # cyclic reference
+            return
+
+        self.seen.add(id(x))
+        try:
+            _digest(x, self)
+        finally:
+            self.seen.discard(id(x))
+
+def fingerprint(x:typing.Any, nbytes:int = FINGERPRINT_MAX_NBYTES, 
+                nobjects:int = FINGERPRINT_MAX_OBJECTS) -> int:
+    """A 64-bit int digest of the type and content of `x`.
+
+    Parameters:
+    -----------
+    x: any object
+
+    nbytes: int, the maximum number of bytes of array data digested; arrays
+        are sampled within what remains of this budget, and contribute their
+        shape and dtype only once it is exhausted.
+        
+    nobjects: int, the maximum number of objects digested (`x`, its elements,
+        their elements, etc.); objects still to be digested when this runs
+        out contribute their type and length (or shape) only.
+    """
+    fp = _Fingerprinter(nbytes, nobjects)
+    fp.digest(x)
+    return int.from_bytes(fp.hash.digest(), "little", signed=True)
+
+def _sampled_indices(n:int, count:int) -> range:
+    """Up to `count` evenly spaced indices in range(n), including the last"""
+    if n <= count:
+        return range(n)
+
+    return np.linspace(0, n - 1, count).astype(int).tolist()
+
+@singledispatch
+def _digest(x, fp:_Fingerprinter):
+    if isinstance(x, (type, types.ModuleType, types.FunctionType, 
+                      types.BuiltinFunctionType, types.MethodType)):
+        # these are identified by their identity
+        fp.update(id(x))
+        return
+
+    if fp.expired:
+        return
+
+    attrs = getattr(x, "__dict__", None)
+    if isinstance(attrs, dict):
+        _digest_mapping(attrs, fp)
+
+    elif is_hashable(x):
+        # e.g. objects with __slots__, range
+        fp.update(hash(x))
+
+# NOTE: objects hashed by their identity (the default for user-defined
+# classes) are digested by their content (see above), NOT by their hash
+@_digest.register(type(None))
+@_digest.register(str)
+@_digest.register(bytes)
+@_digest.register(int)
+@_digest.register(float)
+@_digest.register(complex)
+def _(x, fp:_Fingerprinter):
+    fp.update(hash(x))
+
+@_digest.register(np.generic)
+def _(x:np.generic, fp:_Fingerprinter):
+    _digest_array(x, fp)
+
+@_digest.register(np.ndarray)
+def _(x:np.ndarray, fp:_Fingerprinter):
+    _digest_array(x, fp)
+
+@_digest.register(pq.Quantity)
+def _(x:pq.Quantity, fp:_Fingerprinter):
+    fp.update(str(x.dimensionality))
+    _digest_array(x, fp)
+
+@_digest.register(vigra.VigraArray)
+def _(x:vigra.VigraArray, fp:_Fingerprinter):
+    fp.update(x.axistags.toJSON())
+    _digest_array(x, fp)
+
+@_digest.register(vigra.vigranumpycore.ChunkedArrayBase)
+def _(x, fp:_Fingerprinter):
+    fp.update(x.shape, x.chunk_shape, x.chunk_array_shape)
+
+@_digest.register(NeoDataObject)
+def _(x:NeoDataObject, fp:_Fingerprinter):
+    fp.update(str(x.dimensionality), getattr(x, "name", None))
+
+    for attr in ("t_start", "sampling_rate", "t_stop"):
+        value = getattr(x, attr, None)
+        if isinstance(value, pq.Quantity):
+            fp.update(float(value.magnitude), str(value.dimensionality))
+
+    # NOTE: the `times` of a regularly sampled signal are calculated on
+    # request; only use them when they are stored
+    if isinstance(x, neo.IrregularlySampledSignal):
+        _digest_array(x.times, fp)
+
+    for attr in ("durations", "labels"):
+        value = getattr(x, attr, None)
+        if isinstance(value, np.ndarray):
+            _digest_array(value, fp)
+
+    _digest_array(x, fp)
+
+    for attr in ("annotations", "array_annotations"):
+        value = getattr(x, attr, None)
+        if isinstance(value, dict):
+            fp.digest(value)
+
+@_digest.register(NeoContainer)
+def _(x:NeoContainer, fp:_Fingerprinter):
+    fp.update(getattr(x, "name", None))
+
+    for container in NEO_CONTAINERS:
+        objects = getattr(x, container, None)
+        if objects is not None:
+            fp.update(container)
+            _digest_sequence(list(objects), fp)
+
+    annotations = getattr(x, "annotations", None)
+    if isinstance(annotations, dict):
+        fp.digest(annotations)
+
+@_digest.register(pd.Index)
+@_digest.register(pd.Series)
+@_digest.register(pd.DataFrame)
+def _(x, fp:_Fingerprinter):
+    fp.update(x.shape, getattr(x, "name", None))
+
+    if isinstance(x, pd.DataFrame):
+        fp.update(tuple(str(d) for d in x.dtypes.iloc[list(_sampled_indices(len(x.dtypes), FINGERPRINT_MAX_ITEMS))]))
+        fp.hash.update(pd.util.hash_pandas_object(x.columns).values.tobytes())
+
+    else:
+        fp.update(str(x.dtype))
+
+    if fp.expired or len(x) == 0:
+        return
+
+    rows = _sampled_indices(len(x), FINGERPRINT_MAX_ITEMS)
+
+    if isinstance(x, pd.Index):
+        sample = x[rows]
+    else:
+        sample = x.iloc[rows]
+
+    try:
+        hashed = pd.util.hash_pandas_object(sample).values
+        fp.nbytes -= hashed.nbytes
+        fp.hash.update(hashed.tobytes())
+
+    except TypeError:
+        # unhashable objects in the data
+        for row in np.asarray(sample, dtype=object).reshape(len(rows), -1):
+            _digest_sequence(list(row), fp)
+
+@_digest.register(collections.abc.Mapping)
+def _(x, fp:_Fingerprinter):
+    _digest_mapping(x, fp)
+
+@_digest.register(list)
+@_digest.register(tuple)
+@_digest.register(collections.deque)
+def _(x, fp:_Fingerprinter):
+    _digest_sequence(x, fp)
+
+@_digest.register(set)
+@_digest.register(frozenset)
+def _(x, fp:_Fingerprinter):
+    fp.update(len(x))
+
+    if fp.expired:
+        return
+
+    # order-independent: combine the fingerprints of the elements, which share
+    # the remaining budgets
+    # NOTE: the elements digested are those first in the iteration order of
+    # the set
+    elements = list(x)[:FINGERPRINT_MAX_ITEMS]
+    nbytes = max(fp.nbytes, 0) // len(elements) if len(elements) else 0
+    nobjects = fp.nobjects // len(elements) if len(elements) else 0
+    
+    digests = sorted(fingerprint(v, nbytes, nobjects) for v in elements)
+    fp.update(tuple(digests))
+    
+    fp.nbytes -= nbytes * len(elements)
+    fp.nobjects -= nobjects * len(elements)
+
+def _digest_mapping(x, fp:_Fingerprinter):
+    fp.update(len(x))
+
+    if fp.expired:
+        return
+
+    keys = list(x.keys())
+
+    for k in _sampled_indices(len(keys), FINGERPRINT_MAX_ITEMS):
+        if fp.expired:
+            break
+        key = keys[k]
+        fp.digest(key)
+        fp.digest(x[key])
+
+def _digest_sequence(x, fp:_Fingerprinter):
+    fp.update(len(x))
+
+    for k in _sampled_indices(len(x), FINGERPRINT_MAX_ITEMS):
+        if fp.expired:
+            break
+        fp.update(k)
+        fp.digest(x[k])
+
+def _digest_array(x:np.ndarray, fp:_Fingerprinter):
+    """Digests the shape, dtype and (sampled) data of an array"""
+    a = np.asarray(x)
+
+    fp.update(a.shape, a.dtype.str)
+
+    if a.size == 0 or fp.expired:
+        return
+
+    if a.dtype.hasobject:
+        flat = a.reshape(-1) if a.flags.contiguous else a.ravel()
+        _digest_sequence(flat, fp)
+        return
+
+    if a.nbytes <= min(FINGERPRINT_FULL_NBYTES, fp.nbytes):
+        fp.nbytes -= a.nbytes
+        fp.hash.update(np.ascontiguousarray(a).view(np.uint8).data)
+        return
+    
+    # the number of blocks sampled, within the remaining byte budget
+    blocks = min(FINGERPRINT_BLOCKS, max(fp.nbytes, 0) // FINGERPRINT_BLOCK_NBYTES)
+    
+    if blocks == 0:
+        return
+    
+    fp.nbytes -= blocks * FINGERPRINT_BLOCK_NBYTES
+
+    if (a.flags.c_contiguous or a.flags.f_contiguous) and a.nbytes >= FINGERPRINT_BLOCK_NBYTES:
+        # sample blocks of the data buffer, in memory order
+        buf = a.ravel(order="K").view(np.uint8)
+        for offset in np.linspace(0, buf.size - FINGERPRINT_BLOCK_NBYTES,
+                                  blocks).astype(int).tolist():
+            fp.hash.update(buf[offset:offset + FINGERPRINT_BLOCK_NBYTES].data)
+
+    else:
+        # non-contiguous views: sample evenly spaced elements
+        count = min(blocks * FINGERPRINT_BLOCK_NBYTES // a.itemsize, a.size)
+        ndx = np.unravel_index(np.linspace(0, a.size - 1, count).astype(np.intp), a.shape)
+        fp.hash.update(np.ascontiguousarray(a[ndx]).view(np.uint8).data)
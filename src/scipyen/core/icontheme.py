@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Cezar M. Tigaret <cezar.tigaret@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+"""Icon themes bundled with Scipyen (breeze and breeze-dark).
+
+The themes are registered on demand, by setIconTheme(), from the binary
+resource files (*.rcc) in the gui/resources directory; Qt memory-maps these
+files, instead of keeping a copy of the resource data in memory.
+
+When the binary resource file of a theme component is missing, the
+corresponding Python resource module (*_rc.py) is loaded instead. The binary
+files are generated from these modules by gui/resources/make_rcc.py.
+
+When a theme is not available, the system icon theme is used: the icon theme 
+set by the platform, before Scipyen sets its own (see systemIconTheme).
+
+NOTE: This module is imported by scipyen.py at startup, before the gui
+package; hence it only depends on Qt.
+"""
+
+import os, re, sys, importlib.util, typing
+from qtpy import (QtCore, QtGui, QtWidgets)
+
+__resources_dir__ = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "gui", "resources")
+
+# NOTE: 2026-10-18 15:44:02
+# icon theme name ↦ prefix of the file names of its components
+# (e.g. breeze_dark.rcc, breeze_dark_status.rcc, ...)
+ICON_THEMES = {"breeze": "breeze", "breeze-dark": "breeze_dark"}
+
+# theme name ↦ list of registered components
+_registered_themes = dict()
+
+# the icon theme set by the platform (see systemIconTheme)
+_system_icon_theme = None
+
+def systemIconTheme() -> str:
+    """The name of the icon theme set by the platform.
+    
+    This is the icon theme in use at the first call of this function, which 
+    happens before Scipyen sets its own theme (see setDefaultIconTheme and 
+    setIconTheme).
+    """
+    global _system_icon_theme
+    
+    if _system_icon_theme is None:
+        _system_icon_theme = QtGui.QIcon.themeName()
+            
+    return _system_icon_theme
+
+def _themeComponents(theme:str) -> list:
+    """Names of the components of an icon theme (e.g. 'breeze_dark',
+    'breeze_dark_status', ...) from the files in the resources directory.
+    """
+    prefix = ICON_THEMES[theme]
+    # NOTE: the components of "breeze" must not include those of "breeze-dark"
+    others = [p for p in ICON_THEMES.values() if p != prefix and p.startswith(prefix)]
+
+    pattern = re.compile(r"^(%s(?:_\w+?)?)(?:\.rcc|_rc\.py)$" % re.escape(prefix))
+
+    ret = set()
+
+    if not os.path.isdir(__resources_dir__):
+        return list()
+
+    for fileName in os.listdir(__resources_dir__):
+        match = pattern.match(fileName)
+        if match is None:
+            continue
+
+        component = match.group(1)
+
+        if any(component == p or component.startswith(p + "_") for p in others):
+            continue
+
+        ret.add(component)
+
+    # the component with the index.theme file goes first
+    return sorted(ret, key = lambda c: (c != prefix, c))
+
+def _registerComponent(component:str) -> bool:
+    rccFile = os.path.join(__resources_dir__, component + ".rcc")
+
+    if os.path.isfile(rccFile):
+        return QtCore.QResource.registerResource(rccFile)
+
+    pyFile = os.path.join(__resources_dir__, component + "_rc.py")
+
+    if not os.path.isfile(pyFile):
+        return False
+
+    # the Python resource module registers its data when executed
+    # NOTE: loaded by its path, so that the gui package is not imported
+    spec = importlib.util.spec_from_file_location(component + "_rc", pyFile)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    sys.modules[spec.name] = module
+
+    return True
+
+def registerIconTheme(theme:str) -> bool:
+    """Registers the resources of an icon theme (see ICON_THEMES), once.
+
+    Returns True when the theme is available as a resource.
+    """
+    if theme in _registered_themes:
+        return len(_registered_themes[theme]) > 0
+
+    if theme not in ICON_THEMES:
+        return False
+
+    registered = [c for c in _themeComponents(theme) if _registerComponent(c)]
+
+    # without index.theme, Qt does not find the theme
+    if ICON_THEMES[theme] not in registered:
+        registered = list()
+
+    _registered_themes[theme] = registered
+
+    return len(registered) > 0
+
+def setIconTheme(theme:typing.Optional[str] = None) -> str:
+    """Sets the icon theme of the application.
+
+    Registers the theme resources first, when needed (see registerIconTheme).
+
+    When `theme` is None or is not available, the system icon theme is used.
+
+    Returns the name of the icon theme in use.
+    """
+    systemTheme = systemIconTheme()
+
+    if theme is not None and theme not in ICON_THEMES:
+        # e.g. an icon theme installed in the system
+        QtGui.QIcon.setThemeName(theme)
+        return theme
+
+    if theme is not None and registerIconTheme(theme):
+        QtGui.QIcon.setThemeName(theme)
+        if len(systemTheme) and systemTheme != theme:
+            QtGui.QIcon.setFallbackThemeName(systemTheme)
+        return theme
+
+    QtGui.QIcon.setThemeName(systemTheme)
+
+    return systemTheme
+
+def setDefaultIconTheme(darkStyle:bool = False) -> str:
+    """Sets the default icon theme for the platform.
+
+    On win32 and darwin this is breeze or breeze-dark, depending on the
+    lightness of the application palette (breeze-dark when `darkStyle` is 
+    True, on win32); elsewhere, the system icon theme is kept.
+
+    Call this once the QApplication exists.
+
+    Returns the name of the icon theme in use.
+    """
+    systemIconTheme() # record it, before it is changed below
+
+    if sys.platform not in ("win32", "darwin"):
+        return QtGui.QIcon.themeName()
+
+    if sys.platform == "win32" and darkStyle:
+        return setIconTheme("breeze-dark")
+
+    windowColor = QtWidgets.QApplication.palette().color(QtGui.QPalette.Window)
+    _,_,v,_ = windowColor.getHsv()
+
+    return setIconTheme("breeze" if v > 128 else "breeze-dark")
@@ -0,0 +1,301 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Cezar M. Tigaret <cezar.tigaret@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+"""Deferred module loading, and import time profiling.
+
+lazy_import: returns a module whose code is executed when one of its attributes
+    is first accessed (see importlib.util.LazyLoader), e.g.:
+
+        sm = lazy_import("statsmodels.api")   # statsmodels.api is not loaded
+        ...
+        sm.OLS(y, x)                           # statsmodels.api is loaded here
+
+    This is meant for large modules that are imported in Scipyen's main window
+    (and made available in the console) but are not needed at startup.
+
+    A lazy module is registered in sys.modules, but a subsequent `import` 
+    statement for the same module LOADS it: the import machinery reads the 
+    module's `__spec__` (to check whether it is being initialized), which is an
+    attribute access. So does `from module import name`.
+
+    Hence a module stays deferred only while no other module imported at 
+    startup imports it with an import statement; e.g. seaborn is loaded as soon
+    as plots/sb_plots.py (which does `import seaborn as sb`) is imported.
+
+is_loaded: whether the code of a (lazy) module has been executed.
+
+when_loaded: calls a function with a (lazy) module, once the module is loaded.
+
+ImportProfiler: reports the time spent importing each module; used by the
+    `--profile-startup` option of scipyen.py.
+"""
+
+import builtins, importlib, importlib.util, sys, threading, time, types, typing
+
+# NOTE: 2026-10-18 15:48:06
+# the class of lazy modules, until loaded (CPython's importlib.util)
+_LazyModule = getattr(importlib.util, "_LazyModule", None)
+
+# module name ↦ list of callables to be called with the module, once loaded
+_on_load_ = dict()
+
+# id of lazy module ↦ module name (the module's attributes, including __name__,
+# cannot be read without loading the module)
+_lazy_names_ = dict()
+
+class _NotifyingLoader(object):
+    """Executes a module with its original loader, then calls the callbacks
+    registered for the module with lazy_import.
+    """
+    def __init__(self, loader, name:str):
+        self.loader = loader
+        self.name = name
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        # restore the original loader, used e.g. by importlib.reload and
+        # importlib.resources
+        module.__spec__.loader = self.loader
+        module.__loader__ = self.loader
+
+        self.loader.exec_module(module)
+
+        _lazy_names_.pop(id(module), None)
+
+        for callback in _on_load_.pop(self.name, list()):
+            callback(module)
+
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+def is_loaded(module:types.ModuleType) -> bool:
+    """False for a lazy module (see lazy_import) which has not been loaded yet.
+
+    Does not trigger the loading of the module.
+    """
+    return _LazyModule is None or type(module) is not _LazyModule
+
+def when_loaded(module:types.ModuleType, callback:typing.Callable[[types.ModuleType], typing.Any]):
+    """Calls `callback` with the module as sole argument, once the module is
+    loaded (immediately, if the module is already loaded).
+
+    Does not trigger the loading of the module.
+
+    The callback should not access the module's attributes other than via the
+    module's __dict__.
+    """
+    if is_loaded(module):
+        callback(module)
+    else:
+        _on_load_.setdefault(_lazy_names_[id(module)], list()).append(callback)
+
+def lazy_import(name:str, on_load:typing.Optional[typing.Callable[[types.ModuleType], typing.Any]] = None) -> types.ModuleType:
+    """Imports a module lazily.
+
+    Parameters:
+    -----------
+    name: str, the absolute name of the module (e.g. "statsmodels.api")
+
+        NOTE: The parent packages of a submodule are imported normally.
+
+    on_load: optional callable, called with the module as sole argument after
+        the module has been loaded (see when_loaded)
+
+    Returns:
+    --------
+    The module: if not already imported, a lazy module, loaded on first access
+    to one of its attributes.
+
+    Raises ModuleNotFoundError when the module cannot be found.
+    """
+    module = sys.modules.get(name, None)
+
+    if module is None:
+        spec = importlib.util.find_spec(name)
+
+        if spec is None:
+            raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+
+        if _LazyModule is None or not hasattr(spec.loader, "exec_module"):
+            # cannot be loaded lazily (e.g. builtin or extension modules)
+            module = importlib.import_module(name)
+
+        else:
+            loader = importlib.util.LazyLoader(_NotifyingLoader(spec.loader, name))
+            spec.loader = loader
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[name] = module
+            loader.exec_module(module)
+            _lazy_names_[id(module)] = name
+
+            # as done by the import statement
+            parent, _, child = name.rpartition(".")
+            if len(parent):
+                setattr(sys.modules[parent], child, module)
+
+    if on_load is not None:
+        when_loaded(module, on_load)
+
+    return module
+
+class ImportProfiler(object):
+    """Times the first import of each module.
+
+    While installed, import statements are timed by a wrapper around
+    builtins.__import__. For each module, two times are recorded (in seconds):
+
+        self: the time spent executing the module's own code
+
+        cumulative: self, plus the time spent importing the modules first
+            imported by this module
+
+    The time spent importing a package's submodules with `from package import
+    submodule` is recorded for the submodule.
+
+    Modules imported with importlib.import_module (e.g. Scipyen's plugins) are
+    included in the self time of the importing module.
+
+    Only the imports in the thread that installed the profiler are timed.
+
+    For a more detailed report (without the Scipyen-specific parts) run python
+    with the `-X importtime` option.
+
+    Usage:
+    ------
+        profiler = ImportProfiler()
+        profiler.install()
+        ... # code importing modules
+        profiler.uninstall()
+        profiler.report()
+    """
+    def __init__(self):
+        # module name ↦ (self, cumulative)
+        self.times = dict()
+        self.started = None
+        self.stopped = None
+        self._import_ = None
+        self._active_ = False
+        self._thread_ = None
+        # time spent importing the children of the modules being imported
+        self._stack_ = list()
+
+    @property
+    def installed(self) -> bool:
+        return self._active_
+
+    @property
+    def elapsed(self) -> float:
+        """Wall time since the profiler was installed (until uninstalled)"""
+        if self.started is None:
+            return 0.
+
+        return (self.stopped or time.perf_counter()) - self.started
+
+    def install(self):
+        if self.installed:
+            return
+
+        self._import_ = builtins.__import__
+        self._thread_ = threading.get_ident()
+        self.started = time.perf_counter()
+        self.stopped = None
+        self._active_ = True
+        builtins.__import__ = self._timed_import_
+
+    def uninstall(self):
+        if not self.installed:
+            return
+
+        if builtins.__import__ == self._timed_import_:
+            builtins.__import__ = self._import_
+
+        # NOTE: self._import_ is kept, in case the wrapper is still called
+        # (e.g. when another hook installed after this one wraps it)
+        self._active_ = False
+        self.stopped = time.perf_counter()
+
+    def _resolve_(self, name:str, globals:typing.Optional[dict], level:int) -> str:
+        if level == 0:
+            return name
+
+        globals = globals or dict()
+        package = globals.get("__package__", None) or globals.get("__name__", "")
+
+        try:
+            return importlib.util.resolve_name("." * level + name, package)
+        except (ImportError, ValueError):
+            return name
+
+    def _timed_import_(self, name, globals=None, locals=None, fromlist=(), level=0):
+        importer = self._import_
+
+        if not self._active_ or threading.get_ident() != self._thread_:
+            return importer(name, globals, locals, fromlist, level)
+
+        module_name = self._resolve_(name, globals, level)
+
+        if module_name in sys.modules:
+            # possibly, submodules imported with `from package import ...`
+            candidates = [f"{module_name}.{x}" for x in (fromlist or ()) if x != "*"]
+            candidates = [c for c in candidates if c not in sys.modules]
+
+            if len(candidates) == 0:
+                return importer(name, globals, locals, fromlist, level)
+
+        else:
+            candidates = [module_name]
+
+        self._stack_.append(0.)
+        start = time.perf_counter()
+
+        try:
+            return importer(name, globals, locals, fromlist, level)
+
+        finally:
+            cumulative = time.perf_counter() - start
+            children = self._stack_.pop()
+
+            imported = [c for c in candidates if c in sys.modules and c not in self.times]
+
+            if len(self._stack_):
+                # NOTE: when nothing was imported (e.g. `from package import
+                # attribute`) only the times already recorded are passed on
+                self._stack_[-1] += cumulative if len(imported) else children
+
+            if len(imported):
+                # NOTE: several submodules imported by the same statement share
+                # the time
+                label = ", ".join(imported)
+                self.times[label] = (cumulative - children, cumulative)
+
+    def report(self, limit:typing.Optional[int] = 40, sort:str = "cumulative", file=None):
+        """Prints the import times (in ms) to `file` (default is sys.stderr).
+
+        Parameters:
+        -----------
+        limit: int or None; the number of modules in the report (None for all)
+
+        sort: "cumulative" or "self": the import time used to sort the modules,
+            in decreasing order
+        """
+        if file is None:
+            file = sys.stderr
+
+        key = 0 if sort == "self" else 1
+
+        items = sorted(self.times.items(), key = lambda x: x[1][key], reverse=True)
+
+        if limit is not None:
+            items = items[:limit]
+
+        total_self = sum(t[0] for t in self.times.values())
+
+        print(f"\nElapsed: {self.elapsed * 1000:.1f} ms, of which {total_self * 1000:.1f} ms importing {len(self.times)} modules", file=file)
+        print(f"{'self [ms]':>12} {'cumulative [ms]':>16}  module", file=file)
+
+        for module_name, (self_time, cumulative) in items:
+            print(f"{self_time * 1000:>12.1f} {cumulative * 1000:>16.1f}  {module_name}", file=file)
@@ -0,0 +1,359 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Cezar M. Tigaret <cezar.tigaret@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+"""Deep memory accounting of Scipyen objects.
+
+The memory used by an object is the sum of the memory blocks reachable from it:
+
+* python objects: their sys.getsizeof; builtin containers (tuple, list, deque,
+    dict, set, frozenset and their subclasses) also account for their contents;
+
+* numpy arrays (including quantities, VigraArray and neo data objects): the
+    array object itself, and the data buffer of the array that owns the data.
+    A buffer is counted once, however many arrays (or views) use it;
+
+* pandas objects: their memory_usage(deep=True);
+
+* neo containers: their children (segments, groups, signals, etc) and their
+    annotations; neo data objects: their data, times, durations, labels,
+    waveforms and annotations;
+
+* Scipyen data objects (BaseScipyenData, e.g. ScanData, AnalysisUnit): their
+    attributes; DataBag: its items.
+
+Other objects are counted by their sys.getsizeof only; handlers for other types
+can be registered with `account.register` (see functools.singledispatch).
+
+Data buffers of memory-mapped files (numpy.memmap, mmap.mmap) are paged in by
+the operating system on demand; they are reported separately, as "mapped", and
+are not included in the memory size by default.
+
+Functions:
+----------
+memory_size: the deep memory size of an object
+
+memory_breakdown: per-variable memory usage in a namespace, separating the
+    memory used by one variable only from that shared with other variables
+
+shared_buffers: data buffers used by more than one variable in a namespace
+"""
+
+import collections, mmap, typing
+from functools import singledispatch
+from sys import getsizeof, stderr
+import numpy as np
+import neo
+from neo.core.dataobject import DataObject as NeoDataObject
+from neo.core.container import Container as NeoContainer
+import pandas as pd
+
+from .fingerprint import NEO_CONTAINERS
+
+# attributes of neo data objects, holding data other than the object's own
+NEO_DATA_ATTRIBUTES = ("times", "durations", "labels", "waveforms")
+
+class MemoryAccount(object):
+    """Memory blocks reachable from one or more objects.
+
+    `blocks` maps the key of a memory block to (nbytes, kind) where kind is one
+    of "object" (a python object), "buffer" (the data buffer of an array) or
+    "mapped" (the data buffer of a memory-mapped array).
+
+    `buffers` maps the key of each data buffer to its address.
+    """
+    def __init__(self, handlers:typing.Optional[dict] = None, verbose:bool = False):
+        self.blocks = dict()
+        self.buffers = dict()
+        self.handlers = dict(handlers) if isinstance(handlers, dict) else dict()
+        self.verbose = verbose
+        # NOTE: keeps references to the visited objects, some of which may be
+        # temporary (e.g. the `times` of a neo.SpikeTrain), so that their id
+        # is not reused during the walk
+        self._seen_ = dict()
+
+    def add(self, key, nbytes:int, kind:str = "object"):
+        if key in self.blocks:
+            return
+
+        self.blocks[key] = (int(nbytes), kind)
+
+        if self.verbose:
+            print(nbytes, kind, key, file=stderr)
+
+    def visit(self, x):
+        """Accounts for the memory reachable from x"""
+        if id(x) in self._seen_:
+            return
+
+        self._seen_[id(x)] = x
+
+        handler = next((h for t, h in self.handlers.items() if isinstance(x, t)), None)
+
+        if handler is not None:
+            self.add(("object", id(x)), getsizeof(x))
+            for v in handler(x):
+                self.visit(v)
+            return
+
+        account(x, self)
+
+    def nbytes(self, include_mapped:bool = False) -> int:
+        return sum(nbytes for nbytes, kind in self.blocks.values() if include_mapped or kind != "mapped")
+
+@singledispatch
+def account(x, acc:MemoryAccount):
+    """Adds the memory blocks used by `x` to the MemoryAccount `acc`.
+
+    This is a functools.singledispatch function: handlers for more types can be
+    registered with `account.register`.
+    """
+    acc.add(("object", id(x)), getsizeof(x))
+
+@account.register(tuple)
+@account.register(list)
+@account.register(collections.deque)
+@account.register(set)
+@account.register(frozenset)
+def _(x, acc:MemoryAccount):
+    acc.add(("object", id(x)), getsizeof(x))
+    for v in list(x):
+        acc.visit(v)
+
+@account.register(collections.abc.Mapping)
+def _(x, acc:MemoryAccount):
+    acc.add(("object", id(x)), getsizeof(x))
+    for k, v in list(x.items()):
+        acc.visit(k)
+        acc.visit(v)
+
+@account.register(np.ndarray)
+def _(x:np.ndarray, acc:MemoryAccount):
+    _account_array(x, acc)
+
+@account.register(pd.Index)
+@account.register(pd.Series)
+@account.register(pd.DataFrame)
+def _(x, acc:MemoryAccount):
+    usage = x.memory_usage(deep=True)
+    if isinstance(usage, pd.Series):
+        usage = usage.sum()
+
+    acc.add(("object", id(x)), int(usage))
+
+@account.register(NeoDataObject)
+def _(x:NeoDataObject, acc:MemoryAccount):
+    _account_array(x, acc)
+
+    # NOTE: the `segment` and `group` references to the parent containers are
+    # not followed; the `times` of regularly sampled signals are calculated on
+    # request, and are not stored
+    if not isinstance(x, (neo.AnalogSignal, neo.ImageSequence)):
+        for attr in NEO_DATA_ATTRIBUTES:
+            value = getattr(x, attr, None)
+            if isinstance(value, np.ndarray) and value is not x:
+                acc.visit(value)
+
+    for attr in ("annotations", "array_annotations"):
+        value = getattr(x, attr, None)
+        if isinstance(value, dict):
+            acc.visit(value)
+
+@account.register(NeoContainer)
+def _(x:NeoContainer, acc:MemoryAccount):
+    acc.add(("object", id(x)), getsizeof(x))
+
+    for container in NEO_CONTAINERS:
+        objects = getattr(x, container, None)
+        if objects is not None:
+            for o in list(objects):
+                acc.visit(o)
+
+    annotations = getattr(x, "annotations", None)
+    if isinstance(annotations, dict):
+        acc.visit(annotations)
+
+def _account_attributes(x, acc:MemoryAccount):
+    acc.add(("object", id(x)), getsizeof(x))
+
+    attrs = getattr(x, "__dict__", None)
+    if isinstance(attrs, dict):
+        acc.visit(attrs)
+
+def _register_scipyen_types():
+    # NOTE: imported here, to avoid circular imports (core.utilities uses this
+    # module)
+    from core.basescipyen import BaseScipyenData
+    from core.traitcontainers import DataBag
+
+    account.register(BaseScipyenData, _account_attributes)
+
+    # NOTE: the trait observer of a DataBag refers to the same objects as the
+    # DataBag's items
+    account.register(DataBag, account.dispatch(collections.abc.Mapping))
+
+_scipyen_types_registered = False
+
+def _memory_account(obj, handlers:typing.Optional[dict] = None, verbose:bool = False) -> MemoryAccount:
+    global _scipyen_types_registered
+
+    if not _scipyen_types_registered:
+        try:
+            _register_scipyen_types()
+        except ImportError:
+            pass
+        _scipyen_types_registered = True
+
+    acc = MemoryAccount(handlers, verbose)
+    acc.visit(obj)
+    return acc
+
+def _data_owner(a:np.ndarray) -> np.ndarray:
+    """The outermost ndarray in the `base` chain of `a`"""
+    while isinstance(a.base, np.ndarray):
+        a = a.base
+    return a
+
+def _is_mapped(a:np.ndarray) -> bool:
+    while isinstance(a, np.ndarray):
+        if isinstance(a, np.memmap):
+            return True
+        a = a.base
+
+    return isinstance(a, mmap.mmap)
+
+def _account_array(x:np.ndarray, acc:MemoryAccount):
+    """The array object, and the data buffer of the array owning the data"""
+    header = getsizeof(x)
+    if x.flags.owndata:
+        header -= x.nbytes
+
+    acc.add(("object", id(x)), max(header, 0))
+
+    owner = _data_owner(x)
+    base = owner.base
+
+    if base is None:
+        key = ("buffer", id(owner))
+        nbytes = owner.nbytes
+
+    else:
+        # data owned by another python object (e.g. bytes, mmap.mmap)
+        key = ("buffer", id(base))
+        try:
+            nbytes = memoryview(base).nbytes
+        except TypeError:
+            nbytes = owner.nbytes
+
+    acc.add(key, nbytes, "mapped" if _is_mapped(x) else "buffer")
+    acc.buffers.setdefault(key, owner.__array_interface__["data"][0])
+
+def memory_size(obj, handlers:typing.Optional[dict] = None,
+                include_mapped:bool = False, verbose:bool = False) -> int:
+    """The deep memory size of `obj`, in bytes.
+
+    Parameters:
+    -----------
+    obj: any object
+
+    handlers: dict, optional; maps types to functions that iterate over the
+        contents of objects of that type, e.g.:
+
+            handlers = {SomeContainerClass: iter,
+                        OtherContainerClass: OtherContainerClass.get_elements}
+
+        These take precedence over the handlers registered with `account`.
+
+    include_mapped: when True, include the size of data buffers in memory-mapped
+        files (default is False)
+
+    verbose: when True, print the size of each memory block to stderr
+    """
+    return _memory_account(obj, handlers, verbose).nbytes(include_mapped)
+
+def _namespace_accounts(namespace:typing.Mapping[str, typing.Any]) -> dict:
+    return dict((name, _memory_account(value)) for name, value in namespace.items())
+
+def memory_breakdown(namespace:typing.Mapping[str, typing.Any]) -> pd.DataFrame:
+    """Memory usage of the variables in a namespace.
+
+    Parameters:
+    -----------
+    namespace: mapping of variable names to objects (e.g. the workspace)
+
+    Returns:
+    --------
+    pandas.DataFrame with one row per variable, sorted by decreasing "unique"
+    size, and the columns (all sizes in bytes):
+
+        total: the memory size of the variable (see memory_size)
+
+        unique: the memory used by this variable only, i.e. the memory that
+            would be released by deleting the variable
+
+        shared: the memory the variable shares with other variables in the
+            namespace (e.g. views on the same data, or objects contained in
+            several variables)
+
+        mapped: the size of the memory-mapped data used by the variable
+    """
+    accounts = _namespace_accounts(namespace)
+
+    users = collections.Counter(key for acc in accounts.values() for key in acc.blocks)
+
+    rows = list()
+
+    for name, acc in accounts.items():
+        total = acc.nbytes()
+        unique = sum(nbytes for key, (nbytes, kind) in acc.blocks.items() if kind != "mapped" and users[key] == 1)
+        rows.append({"name": name, "total": total, "unique": unique,
+                     "shared": total - unique,
+                     "mapped": acc.nbytes(True) - total})
+
+    ret = pd.DataFrame(rows, columns=["name", "total", "unique", "shared", "mapped"])
+
+    return ret.set_index("name").sort_values("unique", ascending=False)
+
+def shared_buffers(namespace:typing.Mapping[str, typing.Any], min_nbytes:int = 0) -> pd.DataFrame:
+    """Data buffers used by more than one variable in a namespace.
+
+    Parameters:
+    -----------
+    namespace: mapping of variable names to objects (e.g. the workspace)
+
+    min_nbytes: int; only report buffers of at least this size (default is 0)
+
+    Returns:
+    --------
+    pandas.DataFrame with one row per buffer, sorted by decreasing size, and
+    the columns:
+
+        address: hex address of the data buffer
+
+        nbytes: size of the buffer, in bytes
+
+        kind: "buffer", or "mapped" for memory-mapped data
+
+        shared by: tuple of the names of the variables using the buffer
+    """
+    accounts = _namespace_accounts(namespace)
+
+    sharing = collections.defaultdict(list)
+    blocks = dict()
+    addresses = dict()
+
+    for name, acc in accounts.items():
+        for key, address in acc.buffers.items():
+            sharing[key].append(name)
+            blocks[key] = acc.blocks[key]
+            addresses[key] = address
+
+    rows = [{"address": hex(addresses[key]), "nbytes": blocks[key][0],
+             "kind": blocks[key][1], "shared by": tuple(names)}
+            for key, names in sharing.items()
+            if len(names) > 1 and blocks[key][0] >= min_nbytes]
+
+    ret = pd.DataFrame(rows, columns=["address", "nbytes", "kind", "shared by"])
+
+    return ret.sort_values("nbytes", ascending=False, ignore_index=True)
@@ -16,10 +16,11 @@ import pprint
 
 from abc import ABC, abstractmethod
 from importlib import abc as importlib_abc
-import enum, io, os, re, itertools, sys, time, traceback, types, typing
+import enum, io, os, re, itertools, sys, tempfile, time, traceback, types, typing
 from types import SimpleNamespace
 import collections
 from collections import deque
+import concurrent.futures, multiprocessing
 import importlib, inspect, pathlib, warnings, operator, functools
 from warnings import WarningMessage
 from inspect import Parameter, Signature
@@ -1891,8 +1892,147 @@ def processtimeblock(label):
         end = time.process_time()
         print("{} : {}".format(label, end-start))
 
+@contextmanager
+def atomic_write(filename:typing.Union[str, pathlib.Path], mode:str="wb"):
+    """Opens a temporary file, in the directory of `filename`, for writing; 
+    when the block ends, the temporary file replaces `filename` (os.replace).
+    
+    Readers of `filename` never see a partially written file, and the original
+    file is never truncated while open or memory-mapped elsewhere (e.g. by 
+    arrays loaded from it); these keep the original data, until released.
+    
+    When the block raises, the temporary file is removed and `filename` is 
+    left unchanged.
+    
+    mode: "wb" (default) or "wt"
+    """
+    filename = os.fspath(filename)
+    
+    fd, tmpname = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(filename)),
+                                   prefix=".%s." % os.path.basename(filename), 
+                                   suffix=".tmp")
+    try:
+        if os.path.isfile(filename):
+            # NOTE: mkstemp creates the file readable by the owner only
+            os.chmod(tmpname, os.stat(filename).st_mode & 0o7777)
+            
+        with os.fdopen(fd, mode) as tmpfile:
+            yield tmpfile
+            tmpfile.flush()
+            os.fsync(tmpfile.fileno())
+            
+        os.replace(tmpname, filename)
+        
+    except:
+        try:
+            os.remove(tmpname)
+        except OSError:
+            pass
+        raise
+
 # ### END Context managers
 
+# ### BEGIN Process pools
+
+def process_pool(max_workers:typing.Optional[int]=None, 
+                 initializer:typing.Optional[typing.Callable]=None,
+                 initargs:tuple=()) -> concurrent.futures.ProcessPoolExecutor:
+    """ProcessPoolExecutor with worker processes started by 'spawn'.
+    
+    Forking the Scipyen process (which runs a Qt event loop and a Jupyter 
+    kernel) is unsafe, therefore worker processes are always spawned; they 
+    import the modules needed by the submitted callables on first use.
+    
+    max_workers: default is the number of CPUs (os.cpu_count())
+    
+    Submitted callables and their arguments must be picklable (e.g., module-level
+    functions; NOT lambdas, closures or bound methods of Qt objects).
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+        
+    return concurrent.futures.ProcessPoolExecutor(max_workers = max_workers,
+                                                  mp_context = multiprocessing.get_context("spawn"),
+                                                  initializer = initializer,
+                                                  initargs = initargs)
+
+def bounded_pool_map(executor:concurrent.futures.Executor, fn:typing.Callable, 
+                     items:typing.Iterable, /, 
+                     max_in_flight:typing.Optional[int]=None,
+                     weight:typing.Optional[typing.Callable]=None,
+                     max_weight:typing.Optional[float]=None,
+                     loopControl:typing.Optional[dict]=None,
+                     **kwargs) -> typing.Generator:
+    """Submits fn(item, **kwargs) for each item to executor, with back-pressure.
+    
+    Yields (item, future) tuples in the order in which the futures complete.
+    
+    At most `max_in_flight` calls are pending at any time and, when `weight` is
+    given, the sum of weight(item) over the pending items is kept under 
+    `max_weight` (at least one item is always submitted, whatever its weight).
+    This bounds the memory held by results not yet consumed by the caller.
+    
+    Parameters:
+    -----------
+    executor: a concurrent.futures Executor (e.g., see process_pool)
+    fn: callable; must be picklable for process pools
+    items: iterable of the first argument to `fn`
+    
+    Named parameters:
+    -----------------
+    max_in_flight: int; default is twice the number of the executor's workers 
+        (or CPUs)
+    weight: callable item ↦ number (e.g. os.path.getsize for files); optional
+    max_weight: number; ignored when weight is None
+    loopControl: dict with the mapping "break" ↦ bool; when "break" is True, 
+        pending calls are cancelled and the generator returns.
+        
+    Var-keyword parameters are passed to fn.
+    
+    """
+    if max_in_flight is None:
+        max_in_flight = 2 * (getattr(executor, "_max_workers", None) or os.cpu_count() or 1)
+        
+    pending = dict() # future ↦ (item, weight)
+    in_flight_weight = 0
+    items = iter(items)
+    exhausted = False
+    
+    def _canceled():
+        return isinstance(loopControl, dict) and loopControl.get("break", False) == True
+    
+    try:
+        while True:
+            while not exhausted and len(pending) < max_in_flight and not _canceled():
+                if len(pending) and weight is not None and max_weight is not None and in_flight_weight >= max_weight:
+                    break
+                try:
+                    item = next(items)
+                except StopIteration:
+                    exhausted = True
+                    break
+                
+                w = weight(item) if weight is not None else 0
+                pending[executor.submit(fn, item, **kwargs)] = (item, w)
+                in_flight_weight += w
+                
+            if len(pending) == 0 or _canceled():
+                return
+            
+            done, _ = concurrent.futures.wait(pending, timeout=0.25,
+                                              return_when=concurrent.futures.FIRST_COMPLETED)
+            
+            for future in done:
+                item, w = pending.pop(future)
+                in_flight_weight -= w
+                yield item, future
+                
+    finally:
+        for future in pending:
+            future.cancel()
+
+# ### END Process pools
+
 def is_hashable(x):
     """Returns True if x is hashable, i.e. hash(x) succeeds and returns an int"""
     ret = bool(getattr(x, "__hash__", None) is not None)
@@ -87,6 +87,7 @@ are configuration settings for various Scipyen functionalities:
 """
 #import base64
 import os, inspect, typing, types, math, numbers, json, traceback, warnings
+import atexit, threading
 import yaml
 import dataclasses
 from copy import (copy, deepcopy,)
@@ -115,7 +116,7 @@ from traitlets.utils.bunch import Bunch
 import traitlets.config
 from .traitcontainers import DataBag
 from core import (traitutils, strutils)
-from core.prog import (safeWrapper, printStyled)
+from core.prog import (safeWrapper, printStyled, atomic_write)
 from core.workspacefunctions import user_workspace
 from core.quantities import(quantity2str, str2quantity)
 from iolib.jsonio import (object2JSON, json2python)
@@ -1153,6 +1154,12 @@ class ScipyenConfigurable(object):
         return parent
 
     def _observe_configurables_(self, change):
+        if change.get("change_type", None) == "batch": # see DataBag.batch()
+            for c in change.changes.values():
+                if c.change_type != "removed":
+                    self._observe_configurables_(c)
+            return
+        
         isTop = hasattr(self, "isTopLevel") and self.isTopLevel
         parent = self._get_parent_()
         tag = self.configTag
@@ -1190,21 +1197,25 @@ class ScipyenConfigurable(object):
         #### END debug - comment out when done
                 
         
-        if isinstance(cfg, Bunch):
-            for k,v in cfg.items():
-                scipyen_config[k].set(v)
-                
-        else:
-            for k,v in cfg.items():
-                for kk,vv in v.items():
-                    scipyen_config[k][kk].set(vv)
+        # NOTE: 2026-10-18 15:39:20
+        # the configuration file is written later, by config_writer, together 
+        # with other changes made in the meantime
+        with config_writer.lock:
+            if isinstance(cfg, Bunch):
+                for k,v in cfg.items():
+                    scipyen_config[k].set(v)
+                    
+            else:
+                for k,v in cfg.items():
+                    for kk,vv in v.items():
+                        scipyen_config[k][kk].set(vv)
                     
         #### BEGIN debug - comment out when done
 #         if self.__class__.__name__ == "EventAnalysis":
 #             print(f"\twriting configuration file")
         #### END debug - comment out when done
             
-        write_config(scipyen_config)
+        config_writer.mark_dirty(*cfg.keys())
         
         #### BEGIN debug - comment out when done
         # if self.__class__.__name__ == "EventAnalysis":
@@ -1481,10 +1492,11 @@ class ScipyenConfigurable(object):
                         
                         # val_ = data2confuse(x)
                         
-                        if hasattr(user_conf[k], "set"):
-                            user_conf[k].set(val)
-                        else:
-                            user_conf[k] = val
+                        with config_writer.lock:
+                            if hasattr(user_conf[k], "set"):
+                                user_conf[k].set(val)
+                            else:
+                                user_conf[k] = val
 
                         changed = True
                         
@@ -1493,7 +1505,7 @@ class ScipyenConfigurable(object):
                 # if self.__class__.__name__ == "EventAnalysis":
                 #     print(f"\twriting configuration file")
                 #### END debug - comment out when done
-                write_config(scipyen_config)
+                config_writer.mark_dirty(self.__class__.__name__)
                 #### BEGIN debug - comment out when done
                 # if self.__class__.__name__ == "EventAnalysis":
                 #     print(f"DONE ScipyenConfigurable<{self.__class__.__name__}>.saveSettings()\n\n")
@@ -1792,7 +1804,6 @@ def write_config(config:typing.Optional[confuse.Configuration]=scipyen_config, f
     
     defsrc = [s for s in config.sources if s.default] # default source
     src = [s for s in config.sources if not s.default] # non-default sources
-    out = ""
     
     if default_only:
         as_default = True # force saving to the package default
@@ -1808,17 +1819,9 @@ def write_config(config:typing.Optional[confuse.Configuration]=scipyen_config, f
             filename = ".".join([fn, "yaml"])
             
     #print(f"scipyen_config.write_config: filename {filename}")
-            
-    if isinstance(config, confuse.Configuration): # Configuration and LazyConfig
-        out = config.dump(full=full, redact=redact)
-        
-    else:
-        if full:
-            out = config.flatten(redact=redact)
-        else: # exclude defaults
-            temp_root = confuse.RootView(src)
-            temp_root.redactions = config.redactions
-            out = temp_root.flatten(redact=redact)
+    
+    with config_writer.lock:
+        out = _dump_config_(config, full=full, redact=redact)
 
     #NOTE: 2021-01-13 17:23:36
     # allow the use of empty output - effectively this wipes out the yaml file
@@ -1832,11 +1835,116 @@ def write_config(config:typing.Optional[confuse.Configuration]=scipyen_config, f
         if ret != QtWidgets.QMessageBox.OK:
             return False
         
-    with open(filename, "wt") as yamlfile:
-        yamlfile.write(out)
+    _write_file_atomic_(filename, out)
         
     return True
     
+def _dump_config_(config:confuse.ConfigView, full:bool=True, redact:bool=False) -> str:
+    """The YAML text of the configuration (see write_config)"""
+    if isinstance(config, confuse.Configuration): # Configuration and LazyConfig
+        return config.dump(full=full, redact=redact)
+        
+    if full:
+        return config.flatten(redact=redact)
+    
+    # exclude defaults
+    temp_root = confuse.RootView([s for s in config.sources if not s.default])
+    temp_root.redactions = config.redactions
+    return temp_root.flatten(redact=redact)
+
+def _write_file_atomic_(filename:str, text:str):
+    """Writes text to a temporary file, then renames it to filename.
+    
+    Readers of filename (e.g. another Scipyen session) never see a partially 
+    written file (see core.prog.atomic_write).
+    """
+    with atomic_write(filename, "wt") as tmpfile:
+        tmpfile.write(text)
+    
+# NOTE: 2026-10-18 15:39:20
+# delay (in seconds) between the first change of the configuration and writing
+# the config.yaml file; changes made in the meantime are written together
+CONFIG_WRITE_DELAY = 2.0
+
+class ConfigWriter(object):
+    """Write-behind store for the user configuration (config.yaml).
+    
+    Configurables change the configuration in memory (holding `lock`) then 
+    call mark_dirty(); the configuration is written to the config.yaml file 
+    from a background thread, CONFIG_WRITE_DELAY seconds after the first 
+    change, together with all changes made in the meantime (e.g. by several
+    viewers); pending changes are also written when Scipyen exits.
+    
+    The file is written atomically (see _write_file_atomic_).
+    """
+    def __init__(self, config:confuse.Configuration, delay:float = CONFIG_WRITE_DELAY):
+        self.config = config
+        self.delay = delay
+        self.lock = threading.RLock()
+        self.dirty = set()   # top-level keys changed since the last write
+        self.writes = 0      # number of writes, for diagnostics
+        self._timer_ = None
+        
+    @property
+    def pending(self) -> bool:
+        return len(self.dirty) > 0
+    
+    def mark_dirty(self, *keys):
+        """Schedules writing the configuration.
+        
+        keys: the (top-level) keys of the configuration that have changed
+        """
+        with self.lock:
+            self.dirty.update(keys if len(keys) else (None,))
+            
+            if self._timer_ is None:
+                self._timer_ = threading.Timer(self.delay, self.flush)
+                self._timer_.daemon = True
+                self._timer_.start()
+                
+    def flush(self) -> bool:
+        """Writes the configuration now, if there are pending changes.
+        
+        Returns True when the configuration was written.
+        """
+        with self.lock:
+            if self._timer_ is not None:
+                self._timer_.cancel()
+                self._timer_ = None
+                
+            if len(self.dirty) == 0:
+                return False
+            
+            try:
+                src = [s for s in self.config.sources if not s.default]
+                out = _dump_config_(self.config)
+                
+                # NOTE: unlike write_config, never wipe out the file from here
+                if len(src) == 0 or len(out) == 0:
+                    self.dirty.clear()
+                    return False
+                
+                _write_file_atomic_(src[-1].filename, out)
+                
+            except RuntimeError:
+                # the configuration was changed by another thread while being
+                # dumped (without holding the lock) - try again later
+                self.mark_dirty()
+                return False
+                
+            except:
+                traceback.print_exc()
+                return False
+            
+            self.dirty.clear()
+            self.writes += 1
+            
+        return True
+    
+config_writer = ConfigWriter(scipyen_config)
+
+atexit.register(config_writer.flush)
+    
 def saveWindowSettings(qsettings:QtCore.QSettings, win:typing.Union[QtWidgets.QMainWindow, Figure], group_name:typing.Optional[str]=None, prefix:typing.Optional[str]=None):
     """Saves window settings to the Scipyen's Qt configuration file.
     
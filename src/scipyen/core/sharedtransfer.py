@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Cezar M. Tigaret <cezar.tigaret@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+"""Transfer of python objects between Scipyen and external kernels running on
+the same machine, via shared memory.
+
+Objects are pickled with protocol 5: the data buffers of numpy arrays (and of
+objects derived from them e.g., quantities, VigraArray, neo signals) are taken
+out of the pickle stream ("out-of-band", see PEP 574) and copied to
+multiprocessing.shared_memory segments.
+
+What travels through the kernel messages is a small descriptor (see
+dumps_shared): a JSON string with the pickle stream without the data buffers 
+(base64-encoded), and the names and sizes of the shared memory segments. The 
+receiving end (see loads_shared) copies the data from the segments into its own
+memory, then releases (unlinks) the segments.
+
+Shared memory can only be used when both ends run on the same machine; a
+kernel reached via a local address may still run elsewhere (e.g. through an 
+SSH tunnel). This is confirmed by a probe: a segment created here, whose 
+contents the kernel must be able to read (see make_probe, check_probe and 
+is_local_kernel).
+
+This avoids the text encoding (repr) and parsing of the pickled data, and the
+copies involved; the data is copied once on each side.
+
+NOTE: The segments are created untracked: they are not removed when the
+process that created them exits. Segments of a descriptor that is never loaded
+remain in the system until unlinked (see release_shared) or until reboot.
+"""
+
+import base64, json, pickle, secrets, typing
+from multiprocessing import shared_memory, resource_tracker
+
+# key of the pickle stream in a descriptor
+PICKLE_KEY = "pickle"
+
+# key of the (segment name, size) pairs in a descriptor
+SEGMENTS_KEY = "segments"
+
+# NOTE: 2026-10-18 16:22:40
+# attribute of a kernel client, set to the result of the shared memory probe
+# (see is_local_kernel)
+SHARED_MEMORY_ATTR = "scipyen_shared_memory"
+
+def _create_segment(nbytes:int) -> shared_memory.SharedMemory:
+    try:
+        # python >= 3.13
+        return shared_memory.SharedMemory(create=True, size=nbytes, track=False)
+
+    except TypeError:
+        shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        # NOTE: otherwise the resource tracker unlinks the segment when this
+        # process exits - possibly before the other end has loaded it
+        try:
+            resource_tracker.unregister(shm._name, "shared_memory")
+        except Exception:
+            pass
+        return shm
+
+def _attach_segment(name:str) -> shared_memory.SharedMemory:
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+
+    except TypeError:
+        shm = shared_memory.SharedMemory(name=name)
+        try:
+            resource_tracker.unregister(shm._name, "shared_memory")
+        except Exception:
+            pass
+        return shm
+
+def dumps_shared(obj:typing.Any) -> str:
+    """Pickles `obj` with its data buffers in shared memory segments.
+
+    Returns:
+    --------
+    A descriptor: JSON string of an object with the members
+        "pickle": str - the pickle stream (without the data buffers), base64 
+            encoded
+        "segments": list of [segment name, size] pairs, one per data buffer;
+            the name is null for empty buffers
+
+    NOTE: The descriptor is a single string (rather than a python literal) 
+    because the text/plain representation of user expression values is 
+    truncated by IPython's pretty printer for large collections (e.g. the list
+    of segments).
+    """
+    buffers = list()
+
+    stream = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+
+    segments = list()
+
+    try:
+        for buffer in buffers:
+            data = buffer.raw()
+            nbytes = data.nbytes
+
+            if nbytes == 0:
+                segments.append((None, 0))
+                continue
+
+            shm = _create_segment(nbytes)
+            try:
+                shm.buf[:nbytes] = data
+                segments.append((shm.name, nbytes))
+            finally:
+                shm.close()
+
+    except:
+        release_shared({SEGMENTS_KEY: segments})
+        raise
+
+    return json.dumps({PICKLE_KEY: base64.b64encode(stream).decode("ascii"), 
+                       SEGMENTS_KEY: segments})
+
+def _descriptor(descriptor:typing.Union[str, dict]) -> dict:
+    return json.loads(descriptor) if isinstance(descriptor, str) else descriptor
+
+def loads_shared(descriptor:typing.Union[str, dict]) -> typing.Any:
+    """Unpickles an object from a descriptor created by dumps_shared.
+
+    The data buffers are copied from the shared memory segments, which are
+    then released.
+    
+    Raises FileNotFoundError when a segment cannot be found (e.g. when the
+    descriptor was created on another machine).
+    """
+    descriptor = _descriptor(descriptor)
+    
+    buffers = list()
+
+    try:
+        for name, nbytes in descriptor[SEGMENTS_KEY]:
+            if name is None:
+                buffers.append(bytearray(0))
+                continue
+
+            shm = _attach_segment(name)
+            try:
+                # NOTE: a bytearray, so that the unpickled arrays are writable
+                buffers.append(bytearray(shm.buf[:nbytes]))
+            finally:
+                shm.close()
+
+    finally:
+        release_shared(descriptor)
+
+    return pickle.loads(base64.b64decode(descriptor[PICKLE_KEY]), buffers=buffers)
+
+def _unlink_segment(name:str):
+    try:
+        try:
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            # NOTE: registered with the resource tracker here, and 
+            # unregistered by unlink()
+            shm = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return
+
+    shm.close()
+
+    try:
+        shm.unlink()
+    except FileNotFoundError:
+        pass
+
+def release_shared(descriptor:typing.Union[str, dict]):
+    """Unlinks the shared memory segments of a descriptor"""
+    for name, nbytes in _descriptor(descriptor).get(SEGMENTS_KEY, list()):
+        if name is not None:
+            _unlink_segment(name)
+
+def make_probe() -> tuple:
+    """Creates a shared memory segment holding a random token.
+    
+    Returns the tuple (segment name, token); the token can only be read from
+    the segment (see check_probe) on this machine.
+    
+    The segment must be released with release_probe.
+    """
+    token = secrets.token_hex(16)
+    data = token.encode("ascii")
+    
+    shm = _create_segment(len(data))
+    try:
+        shm.buf[:len(data)] = data
+    finally:
+        shm.close()
+        
+    return (shm.name, token)
+
+def check_probe(name:str, token:str) -> bool:
+    """True when the segment created by make_probe on the other end can be 
+    read here (i.e., both ends run on the same machine).
+    """
+    try:
+        shm = _attach_segment(name)
+    except (OSError, ValueError):
+        return False
+    
+    try:
+        data = token.encode("ascii")
+        return bytes(shm.buf[:len(data)]) == data
+    finally:
+        shm.close()
+        
+def release_probe(name:str):
+    """Unlinks the segment created by make_probe"""
+    _unlink_segment(name)
+
+def is_local_kernel(client) -> bool:
+    """True when the kernel of the client runs on this machine, and shares 
+    memory with this process.
+    
+    The kernel must be reached via a local address, and must have passed the
+    shared memory probe (see make_probe and check_probe), whose result is 
+    stored in the client's attribute named by SHARED_MEMORY_ATTR.
+    """
+    if getattr(client, SHARED_MEMORY_ATTR, False) is not True:
+        return False
+    
+    return has_local_address(client)
+
+def has_local_address(client) -> bool:
+    """True when the kernel of the client is reached via a local address.
+    
+    NOTE: This does not guarantee that the kernel runs on this machine (e.g.
+    the local end of an SSH tunnel); see is_local_kernel.
+    """
+    if getattr(client, "transport", "tcp") == "ipc":
+        return True
+
+    return getattr(client, "ip", None) in ("127.0.0.1", "localhost", "::1", "0.0.0.0", "")
@@ -17,6 +17,7 @@ accessed using attribute syntax.
 import traceback
 import typing
 import contextlib
+import itertools
 from inspect import getcallargs, isfunction, ismethod
 from functools import partial
 from pprint import pformat
@@ -25,15 +26,70 @@ from traitlets import (HasTraits, TraitType, Int, Bool, All, observe, Undefined)
 from traitlets.utils.bunch import Bunch
 
 from .traitutils import (dynamic_trait, transform_link)
+from .utilities import gethash
 
 from .prog import safeWrapper, timefunc, processtimefunc, timeblock
 from .strutils import str2symbol
 
 
+class TraitChangeBatch(object):
+    """Trait change notifications collected during DataBag.batch().
+    
+    Successive changes of the same trait are coalesced into one, e.g.:
+        "new" then "modified" ⇒ "new"
+        "new" then "removed" ⇒ no change
+        "removed" then "new" ⇒ "modified"
+        "modified" then "removed" ⇒ "removed"
+        
+    The coalesced change keeps the old value from the first change, and the 
+    new value from the last one.
+    """
+    def __init__(self):
+        self.changes = dict()
+        self.depth = 0
+        
+    def __len__(self):
+        return len(self.changes)
+        
+    def record(self, change:Bunch):
+        previous = self.changes.get(change.name, None)
+        
+        if previous is None:
+            self.changes[change.name] = change
+            return
+        
+        first, last = previous.change_type, change.change_type
+        
+        if first == "new":
+            if last == "removed":
+                self.changes.pop(change.name)
+                return
+            change_type = "new"
+            
+        elif last == "removed":
+            change_type = "removed"
+            
+        else:
+            change_type = "modified"
+            
+        previous.update(new = change.new, change_type = change_type)
+        
+# NOTE: 2026-10-18 16:16:31
+# source of the change versions of DataBag observers (see DataBag.__fingerprint__);
+# a new value is taken at each change, hence two observers never have the same
+# version
+_change_versions = itertools.count(1)
+
 class DataBagTraitsObserver(HasTraits):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._verbose_ = False
+        # NOTE: 2026-10-18 15:36:12
+        # a TraitChangeBatch, during DataBag.batch()
+        self._batch_ = None
+        # NOTE: 2026-10-18 16:16:31
+        # changed at every notification (including those held in a batch)
+        self._version_ = next(_change_versions)
         # self._traits_dict_cached_ = {}
 
     @property
@@ -96,9 +152,11 @@ class DataBagTraitsObserver(HasTraits):
         """Augmented version of HasTraits._notify_trait.
             Expects a change_type (str) as one of: "modified", "new", "removed".
             By default, this is "modified". 
+            
+            During DataBag.batch() the notification is held, and coalesced 
+            with the other changes in the batch.
         """
-        self.notify_change(
-            Bunch(
+        change = Bunch(
                 name=name,
                 old=old_value,
                 new=new_value,
@@ -106,7 +164,16 @@ class DataBagTraitsObserver(HasTraits):
                 type="change",
                 change_type=change_type,
                 )
-            )
+        
+        self._version_ = next(_change_versions)
+        
+        batch = getattr(self, "_batch_", None)
+        
+        if batch is not None:
+            batch.record(change)
+            return
+        
+        self.notify_change(change)
 
     def remove_trait(self, traitname:str, traitobject:TraitType):
         """Unbinds a TraitType instance from an attribute of self.
@@ -159,7 +226,7 @@ class DataBagTraitsObserver(HasTraits):
     def notify_change(self, change):
         """Notify observers of a change event"""
         if self._verbose_:
-            print(f"notify_change: event = {event}")
+            print(f"notify_change: event = {change}")
 
         return self._notify_observers(change)
 
@@ -178,10 +245,15 @@ class DataBag(Bunch):
     sortedvalues()
     sorteditems()
     copy()
+    batch()
 
     Overridden public methods:
     clear() => removes the traits
     update() => updates with new traits
+    
+    The bulk operations (update(), delete(), clear()) and any changes made 
+    inside a `with bag.batch():` block send one aggregated notification (see 
+    batch()).
 
     Public methods inherited from dict (indirectly, via Bunch):
 
@@ -820,6 +892,24 @@ class DataBag(Bunch):
         """The HasTraits observer. Read-only
         """
         return self.__observer__
+    
+    def __fingerprint__(self) -> int:
+        """The change version of this DataBag (see core.fingerprint).
+        
+        The version changes whenever a trait is added, removed, or modified 
+        (as notified to the observers); the content of the DataBag is not 
+        digested.
+        
+        NOTE: In-place changes of the values in the DataBag (e.g., appending to
+        a list stored in the DataBag) are not notified, hence do not change the
+        version.
+        """
+        try:
+            obs = object.__getattribute__(self, "__observer__")
+        except:
+            return 0
+        
+        return getattr(obs, "_version_", 0)
 
     def as_dict(self):
         """Dictionary of trait values
@@ -831,6 +921,95 @@ class DataBag(Bunch):
         
         return obs._trait_values
     
+    @contextlib.contextmanager
+    def batch(self):
+        """Context manager collecting the changes to this DataBag in one 
+        notification.
+        
+        Inside the `with` block, the changes are applied as usual, but the 
+        observers are not notified; the content hash (see core.utilities.gethash)
+        of a modified trait is calculated once, when the block ends.
+        
+        When the block ends, the observers of all traits (i.e. registered with
+        names=All, the default) receive one change event (a Bunch) with:
+            name: None
+            type: "change"
+            change_type: "batch"
+            added, modified, removed: lists with the names of the traits 
+                added, modified, and removed
+            changes: dict mapping each name above to its (coalesced) change
+                event (see TraitChangeBatch)
+            owner: the observer
+            
+        Observers of individual traits receive the coalesced change event of 
+        that trait.
+        
+        Batches can be nested; the notification is sent when the outermost 
+        block ends.
+        
+        Example:
+        ========
+        with bag.batch():
+            for name, value in data.items():
+                bag[name] = value
+            del bag.old_result
+        """
+        obs = object.__getattribute__(self, "__observer__")
+        
+        batch = getattr(obs, "_batch_", None)
+        
+        if batch is None:
+            batch = TraitChangeBatch()
+            object.__setattr__(obs, "_batch_", batch)
+            
+        batch.depth += 1
+        
+        try:
+            yield self
+            
+        finally:
+            batch.depth -= 1
+            
+            if batch.depth == 0:
+                object.__setattr__(obs, "_batch_", None)
+                self._notify_batch_(obs, batch)
+                
+    def _notify_batch_(self, obs, batch:TraitChangeBatch):
+        changes = dict()
+        
+        for name, change in batch.changes.items():
+            if change.change_type == "modified" and change.new is not None:
+                # NOTE: the content hash was not checked during the batch (see 
+                # traitutils.traitlet_set)
+                trait = obs.traits().get(name, None)
+                if trait is not None and hasattr(trait, "hashed"):
+                    try:
+                        new_hash = gethash(change.new)
+                        if new_hash == trait.hashed:
+                            continue
+                        trait.hashed = new_hash
+                    except:
+                        traceback.print_exc()
+                    
+            changes[name] = change
+        
+        if len(changes) == 0:
+            return
+        
+        # observers of individual traits
+        notifiers = obs._trait_notifiers
+        for name, change in changes.items():
+            handlers = notifiers.get(name, {})
+            for handler in list(handlers.get("change", [])) + list(handlers.get(All, [])):
+                handler(change)
+        
+        obs.notify_change(Bunch(name = None, type = "change", owner = obs,
+                                change_type = "batch", 
+                                added = [n for n, c in changes.items() if c.change_type == "new"],
+                                modified = [n for n, c in changes.items() if c.change_type == "modified"],
+                                removed = [n for n, c in changes.items() if c.change_type == "removed"],
+                                changes = changes))
+    
     def delete(self, *args):
         """Removes traits by name
         
@@ -849,8 +1028,9 @@ class DataBag(Bunch):
             raise TypeError("Expecting a sequence of str")
         
         try:
-            for arg in args:
-                self.__delitem__(arg)
+            with self.batch():
+                for arg in args:
+                    self.__delitem__(arg)
                 
         except:
             traceback.print_exc()
@@ -860,8 +1040,9 @@ class DataBag(Bunch):
         try:
             obs = object.__getattribute__(self, "__observer__")
             traitkeys = [k for k in obs.traits()]
-            for key in traitkeys:
-                self.__delitem__(key)
+            with self.batch():
+                for key in traitkeys:
+                    self.__delitem__(key)
                 
 #             # super().clear()
 #             # self.remove_members(*traitkeys)
@@ -1053,8 +1234,9 @@ class DataBag(Bunch):
         # traits
         # print(f"\n{self.__class__.__name__}.update")
         if isinstance(other, dict):  # this includes DataBag!
-            for key, value in other.items():
-                self[key] = value # calls __setitem__
+            with self.batch():
+                for key, value in other.items():
+                    self[key] = value # calls __setitem__
                 
             # with timeblock("DataBag.update"):
             #     for key, value in other.items():
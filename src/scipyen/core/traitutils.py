@@ -128,13 +128,21 @@ def traitlet_set(instance, obj, value):
         if silent:
             if isinstance(new_value, QtCore.QObject):
                 return
-            new_hash = gethash(new_value)
-            #print("\told %s (hash %s)\n\tnew %s (hash %s)" % (old_value, instance.hashed, new_value, new_hash))
-            #print(instance.name, "old hashed", instance.hashed, "new_hash", new_hash)
-            silent = bool(new_hash == instance.hashed)
             
-            if not silent:
-                instance.hashed = new_hash
+            if getattr(obj, "_batch_", None) is not None:
+                # NOTE: 2026-10-18 15:36:12
+                # during DataBag.batch() the hash is calculated once, when the
+                # batch ends (see DataBag._notify_batch_)
+                silent = False
+                
+            else:
+                new_hash = gethash(new_value)
+                #print("\told %s (hash %s)\n\tnew %s (hash %s)" % (old_value, instance.hashed, new_value, new_hash))
+                #print(instance.name, "old hashed", instance.hashed, "new_hash", new_hash)
+                silent = bool(new_hash == instance.hashed)
+                
+                if not silent:
+                    instance.hashed = new_hash
             
     except:
         traceback.print_exc()
@@ -56,6 +56,7 @@ from .prog import safeWrapper, deprecation, with_doc, is_hashable
 from .strutils import get_int_sfx
 from .quantities import units_convertible
 from .datazone import DataZone
+from .fingerprint import fingerprint
 
 # NOTE: 2021-07-24 15:03:53
 # moved TO core.datatypes
@@ -88,6 +89,19 @@ standard_obj_summary_headers = ["Name","Workspace",
                                 "Shape", "Axes", "Array Order", "Memory Size",
                                 "Address", "Icon"]
 
+# NOTE: 2026-10-18 15:24:12
+# columns of the workspace table that are expensive to calculate for large 
+# objects; these are calculated separately (see summarize_object_properties and
+# summarize_deferred_object_properties)
+deferred_obj_summary_headers = ["Minimum", "Maximum", "Memory Size"]
+
+# arrays with more elements than this have their deferred columns calculated 
+# separately
+DEFERRED_SUMMARY_SIZE = 2**16
+
+# text shown in deferred columns until they are calculated
+DEFERRED_SUMMARY_TEXT = "\u2026"
+
 GeneralIndexType = typing.Union[str, int, typing.Union[typing.Sequence[str], typing.Sequence[int]], np.ndarray, range, slice, type(MISSING)]
 """Generic index type, used with normalized_indexed and similar functions"""
 
@@ -594,79 +608,27 @@ def gethash(x:typing.Any) -> int:
     
     Not suitable for secure code.
     
-    CAUTION: some types may return same hash even if they have different content:
-    These are np.ndarray and subclasses
+    This is the content fingerprint of the object (see core.fingerprint), 
+    calculated within the budgets fingerprint.FINGERPRINT_MAX_NBYTES (of array
+    data) and fingerprint.FINGERPRINT_MAX_OBJECTS:
     
-    WARNING: This is NOT NECESSARILY a hash
-    In particular for mutable sequences, or objects containing immutable sequences
-    is very likely to return floats
-    """
-    # from core.datatypes import is_hashable
+    * hashable objects contribute their hash;
     
-    # FIXME 2021-08-20 14:23:26
-    # for large data array, calculating the hash after converting to tuple may:
-    # 
-    # 1. incur significant overheads (for very large data)
-    #
-    # 2. may raise exception when the element type in the tuple is not hashable
-    #   checking this may also increase overhead
-    
-    # Arguably, we don't need to monitor elemental vale changes in these large
-    # data sets, just their ndim/shape/size/axistags, etc
-    def _hasharr(_x):
-        return hash((type(_x), _x.size, _x.shape))
-        
-    def _hasharrdtype(_x):
-        return hash((type(x), _x.size, _x.shape, _x.dtype))
-
-    try:
-        if is_hashable(x):
-            return hash(x)
-        
-        elif isinstance(x, pq.Quantity):
-            return hash((type(x), x.size, x.shape, x.dtype, x.dimensionality))
-        
-        elif isinstance(x, vigra.VigraArray):
-            return hash((type(x), x.size, x.shape, x.dtype, x.axistags))
-        
-        elif isinstance(x, vigra.vigranumpycore.ChunkedArrayBase):
-            return hash((type(x), x.chunk_array_shape, x.chunk_shape))
-        
-        elif isinstance(x, (vigra.filters.Kernel1D, vigra.filters.Kernel2D)):
-            return hash(type(x), x)
-        
-        elif isinstance(x, np.ndarray):
-            return _hasharrdtype(x)
+    * numpy arrays (and subclasses) contribute their shape, dtype and data; the 
+        data of large arrays is sampled in evenly spaced blocks;
         
-        elif isinstance(x, pd.DataFrame):
-            return hash((type(x), x.size, x.shape, x.dtype, x.index, x.columns))
+    * neo, vigra and pandas objects also contribute their specific attributes
+        (units, axistags, sampling, index, columns, etc);
         
-        elif isinstance(x, pd.Series):
-            return hash(type(x), x.size, x.shape, x.dtype, x.index, x.name)
-        
-        elif isinstance(x, pd.Index):
-            return hash(type(x), tuple(x))
-            
-        elif hasattr(x, "__iter__"):
-            return hash((type(x),tuple(x)))
-            
-        elif isinstance(x, dict):
-            return hash((type(x), tuple(x)))
-        
-        elif not is_hashable(x):
-            if hasattr(x, "__dict__"):
-                return hash((type(x), x.__dict__))
-
-            else:
-                return hash(type(x)) # FIXME 2021-08-20 14:22:13
-        
-        else:
-            # NOTE: 2021-08-19 16:18:20
-            # tuples, like all immutable basic python datatypes are hashable and their
-            # hash values reflect the order of the elements
-            # All user-defined classes and objects of user-defined types are also
-            # hashable
-            return hash(type(x)) + hash(x)
+    * collections contribute (up to fingerprint.FINGERPRINT_MAX_ITEMS of) their
+        elements.
+    
+    CAUTION: in-place changes to the data of large arrays, outside the sampled 
+    blocks, are not detected.
+    """
+    try:
+        return fingerprint(x)
+    
     except:
         return hash(type(x))
         
@@ -857,53 +819,23 @@ def get_index_for_seq(index:int, test:typing.Sequence[typing.Any],
 def total_size(o, handlers={}, verbose=False) -> int:
     """ Returns the approximate memory footprint an object and all of its contents.
 
-    Automatically finds the contents of the following builtin containers and
-    their subclasses:  tuple, list, deque, dict, set and frozenset.
+    NOTE: 2026-10-18 15:27:40
+    This is now calculated by core.memoryaccounting.memory_size, which also 
+    accounts for the data of numpy arrays (counting buffers shared by several
+    arrays only once), pandas objects, neo containers and Scipyen data objects.
+    
     To search other containers, add handlers to iterate over their contents:
 
         handlers = {SomeContainerClass: iter,
                     OtherContainerClass: OtherContainerClass.get_elements}
 
-    Author:
-    Raymond Hettinger
-    
-    Reference:
-    Compute memory footprint of an object and its contents (python recipe)
-    
-    Raymond Hettinger python recipe 577504-1
+    Credits:
+    Raymond Hettinger python recipe 577504-1 (the original implementation)
     https://code.activestate.com/recipes/577504/
     
     """
-    dict_handler = lambda d: chain.from_iterable(d.items())
-    all_handlers = {tuple: iter,
-                    list: iter,
-                    deque: iter,
-                    dict: dict_handler,
-                    set: iter,
-                    frozenset: iter,
-                   }
-    all_handlers.update(handlers)     # user handlers, if given, take precedence
-    seen = set()                      # track which object id's have already been seen
-    default_size = getsizeof(0)       # estimate sizeof object without __sizeof__
-
-    def sizeof(o_) -> int:
-        if id(o_) in seen:       # do not double count the same object
-            return 0
-
-        seen.add(id(o_))
-        
-        s = getsizeof(o_, default_size)
-
-        if verbose:
-            print(s, type(o_), repr(o_), file=stderr)
-            
-        handler = all_handlers[type(o_)]
-        
-        s += sum(map(sizeof, handler(o_)))
-
-        return s
-
-    return sizeof(o)
+    from .memoryaccounting import memory_size
+    return memory_size(o, handlers=handlers, verbose=verbose)
 
 # NOTE: 2021-07-27 23:09:02
 # define this here BEFORE NestedFinder so that we can use it as default value for
@@ -2716,7 +2648,114 @@ def reverse_mapping_lookup(x:dict, y:typing.Any) -> typing.Optional[typing.Union
     else:
         return tuple()
     
-def summarize_object_properties(objname, obj, namespace="Internal"):
+def defers_object_summary(obj) -> bool:
+    """True when the deferred columns (see deferred_obj_summary_headers) of the
+    summary of `obj` should be calculated separately.
+    
+    This is the case for arrays with more than DEFERRED_SUMMARY_SIZE elements,
+    and for non-empty containers (python containers, pandas objects, neo 
+    containers and Scipyen data objects), whose memory size includes the size of
+    their contents (see core.memoryaccounting).
+    """
+    from core.datatypes import (dict_types, sequence_types, set_types)
+    
+    if isinstance(obj, type):
+        return False
+    
+    if isinstance(obj, np.ndarray):
+        return obj.size > DEFERRED_SUMMARY_SIZE
+    
+    if isinstance(obj, sequence_types + set_types + dict_types + (pd.Series, pd.DataFrame)):
+        return len(obj) > 0
+    
+    if isinstance(obj, NeoContainer):
+        return True
+    
+    from core.basescipyen import BaseScipyenData
+    
+    return isinstance(obj, BaseScipyenData)
+
+def _summary_data_range(obj) -> tuple:
+    """Minimum and maximum of the data in `obj`, as str, or ("", "").
+    
+    `obj` is a numpy array or a collection of numbers.
+    """
+    datamin = ""
+    datamax = ""
+    
+    if isinstance(obj, np.ndarray):
+        if obj.size > 0:
+            try:
+                if np.all(np.isnan(obj[:])):
+                    datamin = str(np.nan)
+                    
+                else:
+                    datamin = str(np.nanmin(obj))
+            except:
+                pass
+                
+            try:
+                if np.all(np.isnan(obj[:])):
+                    datamax = str(np.nan)
+                    
+                else:
+                    datamax  = str(np.nanmax(obj))
+                    
+            except:
+                pass
+            
+    elif len(obj) and all([isinstance(v, Number) for v in obj]):
+        datamin = str(min([v for v in obj]))
+        datamax = str(max([v for v in obj]))
+        
+    return datamin, datamax
+
+def summarize_deferred_object_properties(obj, namespace="Internal") -> dict:
+    """Returns the deferred columns (see deferred_obj_summary_headers) of the
+    summary of `obj`, in the format of summarize_object_properties.
+    
+    The memory size is calculated including the contents of containers (see 
+    core.memoryaccounting.memory_size).
+    
+    This is meant to be called outside the GUI thread.
+    """
+    from core.datatypes import (sequence_types, set_types)
+    from .memoryaccounting import memory_size
+    
+    wspace_name = "Namespace: %s" % namespace
+    
+    datamin = ""
+    datamax = ""
+    memsz = ""
+    memsztip = "memory size: "
+    
+    try:
+        if isinstance(obj, np.ndarray):
+            datamin, datamax = _summary_data_range(obj)
+            memsz = str(obj.nbytes)
+            memsztip = "memory size (bytes): "
+            
+        elif isinstance(obj, sequence_types + set_types):
+            datamin, datamax = _summary_data_range(obj)
+            memsz = str(memory_size(obj))
+            
+        else:
+            memsz = str(memory_size(obj))
+            
+    except Exception as e:
+        # e.g., the container was changed while being traversed
+        traceback.print_exc()
+        
+    result = {"Minimum":     {"display": datamin, "tooltip": "min: %s" % datamin},
+              "Maximum":     {"display": datamax, "tooltip": "max: %s" % datamax},
+              "Memory Size": {"display": memsz,   "tooltip": "%s%s" % (memsztip, memsz)}}
+    
+    for value in result.values():
+        value["tooltip"] = "\n".join([value["tooltip"], wspace_name])
+        
+    return result
+
+def summarize_object_properties(objname, obj, namespace="Internal", deferred=False):
     """Returns a dict with object properties for display in Scipyen workspace.
     The dict keys represent the column names in the WorkspaceViewer table, and 
     are mapped to the a dict with two key: str value pairs: display, tooltip,
@@ -2731,6 +2770,12 @@ def summarize_object_properties(objname, obj, namespace="Internal"):
     with the items being displayed in the corresponding Workspace Table view in
     the Scipyen main window.
     
+    When `deferred` is True, the columns in deferred_obj_summary_headers are
+    not calculated for objects where this may be slow (see 
+    defers_object_summary); instead, they display DEFERRED_SUMMARY_TEXT and 
+    should be obtained separately, by calling 
+    summarize_deferred_object_properties.
+    
     """
     import builtins
     from core.datatypes import (abbreviated_type_names, dict_types, dict_typenames,
@@ -2885,17 +2930,18 @@ def summarize_object_properties(objname, obj, namespace="Internal"):
     obj_address = id(obj)
     address = f"{obj_address}"
     hexaddress = f"{hex(obj_address)}"
+    
+    defer = deferred and defers_object_summary(obj)
 
     try:
         if isinstance(obj, type):
             # icon = QtGui.QIcon.fromTheme("datatype")
             pass
         elif isinstance(obj, sequence_types):
-            if len(obj) and all([isinstance(v, Number) for v in obj]):
-                datamin = str(min(obj))
-                mintip = "min: "
-                datamax = str(max(obj))
-                maxtip = "max: "
+            if not defer:
+                datamin, datamax = _summary_data_range(obj)
+            mintip = "min: "
+            maxtip = "max: "
             
             sz = str(len(obj))
             sizetip = "length: "
@@ -2905,11 +2951,10 @@ def summarize_object_properties(objname, obj, namespace="Internal"):
             memsztip = "memory size: "
             
         elif isinstance(obj, set_types):
-            if len(obj) and all([isinstance(v, Number) for v in obj]):
-                datamin = str(min([v for v in obj]))
-                mintip = "min: "
-                datamax = str(max([v for v in obj]))
-                maxtip = "max: "
+            if not defer:
+                datamin, datamax = _summary_data_range(obj)
+            mintip = "min: "
+            maxtip = "max: "
             
             sz = str(len(obj))
             sizetip = "length: "
@@ -3004,27 +3049,10 @@ def summarize_object_properties(objname, obj, namespace="Internal"):
             # dtypetip = "dtype: "
             
             if obj.size > 0:
-                try:
-                    if np.all(np.isnan(obj[:])):
-                        datamin = str(np.nan)
-                        
-                    else:
-                        datamin = str(np.nanmin(obj))
-                except:
-                    pass
+                if not defer:
+                    datamin, datamax = _summary_data_range(obj)
                     
                 mintip = "min: "
-                    
-                try:
-                    if np.all(np.isnan(obj[:])):
-                        datamax = str(np.nan)
-                        
-                    else:
-                        datamax  = str(np.nanmax(obj))
-                        
-                except:
-                    pass
-                
                 maxtip = "max: "
                 
             sz = str(obj.size)
@@ -3079,6 +3107,10 @@ def summarize_object_properties(objname, obj, namespace="Internal"):
         result["Address"]       = {"display": hexaddress,   "tooltip" : f"Memory address in hex (decimal):\n{hexaddress} ({address})"}
         result["Icon"]          = icon
         
+        if defer:
+            for key in deferred_obj_summary_headers:
+                result[key] = {"display": DEFERRED_SUMMARY_TEXT, "tooltip": "calculating..."}
+        
         # NOTE: 2021-06-12 12:22:38
         # append namespace name to the tooltip at the entries other than Name, as well
         for key, value in result.items():
@@ -94,7 +94,7 @@ from imaging.axisutils import (axisTypeFromString,
                                axisTypeSymbol, 
                                axisTypeUnits, )
 
-from imaging.axiscalibration import (AxesCalibration, AxisCalibrationData,)
+from imaging.axiscalibration import (AxesCalibration, AxisCalibrationData, axesCalibration,)
 
 #from core import neo
 #from core import metaclass_solver
@@ -640,6 +640,9 @@ class ImageViewer(ScipyenFrameViewer, Ui_ImageViewerWindow):
         self._currentZoom_              = 0
         #self.complexDisplay            = ComplexDisplay.real # one of "real", "imag", "dual" "abs", "phase" (cmath.phase), "arg"
         self._currentFrameData_         = None
+        # NOTE: 2026-10-18 17:20:41
+        # optional callable frame -> 2D frame VigraArray (see view())
+        self._frame_reader_             = None
         
         # QGraphicsLineItems -- outside the roi/cursor GraphicsObject framework!
         self._scaleBarColor_             = QtGui.QColor(255, 255, 255)
@@ -1522,8 +1525,9 @@ class ImageViewer(ScipyenFrameViewer, Ui_ImageViewerWindow):
                 else:
                     img = self._data_
                     
-                xcal = axiscalibration.AxesCalibration(img.axistags[0])
-                ycal = axiscalibration.AxesCalibration(img.axistags[1])
+                # NOTE: 2026-10-18 14:59:02
+                # one (cached) AxesCalibration for both axes
+                xcal = ycal = axesCalibration(img)
                 
                 x_units = xcal.getUnits(img.axistags[0])
                 y_units = ycal.getUnits(img.axistags[1])
@@ -1920,7 +1924,10 @@ class ImageViewer(ScipyenFrameViewer, Ui_ImageViewerWindow):
             index = self.frameIndexBinding[self._current_frame_index_]
             dimindices = [index]
         
-            if all(isinstance(ndx, tuple) for ndx in index):
+            if self._frame_reader_ is not None and not all(isinstance(ndx, tuple) for ndx in index):
+                img_view = self._frame_reader_(index[1])
+                
+            elif all(isinstance(ndx, tuple) for ndx in index):
                 for ndx in index:
                     # NOTE: 2021-12-02 10:40:17
                     # axis infos are now axis indices (ints)
@@ -3002,15 +3009,16 @@ class ImageViewer(ScipyenFrameViewer, Ui_ImageViewerWindow):
         self.displayFrame()
         
         
-    def view(self, image, doc_title=None, normalize=True, colormap=None, gamma=None, frameAxis=None, displayChannel=None, asAlphaChannel=False, frameIndex=None, get_focus=True):
+    def view(self, image, doc_title=None, normalize=True, colormap=None, gamma=None, frameAxis=None, displayChannel=None, asAlphaChannel=False, frameIndex=None, get_focus=True, frameReader=None):
         # NOTE: 2020-09-24 14:19:57
         # this calls ancestor's instance method ScipyenFrameViewer.setData(...)
         # which then delegates back to _set_data() here.
         self.setData(image, doc_title=doc_title, normalize=normalize, colormap=colormap, gamma=gamma,
                      frameAxis=frameAxis, frameIndex=None, displayChannel=displayChannel, 
-                     asAlphaChannel=asAlphaChannel, get_focus=get_focus)
+                     asAlphaChannel=asAlphaChannel, get_focus=get_focus,
+                     frameReader=frameReader)
         
-    def _set_data_(self, data, normalize=True, colormap = None, gamma = None, tempColorMap = None, frameAxis=None, frameIndex=None, arrayAxes:(type(None), vigra.AxisTags) = None, displayChannel = None, doc_title:(str, type(None)) = None, asAlphaChannel:bool=False, *args, **kwargs):
+    def _set_data_(self, data, normalize=True, colormap = None, gamma = None, tempColorMap = None, frameAxis=None, frameIndex=None, arrayAxes:(type(None), vigra.AxisTags) = None, displayChannel = None, doc_title:(str, type(None)) = None, asAlphaChannel:bool=False, frameReader=None, *args, **kwargs):
         '''
         SYNTAX: self.view(image, title = None, normalize = True, colormap = None, gamma = None, separateChannels = False, frameAxis = None)
     
@@ -3031,10 +3039,18 @@ class ImageViewer(ScipyenFrameViewer, Ui_ImageViewerWindow):
             frameAxis: int, str, vigra.AxisInfo or None (default)
             
             displaychannel: int, "all", or None (default)
+            
+            frameReader: callable or None (default); when given, it is called 
+                with a frame index and returns that frame (a 2D VigraArray),
+                which is displayed instead of the corresponding slice of 
+                `image`; `image` then only provides the shape and axes of the
+                data (e.g. ScanData image data that is not loaded, with
+                ScanData.scansFrame as frameReader)
         '''
         
         self._imageNormalize     = normalize
         self._imageGamma         = gamma
+        self._frame_reader_      = frameReader if callable(frameReader) else None
         
         if isinstance(colormap, colormaps.colors.Colormap):
             self._colorMap = colormap
@@ -3087,7 +3103,7 @@ class ImageViewer(ScipyenFrameViewer, Ui_ImageViewerWindow):
                 self._data_  = data
                 self.frameIndex = frameIndex or range(self._data_frames_) # set by _parseVigraArrayData_
                 self._number_of_frames_ = len(self.frameIndex)
-                self._axes_calibration_ = AxesCalibration(data)
+                self._axes_calibration_ = axesCalibration(data)
                 self._setup_channels_display_actions_()
                 self.displayFrame(asAlphaChannel=asAlphaChannel)
                 
@@ -3130,7 +3146,7 @@ class ImageViewer(ScipyenFrameViewer, Ui_ImageViewerWindow):
             if self._parseVigraArrayData_(array_data):
                 self._data_  = array_data
                 self.frameIndex = frameIndex or range(self._number_of_frames_) # set by _parseVigraArrayData_
-                self._axes_calibration_ = AxesCalibration(array_data)
+                self._axes_calibration_ = axesCalibration(array_data)
                 self._setup_channels_display_actions_()
                 self.displayFrame(asAlphaChannel=asAlphaChannel)
             
@@ -3145,6 +3161,7 @@ class ImageViewer(ScipyenFrameViewer, Ui_ImageViewerWindow):
         self.framesQSlider.setMaximum(0)
         self.framesQSpinBox.setMaximum(0)
         self._data_ = None
+        self._frame_reader_ = None
         self._separateChannels           = False
         self.tStride                    = 0
         self.zStride                    = 0
@@ -64,6 +64,7 @@ from core.scipyen_config import (markConfigurable, confuse,
                                  saveWindowSettings, loadWindowSettings, )
 from core.workspacefunctions import *
 from core import scipyen_plugin_loader
+from core.lazyimport import (lazy_import, when_loaded)
 
 from imaging.scandata import (AnalysisUnit, ScanData,)
 from imaging.axiscalibration import (AxesCalibration,
@@ -73,7 +74,9 @@ from imaging.axiscalibration import (AxesCalibration,
 from imaging import axisutils, vigrautils
 from imaging import (imageprocessing as imgp, imgsim,)
 from systems import *
-from ephys import (ephys, membrane)
+from ephys import ephys
+# NOTE: 2026-10-18 15:51:24 loaded on first use; see also ScipyenWindow.__init__
+membrane = lazy_import("ephys.membrane")
 # from ephys import (ephys,)
 from .workspacemodel import WorkspaceModel
 from .workspacegui import (WorkspaceGuiMixin, DirectoryObserver)
@@ -191,6 +194,7 @@ import io
 import warnings
 import numbers
 import faulthandler
+import time
 import importlib
 import subprocess
 import platform
@@ -231,18 +235,21 @@ from scipy import io as sio
 from scipy import stats
 
 # for statistics
-import statsmodels.api as sm
-import statsmodels.formula.api as smf
-import statsmodels.stats as sms
-import statsmodels.regression as smr
-import patsy as pt
+# NOTE: 2026-10-18 15:51:24
+# these are made available in the console, but are not used at startup: they
+# are loaded on first use (see core.lazyimport)
+sm = lazy_import("statsmodels.api")
+smf = lazy_import("statsmodels.formula.api")
+sms = lazy_import("statsmodels.stats")
+smr = lazy_import("statsmodels.regression")
+pt = lazy_import("patsy")
 import pandas as pd  # for DataFrame and Series
-import pingouin as pn  # nicer stats
-import mpmath as mpm
-import researchpy as rp  # for use with DataFrames & stats
-import joblib as jl  # to use functions as pipelines: lightweight pipelining in Python
-import sklearn as sk  # machine learning, also nice plot_* functionality
-import seaborn as sb  # statistical data visualization
+pn = lazy_import("pingouin")  # nicer stats
+mpm = lazy_import("mpmath")
+rp = lazy_import("researchpy")  # for use with DataFrames & stats
+jl = lazy_import("joblib")  # to use functions as pipelines: lightweight pipelining in Python
+sk = lazy_import("sklearn")  # machine learning, also nice plot_* functionality
+sb = lazy_import("seaborn")  # statistical data visualization
 from qtconsole.svg import save_svg, svg_to_clipboard, svg_to_image
 # print("mainwindow.py __name__ =", __name__)
 # BEGIN matplotlib modules
@@ -961,8 +968,18 @@ class ScipyenWindow(__QMainWindow__, __UI_MainWindow__, WorkspaceGuiMixin):
     sig_newItemsInMonitoredDir = Signal(tuple, name="sig_newItemsInMonitoredDir")
     sig_itemsRemovedFromMonitoredDir = Signal(tuple, name="sig_itemsRemovedFromMonitoredDir")
     sig_itemsChangedInMonitoredDir = Signal(tuple, name="sig_itemsChangedInMonitoredDir")
+    sig_loadedFilesBatch = Signal(object, name="sig_loadedFilesBatch")
     
     _instance = None
+    
+    # NOTE: 2026-10-18 11:20:05
+    # Selections of at least this many files are loaded in parallel, by a pool
+    # of worker processes (see _openSelectedFileItemsParallel); loaded data is
+    # placed in the workspace in batches of at most loadedFilesBatchSize 
+    # objects, or every loadedFilesBatchInterval seconds
+    parallelLoadMinFiles = 4
+    loadedFilesBatchSize = 32
+    loadedFilesBatchInterval = 0.5
 
     # TODO: 2021-11-26 17:23:45 To add:
     # saveFile, runScript, showObj, sysOpen, editor
@@ -1484,6 +1501,7 @@ class ScipyenWindow(__QMainWindow__, __UI_MainWindow__, WorkspaceGuiMixin):
         
         # signal inherited from WindowManager
         self.sig_windowRemoved.connect(self.slot_windowRemoved)
+        self.sig_loadedFilesBatch[object].connect(self._slot_bindLoadedFilesBatch)
 
         # NOTE: 2020-10-22 13:30:54
         # self._nonInteractiveVars_ is updated in _init_QtConsole_()
@@ -1543,18 +1561,21 @@ class ScipyenWindow(__QMainWindow__, __UI_MainWindow__, WorkspaceGuiMixin):
         # finally, inject references to self and the workspace into relevant
         # NOTE: 2024-05-29 14:04:11
         # plugin modules already have this injected by slot_loadPlugins
+        # NOTE: 2026-10-18 15:51:24
+        # lazily imported modules (e.g. membrane) get these when loaded, so that
+        # the injection does not load them
         ws_aware_modules = (membrane,pgui, sigp, imgp, crvf, plots)
         # ws_aware_modules = (pgui, sigp, imgp, crvf, plots)
 
-        for m in ws_aware_modules:
+        def _inject_workspace(m):
             # NOTE: 2022-12-23 10:47:39
             # some modules provide plugin functionality which will trigger these
             # injections -- see slot_loadPlugins
-            if not hasattr(m, "mainWindow"):
-                m.__dict__["mainWindow"] = self
+            m.__dict__.setdefault("mainWindow", self)
+            m.__dict__.setdefault("workspace", self.workspace)
 
-            if not hasattr(m, "workspace"):
-                m.__dict__["workspace"] = self.workspace
+        for m in ws_aware_modules:
+            when_loaded(m, _inject_workspace)
 
         # NOTE: 2021-08-17 12:45:10 TODO
         # to be used with _run_loop_process_, which at the moment is not used
@@ -1784,24 +1805,10 @@ class ScipyenWindow(__QMainWindow__, __UI_MainWindow__, WorkspaceGuiMixin):
 
         self._current_GUI_style_name = val
         
-        if sys.platform == "win32":
-            if hasQDarkTheme:
-                QtGui.QIcon.setThemeName("breeze-dark")
-            else:
-                windowColor = QtWidgets.QApplication.palette().color(QtGui.QPalette.Window)
-                _,_,v,_ = windowColor.getHsv()
-                if v > 128:
-                    QtGui.QIcon.setThemeName("breeze")
-                else:
-                    QtGui.QIcon.setThemeName("breeze-dark")
-                    
-        elif sys.platform == "darwin":
-            windowColor = QtWidgets.QApplication.palette().color(QtGui.QPalette.Window)
-            _,_,v,_ = windowColor.getHsv()
-            if v > 128:
-                QtGui.QIcon.setThemeName("breeze")
-            else:
-                QtGui.QIcon.setThemeName("breeze-dark")
+        # NOTE: 2026-10-18 18:02:37
+        # the default icon theme is set at startup (see scipyen.py); here it
+        # only follows the palette of the new style
+        resources_rc.setDefaultIconTheme(darkStyle = hasQDarkTheme)
             
             
 
@@ -4713,7 +4720,11 @@ class ScipyenWindow(__QMainWindow__, __UI_MainWindow__, WorkspaceGuiMixin):
         self.menuFile.insertSeparator(self.actionQuit)
 
         # NOTE: 2016-05-02 12:22:21 -- refactoring plugin codes
-        self.startPluginLoad.connect(self.slot_loadPlugins)
+        # NOTE: 2026-10-18 15:51:24
+        # queued, so that plugins are loaded once the event loop is running
+        # i.e., after the main window is shown (startPluginLoad is emitted in
+        # __init__)
+        self.startPluginLoad.connect(self.slot_loadPlugins, QtCore.Qt.QueuedConnection)
         
         self.sig_refreshRecentFilesMenu.connect(self._slot_refreshRecentFilesMenu_)
 
@@ -5236,7 +5247,10 @@ class ScipyenWindow(__QMainWindow__, __UI_MainWindow__, WorkspaceGuiMixin):
                 
             file_urls = [u for u in valid_urls if os.path.isfile(u.path())]
             file_paths = [u.path() for u in file_urls]
-            self.loadFiles(file_paths, self._openSelectedFileItemsThreaded, updateUi=False)
+            if len(file_paths) >= self.parallelLoadMinFiles:
+                self.loadFiles(file_paths, self._openSelectedFileItemsParallel, updateUi=False)
+            else:
+                self.loadFiles(file_paths, self._openSelectedFileItemsThreaded, updateUi=False)
             
             if target_dir and os.path.isdir(target_dir):
                 self.slot_changeDirectory(target_dir)
@@ -5844,8 +5858,15 @@ class ScipyenWindow(__QMainWindow__, __UI_MainWindow__, WorkspaceGuiMixin):
         # which then calls self._openSelectedFileItemsThreaded in a separate 
         # GUI thread.
         # print(f"{self.__class__.__name__}.slot_openSelectedFileItems")
-        self.loadFiles(selectedItems, 
-                       self._openSelectedFileItemsThreaded, updateUi=False)
+        # NOTE: 2026-10-18 11:24:47
+        # large selections are decoded in parallel by worker processes, see
+        # self._openSelectedFileItemsParallel
+        if nItems >= self.parallelLoadMinFiles:
+            self.loadFiles(selectedItems, 
+                           self._openSelectedFileItemsParallel, updateUi=False)
+        else:
+            self.loadFiles(selectedItems, 
+                           self._openSelectedFileItemsThreaded, updateUi=False)
         # self.loadFiles(selectedItems, 
         #                self._openSelectedFileItemsThreaded, updateUi=True)
         
@@ -5906,6 +5927,85 @@ class ScipyenWindow(__QMainWindow__, __UI_MainWindow__, WorkspaceGuiMixin):
                 
         return OK
             
+    @safeWrapper
+    def _openSelectedFileItemsParallel(self, **kwargs):
+        """Parallel variant of _openSelectedFileItemsThreaded.
+        
+        Pass this as fileLoaderFn argument to self.loadFiles inherited from 
+        WorkspaceGuiMixin.
+        
+        Files are decoded by a pool of worker processes (see pictio.iterLoadFiles)
+        while this function runs in the worker thread created by self.loadFiles.
+        
+        The loaded data is sent to the GUI thread in batches, via the 
+        sig_loadedFilesBatch signal (see _slot_bindLoadedFilesBatch) so that
+        the workspace and its viewer are updated once per batch, and not once
+        per file.
+        
+        Loading is interrupted by the "Abort" button of the progress dialog 
+        (via self.loopControl); data already loaded is kept in the workspace.
+        """
+        filePaths = kwargs.pop("filePaths", None)
+        
+        if not isinstance(filePaths, (tuple, list)) or len(filePaths) == 0: 
+            return
+        
+        loopControl = kwargs.pop("loopControl", None)
+        progressSignal = kwargs.pop("progressSignal", None)
+        canceledSignal = kwargs.pop("canceledSignal", None)
+        ioReader = kwargs.pop("ioReader", None)
+        
+        if not isinstance(ioReader, typing.Callable):
+            ioReader=None
+            
+        # NOTE: the workspace viewer is updated by _slot_bindLoadedFilesBatch
+        self.updateUiWithFileLoad = True
+        
+        OK = True
+        batch = dict()
+        last_emit = time.perf_counter()
+        
+        for k, (fName, data, exc) in enumerate(pio.iterLoadFiles(filePaths, 
+                                                                 fileReader = ioReader,
+                                                                 loopControl = loopControl)):
+            if exc is not None:
+                scipywarn(f"Could not load {fName}: {exc}")
+                OK = False
+                
+            elif data is not None:
+                bName = strutils.str2symbol(os.path.splitext(os.path.basename(fName))[0])
+                batch[bName] = data
+                
+            if isinstance(progressSignal, QtCore.SignalInstance):
+                progressSignal.emit(k+1)
+                
+            if len(batch) >= self.loadedFilesBatchSize or \
+                (len(batch) and time.perf_counter() - last_emit >= self.loadedFilesBatchInterval):
+                self.sig_loadedFilesBatch.emit(batch)
+                batch = dict()
+                last_emit = time.perf_counter()
+                
+        if len(batch):
+            self.sig_loadedFilesBatch.emit(batch)
+            
+        if isinstance(loopControl, dict) and loopControl.get("break", None) == True:
+            if isinstance(canceledSignal, QtCore.SignalInstance):
+                canceledSignal.emit()
+                
+        return OK
+    
+    @Slot(object)
+    @safeWrapper
+    def _slot_bindLoadedFilesBatch(self, batch:dict):
+        """Places a batch of loaded data in the workspace, in the GUI thread.
+        See _openSelectedFileItemsParallel.
+        """
+        if not isinstance(batch, dict) or len(batch) == 0:
+            return
+        
+        self.workspace.update(batch)
+        self.workspaceModel.update()
+        
     @Slot(bool)
     @safeWrapper
     def slot_showFilesFilter(self, val):
@@ -6736,7 +6836,8 @@ class ScipyenWindow(__QMainWindow__, __UI_MainWindow__, WorkspaceGuiMixin):
     @Slot()
     @safeWrapper
     def _slot_copyToExternalWS(self):
-        from core.extipyutils_client import cmd_copy_to_foreign
+        from core.extipyutils_client import (cmd_copy_to_foreign, is_local_kernel,
+                                             cmd_foreign_namespace_delta)
         # get the model indices of the selected workspace model items
         indexList = [i for i in self.workspaceView.selectedIndexes()
                      if i.column() == 0]
@@ -6745,20 +6846,23 @@ class ScipyenWindow(__QMainWindow__, __UI_MainWindow__, WorkspaceGuiMixin):
         # headers = [k for k in standard_obj_summary_headers if k != "Icon"]
         wscol = self._wspace_headers_.index("Workspace")
         varnames = [self.workspaceModel.item(i.row(), 0).text() for i in indexList if self.workspaceModel.item(i.row(), wscol).text() == "Internal"]
-        ns = self.external_console.window.find_tab_title(self.external_console.window.active_frontend)
+        frontend = self.external_console.window.active_frontend
+        ns = self.external_console.window.find_tab_title(frontend)
+        # NOTE: 2026-10-18 15:31:05 use shared memory with kernels on this machine
+        shared = is_local_kernel(frontend.kernel_client)
         for varname in varnames:
             # print("_slot_copyToExternalWS: varname = %s , data = %s" % (varname, self.workspace[varname]))
-            self.external_console.execute(cmd_copy_to_foreign(varname, self.workspace[varname]),
+            self.external_console.execute(cmd_copy_to_foreign(varname, self.workspace[varname], shared=shared),
                                           where=ns)
 
         self.external_console.execute(
-            cmd_foreign_shell_ns_listing(namespace=ns))
+            cmd_foreign_namespace_delta(namespace=ns))
 
     @Slot()
     @safeWrapper
     def _slot_copyFromExternalWS(self):
         from core.utilities import standard_obj_summary_headers
-        from core.extipyutils_client import cmd_copies_from_foreign
+        from core.extipyutils_client import (cmd_copies_from_foreign, is_local_kernel)
 
         # get the model indices of the selected workspace model items
         indexList = [i for i in self.workspaceView.selectedIndexes()
@@ -6774,8 +6878,10 @@ class ScipyenWindow(__QMainWindow__, __UI_MainWindow__, WorkspaceGuiMixin):
             varnames = [self.workspaceModel.item(i.row(), 0).text() for i in indexList if self.workspaceModel.item(i.row(), wscol).text() == ns]
 
             if len(varnames):
+                frontend = self.external_console.window.get_frontend(ns)
+                shared = frontend is not None and is_local_kernel(frontend.kernel_client)
                 self.external_console.execute(
-                    cmd_copies_from_foreign(*varnames), where=ns)
+                    cmd_copies_from_foreign(*varnames, shared=shared), where=ns)
 
             # wsname = ns.replace("_", " ")
             # varnames = [self.workspaceModel.item(i.row(),0).text() for i in indexList if self.workspaceModel.item(i.row(), wscol).text() == wsname]
@@ -6823,7 +6929,10 @@ class ScipyenWindow(__QMainWindow__, __UI_MainWindow__, WorkspaceGuiMixin):
         #
         from core.extipyutils_client import (unpack_shell_channel_data,
                                              cmds_get_foreign_data_props,
-                                             cmd_foreign_shell_ns_listing,
+                                             cmd_foreign_namespace_delta,
+                                             cmd_probe_shared_memory,
+                                             end_probe_shared_memory,
+                                             has_local_address,
                                              )
 
         # print("_slot_ext_krn_shell_chnl_msg_recvd")
@@ -6869,6 +6978,16 @@ class ScipyenWindow(__QMainWindow__, __UI_MainWindow__, WorkspaceGuiMixin):
                 ns_listings = dict(
                     [(key, val) for key, val in vardict.items() if key.startswith("ns_listing_of_")])
 
+                # changes in the external kernel namespace, with the 
+                # properties of the added and modified variables
+                ns_deltas = dict(
+                    [(key, val) for key, val in vardict.items() if key.startswith("ns_delta_of_")])
+
+                # results of the shared memory probes (see 
+                # core.extipyutils_client.cmd_probe_shared_memory)
+                shm_probes = dict(
+                    [(key, val) for key, val in vardict.items() if key.startswith("shm_probe_of_")])
+
                 # this is needed here so that they don't clutter our own namespace
                 for key in prop_dicts.keys():
                     vardict.pop(key, None)
@@ -6876,6 +6995,17 @@ class ScipyenWindow(__QMainWindow__, __UI_MainWindow__, WorkspaceGuiMixin):
                 for key in ns_listings.keys():
                     vardict.pop(key, None)
 
+                for key in ns_deltas.keys():
+                    vardict.pop(key, None)
+
+                for key in shm_probes.keys():
+                    vardict.pop(key, None)
+
+                for key, val in shm_probes.items():
+                    ns_name = key.replace("shm_probe_of_", "")
+                    frontend = self.external_console.window.get_frontend(ns_name)
+                    end_probe_shared_memory(ns_name, getattr(frontend, "kernel_client", None), val)
+
                 # now vardict only has variables shuttled (via pickle) from the
                 # external kernel namespace into our own
                 # NOTE: 2023-06-28 22:30:51 WARNING
@@ -6915,6 +7045,26 @@ class ScipyenWindow(__QMainWindow__, __UI_MainWindow__, WorkspaceGuiMixin):
                                                                                                   namespace=msg["workspace_name"]),
                                                                       where=msg["parent_header"]["session"])
 
+                # NOTE: 2026-10-18 15:33:40
+                # one reply per refresh, with only the changed symbols and 
+                # their properties; see core.extipyutils_host.namespace_delta
+                for key, val in ns_deltas.items():
+                    ns_name = key.replace("ns_delta_of_", "")
+                    if ns_name != msg["workspace_name"] or not isinstance(val, dict):
+                        continue
+
+                    pending = self.workspaceModel.updateForeignNamespaceDelta(
+                        ns_name, msg["connection_file"], val)
+
+                    if pending is None:
+                        self.external_console.execute(cmd_foreign_namespace_delta(namespace=ns_name, reset=True),
+                                                      where=msg["parent_header"]["session"])
+
+                    elif len(pending) and val.get("reset", False):
+                        # the properties are not sent with a reset reply
+                        self.external_console.execute(cmd_foreign_namespace_delta(namespace=ns_name, properties=pending),
+                                                      where=msg["parent_header"]["session"])
+
         elif msg["msg_type"] == "kernel_info_reply":
             # print("\n\t** kernel_info_reply from %s" % msg["workspace_name"])
             # print("\n****** kernel_info_reply from %s\n" % msg["workspace_name"], msg, "\n********\n")
@@ -6926,13 +7076,24 @@ class ScipyenWindow(__QMainWindow__, __UI_MainWindow__, WorkspaceGuiMixin):
             #
             # pass
             # self.external_console.execute(cmd_foreign_shell_ns_listing(namespace=msg["workspace_name"].replace(" ", "_")),
-            self.external_console.execute(cmd_foreign_shell_ns_listing(namespace=msg["workspace_name"]),
+            self.external_console.execute(cmd_foreign_namespace_delta(namespace=msg["workspace_name"],
+                                                                      reset=msg["workspace_name"] not in self.workspaceModel.foreign_namespaces),
                                           where=msg["parent_header"]["session"])
 
+            # NOTE: 2026-10-18 16:22:40
+            # a kernel reached via a local address may still run on another 
+            # machine (e.g. via an SSH tunnel): shared memory is used for data
+            # transfers only after the kernel has read a probe segment
+            frontend = self.external_console.window.get_frontend(msg["workspace_name"])
+            if frontend is not None and has_local_address(frontend.kernel_client):
+                self.external_console.execute(cmd_probe_shared_memory(msg["workspace_name"]),
+                                              where=msg["parent_header"]["session"])
+
         elif msg["msg_type"] == "is_complete_reply":
             # print("\n\t** is_complete_reply from %s" % msg["workspace_name"])
             # print("\n****** is_complete_reply from %s\n"% msg["workspace_name"], msg, "\n********\n")
-            self.external_console.execute(cmd_foreign_shell_ns_listing(namespace=msg["workspace_name"]),
+            self.external_console.execute(cmd_foreign_namespace_delta(namespace=msg["workspace_name"],
+                                                                      reset=msg["workspace_name"] not in self.workspaceModel.foreign_namespaces),
                                           where=msg["parent_header"]["session"])
 
     def execute_in_external_console(self, call, where=None):
@@ -6956,14 +7117,14 @@ class ScipyenWindow(__QMainWindow__, __UI_MainWindow__, WorkspaceGuiMixin):
     @safeWrapper
     def _slot_ext_krn_restart(self, conndict):
         # print("mainWindow: _slot_ext_krn_restart %s" % conndict)
-        from core.extipyutils_client import cmd_foreign_shell_ns_listing
+        from core.extipyutils_client import cmd_foreign_namespace_delta
 
         ns_name = conndict["name"]
 
         signalBlocker = QtCore.QSignalBlocker(self.external_console.window)
 
         self.external_console.execute(
-            cmd_foreign_shell_ns_listing(namespace=ns_name))
+            cmd_foreign_namespace_delta(namespace=ns_name, reset=True))
 
     @safeWrapper
     def _import_python_module_file_(self, fileName):
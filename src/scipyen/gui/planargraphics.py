@@ -161,7 +161,7 @@ import sys, os, re, numbers, itertools, warnings, traceback
 import typing
 import math
 from collections import (ChainMap, namedtuple, defaultdict, OrderedDict,)
-from functools import (partial, partialmethod,)
+from functools import (partial, partialmethod, wraps,)
 from enum import (Enum, IntEnum,)
 from abc import (ABC, abstractmethod,)# ABCMeta)
 from copy import copy
@@ -311,6 +311,24 @@ def __constrain_square__(p0, p1):
             
     return QtCore.QPointF(x1, y1)
 
+# NOTE: 2026-10-18 16:09:12
+# source of PlanarGraphics.stateVersion values; a new value is taken at each
+# change, hence the versions of all PlanarGraphics only ever increase
+__state_versions__ = itertools.count(1)
+
+def __changes_state__(f):
+    """Decorator for the PlanarGraphics methods (and property setters) that 
+    change the states, or the current state, of the object.
+    """
+    @wraps(f)
+    def _wrapper(self, *args, **kwargs):
+        try:
+            return f(self, *args, **kwargs)
+        finally:
+            object.__setattr__(self, "_state_version_", next(__state_versions__))
+            
+    return _wrapper
+
 class PlanarGraphicsType(TypeEnum):
     """Enumeration of all supported graphical object types.
     Type name             type value  QGraphicsItem               Planar Descriptors
@@ -696,6 +714,9 @@ class PlanarGraphics():
     qt_path_composition_call = ""
     
     _default_label_ = ""
+    
+    # see stateVersion
+    _state_version_ = 0
    
     # NOTE: properties (descriptor names) do not belong here
     _required_attributes_ = ("_states_", "_currentframe_", "_currentstates_",
@@ -1394,6 +1415,7 @@ class PlanarGraphics():
             state = self.getState()
             if isinstance(state, Bunch):
                 state[name]=value
+                object.__setattr__(self, "_state_version_", next(__state_versions__))
             
         else:
             object.__setattr__(self, name, value)
@@ -1554,6 +1576,7 @@ class PlanarGraphics():
             return False # shouldn't reach here
             
                     
+    @__changes_state__
     def _applyFrameIndex_(self, frameindex:typing.Optional[typing.Iterable]=[],
                             sort=False, none_last=False):
         """Reassigns the z_frame values.
@@ -1689,6 +1712,7 @@ class PlanarGraphics():
         return QtCore.QPointF(position[0], position[1])
     
     @pos.setter
+    @__changes_state__
     def pos(self, value:QtCore.QPointF):
         if not all(s in self._planar_descriptors_ for s in ("x", "y")):
             return
@@ -1715,6 +1739,7 @@ class PlanarGraphics():
         return (None, None)
     
     @position.setter
+    @__changes_state__
     def position(self, x, y=None):
         if not all(s in self._planar_descriptors_ for s in ("x", "y")):
             return
@@ -1739,6 +1764,7 @@ class PlanarGraphics():
         
         self.updateLinkedObjects()
         
+    @__changes_state__
     def translate(self, dx, dy):
         descr = self.shapeDescriptors
         xDescr = [d for d in self.shapeDescriptors if "x" in d]
@@ -1811,6 +1837,19 @@ class PlanarGraphics():
         
         """
         return self.getState()
+    
+    @property
+    def stateVersion(self) -> int:
+        """Read-only. A number that increases with every change to the states,
+        or to the current state, of this object.
+        
+        Used to cache data derived from the states (e.g. the geometry of a 
+        path, see imaging.imageprocessing.pathGeometry).
+        
+        NOTE: Changes made directly to a state object (e.g. one returned by 
+        getState() or currentState) are not tracked.
+        """
+        return self._state_version_
         
     @property
     def currentFrame(self):
@@ -1836,6 +1875,7 @@ class PlanarGraphics():
         return self._currentframe_
         
     @currentFrame.setter
+    @__changes_state__
     def currentFrame(self, value):
         """Sets the frame index in "value" as the "current" frame.
         
@@ -1919,6 +1959,7 @@ class PlanarGraphics():
         return self._closed_
     
     @closed.setter
+    @__changes_state__
     def closed(self, value):
         if not isinstance(value, bool):
             raise TypeError("value expected to be a boolean; got %s instead" % type(value).__name__)
@@ -2010,6 +2051,7 @@ class PlanarGraphics():
             
         return ret
         
+    @__changes_state__
     def fromControlPath(self, path, frame:typing.Optional[int]=None):
         """Set this planar graphics' descriptor coordinates from a control Path.
         A control Path is a Path containing exclusively Move and Line primitives.
@@ -2146,6 +2188,7 @@ class PlanarGraphics():
         
         return ret
         
+    @__changes_state__
     def appendStates(self, other):
         """Joins the state descriptors of the "other" PlanarGraphics object to self.
         
@@ -2244,6 +2287,7 @@ class PlanarGraphics():
                 
     
     @deprecated
+    @__changes_state__
     def addState(self, state):
         """ Adds (inserts or appends) a state.
         DEPRECATED Please use setState instead
@@ -2422,6 +2466,7 @@ class PlanarGraphics():
                     
             f.setPos(self.x, self.y) # also calls _makeObject_() and update()
             
+    @__changes_state__
     def removeState(self, stateOrFrame):
         """Removes a state associated with a frame index or indices specified in "stateOrFrame".
         
@@ -2480,6 +2525,7 @@ class PlanarGraphics():
         else:
             raise TypeError("expecting an int, a Bunch, or a sequence of int or Bunch objects (no mixed types); got %s instead" % stateOrFrame)
         
+    @__changes_state__
     def setParameter(self, name, value, frame=None):
         """Sets the value of a named planar graphics descriptor.
         
@@ -2828,6 +2874,7 @@ class PlanarGraphics():
         if states:
             return states[0]
             
+    @__changes_state__
     def setFrameIndex(self, state:typing.Optional[typing.Union[Bunch, int]]=None, 
                       new_frame:typing.Optional[int]=None,
                       check_visible:bool=True,
@@ -3080,6 +3127,7 @@ class PlanarGraphics():
             raise TypeError("new_frame expected to be an int or None; got %sinstead" % type(new_frame).__name__)
         
                 
+    @__changes_state__
     def setState(self, state:Bunch, frame:typing.Optional[int], nFrames:typing.Optional[int]=None):
         """Sets/adds a state
         
@@ -3945,6 +3993,7 @@ class PlanarGraphics():
     def unlink(self):
         self.clearObjectLinks()
         
+    @__changes_state__
     def linkFrames(self, value):
         """Associates planar descriptor state values to frame indices.
         
@@ -3975,6 +4024,7 @@ class PlanarGraphics():
         """
         self.frameIndices = value
             
+    @__changes_state__
     def unlinkFrames(self):
         """Makes the current planar descriptor state common to all available data frames.
         DEPRECATED
@@ -3986,6 +4036,7 @@ class PlanarGraphics():
             states.z_frame = None
         self._states_[:] = states[:]
         
+    @__changes_state__
     def propagateState(self, state, destframes):
         """Creates copies of "state" to all frames in destframes.
         TODO
@@ -4040,6 +4091,7 @@ class PlanarGraphics():
         #if setcurrent:
             #self._currentframe_ = srcframe
                     
+    @__changes_state__
     def remapFrameStateAssociations(self, newmap):
         """Remaps the frame state associations.
         
@@ -4139,6 +4191,7 @@ class PlanarGraphics():
         return [s.z_frame for s in self._states_]
         
     @frameIndices.setter
+    @__changes_state__
     def frameIndices(self, values:typing.Optional[typing.Iterable]):
         """FIXME Re-assigns the z_frame values in existing states.
         
@@ -4414,6 +4467,7 @@ class PlanarGraphics():
             return state.x if "x" in self.shapeDescriptors else self().boundingRect().x()
     
     @x.setter
+    @__changes_state__
     def x(self, val:numbers.Number):
         state = self.currentState
         if state:
@@ -4430,6 +4484,7 @@ class PlanarGraphics():
             return state.y if "y" in self.shapeDescriptors else self().boundingRect().y()
         
     @y.setter
+    @__changes_state__
     def y(self, val:numbers.Number):
         state = self.currentState
         if state:
@@ -6783,6 +6838,7 @@ class Path(PlanarGraphics):
         except:
             return super().__getattr__(name)
             
+    @__changes_state__
     def __setitem__(self, key, value):
         if not isinstance(value, PlanarGraphics):
             raise TypeError("Expecting a PlanarGraphics objects; got %s instead" % type(value).__name__)
@@ -6827,6 +6883,7 @@ class Path(PlanarGraphics):
             
         return ret
     
+    @__changes_state__
     def __iadd__(self, other):
         if not isinstance(other, PlanarGraphics):
             raise TypeError("Expecting a PlanarGraphics object; got %s instead" % type(other).__name__)
@@ -6839,6 +6896,7 @@ class Path(PlanarGraphics):
             
         return self
             
+    @__changes_state__
     def __imul__(self, value):
         if not isinstance(value, int):
             raise TypeError("Expecting an int; got %s instead" % type(value).__name__)
@@ -6877,11 +6935,13 @@ class Path(PlanarGraphics):
         """
         return self._objects_.__reversed__()
     
+    @__changes_state__
     def appendStates(self, other):
         """ Overrides PlanarGraphics.appendStates() to flag that Path objects does not support this method
         """
         raise NotImplementedError("Path objects do not support this function; use appendStates on individual Path elements")
         
+    @__changes_state__
     def append(self, other):
         """Paths are appended as nested subpaths.
         To append all elements of another path, use appendStates().
@@ -6910,15 +6970,19 @@ class Path(PlanarGraphics):
             
         return self._objects_.count(other)
     
+    @__changes_state__
     def clear(self):
         self._objects_.clear()
         
+    @__changes_state__
     def pop(self, index):
         return self._objects_.pop(index)
     
+    @__changes_state__
     def extend(self, other):
         self.__iadd__(other)
         
+    @__changes_state__
     def translate(self, dx, dy):
         if len(self._objects_):
             states = self.getState(self.currentFrame)
@@ -6954,6 +7018,7 @@ class Path(PlanarGraphics):
 
         return self._objects_.index(other, *where)
             
+    @__changes_state__
     def insert(self, index, other):
         if isinstance(other, Path):
             if len(other):
@@ -6963,9 +7028,11 @@ class Path(PlanarGraphics):
         else:
             self._objects_.insert(index, other)
             
+    @__changes_state__
     def remove(self, other):
         self._objects_.remove(other)
         
+    @__changes_state__
     def reverse(self):
         """Reverses the order of the elements in this Path.
         """
@@ -6983,6 +7050,7 @@ class Path(PlanarGraphics):
         
         return all([isinstance(k, int) and self.validateState(state) for (k, state) in value.items()])
         
+    @__changes_state__
     def addState(self, state):
         """Adds a copy of state to each of its objects.
         Use with CAUTION.
@@ -7031,6 +7099,7 @@ class Path(PlanarGraphics):
             
         return self._objects_[path_slice]
     
+    @__changes_state__
     def remapFrameStateAssociations(self, newmaps):
         """Overrides PlanarGraphics.remapFrameStateAssociations, for Path objects.
         
@@ -7159,6 +7228,7 @@ class Path(PlanarGraphics):
         return x
         
     @x.setter
+    @__changes_state__
     def x(self, value):
         if len(self._objects_):
             # I need this cache below, to find out 'x'
@@ -7197,6 +7267,7 @@ class Path(PlanarGraphics):
         return y
         
     @y.setter
+    @__changes_state__
     def y(self, value):
         if len(self._objects_):
             # find out current y from a frame cache; do nothing if not visible
@@ -7235,6 +7306,7 @@ class Path(PlanarGraphics):
             return []
     
     @elementsFrameIndices.setter
+    @__changes_state__
     def elementsFrameIndices(self, value):
         """Parameter MUST be a sequence of nested sequences, of the same length as self.
         
@@ -7318,6 +7390,7 @@ class Path(PlanarGraphics):
             return []
     
     @frameIndices.setter
+    @__changes_state__
     def frameIndices(self, value):
         """Parameter MUST be a sequence of nested sequences, of the same length as self.
         
@@ -7429,6 +7502,7 @@ class Path(PlanarGraphics):
         return self._currentframe_
         
     @currentFrame.setter
+    @__changes_state__
     def currentFrame(self, value):
         if not isinstance(value, int):
             raise TypeError("expecting an int; got %s instead" % type(value).__name__)
@@ -7462,11 +7536,19 @@ class Path(PlanarGraphics):
         
         #return Path(states) if len(states) else None
         
+    @property
+    def stateVersion(self) -> int:
+        """Read-only. The largest of the state versions of this Path and of its 
+        elements (see PlanarGraphics.stateVersion).
+        """
+        return max(itertools.chain((self._state_version_, ), (o.stateVersion for o in self._objects_)))
+        
     @property
     def closed(self):
         return self._closed_
     
     @closed.setter
+    @__changes_state__
     def closed(self, value):
         if not isinstance(value, bool):
             raise TypeError("value expected to be a boolean; got %s instead" % type(value).__name__)
@@ -7517,9 +7599,11 @@ class Path(PlanarGraphics):
                 
         return points
         
+    @__changes_state__
     def setParameter(self, name, value, frame=None):
         raise NotImplementedError("Path objects do not support this method")
     
+    @__changes_state__
     def propagateState(self, frame, destframes):
         """Propagate the states at specified frame, to destframes
         """
@@ -7580,6 +7664,7 @@ class Path(PlanarGraphics):
         
         return list(filter(lambda o:o, obj_states))
         
+    @__changes_state__
     def removeState(self, value):
         for o in self._objects_:
             o.removeState(value)
@@ -7611,6 +7696,7 @@ class Path(PlanarGraphics):
                 
         return ret
         
+    @__changes_state__
     def fromControlPath(self, path, frame=None):
         if not isinstance(path, Path):
             raise TypeError("path argument expected to be a Path; got %s instead" % type(path).__name__)
@@ -7629,6 +7715,7 @@ class Path(PlanarGraphics):
         if control_state is None or len(control_state) == 0:
             return
         
+    @__changes_state__
     def linkFrames(self, value):
         if not isinstance(value, (tuple, list)):
             raise TypeError("Path.linkFrame() expects a sequence")
@@ -7640,6 +7727,7 @@ class Path(PlanarGraphics):
             if value[k] is not None and len(value[k]):
                 o.linkFrames(value[k]) # o.linkFrame() may raise its own error.
     
+    @__changes_state__
     def adoptPainterPath(self, p):
         """Re-composes this Path from a (possibly different) QPainterPath object.
         
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Cezar M. Tigaret <cezar.tigaret@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+"""Converts Python resource modules (generated by pyrcc5) to binary Qt
+resource files (.rcc), as generated by `rcc --binary`.
+
+The binary files are registered at run time with QResource.registerResource
+(see gui.resources_rc), which memory-maps them, instead of being imported as
+Python modules holding the resource data as bytes literals.
+
+Usage (from this directory):
+
+    python make_rcc.py [module_rc.py ...]
+
+Without arguments, converts all the breeze*_rc.py modules in this directory.
+
+Does not require Qt.
+"""
+
+import ast, os, struct, sys, glob
+
+RCC_MAGIC = b"qres"
+
+# NOTE: the format of the tree structure in resource modules generated for
+# Qt >= 5.8 (qt_resource_struct_v2)
+RCC_FORMAT_VERSION = 2
+
+def read_resource_module(fileName:str) -> dict:
+    """The bytes literals in a pyrcc5-generated module, without importing it.
+    """
+    with open(fileName, "rt") as src:
+        tree = ast.parse(src.read(), fileName)
+
+    ret = dict()
+
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            if isinstance(node.value, ast.Constant) and isinstance(node.value.value, bytes):
+                ret[node.targets[0].id] = node.value.value
+
+    return ret
+
+def make_rcc(data:bytes, names:bytes, tree:bytes, version:int = RCC_FORMAT_VERSION) -> bytes:
+    """A binary resource: the header, followed by the data, names and tree
+    sections (in the order written by rcc).
+    """
+    header_size = len(RCC_MAGIC) + 4 * 4
+
+    data_offset = header_size
+    names_offset = data_offset + len(data)
+    tree_offset = names_offset + len(names)
+
+    header = RCC_MAGIC + struct.pack(">iiii", version, tree_offset, data_offset, names_offset)
+
+    return b"".join([header, data, names, tree])
+
+def convert(moduleFile:str, rccFile:str = None) -> str:
+    """Writes the resources in a pyrcc5-generated module to a .rcc file.
+
+    Returns the name of the .rcc file: by default, the module file name with
+    the "_rc.py" suffix replaced by ".rcc"
+    """
+    literals = read_resource_module(moduleFile)
+
+    missing = [k for k in ("qt_resource_data", "qt_resource_name", "qt_resource_struct_v2") if k not in literals]
+
+    if len(missing):
+        raise ValueError(f"{moduleFile} is not a resource module (missing {', '.join(missing)})")
+
+    if rccFile is None:
+        base = os.path.basename(moduleFile)
+        if base.endswith("_rc.py"):
+            base = base[:-len("_rc.py")]
+        else:
+            base = os.path.splitext(base)[0]
+
+        rccFile = os.path.join(os.path.dirname(moduleFile), base + ".rcc")
+
+    rcc = make_rcc(literals["qt_resource_data"], literals["qt_resource_name"],
+                   literals["qt_resource_struct_v2"])
+
+    with open(rccFile, "wb") as dest:
+        dest.write(rcc)
+
+    return rccFile
+
+def main(args:list):
+    if len(args) == 0:
+        args = sorted(glob.glob(os.path.join(os.path.dirname(os.path.abspath(__file__)), "breeze*_rc.py")))
+
+    for moduleFile in args:
+        print(moduleFile, "→", convert(moduleFile))
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -3,35 +3,16 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 # SPDX-License-Identifier: LGPL-2.1-or-later
 
-from .resources import breeze_dark_rc
-from .resources import breeze_dark_16x16_rc
-from .resources import breeze_dark_22x22_rc
-from .resources import breeze_dark_8x8_rc
-from .resources import breeze_dark_actions_rc
-from .resources import breeze_dark_animations_rc
-from .resources import breeze_dark_applets_rc
-from .resources import breeze_dark_apps_rc
-from .resources import breeze_dark_categories_rc
-from .resources import breeze_dark_devices_rc
-from .resources import breeze_dark_emblems_rc
-from .resources import breeze_dark_emotes_rc
-from .resources import breeze_dark_mimetypes_rc
-from .resources import breeze_dark_places_rc
-from .resources import breeze_dark_preferences_rc
-from .resources import breeze_dark_status_rc
-from .resources import breeze_rc
-from .resources import breeze_16x16_rc
-from .resources import breeze_22x22_rc
-from .resources import breeze_actions_rc
-from .resources import breeze_animations_rc
-from .resources import breeze_applets_rc
-from .resources import breeze_apps_rc
-from .resources import breeze_categories_rc
-from .resources import breeze_devices_rc
-from .resources import breeze_emblems_rc
-from .resources import breeze_emotes_rc
-from .resources import breeze_mimetypes_rc
-from .resources import breeze_places_rc
-from .resources import breeze_preferences_rc
-from .resources import breeze_status_rc
+"""Scipyen's Qt resources.
+
+Importing this module registers Scipyen's own images (images_rc).
+
+The breeze and breeze-dark icon themes are NOT registered at import; they are
+registered on demand, by setIconTheme() (see core.icontheme, where these
+functions are defined; scipyen.py sets the default icon theme at startup).
+"""
+
 from . import images_rc
+
+from core.icontheme import (ICON_THEMES, systemIconTheme, registerIconTheme,
+                            setIconTheme, setDefaultIconTheme)
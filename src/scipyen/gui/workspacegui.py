@@ -1312,8 +1312,13 @@ class WorkspaceGuiMixin(GuiMessages, FileIOGui, ScipyenConfigurable):
                                                 nItems, self)
         progressDlg.setMinimumDuration(1000)
         progressDlg.canceled.connect(self._slot_breakLoop)
+        self.loopControl["break"] = False
         kw = {"filePaths": filePaths, "ioReader": ioReaderFn, "updateUi": updateUi}
-        workerThread = pgui.LoopWorkerThread(self, fileLoaderFn, **kw)
+        # NOTE: 2026-10-18 11:31:02
+        # pass loopControl on, so that the "Abort" button of the progress 
+        # dialog actually interrupts the file loading loop
+        workerThread = pgui.LoopWorkerThread(self, fileLoaderFn, 
+                                             loopControl = self.loopControl, **kw)
         workerThread.signals.signal_Progress[int].connect(progressDlg.setValue)
         workerThread.signals.signal_Result[object].connect(self.workerReady)
         workerThread.signals.signal_Finished.connect(progressDlg.reset)
@@ -25,7 +25,6 @@ event handlers preExecute() and post_execute().
 import gc
 import contextlib
 import itertools
-import seaborn as sb
 import numpy as np
 import matplotlib as mpl
 import matplotlib.mlab as mlb
@@ -39,6 +38,7 @@ import asyncio
 import warnings
 from copy import deepcopy
 from functools import partial
+from collections import OrderedDict
 import json
 
 from traitlets import Bunch
@@ -47,11 +47,15 @@ from .guiutils import (get_text_width, get_elided_text)
 from gui import pictgui as pgui
 from core.traitcontainers import DataBag
 from core.utilities import (summarize_object_properties,
+                            summarize_deferred_object_properties,
+                            defers_object_summary,
                             standard_obj_summary_headers,
                             safe_identity_test,
                             reverse_mapping_lookup,
                             )
 from core.strutils import (is_cached_output_varname, is_cached_input_varname)
+from core.fingerprint import fingerprint
+from core.lazyimport import lazy_import
 
 from core.prog import (safeWrapper, timefunc, processtimefunc, timeblock)
 from core.datatypes import TypeEnum
@@ -59,6 +63,9 @@ from core.datatypes import TypeEnum
 
 from qtpy import QtCore, QtGui, QtWidgets
 from qtpy.QtCore import Signal, Slot
+
+# NOTE: 2026-10-18 15:53:10 not needed at startup; see core.lazyimport
+sb = lazy_import("seaborn")
 # from PyQt5 import QtCore, QtGui, QtWidgets
 # from PyQt5.QtCore import Signal, Slot
 
@@ -73,6 +80,120 @@ class WorkspaceVarChange(TypeEnum):
     Modified = 2
     Removed = 4
 
+# NOTE: 2026-10-18 15:24:12
+# maximum number of object summaries cached by WorkspaceModel (see 
+# WorkspaceModel.objectSummary)
+ROW_SUMMARY_CACHE_SIZE = 4096
+
+class NamespaceSnapshot(object):
+    """Fingerprints of the variables in a namespace, at the last model update.
+    
+    diff() compares a namespace with the snapshot, and returns the names of the
+    variables added, removed and modified since then; the snapshot is then 
+    updated to the contents of the namespace.
+    
+    A variable is modified when its name is bound to a different object, or 
+    when the fingerprint of the object's contents has changed (see 
+    core.fingerprint); the fingerprint of an unchanged object is always the
+    same.
+    
+    Objects that keep track of their own changes (i.e., implement 
+    `__fingerprint__`, e.g. DataBag) are not digested: their (id, fingerprint)
+    is taken directly from their change counter.
+    """
+    def __init__(self):
+        self._fingerprints_ = dict()
+        
+    def __len__(self):
+        return len(self._fingerprints_)
+    
+    def __contains__(self, name):
+        return name in self._fingerprints_
+    
+    def key(self, name:str, value) -> tuple:
+        """The (id, fingerprint) of `value`; uses the snapshot when `value` is
+        the object bound to `name` at the last update (unless `value` tracks
+        its own changes, see `__fingerprint__`).
+        """
+        custom = self._customFingerprint_(value)
+        if custom is not None:
+            return custom
+        
+        ret = self._fingerprints_.get(name, None)
+        if ret is not None and ret[0] == id(value):
+            return ret
+        
+        return self.fingerprint(value)
+        
+    def clear(self):
+        self._fingerprints_.clear()
+        
+    def modified(self, name:str, value) -> bool:
+        """Whether `value` differs from the object bound to `name` at the last
+        update (a different object, or changed contents); True when `name` is
+        not in the snapshot.
+        """
+        return self._fingerprints_.get(name, None) != self.fingerprint(value)
+        
+    @staticmethod
+    def _customFingerprint_(value) -> typing.Optional[tuple]:
+        """The (id, fingerprint) of objects implementing `__fingerprint__`, 
+        without digesting them; None for all other objects.
+        """
+        custom = getattr(type(value), "__fingerprint__", None)
+        
+        if not callable(custom) or isinstance(value, type):
+            return
+        
+        try:
+            return (id(value), custom(value))
+        except:
+            return
+        
+    def fingerprint(self, value) -> tuple:
+        if isinstance(value, QtCore.QObject):
+            # NOTE: the contents of Qt objects are not monitored (as in 
+            # core.traitutils)
+            return (id(value), type(value))
+        
+        custom = self._customFingerprint_(value)
+        if custom is not None:
+            return custom
+        
+        try:
+            return (id(value), fingerprint(value))
+        except:
+            return (id(value), type(value))
+        
+    def diff(self, namespace:dict) -> Bunch:
+        """Returns the change set: a Bunch with the lists of variable names
+        `added`, `removed` and `modified`.
+        """
+        previous = self._fingerprints_
+        current = dict((name, self.fingerprint(value)) for name, value in namespace.items())
+        
+        self._fingerprints_ = current
+        
+        return Bunch(added = [n for n in current if n not in previous],
+                     removed = [n for n in previous if n not in current],
+                     modified = [n for n in current if n in previous and current[n] != previous[n]])
+
+def _deferredSummary(key:tuple, dataname:str, namespace:str, obj) -> tuple:
+    """Runs in a worker thread; see WorkspaceModel.objectSummary"""
+    return (key, dataname, namespace, summarize_deferred_object_properties(obj, namespace=namespace))
+
+def _rowRuns(rows:typing.Iterable[int]) -> list:
+    """Runs of consecutive row indices, as (first, count) in descending order"""
+    ret = list()
+    
+    for row in sorted(set(rows), reverse=True):
+        if len(ret) and ret[-1][0] == row + 1:
+            ret[-1] = (row, ret[-1][1] + 1)
+        else:
+            ret.append((row, 1))
+            
+    return ret
+
 
 class WorkspaceModel(QtGui.QStandardItemModel):
     '''
@@ -132,6 +253,17 @@ class WorkspaceModel(QtGui.QStandardItemModel):
         # NOTE: 2023-05-23 16:58:37
         # temporary cache of notified observer changes
         self.__changes__:typing.Dict[str, WorkspaceVarChange] = dict()
+        
+        # NOTE: 2026-10-18 15:21:07
+        # fingerprints of the displayed variables, at the last model update
+        self._namespaceSnapshot_ = NamespaceSnapshot()
+        
+        # NOTE: 2026-10-18 15:24:12
+        # object summaries (namespace, id, fingerprint) ↦ summary, see 
+        # self.objectSummary; and the keys of the summaries being completed in
+        # self.threadpool
+        self._rowSummaryCache_ = OrderedDict()
+        self._pendingSummaries_ = set()
 
         # NOTE: 2023-01-27 08:57:52 about _pylab_helpers.Gcf:
         # the `figs` attribute if an OrderedDict with:
@@ -211,6 +343,7 @@ class WorkspaceModel(QtGui.QStandardItemModel):
         self.new_vars.clear()
         self.deleted_vars.clear()
         self.internalVariablesMonitor.clear()
+        self._namespaceSnapshot_.clear()
 
     def removeForeignNamespace(self, wspace: dict):
         # print("workspaceModel to remove %s" % wspace)
@@ -633,10 +766,7 @@ class WorkspaceModel(QtGui.QStandardItemModel):
 
             removed_symbols = self.foreign_namespaces[ns_name]["current"] - initial
             # print("\tremoved_symbols", removed_symbols)
-            for vname in removed_symbols:
-                self.removeRowForVariable2(vname, ns=ns_name)
-                # self.removeRowForVariable(vname, ns=ns_name)
-                # self.removeRowForVariable(vname, ns = ns_name.replace("_", " "))
+            self._removeForeignRows_(ns_name, removed_symbols)
 
             added_symbols = initial - \
                 self.foreign_namespaces[ns_name]["current"]
@@ -647,6 +777,67 @@ class WorkspaceModel(QtGui.QStandardItemModel):
 
             self.foreign_namespaces[ns_name]["current"] -= self.foreign_namespaces[ns_name]["initial"]
 
+    def updateForeignNamespaceDelta(self, ns_name:str, cfile:str, delta:dict) -> typing.Optional[list]:
+        """Applies the changes in an external kernel's namespace.
+        
+        Parameters:
+        ==========
+        ns_name:str Name of the external kernel workspace
+        
+        cfile:str Fully qualified name of the connection file
+        
+        delta: dict - the reply of the external kernel to 
+            core.extipyutils_client.cmd_foreign_namespace_delta (see 
+            core.extipyutils_host.namespace_delta)
+            
+        Returns:
+        ========
+        A list with the symbols whose properties are still needed (e.g. after
+        a reset), possibly empty; or None when the delta cannot be applied 
+        because the namespace is unknown - the caller should then request a
+        reset.
+        
+        As for updateForeignNamespace, symbols in the "initial" set of the 
+        namespace are not shown.
+        """
+        if delta.get("reset", False):
+            self.updateForeignNamespace(ns_name, cfile, {"user_ns": set(delta.get("names", list()))})
+            
+        elif ns_name not in self.foreign_namespaces:
+            return None
+        
+        else:
+            symbols = self.foreign_namespaces[ns_name]
+            removed = set(delta.get("removed", list()))
+            
+            self._removeForeignRows_(ns_name, removed & symbols["current"])
+            
+            symbols["current"] -= removed
+            symbols["initial"] -= removed
+            symbols["current"] |= set(delta.get("added", list())) - symbols["initial"]
+            
+        current = self.foreign_namespaces[ns_name]["current"]
+        
+        properties = delta.get("properties", dict())
+        
+        prop_dicts = dict(("properties_of_%s" % name, props) for name, props in properties.items() if name in current)
+        
+        if len(prop_dicts):
+            self.updateFromExternal(prop_dicts)
+        
+        displayed = self._displayedRows_(ns_name)
+        
+        return sorted(name for name in current if name not in displayed and name not in properties)
+    
+    def _removeForeignRows_(self, ns_name:str, names:typing.Iterable[str]):
+        """Removes the rows of variables in an external kernel workspace, in
+        runs of consecutive rows.
+        """
+        rows = self._displayedRows_(ns_name)
+        
+        for first, count in _rowRuns(rows[name] for name in names if name in rows):
+            self.removeRows(first, count)
+            
     def clear(self):
         self.cached_vars.clear()
         self.modified_vars.clear()
@@ -654,6 +845,7 @@ class WorkspaceModel(QtGui.QStandardItemModel):
         self.deleted_vars.clear()
         # self.user_ns_hidden.clear()
         self.internalVariablesMonitor.clear()
+        self._namespaceSnapshot_.clear()
 
     def isDisplayable(self, ns, name, val):
         """Check if the name ↦ value binding is in the ns and should be shown in the viewer.
@@ -809,6 +1001,10 @@ class WorkspaceModel(QtGui.QStandardItemModel):
             self.__changes__[name] = WorkspaceVarChange.New
         elif change_type in ("remove", "removed"):
             self.__changes__[name] = WorkspaceVarChange.Removed
+        elif name in self.shell.user_ns and not self._namespaceSnapshot_.modified(name, self.shell.user_ns[name]):
+            # NOTE: 2026-10-18 16:19:48
+            # notified, but neither rebound nor changed since the last update
+            return
         elif change_type == "modified":
             self.__changes__[name] = WorkspaceVarChange.Modified
         else:   # for legacy (traitlets.TraitType-style) notifications
@@ -898,8 +1094,10 @@ class WorkspaceModel(QtGui.QStandardItemModel):
         # self.cached_vars = dict([item for item in self.shell.user_ns.items(
         # ) if not item[0].startswith("_") and self.isDisplayable(item[0], item[1])])
         
-        self.cached_vars = dict([item for item in self.shell.user_ns.items(
-        ) if self.isDisplayable(self.shell.user_ns, *item)])
+        # NOTE: 2026-10-18 15:21:07
+        # the namespace is no longer copied here: changes are detected after 
+        # execution, by comparing the namespace with the fingerprints taken at
+        # the previous update (see self._diffNamespace_)
 
 #         # NOTE: 2023-01-28 13:27:47
 #         # we also take a snapshot of the mpl figures
@@ -933,13 +1131,14 @@ class WorkspaceModel(QtGui.QStandardItemModel):
 #         # print(f"\npreExecute cached figs {self.cached_mpl_figs_in_internal}")
 
         # NOTE: 2023-06-07 08:39:15
-        # at this stage there may be variables not cached but still monitored
-        # we need to remove then from the monitor, but withhold notifications
+        # at this stage there may be variables no longer in the workspace but 
+        # still monitored; we need to remove then from the monitor, but withhold
+        # notifications
+        if len(self.internalVariablesMonitor) == 0:
+            return
+        
         with self.internalVariablesMonitor.observer.hold_trait_notifications():
-            observed_set = set(self.internalVariablesMonitor.keys())
-            cached_set = set(self.cached_vars)
-
-            observed_not_cached = observed_set - cached_set
+            observed_not_cached = set(self.internalVariablesMonitor.keys()) - set(self.shell.user_ns.keys())
             for var in observed_not_cached:
                 self.internalVariablesMonitor.pop(var, None)
 
@@ -1469,49 +1668,13 @@ class WorkspaceModel(QtGui.QStandardItemModel):
         # ###
         # 3. now, deal with everything else
         #
-        # ### BEGIN 2023-05-23 22:39:22 do not delete
-        #
-        # 3.1. establish which variables have been removed ⇒ del_vars
-        #
-        # symbols presend in the namespace
-        current_user_varnames = set(ns.keys())
-        # varnames that are currently monitored
-        observed_varnames = set(self.internalVariablesMonitor.keys())
-        # varnames that have been removed 
-        del_vars = observed_varnames - current_user_varnames
-        
-        # print(f"{self.__class__.__name__}._updateModel_ del_vars = {del_vars}")
-
-        # 3.2. now, remove these from the DataBag of observed variables (self.internalVariablesMonitor)
-        #
-        # NOTE: 2023-05-24 16:18:58
-        # The DataBag will NOW notify any observers upon the removal of these variables
-        # Works OK
-        self.internalVariablesMonitor.delete(*list(del_vars))
-
-        #
-        # 3.3. now, figure out whether there are NEW variables added to the workspace
-        # Their names are present in the workspace, but ABSENT in the DataBag of 
-        # observed variables.
-        #
-
-        # current_vars = dict([item for item in self.shell.user_ns.items() if not item[0].startswith("_") and self.isDisplayable(item[0], item[1])])
-        current_vars = dict([item for item in ns.items() if not item[0].startswith(
-            "_") and self.isDisplayable(ns, *item)])
-        
-        # print(f"{self.__class__.__name__}._updateModel_ current_vars = {current_vars}")
-
-        # NOTE: 2023-05-24 16:22:58
-        # this SHOULD also notify the observers - Works OK when adding new symbols
-        # does not work when an object bound to an existing symbol has been modified
-        # (i.e., either the symbols is bound to a different object reference, or
-        # the contents of the object have changed)
-        self.internalVariablesMonitor.update(current_vars)
-        
-        # NOTE 2023-05-25 18:13:46
-        # Changes of object attributes or data the object are NOT detected by this approach 
-        # (see TODO/FIXME 2023-05-25 18:12:56 in core/scipyen_traitlets.py)
-        # ### END 2023-05-23 22:39:22 do not delete
+        # NOTE: 2026-10-18 15:21:07
+        # Variables added, removed and modified since the last update are found
+        # by comparing the fingerprints of the displayable variables with those
+        # taken at the previous update, instead of pushing the whole namespace 
+        # through self.internalVariablesMonitor (which notified one variable at
+        # a time, and did not detect changes in the contents of the objects).
+        self._diffNamespace_(ns)
         
         # NOTE: 2023-06-01 08:16:13
         # see NOTE: 2023-06-01 08:14:33
@@ -1621,8 +1784,84 @@ class WorkspaceModel(QtGui.QStandardItemModel):
     def generateRowContents(self, dataname: str, 
                             data: object, 
                             namespace: str = "Internal"):
-        obj_props = summarize_object_properties(dataname, data, namespace=namespace)
+        obj_props = self.objectSummary(dataname, data, namespace=namespace)
         return self.genRowFromPropDict(obj_props)
+    
+    def objectSummary(self, dataname: str, data: object, namespace: str = "Internal") -> dict:
+        """Cached version of core.utilities.summarize_object_properties.
+        
+        Summaries are cached by the identity and the fingerprint of the object 
+        (see NamespaceSnapshot).
+        
+        For large objects (see core.utilities.defers_object_summary) the 
+        expensive columns are calculated in self.threadpool and are filled in
+        the workspace table when ready (see self._slot_deferredSummaryReady_).
+        """
+        key = (namespace, ) + self._namespaceSnapshot_.key(dataname, data)
+        
+        cached = self._rowSummaryCache_.get(key, None)
+        
+        if cached is not None:
+            self._rowSummaryCache_.move_to_end(key)
+            ret = dict((k, dict(v) if isinstance(v, dict) else v) for k, v in cached.items())
+            ret["Name"]["display"] = "%s" % dataname
+            return ret
+        
+        deferred = defers_object_summary(data)
+        
+        ret = summarize_object_properties(dataname, data, namespace=namespace, deferred=deferred)
+        
+        if deferred:
+            if key not in self._pendingSummaries_:
+                self._pendingSummaries_.add(key)
+                worker = pgui.GuiWorker(_deferredSummary, key, dataname, namespace, data)
+                worker.signals.signal_Result.connect(self._slot_deferredSummaryReady_)
+                self.threadpool.start(worker)
+                
+        else:
+            self._cacheSummary_(key, ret)
+            
+        return ret
+    
+    def _cacheSummary_(self, key:tuple, obj_props:dict):
+        self._rowSummaryCache_[key] = obj_props
+        self._rowSummaryCache_.move_to_end(key)
+        
+        while len(self._rowSummaryCache_) > ROW_SUMMARY_CACHE_SIZE:
+            self._rowSummaryCache_.popitem(last=False)
+            
+    @Slot(object)
+    def _slot_deferredSummaryReady_(self, value):
+        """Fills in the deferred columns of a row, calculated by a worker thread.
+        """
+        key, dataname, namespace, props = value
+        
+        self._pendingSummaries_.discard(key)
+        
+        if namespace != "Internal" or dataname not in self.shell.user_ns:
+            return
+        
+        data = self.shell.user_ns[dataname]
+        
+        # the variable may have been changed (or bound to another object) while
+        # the summary was being calculated
+        if (namespace, ) + self._namespaceSnapshot_.key(dataname, data) != key:
+            return
+        
+        wscol = standard_obj_summary_headers.index("Workspace")
+        rows = [item.row() for item in self.findItems(dataname, QtCore.Qt.MatchExactly, 0) if self.item(item.row(), wscol).text() == namespace]
+        if len(rows) == 0:
+            return
+        
+        row = rows[0]
+        
+        obj_props = summarize_object_properties(dataname, data, namespace=namespace, deferred=True)
+        obj_props.update(props)
+        self._cacheSummary_(key, obj_props)
+        
+        for header, propdict in props.items():
+            col = self._wspace_headers_.index(header)
+            self.setItem(row, col, self._generateModelItemForObject_(propdict))
 
     def genRowFromPropDict(self, obj_props: dict, 
                            background: typing.Optional[QtGui.QBrush] = None, 
@@ -1938,6 +2177,7 @@ class WorkspaceModel(QtGui.QStandardItemModel):
 
     def clearTable(self):
         self.removeRows(0, self.rowCount())
+        self._namespaceSnapshot_.clear()
 
 #     def update_old(self):
 #         """Updates workspace model.
@@ -1986,34 +2226,8 @@ class WorkspaceModel(QtGui.QStandardItemModel):
         internal variable monitor which triggers Ui updates already.
 
         """
-        # currently displayed variables in the viewer widget
-        displayed_var_names = set(self.getDisplayedVariableNames())
-        
-        # current variable names in the namespace, which should be available to
-        # the user - is this faster?
-        current_vars = dict(filter(lambda x: not x[0].startswith("_") and self.isDisplayable(self.shell.user_ns, *x), self.shell.user_ns.items()))
-        
-        # names of variables in user namespace
-        current_user_varnames = set(current_vars.keys())
-        # current_user_varnames = set(self.shell.user_ns.keys())
-
-        # names of variables present in the internalVariablesMonitor DataBag
-        observed_varnames = set(self.internalVariablesMonitor.keys())
-
-        # names still in internalVariablesMonitor but not in user namespace anymore
-        del_vars = observed_varnames - current_user_varnames
-
-        # current variable names in the namespace, which should be available to
-        # the user - CAUTION this scales with 𝒪(n) !
-        # current_vars = dict([item for item in self.shell.user_ns.items(
-        # ) if not item[0].startswith("_") and self.isDisplayable(item[0], item[1])])
-        
-        new_vars = dict(filter(lambda x: not x[0] in displayed_var_names, current_vars.items()))
-        
-        mod_vars = dict(filter(lambda x: x[0] in displayed_var_names, current_vars.items()))
-        
-        self.internalVariablesMonitor.delete(*list(del_vars)) # -> WorkspaceVarChange.Removed
-        self.internalVariablesMonitor.update(current_vars) # -> WorkspaceVarChange.New or WorkspaceVarChange.Modified
+        # NOTE: 2026-10-18 15:21:07 see NOTE: 2026-10-18 15:21:07 in _updateModel_
+        self._diffNamespace_(self.shell.user_ns)
             
         # try:
         #     self.internalVariableChanged.disconnect(self._slot_cacheInternalVariableChange_)
@@ -2074,6 +2288,113 @@ class WorkspaceModel(QtGui.QStandardItemModel):
 #             del self.internalVariablesListenerCB
                 
             
+    def _diffNamespace_(self, ns:dict) -> Bunch:
+        """Adds the changes in the displayable variables of `ns` since the last
+        update, to the pending changes (self.__changes__).
+        
+        Returns the change set (see NamespaceSnapshot.diff)
+        """
+        current_vars = dict(item for item in ns.items() if not item[0].startswith("_") and self.isDisplayable(ns, *item))
+        
+        changes = self._namespaceSnapshot_.diff(current_vars)
+        
+        self.__changes__.update((name, WorkspaceVarChange.Removed) for name in changes.removed)
+        self.__changes__.update((name, WorkspaceVarChange.New) for name in changes.added)
+        self.__changes__.update((name, WorkspaceVarChange.Modified) for name in changes.modified)
+        
+        return changes
+    
+    def _displayedRows_(self, ns_name:str = "Internal") -> dict:
+        """Maps the names of the variables displayed for the `ns_name` workspace
+        to their row indices.
+        """
+        wscol = standard_obj_summary_headers.index("Workspace")
+        
+        return dict((self.item(row, 0).text(), row) for row in range(self.rowCount()) if self.item(row, wscol).text() == ns_name)
+    
+    def _applyChangeSet_(self, ns:dict, removed:typing.Sequence[str], 
+                         added:typing.Sequence[str], modified:typing.Sequence[str],
+                         ns_name:str = "Internal"):
+        """Applies a change set to the model, in batches.
+        
+        Parameters:
+        ===========
+        ns: dict - the namespace
+        
+        removed, added, modified: sequences of variable names
+        
+        ns_name: str - the name of the workspace, as displayed in the model
+        
+        Rows of removed variables are removed in runs of consecutive rows; rows 
+        of modified variables are updated in place, and rows of added variables 
+        are inserted at the end of the model in one operation. The attached views
+        are notified once for each of these.
+        """
+        rows = self._displayedRows_(ns_name)
+        
+        # 1. removals
+        for first, count in _rowRuns(rows[name] for name in removed if name in rows):
+            self.removeRows(first, count)
+            
+        if any(name in rows for name in removed):
+            rows = self._displayedRows_(ns_name)
+            
+        # 2. modifications - including variables already shown, that are 
+        # reported as new (e.g., when the row was added directly by 
+        # addRowForVariable2)
+        updates = [name for name in itertools.chain(modified, added) if name in rows and name in ns]
+        additions = [name for name in itertools.chain(added, modified) if name not in rows and name in ns]
+        
+        updated = list()
+        
+        if len(updates):
+            blocked = self.blockSignals(True)
+            try:
+                for name in updates:
+                    v_row = self.generateRowContents(name, ns[name], ns_name)
+                    if v_row is None:
+                        continue
+                    
+                    self.updateRow(rows[name], v_row)
+                    updated.append(rows[name])
+                    
+            finally:
+                self.blockSignals(blocked)
+                
+            if len(updated):
+                self.dataChanged.emit(self.index(min(updated), 0), 
+                                      self.index(max(updated), self.columnCount()-1))
+        
+        # 3. additions
+        new_rows = list()
+        
+        for name in additions:
+            v_row = self.generateRowContents(name, ns[name], ns_name)
+            if v_row is not None:
+                new_rows.append(v_row)
+                
+        if len(new_rows):
+            first = self.rowCount()
+            self.insertRows(first, len(new_rows))
+            
+            blocked = self.blockSignals(True)
+            try:
+                for k, v_row in enumerate(new_rows):
+                    for col, item in enumerate(v_row):
+                        self.setItem(first + k, col, item)
+                        
+            finally:
+                self.blockSignals(blocked)
+                
+            self.dataChanged.emit(self.index(first, 0), 
+                                  self.index(first + len(new_rows) - 1, self.columnCount()-1))
+            
+        # BUG: 2023-09-16 09:55:11 see addRowForVariable2
+        for name in additions + updates:
+            data = ns[name]
+            if isinstance(data, QtWidgets.QWidget):
+                data.windowTitleChanged.connect(self._slot_itemGuiObjectTitleChanged)
+            
     @Slot(dict)
     def _slot_updateModelAsync_(self, namespace:dict):
         """Triggered by self.sig_startAsyncUpdate signal.
@@ -2083,39 +2404,21 @@ class WorkspaceModel(QtGui.QStandardItemModel):
         if len(self.__changes__) == 0:
             return
         
-        # removals = []
-        # additions = []
-        # modifications = []
-        
-        removals = list(filter(lambda x: x[1] == WorkspaceVarChange.Removed, self.__changes__.items()))
-        additions = list(filter(lambda x: x[1] == WorkspaceVarChange.New, self.__changes__.items()))
-        modifications = list(filter(lambda x: x[1] == WorkspaceVarChange.Modified, self.__changes__.items()))
+        removals = [name for name, change in self.__changes__.items() if change == WorkspaceVarChange.Removed]
+        additions = [name for name, change in self.__changes__.items() if change == WorkspaceVarChange.New]
+        modifications = [name for name, change in self.__changes__.items() if change == WorkspaceVarChange.Modified]
         
         # print(f"\n{self.__class__.__name__}._slot_updateModelAsync_ removals = {removals}")
         # print(f"\n{self.__class__.__name__}._slot_updateModelAsync_ additions = {additions}")
         # print(f"\n{self.__class__.__name__}._slot_updateModelAsync_ modifications = {modifications}")
         
-        
-        for item in removals:
-            # self.sig_varRemoved.emit(self.shell.user_ns, item[0], "Internal")
-            # self._varChanges_callbacks_[item[1]](self.shell.user_ns, item[0])
-            # print(f"\n{self.__class__.__name__}._slot_updateModelAsync_ for {item[0]} to call {self._varChanges_callbacks_[item[1]].func.__name__}")
-            self._varChanges_callbacks_[item[1]](item[0])
-        
-        for item in additions:
-            # self.sig_varAdded.emit(self.shell.user_ns, item[0], "Internal")
-            # self._varChanges_callbacks_[item[1]](self.shell.user_ns, item[0])
-            # print(f"\n{self.__class__.__name__}._slot_updateModelAsync_ for {item[0]} to call {self._varChanges_callbacks_[item[1]].func.__name__}")
-            self._varChanges_callbacks_[item[1]](item[0])
-        
-        for item in modifications:
-            # self.sig_varModified.emit(self.shell.user_ns, item[0], "Internal")
-            # print(f"\n{self.__class__.__name__}._slot_updateModelAsync_ for {item[0]} to call {self._varChanges_callbacks_[item[1]].func.__name__}")
-            # self._varChanges_callbacks_[item[1]](self.shell.user_ns, item[0])
-            self._varChanges_callbacks_[item[1]](item[0])
-
         self.__changes__.clear()
         
+        # NOTE: 2026-10-18 15:21:07
+        # apply the whole change set at once, instead of calling 
+        # self._varChanges_callbacks_ for each variable
+        self._applyChangeSet_(self.shell.user_ns, removals, additions, modifications)
+        
         self.modelContentsChanged.emit()
 
     def updateFromExternal(self, prop_dicts):
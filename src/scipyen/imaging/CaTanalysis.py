@@ -126,7 +126,7 @@ TODO:
 
 #### BEGIN core python modules
 # from __future__ import print_function
-import os, sys, traceback, inspect
+import os, sys, time, json, traceback, inspect
 # try:
 #     fi = inspect.getframeinfo(sys._getframe())
 #     of = inspect.getouterframes(sys._getframe())
@@ -209,7 +209,8 @@ from core.utilities import (get_nested_value, set_nested_value, counter_suffix,
                             yyMdd,
                             NestedFinder)
 
-from core.prog import (safeWrapper, safeGUIWrapper, scipywarn)
+from core.prog import (safeWrapper, safeGUIWrapper, scipywarn,
+                       process_pool, bounded_pool_map,)
 #import core.datasignal as datasignal
 from core.datasignal import (DataSignal, IrregularlySampledDataSignal)
 from core.datazone import DataZone
@@ -257,7 +258,7 @@ from imaging.scandata import (ScanDataType, ScanData, ScanDataAnalysisMode,
                               AnalysisUnit, check_apiversion, scanDataOptions)
 from imaging import axisutils
 from imaging.axisutils import dimEnum
-from imaging.axiscalibration import (AxesCalibration, 
+from imaging.axiscalibration import (AxesCalibration, axesCalibration,
                               AxisCalibrationData, 
                               ChannelCalibrationData,
                               CalibrationData,  
@@ -304,6 +305,35 @@ if os.environ["QT_API"] in ("pyqt5", "pyside2"):
 else:
     __UI_LSCaTWindow__, __QMainWindow__ = __loadUiType__(__ui_path__)#, import_from="gui")
 
+def _scanlinePoint(geometry, v_pos, span) -> tuple:
+    """Maps a position in the linescan row to (x, y) on a scanline path.
+    
+    geometry: imgp.PathGeometry of the scanline path
+    
+    v_pos: the position along the linescan row, in samples (pixels)
+    
+    span: the width of the linescan image, in samples
+    """
+    if len(geometry) == 0:
+        return (None, None)
+    
+    if len(geometry) == 1:
+        x, y = geometry.vertices[0]
+        
+    elif len(geometry) == 2 and geometry.linear: # linear interpolation between path's ends
+        x, y = v_pos * (geometry.vertices[1] - geometry.vertices[0]) / span + geometry.vertices[0]
+        
+    elif len(geometry) == int(span) and geometry.linear: # good chances this is 1 element per pixel in a scan row
+        x, y = geometry.vertices[int(v_pos)]
+        
+    else: # use the arc length along the path
+        x, y = geometry.pointsAt(v_pos)
+        
+        if np.isnan(x) or np.isnan(y):
+            return (None, None)
+        
+    return float(x), float(y)
+
 def vCursor2ScanlineProjection(v, path, span=None):
     """Maps the x coordinate for a vertical cursor in linescans space (x,y) coordinates on scanline path, in scene space.
     
@@ -319,99 +349,17 @@ def vCursor2ScanlineProjection(v, path, span=None):
         
         When None (the default) the span is taken to be the value of its "width"
         descriptor.
-    
-    """
-    
-    def _project_on_path_(value, p, cum_len):
-        obj_index = np.where(cum_len >= value)[0]
         
-        if len(obj_index):
-            obj_index = int(obj_index[0])
-            
-        else:
-            x = y = None
-            
-            return (x, y)
-            
-        obj = p[obj_index]
-        
-        x1, y1 = obj.x, obj.y
-        
-        if obj_index  == 0:
-            return (x1, y1) # assumes it is a Mmove
-        
-        x0, y0 = p[obj_index-1].x, p[obj_index-1].y
-        
-        rel_pos = value - cum_len[obj_index-1]
-            
-        element_len = cum_len[obj_index] - cum_len[obj_index-1] # faster than getting the element to calculate its own length
-        
-        if all([p in obj for p in ("c1x", "c1y", "c2x", "c2y")]):              # state of a Cubic
-            t = np.zeros((8,))
-            t[4:] = 1.
-            
-            c = np.array([[x0, y0], 
-                          [obj.c1x, obj.c1y], 
-                          [obj.c2x, obj.c2y],
-                          [x1, y1]])
-            
-            spline = interpolate.BSpline(t, c, 3, extrapolate=True)
-            
-            u = rel_pos/element_len
-            
-            x, y = spline(u)
-            
-        elif all([p in obj for p in ("cx", "cy")]):                             # state of a Quad
-            t = np.zeros((6,))
-            t[3:] = 1.
-            
-            c = np.array([[x0,y0], 
-                          [obj.cx, obj.cy], 
-                          [x1, y1]])
-            
-            spline = interpolate.BSpline(t, c, 2, extrapolate=True)
-            
-            u_val = rel_pos/element_len
-            
-            x, y = spline(u_val)
-            
-        else:                                                                   # state of Move or Line
-            dx = x1 - x0
-            dy = y1 - y0
-            
-            alpha = np.arctan
-            
-            if dx == 0:
-                if dy == 0: # point coincides with the coords of the previous point
-                    return (x1, y1)
-                
-                else:
-                    alpha = np.pi/2 if dy > 0 else np.pi * 3/2
-                    
-            elif dy == 0:
-                if dx == 0:
-                    return (x1, y1)
-                
-                else:
-                    alpha = 0 if dx > 0 else np.pi
-                    
-            else:
-                alpha = np.arctan((dy/dx))
-                
-            x = rel_pos * np.cos(alpha) + x0
-            y = rel_pos * np.sin(alpha) + y0
-            
-        return float(x), float(y)
+    NOTE: The geometry of the path is cached (see imageprocessing.pathGeometry)
+    so that repeated calls for the same path do not need to recalculate it.
     
+    """
     if not isinstance(v, pgui.Cursor):
         raise TypeError("Expecting a pictgui.Cursor for the first parameter; got %s instead" % type(v).__name__)
     
     if v.type != pgui.GraphicsObjectType.vertical_cursor:
         raise TypeError("Expecting a vertical cursor for the first parameter; got %s instead" % v.type)
     
-    #if not isinstance(path, pgui.PlanarGraphics):
-        #raise TypeError("Expecting a pictgui.PlanarGraphics for the second parameter; got %s instead" % type(path).__name__)
-    
     if not v.hasStateForFrame(v.currentFrame):
         raise RuntimeError("Vertical cursor %s has no state defined for frame %d" % (v.name, v.currentFrame))
     
@@ -434,38 +382,7 @@ def vCursor2ScanlineProjection(v, path, span=None):
     else:
         v_pos = v.x
         
-    if len(path) == 2: # linear interpolation between path's ends
-        dx = path[1].x - path[0].x
-        dy = path[1].y - path[0].y
-        
-        ret_x = v_pos * dx / span + path[0].x
-        ret_y = v_pos * dy / span + path[0].y
-        
-    elif len(path) > 2:
-        if any([any([p in o for p in ("cx", "cy", "c1x", "c1y", "c2x", "c2y")]) for o in path]): # there are Cubic and Quad states -> interpolate
-            path_len, pe_len = pgui.curveLength(path)
-        
-            cum_pe_len = np.cumsum(pe_len)
-            
-            ret_x, ret_y = _project_on_path_(v_pos, path, cum_pe_len)
-            
-        else: # assumes all have "x" and "y" attributes; if this is False, key errors & attribute erroes will be raised 
-            if len(path) == int(span): # good chances this is 1 element per pixel in a scan row
-                ret_x = path[int(v_pos)].x
-                ret_y = path[int(v_pos)].y
-                
-            else: # use interpolations
-                path_len, pe_len = pgui.curveLength(path)
-            
-                cum_pe_len = np.cumsum(pe_len)
-        
-                ret_x, ret_y =  _project_on_path_(v_pos, path, cum_pe_len)
-                
-    else: # len(path) is 1
-        ret_x = path[0].x
-        ret_y = path[0].y
-    
-    return (ret_x, ret_y)
+    return _scanlinePoint(imgp.pathGeometry(path), v_pos, span)
 
 def vCursorPos2ScanlineCoords(v, path, span=None):
     """Maps the x coordinate for a vertical cursor in linescans space (x,y) coordinates on scanline path, in scene space.
@@ -483,120 +400,10 @@ def vCursorPos2ScanlineCoords(v, path, span=None):
         When None (the default) the span is taken to be the value of its "width"
         descriptor.
     
-    """
-    
-    def _get_coords_for_proj_pos_on_path_(value, p, cum_len):
-        obj_index = np.where(cum_len >= value)[0]
-        
-        #print(obj_index)
-        
-        #print("_get_coords_for_proj_pos_on_path_ value ", value)
-        
-        if len(obj_index):
-            obj_index = int(obj_index[0])
-            
-        else:
-            #print("_get_coords_for_proj_pos_on_path_ obj not found")
-                    
-            x = y = None
-            
-            return (x, y)
-            
-        obj = p[obj_index]
-        
-        #print("_get_coords_for_proj_pos_on_path_ obj_index: %d, %s, %s" % (obj_index, type(obj).__name__, obj.type))
-        
-        x1, y1 = obj.x, obj.y
-        
-        if obj_index  == 0:
-            if isinstance(obj, pgui.Move):
-                #print("_get_coords_for_proj_pos_on_path_ return on first Move", (x1, y1))
-                return (x1, y1)
-                
-            x0 = y0 = 0.
-            rel_pos = value
-        
-        else:
-            x0, y0 = p[obj_index-1].x, p[obj_index-1].y
-            
-            #print(" prev object: %s, %s" % (type(p[obj_index-1]).__name__, p[obj_index-1].type), (x0, y0))
-            
-            rel_pos = value - cum_len[obj_index-1]
-            
-        
-        #print("_get_coords_for_proj_pos_on_path_ rel_pos", rel_pos)
-        
-        element_len = cum_len[obj_index] - cum_len[obj_index-1] # faster than getting the element to calculate its own length
-        
-        if isinstance(obj, (pgui.Line, pgui.Move)): # include Move for subpaths
-            dx = x1 - x0
-            dy = y1 - y0
-            
-            alpha = np.arctan
-            
-            if dx == 0:
-                if dy == 0: # points on the Line coincides with the coords of the previous point
-                    return (x1, y1)
-                
-                else:
-                    alpha = np.pi/2 if dy > 0 else np.pi * 3/2
-                    
-            elif dy == 0:
-                if dx == 0:
-                    return (x1, y1)
-                
-                else:
-                    alpha = 0 if dx > 0 else np.pi
-                    
-            else:
-                alpha = np.arctan((dy/dx))
-                
-            x = rel_pos * np.cos(alpha) + x0
-            y = rel_pos * np.sin(alpha) + y0
-            
-        elif isinstance(obj, pgui.Cubic):
-            #t = np.zeros((8,))
-            #t[4:] = 1.
-
-            #c = np.array([[x0, y0], [obj.c1x, obj.c1y], [obj.c2x, obj.c2y], [x1, y1]])
-            
-            #k = 3
-
-            #spline = interpolate.BSpline(t, c, k, extrapolate=True)
-            
-            spline = obj.makeBSpline([x0, y0])
-            
-            u = rel_pos/element_len
-            
-            x, y = spline(u)
-            
-        elif isinstance(obj, pgui.Quad):
-            #t = np.zeros((6,))
-            #t[3:] = 1.
-            
-            #c = np.array([[x0,y0], [obj.cx, obj.cy], [x1, y1]])
-            
-            #k = 2
-            
-            #spline = interpolate.BSpline(t, c, k, extrapolate=True)
-            
-            spline = obj.makeBSpline([x0, y0])
-            
-            u_val = rel_pos/element_len
-            
-            #x, y = interpolate.splev(u_val, tck)
-            x, y = spline(u_val)
-            
-            #print(" _get_coords_for_proj_pos_on_path_ on Quad", (x,y))
-            #return float(x), float(y)
-
-        else:
-            raise NotImplementedError("Function is not implemented for %s objects (:class: %s)" % (obj.type, type(obj).__name__))
-                    
-        #print("_get_coords_for_proj_pos_on_path_", (x,y))
-                    
-        return float(x), float(y)
+    NOTE: The geometry of the path is cached (see imageprocessing.pathGeometry)
+    so that repeated calls for the same path do not need to recalculate it.
     
+    """
     if not isinstance(v, pgui.Cursor):
         raise TypeError("Expecting a pictgui.Cursor for the first parameter; got %s instead" % type(v).__name__)
     
@@ -628,21 +435,16 @@ def vCursorPos2ScanlineCoords(v, path, span=None):
     # ATTENTION: a pgui.Path with two points (Move, Line) encapsulates a 
     # straight line segment !
     
-    #print("v.currentFrame", v.currentFrame)
+    frame = v.currentFrame if isinstance(v.currentFrame, int) else 0
     
-    if isinstance(v.currentFrame, int):
-        currentPath = path.asPath(v.currentFrame)
+    # NOTE: 2026-10-18 15:10:03
+    # raises NotImplementedError for path elements other than Move, Line, 
+    # Cubic and Quad
+    try:
+        geometry = imgp.pathGeometry(path, frame)
         
-    else:
-        currentPath = path.asPath(0)
-    
-    if currentPath is None or len(currentPath) == 0:
-        #warnings.warn("%s object has no state defined for frame %s" % (path.name, v.currentFrame), RuntimeWarning)
-        #raise RuntimeError("%s object has no state defined for frame %d" % (path.name, v.currentFrame))
-    
-        return None, None
-    
-    #print("vCursorPos2ScanlineCoords span", span)
+    except TypeError as e:
+        raise NotImplementedError("Only paths composed of line segments and cubic curves are supported") from e
     
     if v.x < 0:
         v_pos = 0
@@ -653,78 +455,27 @@ def vCursorPos2ScanlineCoords(v, path, span=None):
     else:
         v_pos = v.x
         
-    if all([isinstance(e, (pgui.Move, pgui.Line)) for e in currentPath]):
-        # a line segment, a polyline or a polygon of line segments
-        
-        if len(currentPath) == 2: 
-            # a simple line segment -- by definition it should span the entire 
-            # linescan width (span)
-            
-            assert currentPath.type & (pgui.GraphicsObjectType.line | pgui.GraphicsObjectType.polyline)
-            
-            dx = currentPath[1].x - currentPath[0].x
-            dy = currentPath[1].y - currentPath[0].y
-            
-            ret_x = v_pos * dx / span + currentPath[0].x
-            ret_y = v_pos * dy / span + currentPath[0].y
-                
-            #return ret_x, ret_y
-        
-        elif len(currentPath) > 2:
-            # NOTE: 2018-08-19 10:01:28
-            # there are three situations:
-            # a) there are as many elements as pixels in the linescan width 
-            # (i.e., the "span") => each element in the currentPath maps to 
-            # a sample along the linescan axis
-            #
-            # b) there are fewer elements than pixels in the span, which means
-            # we need to interpolate inside each of the scanline segments
-            #
-            # c) that there are more elements than pixels in the linescan width, 
-            # but I think this is practically impossible, as it would mean 
-            # the scanning trajectory was oversampled
-            #
-            # NOTE: 2018-09-20 21:54:53 Case (c) could actually happen when
-            # after concatenating linescan images fom scandata objects
-            # will result in linescan width smaller that the number of elements
-            # in the scanline path (in turn this will happen when the concatenated
-            # linescans need to be resampled along the spatial axis, followed by
-            # adjustments to the width of the linescan image)
-            
-            if len(currentPath) == int(span):
-                # case (a) -- straightforward
-                element = currentPath[int(v_pos)]
-                ret_x = element.x
-                ret_y = element.y
-                
-            else:
-                # all other cases
-                
-                path_len, pe_len = currentPath.curveLength()
-            
-                cum_pe_len = np.cumsum(pe_len)
-        
-                ret_x, ret_y =  _get_coords_for_proj_pos_on_path_(v_pos, currentPath, cum_pe_len)
-                
-        else: # len is 1 
-            ret_x = currentPath[0].x
-            ret_y = currentPath[0].y
-        
-    elif all([isinstance(e, (pgui.Move, pgui.Line, pgui.Cubic, pgui.Quad)) for e in currentPath]):
-        # a more complex shape, composed of Move, Line, Cubic and/or Quad
-        
-        path_len, pe_len = currentPath.curveLength()
-    
-        cum_pe_len = np.cumsum(pe_len)
-        
-        ret_x, ret_y = _get_coords_for_proj_pos_on_path_(v_pos, currentPath, cum_pe_len)
-                
-    else:
-        raise NotImplementedError("Only paths composed of line segments and cubic curves are supported")
-    
-    #print("vCursorPos2ScanlineCoords", (ret_x, ret_y))
+    # NOTE: 2018-08-19 10:01:28
+    # for polylines, there are three situations:
+    # a) there are as many elements as pixels in the linescan width 
+    # (i.e., the "span") => each element in the path maps to 
+    # a sample along the linescan axis
+    #
+    # b) there are fewer elements than pixels in the span, which means
+    # we need to interpolate inside each of the scanline segments
+    #
+    # c) that there are more elements than pixels in the linescan width, 
+    # but I think this is practically impossible, as it would mean 
+    # the scanning trajectory was oversampled
+    #
+    # NOTE: 2018-09-20 21:54:53 Case (c) could actually happen when
+    # after concatenating linescan images fom scandata objects
+    # will result in linescan width smaller that the number of elements
+    # in the scanline path (in turn this will happen when the concatenated
+    # linescans need to be resampled along the spatial axis, followed by
+    # adjustments to the width of the linescan image)
     
-    return (ret_x, ret_y)
+    return _scanlinePoint(geometry, v_pos, span)
 
 def mapScansVCToScenePCOnPath(v, p, path, span=None):
     """Maps the X coordinate of vertical cursor to a point cursor position on a path.
@@ -950,6 +701,9 @@ def analyseLSData(*args, **kwargs):
     =====================
     kwargs: named parameters for the module-level function analyseFrame()
     
+    See also batchAnalyseLSData, for the parallel analysis of many ScanData 
+    objects, with checkpoints.
+    
     """
     
     for data in args:
@@ -959,58 +713,476 @@ def analyseLSData(*args, **kwargs):
         for frame in range(data.scansFrames):
             analyseFrame(data, frame, **kwargs)
     
-#@safeWrapper
-def analyseEPSCaT(lsdata, frame, indicator_channel_ndx, 
-                  unit = None, reference_channel_ndx=None, do_fit = True,
-                  detrend=False):
-    """Calculates EPSCaT trace and optionally fits an EPSCaT model.
+def analyseFrames(lsdata:ScanData, frames=None, unit=None, indicator_channel_ndx=None, reference_channel_ndx=None, detrend=False, gen_long_fits=False, warm_start=True, max_workers=None, progressSignal=None, setMaxSignal=None, loopControl=None):
+    """Analyses several frames of a ScanData object, with EPSCaTs fitted in parallel.
     
-    The EPSCaT waveform is computed on an AnalysisUnit!
+    The EPSCaT traces of all frames are computed first; they are then fitted
+    by fitEPSCaTs in a pool of worker processes and finally, the analysis 
+    results are assembled for each frame by analyseFrame.
     
+    Modifies ScanData in place !
     Uses analysisOptions stored in lsdata.
     
+    Parameters:
+    ===========
     lsdata: a ScanData object
     
+    frames: sequence of int (frame indices) or None (default, for all frames)
+    
+    Named parameters:
+    =================
+    unit, indicator_channel_ndx, reference_channel_ndx, detrend, gen_long_fits:
+        see analyseFrame
+        
+    warm_start, max_workers: see fitEPSCaTs
+    
+    progressSignal, setMaxSignal: Signals with one int argument, or None 
+        (default); the progress is reported for the fitting stage, then for the
+        analysis of individual frames
+        
+    loopControl: dict {"break": bool}; set "break" to True to abort the analysis
+    
+    Returns:
+    ========
+    The fit statistics (see fitEPSCaTs), or None when the analysis options do
+    not require fitting.
     """
+    if frames is None:
+        frames = range(lsdata.scansFrames)
+        
+    # NOTE: 2026-10-18 14:24:36
+    # frame order matters for warm starts
+    frames = sorted(set(frames))
     
-    # NOTE 2018-08-02 15:50:46
-    # apply discriminant AFTER computing the EPSCaT waveform
-    # see NOTE:  2018-08-02 15:52:31 and NOTE: 2018-08-03 09:50:49
-    #
-    # NOTE: 2018-08-02 13:16:30
-    # compute waveform amplitude AFTER computing the EPSCaT
-    # so that if needed, we use the fitted delay
-    # see NOTE: 2018-08-02 13:10:32
-    #
+    def _canceled():
+        return isinstance(loopControl, dict) and loopControl.get("break", False) == True
     
-    # NOTE: 2018-08-03 09:31:28
-    # suitable defaults for discrimination
-    discr_func={'np.linalg.norm': {'axis': None, 'ord': None}}
-    discr_pred_func='lambda x,y: x/y'
-    discr_pred='lambda x,y: x >= y'
-    discr_value=1.3 
-    min_r2_discr = 0.5
-    discr_2D = True
+    setups = dict()
+    traces = dict()
+    
+    for frame in frames:
+        setups[frame] = _frameAnalysisSetup(lsdata, frame, unit, indicator_channel_ndx, reference_channel_ndx)
+        units, protocol, indicator, reference = setups[frame]
+        traces[frame] = frameEPSCaTs(lsdata, frame, units, indicator, reference, detrend=detrend)
+        
+    stats = None
+    fits = dict()
+    
+    if lsdata.analysisOptions["Fitting"].get("Fit", True):
+        fits, stats = fitEPSCaTs([(frame, trace) for frame in frames for u, trace in traces[frame]],
+                                 lsdata.analysisOptions["Fitting"]["Initial"],
+                                 (lsdata.analysisOptions["Fitting"]["Lower"], 
+                                  lsdata.analysisOptions["Fitting"]["Upper"]),
+                                 fitWindow = lsdata.analysisOptions["Intervals"]["Fit"],
+                                 integration = lsdata.analysisOptions["Intervals"]["Integration"][1],
+                                 warm_start = warm_start, max_workers = max_workers,
+                                 progressSignal = progressSignal, 
+                                 setMaxSignal = setMaxSignal,
+                                 loopControl = loopControl)
+        
+    if setMaxSignal is not None:
+        setMaxSignal.emit(len(frames))
+        
+    for k, frame in enumerate(frames):
+        if _canceled():
+            break
+        
+        units, protocol, indicator, reference = setups[frame]
+        
+        frameFits = dict((name, fitted) for (name, f), fitted in fits.items() if f == frame)
+        
+        analyseFrame(lsdata, frame, unit=unit, indicator_channel_ndx=indicator,
+                     reference_channel_ndx=reference, detrend=detrend,
+                     gen_long_fits=gen_long_fits, fits=frameFits, 
+                     traces=traces[frame])
+        
+        if progressSignal is not None:
+            progressSignal.emit(k+1)
+            
+    return stats
+    
+# NOTE: 2026-10-18 14:36:05
+# name of the checkpoint manifest file of iterBatchAnalyseLSData
+BATCH_MANIFEST = "manifest.json"
 
-    # NOTE: protocol will help establish the discrimination windows
-    # according to triggers if so required by the analysisOptions
+# ScanData loaded in a worker process of iterBatchAnalyseLSData, by file name
+_batchWorkerData = dict()
+
+def _readBatchManifest(checkpoint):
+    fileName = os.path.join(checkpoint, BATCH_MANIFEST)
     
-    protocol = None
+    if not os.path.isfile(fileName):
+        return
+    
+    with open(fileName, "r") as manifestFile:
+        return json.load(manifestFile)
+    
+def _writeBatchManifest(checkpoint, manifest):
+    # NOTE: write to a temporary file, then replace, so that an interruption
+    # never leaves a truncated manifest behind
+    fileName = os.path.join(checkpoint, BATCH_MANIFEST)
+    tmpFileName = fileName + ".tmp"
+    
+    with open(tmpFileName, "w") as manifestFile:
+        json.dump(manifest, manifestFile, indent = 1)
+        
+    os.replace(tmpFileName, fileName)
+    
+def _checkScansSegments(lsdata):
+    """Makes sure lsdata.scansBlock has one segment for each scans frame
+    """
+    if len(lsdata.scansBlock.segments) != lsdata.scansFrames:
+        lsdata.scansBlock.segments.clear()
+        lsdata.scansBlock.segments[:] = [neo.Segment() for f in range(lsdata.scansFrames)]
+        
+def _loadBatchData(fileName):
+    lsdata = pio.loadPickleFile(fileName)
     
     if not isinstance(lsdata, ScanData):
-        raise TypeError("First parameters was expected to be a datatypes.ScanData; got %s instead" % type(lsdata).__name__)
+        raise TypeError("%s does not contain a ScanData object" % fileName)
     
-    if len(lsdata.scans) == 0:
-        raise ValueError("no linescan data was found in %s" % lsdata.name)
+    _checkScansSegments(lsdata)
     
-    if lsdata.scanType != ScanDataType.linescan:
-        raise ValueError("%s was expected to be a ScanDataType.linescan experiment; it has %s instead" % (lsdata.name,lsdata.scanType))
+    return lsdata
+
+def _batchAnalyseFrame(job, detrend=False, gen_long_fits=False):
+    """Runs in a worker process of iterBatchAnalyseLSData.
+    
+    job: tuple (key, fileName, frame)
+    
+    Returns a tuple (segment name, analogsignals, events) with the analysis 
+    results in the frame.
+    """
+    key, fileName, frame = job
+    
+    lsdata = _batchWorkerData.get(fileName, None)
+    
+    if lsdata is None:
+        # NOTE: jobs are submitted in data order; keep one ScanData per worker
+        _batchWorkerData.clear()
+        lsdata = _loadBatchData(fileName)
+        _batchWorkerData[fileName] = lsdata
         
-    if lsdata.analysisMode != ScanDataAnalysisMode.frame:
-        raise ValueError("%s was expected to have a ScanDataAnalysisMode.frame analysis mode; it has %s instead" % (lsdata.name, lsdata.analysisMode))
+    analyseFrame(lsdata, frame, detrend=detrend, gen_long_fits=gen_long_fits)
+    
+    segment = lsdata.scansBlock.segments[frame]
+    
+    signals = list(segment.analogsignals)
+    events = list(segment.events)
+    
+    # NOTE: do not send the whole scans block back with the results
+    for obj in signals + events:
+        obj.segment = None
         
-    if len(lsdata.analysisOptions) == 0:
-        raise ValueError("%s has no analysis options" % lsdata.name)
+    return segment.name, signals, events
+
+def _applyBatchResult(lsdata, frame, result):
+    name, signals, events = result
+    segment = lsdata.scansBlock.segments[frame]
+    segment.analogsignals = signals
+    segment.events = events
+    segment.name = name
+    
+def iterBatchAnalyseLSData(checkpoint, sources=None, detrend=False, gen_long_fits=False, max_workers=None, progressSignal=None, loopControl=None):
+    """Batch (re-)analysis of ScanData objects in a pool of worker processes.
+    
+    Each frame of each ScanData is analysed by analyseFrame() in a worker 
+    process (unlike in analyseFrames, the EPSCaTs are not warm-started). 
+    
+    The progress is saved to the `checkpoint` directory after each frame, so 
+    that an interrupted batch analysis is resumed by calling this function 
+    again with the same checkpoint directory. Resuming also retries the 
+    ScanData that could not be loaded, the frames that failed, and the reports
+    that could not be generated.
+    
+    Generator yielding (key, report, errors) tuples, for each ScanData, when 
+    all its frames have been analysed:
+    
+    key: str, identifies the ScanData in the checkpoint directory
+    report: pandas.DataFrame with the analysis results (see reportUnitAnalysis),
+        or None when the report could not be generated
+    errors: dict mapping frame indices (or "data", "report") to error messages
+    
+    The analysed ScanData objects are saved in the "analysed" subdirectory of
+    `checkpoint` and their reports, in the "reports" subdirectory.
+    
+    This does not require LSCaTWindow (or a GUI).
+    
+    Parameters:
+    ===========
+    checkpoint: str, path of the checkpoint directory (created if needed)
+    
+    sources: sequence of ScanData objects and/or names of pickle files 
+        containing ScanData objects. 
+        
+        ScanData objects are saved to the "inputs" subdirectory of checkpoint,
+        for the worker processes. The ScanData objects are modified in place,
+        as in analyseLSData.
+        
+        Ignored when resuming, i.e. when checkpoint contains a manifest file.
+        
+    Named parameters:
+    =================
+    detrend, gen_long_fits: see analyseFrame; ignored when resuming (the values
+        used when the batch analysis was started are used)
+        
+    max_workers: int, default is the number of CPUs
+    
+    progressSignal: a Signal with one int argument (the number of frames 
+        analysed so far), or None
+        
+    loopControl: dict {"break": bool}; set "break" to True to interrupt the
+        batch analysis (it can be resumed later)
+        
+    """
+    checkpoint = os.path.abspath(checkpoint)
+    
+    os.makedirs(checkpoint, exist_ok = True)
+    
+    for subdir in ("inputs", "results", "analysed", "reports"):
+        os.makedirs(os.path.join(checkpoint, subdir), exist_ok = True)
+        
+    manifest = _readBatchManifest(checkpoint)
+    
+    loaded = dict() # key ↦ ScanData, for objects given in sources
+    
+    if manifest is None:
+        if sources is None or len(sources) == 0:
+            return
+        
+        manifest = {"options": {"detrend": detrend, "gen_long_fits": gen_long_fits},
+                    "data": list(), "done": dict(), "failed": dict(), 
+                    "complete": list()}
+        
+        keys = list()
+        
+        for source in sources:
+            if isinstance(source, str):
+                key = strutils.str2symbol(os.path.splitext(os.path.basename(source))[0])
+                
+            elif isinstance(source, ScanData):
+                key = strutils.str2symbol(source.name) if len(source.name.strip()) else "scandata"
+                
+            else:
+                raise TypeError("Expecting a ScanData or a file name; got %s instead" % type(source).__name__)
+            
+            key = counter_suffix(key, keys)
+            keys.append(key)
+            
+            if isinstance(source, ScanData):
+                _checkScansSegments(source)
+                fileName = os.path.join(checkpoint, "inputs", "%s.pkl" % key)
+                pio.savePickleFile(source, fileName, outOfBand = True)
+                loaded[key] = source
+                
+            else:
+                fileName = os.path.abspath(source)
+                
+            manifest["data"].append({"key": key, "source": fileName})
+            
+        _writeBatchManifest(checkpoint, manifest)
+        
+    elif sources is not None:
+        warnings.warn("Resuming the batch analysis in %s; 'sources' is ignored" % checkpoint, RuntimeWarning)
+        
+    detrend = manifest["options"]["detrend"]
+    gen_long_fits = manifest["options"]["gen_long_fits"]
+    
+    # NOTE: 2026-10-18 14:38:22
+    # ScanData of the resumed batch that were completed in a previous run
+    for entry in manifest["data"]:
+        key = entry["key"]
+        
+        if key in manifest["complete"]:
+            report = pio.loadPickleFile(os.path.join(checkpoint, "reports", "%s.pkl" % key))
+            yield key, report, dict(manifest["failed"].get(key, dict()))
+            
+    opened = dict()     # key ↦ [ScanData, set of frames not yet analysed]
+    loadErrors = list() # (key, error message)
+    
+    def _canceled():
+        return isinstance(loopControl, dict) and loopControl.get("break", False) == True
+    
+    def _resultFileName(key, frame):
+        return os.path.join(checkpoint, "results", "%s_%d.pkl" % (key, frame))
+    
+    def _jobs():
+        # NOTE: ScanData are loaded in the calling process when their frames 
+        # are submitted (the number of jobs in flight is bounded, so only a
+        # few are open at any time)
+        for entry in manifest["data"]:
+            key = entry["key"]
+            
+            if key in manifest["complete"]:
+                continue
+            
+            try:
+                lsdata = loaded.pop(key, None)
+                
+                if lsdata is None:
+                    lsdata = _loadBatchData(entry["source"])
+                    
+                done = manifest["done"].get(key, list())
+                
+                for frame in done:
+                    _applyBatchResult(lsdata, frame, pio.loadPickleFile(_resultFileName(key, frame)))
+                    
+            except Exception as e:
+                loadErrors.append((key, "%s: %s" % (type(e).__name__, e)))
+                continue
+            
+            # loaded now, after failing in a previous run
+            manifest["failed"].get(key, dict()).pop("data", None)
+            
+            remaining = [f for f in range(lsdata.scansFrames) if f not in done]
+            
+            opened[key] = [lsdata, set(remaining)]
+            
+            for frame in remaining:
+                yield (key, entry["source"], frame)
+                
+    def _finish(key):
+        lsdata, _ = opened.pop(key)
+        
+        errors = dict((int(f), msg) for f, msg in manifest["failed"].get(key, dict()).items())
+        
+        try:
+            if len(lsdata.analysisUnits):
+                report = reportUnitAnalysis(lsdata, analysis_unit=sorted(lsdata.analysisUnits, key = lambda x: x.name))
+            else:
+                report = reportUnitAnalysis(lsdata, analysis_unit=None)
+                
+            pio.savePickleFile(report, os.path.join(checkpoint, "reports", "%s.pkl" % key))
+            
+        except Exception as e:
+            report = None
+            errors["report"] = "%s: %s" % (type(e).__name__, e)
+            
+        pio.savePickleFile(lsdata, os.path.join(checkpoint, "analysed", "%s.pkl" % key), outOfBand = True)
+        
+        # NOTE: 2026-10-18 17:48:30
+        # with errors, the ScanData is not complete: resuming the batch 
+        # analysis retries its failed frames (and its report)
+        if len(errors) == 0:
+            manifest["complete"].append(key)
+            
+        _writeBatchManifest(checkpoint, manifest)
+        
+        return key, report, errors
+    
+    def _loadFailures():
+        while len(loadErrors):
+            key, msg = loadErrors.pop(0)
+            manifest["failed"][key] = {"data": msg} # retried when resuming
+            _writeBatchManifest(checkpoint, manifest)
+            yield key, None, {"data": msg}
+            
+    def _idle():
+        # opened ScanData with no frames left to analyse
+        return [key for key, (_, remaining) in opened.items() if len(remaining) == 0]
+            
+    nDone = 0
+    
+    executor = process_pool(max_workers)
+    
+    try:
+        for job, future in bounded_pool_map(executor, _batchAnalyseFrame, _jobs(),
+                                            loopControl = loopControl,
+                                            detrend = detrend, 
+                                            gen_long_fits = gen_long_fits):
+            key, fileName, frame = job
+            lsdata, remaining = opened[key]
+            
+            try:
+                result = future.result()
+                pio.savePickleFile(result, _resultFileName(key, frame))
+                _applyBatchResult(lsdata, frame, result)
+                manifest["done"].setdefault(key, list()).append(frame)
+                manifest["failed"].get(key, dict()).pop(str(frame), None)
+                
+            except Exception as e:
+                manifest["failed"].setdefault(key, dict())[str(frame)] = "%s: %s" % (type(e).__name__, e)
+                
+            remaining.discard(frame)
+            _writeBatchManifest(checkpoint, manifest)
+            
+            nDone += 1
+            
+            if progressSignal is not None:
+                progressSignal.emit(nDone)
+                
+            yield from _loadFailures()
+            
+            for k in _idle():
+                yield _finish(k)
+                
+    finally:
+        executor.shutdown(wait = not _canceled(), cancel_futures = True)
+        
+    if _canceled():
+        return
+    
+    yield from _loadFailures()
+    
+    for k in _idle():
+        yield _finish(k)
+        
+def batchAnalyseLSData(checkpoint, sources=None, **kwargs):
+    """Batch (re-)analysis of ScanData objects, with checkpoints.
+    
+    Calls iterBatchAnalyseLSData and collates the reports of all ScanData 
+    objects (see collateReports).
+    
+    Parameters:
+    ===========
+    checkpoint: str, path of the checkpoint directory
+    
+    sources: sequence of ScanData objects and/or pickle file names, or None
+        (when resuming an interrupted batch analysis)
+        
+    Var-keyword parameters:
+    =======================
+    Passed to iterBatchAnalyseLSData
+    
+    Returns:
+    ========
+    A pandas.DataFrame with the collated reports (or None when there are no 
+    reports) and a dict mapping the ScanData keys to the errors, if any.
+    """
+    reports = list()
+    errors = dict()
+    
+    for key, report, err in iterBatchAnalyseLSData(checkpoint, sources, **kwargs):
+        if isinstance(report, pd.DataFrame) and len(report):
+            reports.append(report)
+            
+        if len(err):
+            errors[key] = err
+            
+    return collateReports(reports), errors
+    
+def epscatWindow(lsdata, frame, unit=None):
+    """Spatial boundaries of the EPSCaT for an analysis unit in a frame.
+    
+    Parameters:
+    ===========
+    lsdata: a ScanData object
+    
+    frame: int, the frame index
+    
+    unit: an AnalysisUnit, a vertical scans cursor, the name of an AnalysisUnit,
+        or None (for the analysis unit defined on the entire data)
+        
+    Returns:
+    ========
+    A tuple (roiRange, epscatname, protocol) where roiRange is a [start, stop]
+    list of pixel indices along the x axis of the linescans, epscatname is the 
+    name of the EPSCaT signal and protocol is the TriggerProtocol of the frame.
+    
+    Returns None when the boundaries cannot be determined.
+    
+    """
+    protocol = None
     
     # NOTE: use analysis unit instead of cursor, but allow for cursor to be 
     # specified
@@ -1124,55 +1296,133 @@ def analyseEPSCaT(lsdata, frame, indicator_channel_ndx,
                 roiRange[0] = 0
                 
             epscatname = "%s" % cursor.name
+            
+        else:
+            warnings.warn("Frame %d is not associated with cursor %s in %s" % (frame, cursor.name, lsdata.name))
+            return
         
     else:
         warnings.warn("Cannot determine spatial boundaries for EPSCaT in frame %d of %s" % (frame, lsdata.name))
         return
         #raise RuntimeError("Cannot determine spatial boundaries for EPSCaT in frame %d of %s" % (frame, lsdata.name))
     
-    # NOTE: determine the f0Range: the temporal boundaries of the F0 (on the t axis)
+    return roiRange, epscatname, protocol
+
+#@safeWrapper
+def analyseEPSCaT(lsdata, frame, indicator_channel_ndx, 
+                  unit = None, reference_channel_ndx=None, do_fit = True,
+                  detrend=False, epscat=None, fitted_epscat=None):
+    """Calculates EPSCaT trace and optionally fits an EPSCaT model.
+    
+    The EPSCaT waveform is computed on an AnalysisUnit!
+    
+    Uses analysisOptions stored in lsdata.
+    
+    lsdata: a ScanData object
+    
+    epscat: neo.AnalogSignal or None (default); the EPSCaT trace for this unit
+        and frame, when already computed (e.g. by computeLSCaTs, for all units
+        in the frame - see analyseFrame)
+    
+    fitted_epscat: neo.AnalogSignal or None (default); the result of fitting
+        the EPSCaT, when already fitted (e.g. by fitEPSCaTs, see analyseFrames);
+        when given, the EPSCaT is not fitted again
+    
+    """
+    
+    # NOTE 2018-08-02 15:50:46
+    # apply discriminant AFTER computing the EPSCaT waveform
+    # see NOTE:  2018-08-02 15:52:31 and NOTE: 2018-08-03 09:50:49
+    #
+    # NOTE: 2018-08-02 13:16:30
+    # compute waveform amplitude AFTER computing the EPSCaT
+    # so that if needed, we use the fitted delay
+    # see NOTE: 2018-08-02 13:10:32
     #
-    cal = AxesCalibration(lsdata.scans[0].axistags["t"])
-    units = cal.getUnits(lsdata.scans[0].axistags["t"])
-    origin = cal.getOrigin(lsdata.scans[0].axistags["t"])
-    resolution = cal.getResolution(lsdata.scans[0].axistags["t"])
     
-    f0TimeRange = lsdata.analysisOptions["Intervals"]["F0"]
+    # NOTE: 2018-08-03 09:31:28
+    # suitable defaults for discrimination
+    discr_func={'np.linalg.norm': {'axis': None, 'ord': None}}
+    discr_pred_func='lambda x,y: x/y'
+    discr_pred='lambda x,y: x >= y'
+    discr_value=1.3 
+    min_r2_discr = 0.5
+    discr_2D = True
+
+    # NOTE: protocol will help establish the discrimination windows
+    # according to triggers if so required by the analysisOptions
     
-    f0Range = [int((t + origin)/resolution) for t in f0TimeRange]
+    protocol = None
     
-    # NOTE: define (extract) the spatially bounded EPSCaT data in the indicator channel
+    if not isinstance(lsdata, ScanData):
+        raise TypeError("First parameters was expected to be a datatypes.ScanData; got %s instead" % type(lsdata).__name__)
     
-    if len(lsdata.scans) == lsdata.scansChannels:
-        # array of possibily several single-band images
-        ca_data = lsdata.scans[indicator_channel_ndx].bindAxis("c", 0).bindAxis(lsdata.scansFrameAxis, frame).squeeze()
+    if len(lsdata.scans) == 0:
+        raise ValueError("no linescan data was found in %s" % lsdata.name)
     
-    else:
-        # array with one multi-band image
-        ca_data = lsdata.scans[0].bindAxis("c", indicator_channel_ndx).bindAxis(lsdata.scansFrameAxis, frame).squeeze()
+    if lsdata.scanType != ScanDataType.linescan:
+        raise ValueError("%s was expected to be a ScanDataType.linescan experiment; it has %s instead" % (lsdata.name,lsdata.scanType))
+        
+    if lsdata.analysisMode != ScanDataAnalysisMode.frame:
+        raise ValueError("%s was expected to have a ScanDataAnalysisMode.frame analysis mode; it has %s instead" % (lsdata.name, lsdata.analysisMode))
+        
+    if len(lsdata.analysisOptions) == 0:
+        raise ValueError("%s has no analysis options" % lsdata.name)
     
-    # NOTE: define the spatially bounded reference data (in the reference channel)
-    # if it exists
-    ref_data = None
+    # NOTE: 2026-10-18 13:40:02
+    # the spatial boundaries of the EPSCaT are determined by epscatWindow
+    window = epscatWindow(lsdata, frame, unit)
     
-    if reference_channel_ndx is not None:
-        if len(lsdata.scans) == lsdata.scansChannels:
-            ref_data = lsdata.scans[reference_channel_ndx].bindAxis("c",0).bindAxis(lsdata.scansFrameAxis,frame).squeeze()
-            
-        else:
-            ref_data = lsdata.scans[0].bindAxis("c",reference_channel_ndx).bindAxis(lsdata.scansFrameAxis,frame).squeeze()
+    if window is None:
+        return
+    
+    roiRange, epscatname, protocol = window
+    
+    
+    # NOTE: determine the f0Range: the temporal boundaries of the F0 (on the t axis)
+    #
+    # NOTE: 2026-10-18 14:56:03
+    # axesCalibration() is cached with the scans array
+    cal = axesCalibration(lsdata.scans[0])
+    units = cal.getUnits("t")
+    origin = cal.getOrigin("t")
+    resolution = cal.getResolution("t")
+    
+    f0TimeRange = lsdata.analysisOptions["Intervals"]["F0"]
+    
+    f0Range = [int((t + origin)/resolution) for t in f0TimeRange]
+    
+    if epscat is None:
+        # NOTE: define (extract) the spatially bounded EPSCaT data in the indicator channel
+        
+        # NOTE: 2026-10-18 12:31:15
+        # ScanData.scansFrame() reads the frame on demand (through the frame 
+        # cache) when the scans are backed by a FrameStore
+        ca_data = lsdata.scansFrame(frame, indicator_channel_ndx)
         
-    # NOTE: 2018-08-03 09:46:21
-    # EPSCaT waveform computed here
-    epscat = computeLSCaT(roiRange, f0Range, 
-                          ca_data, 
-                          ref_data = ref_data,
-                          name=epscatname, units=arbitrary_unit,
-                          detrend=detrend)
+        # NOTE: define the spatially bounded reference data (in the reference channel)
+        # if it exists
+        ref_data = None
+        
+        if reference_channel_ndx is not None:
+            ref_data = lsdata.scansFrame(frame, reference_channel_ndx)
+            
+        # NOTE: 2018-08-03 09:46:21
+        # EPSCaT waveform computed here
+        epscat = computeLSCaT(roiRange, f0Range, 
+                            ca_data, 
+                            ref_data = ref_data,
+                            name=epscatname, units=arbitrary_unit,
+                            detrend=detrend)
         
     # NOTE: 2018-08-03 10:04:57
     # EPSCaT waveform fitted here
-    if do_fit:
+    if fitted_epscat is not None:
+        # NOTE: 2026-10-18 14:15:27
+        # already fitted, by fitEPSCaTs
+        pass
+    
+    elif do_fit:
         fit_p0    = lsdata.analysisOptions["Fitting"]["Initial"] # initial parameter values for the EPSCaT model
                                                                  # and their
         fit_lower = lsdata.analysisOptions["Fitting"]["Lower"]   # lower boundaries
@@ -1621,35 +1871,12 @@ def analyseEPSCaT(lsdata, frame, indicator_channel_ndx,
         
         return fitted_epscat #, src_base, src_peak
     
-def analyseFrame(lsdata:ScanData, frame:int, unit=None, indicator_channel_ndx=None, reference_channel_ndx=None, detrend=False, gen_long_fits=False):
-    """Analyses a specific frame in a ScanData object.
-    See also the module-level function CaTanalysis.analyseFrame(...)
-    Modifies ScanData in place !
-    Uses analysisOptions stored in lsdata.
-    
-    lsdata: a ScanData object
-    
-    frame: int; index of the frame to be analysed
-    
-    unit: None, an AnalysisUnit, a vertical scan cursor used in an Analysis unit, or the name of such cursor
-        
-            If "unit" is None then all landmark-based analysis units will be analysed.
-                If there are no landmark-based analysis units then the analysis unit
-                based on the entire data set will be analysed.
-                Previous analysys results will be replaced.
-                
-            If "unit" is a str:
-                analyse a landmark-based analysis unit with the name given in "unit"
-                if it exists, otherwise:
-                analyse along a vertical scan cursor with the name given in "unit"
-                if it exists, otherwise:
-                analyse the analysis unit associated with the entire data set
-                
-                
-            use the AnalysisUnit define on the whole data set to specifically work on it.
-    
-    indicator_channel_ndx, reference_channel_ndx, indices of the indicator and reference channels for EPSCaT calculation
+def _frameAnalysisSetup(lsdata, frame, unit=None, indicator_channel_ndx=None, reference_channel_ndx=None):
+    """Checks the arguments of analyseFrame.
     
+    Returns a tuple (units, protocol, indicator_channel_ndx, reference_channel_ndx)
+    with the analysis units to analyse in the frame, the trigger protocol of
+    the frame, and the resolved channel indices.
     """
     if not isinstance(lsdata, ScanData):
         raise TypeError("First parameters was expected to be a datatypes.ScanData; got %s instead" % type(lsdata).__name__)
@@ -1755,11 +1982,100 @@ def analyseFrame(lsdata:ScanData, frame:int, unit=None, indicator_channel_ndx=No
             raise ValueError("Indicator and reference channel indices cannot be identical (%d)" % reference_channel_ndx)
         
     else:
-        reference_channel_ndx = None
+        reference_channel_ndx = None
+        
+    return units, protocol, indicator_channel_ndx, reference_channel_ndx
+
+def frameEPSCaTs(lsdata, frame, units, indicator_channel_ndx, reference_channel_ndx=None, detrend=False):
+    """EPSCaT traces of several analysis units in a frame, computed together.
+    
+    The frame is read once and all traces are computed by computeLSCaTs.
+    
+    Parameters:
+    ===========
+    lsdata: a ScanData object
+    
+    frame: int, the frame index
+    
+    units: sequence of analysis units (see analyseFrame)
+    
+    indicator_channel_ndx, reference_channel_ndx: int (the latter may be None)
+        indices of the indicator and reference channels in lsdata.scans
+        
+    detrend: bool, default is False; see computeLSCaT
+    
+    Returns:
+    ========
+    A list of (unit, neo.AnalogSignal) tuples, for the units with valid 
+    spatial boundaries in the frame (see epscatWindow).
+    """
+    cal = axesCalibration(lsdata.scans[0])
+    origin = cal.getOrigin("t")
+    resolution = cal.getResolution("t")
+    
+    f0Range = [int((t + origin)/resolution) for t in lsdata.analysisOptions["Intervals"]["F0"]]
+    
+    windows = [epscatWindow(lsdata, frame, u) for u in units]
+    
+    analysed = [u for u, w in zip(units, windows) if w is not None]
+    windows = [w for w in windows if w is not None]
+    
+    if len(windows):
+        ca_data = lsdata.scansFrame(frame, indicator_channel_ndx)
+        
+        ref_data = None
+        
+        if reference_channel_ndx is not None:
+            ref_data = lsdata.scansFrame(frame, reference_channel_ndx)
+            
+        traces = computeLSCaTs([(w[0], f0Range) for w in windows], ca_data, 
+                               ref_data = ref_data, detrend = detrend,
+                               names = [w[1] for w in windows],
+                               units = arbitrary_unit)
+    else:
+        traces = list()
+        
+    return list(zip(analysed, traces))
 
-    cal = AxesCalibration(lsdata.scans[0].axistags["t"])
-    #print("analyseFrame time axis calibration:")
-    #print(cal)
+def analyseFrame(lsdata:ScanData, frame:int, unit=None, indicator_channel_ndx=None, reference_channel_ndx=None, detrend=False, gen_long_fits=False, fits=None, traces=None):
+    """Analyses a specific frame in a ScanData object.
+    See also the module-level function CaTanalysis.analyseFrame(...)
+    Modifies ScanData in place !
+    Uses analysisOptions stored in lsdata.
+    
+    lsdata: a ScanData object
+    
+    frame: int; index of the frame to be analysed
+    
+    unit: None, an AnalysisUnit, a vertical scan cursor used in an Analysis unit, or the name of such cursor
+        
+            If "unit" is None then all landmark-based analysis units will be analysed.
+                If there are no landmark-based analysis units then the analysis unit
+                based on the entire data set will be analysed.
+                Previous analysys results will be replaced.
+                
+            If "unit" is a str:
+                analyse a landmark-based analysis unit with the name given in "unit"
+                if it exists, otherwise:
+                analyse along a vertical scan cursor with the name given in "unit"
+                if it exists, otherwise:
+                analyse the analysis unit associated with the entire data set
+                
+                
+            use the AnalysisUnit define on the whole data set to specifically work on it.
+    
+    indicator_channel_ndx, reference_channel_ndx, indices of the indicator and reference channels for EPSCaT calculation
+    
+    fits: dict or None (default); maps EPSCaT names to EPSCaTs already fitted
+        for this frame (e.g. by fitEPSCaTs, see analyseFrames); the other 
+        EPSCaTs are fitted here
+        
+    traces: list of (unit, EPSCaT) tuples, or None (default); the EPSCaT 
+        traces of the frame when already computed by frameEPSCaTs
+    
+    """
+    units, protocol, indicator_channel_ndx, reference_channel_ndx = \
+        _frameAnalysisSetup(lsdata, frame, unit, indicator_channel_ndx, reference_channel_ndx)
     
     if "Fit" in lsdata.analysisOptions["Fitting"]:
         doFit = lsdata.analysisOptions["Fitting"]["Fit"]
@@ -1767,6 +2083,9 @@ def analyseFrame(lsdata:ScanData, frame:int, unit=None, indicator_channel_ndx=No
     else:
         doFit = True
         
+    if fits is None:
+        fits = dict()
+        
     epscats = list()
     
     # NOTE: 2018-08-03 12:31:47
@@ -1774,14 +2093,24 @@ def analyseFrame(lsdata:ScanData, frame:int, unit=None, indicator_channel_ndx=No
     # (and this frame should associate ONE protocol only)
     
     
+    # NOTE: 2026-10-18 13:52:10
+    # the EPSCaT traces of all units in this frame are computed together (see
+    # frameEPSCaTs), then passed on to analyseEPSCaT for fitting and 
+    # failure/success discrimination
+    if traces is None:
+        traces = frameEPSCaTs(lsdata, frame, units, indicator_channel_ndx, 
+                              reference_channel_ndx, detrend=detrend)
+    
     # FIXME: assign result to the EPSCaT corresponding to the unit name
     # find it by the analosignal name attribute
     epscats[:] = [analyseEPSCaT(lsdata, frame, indicator_channel_ndx,
                                 unit=u, 
                                 reference_channel_ndx=reference_channel_ndx,
                                 do_fit = doFit,
-                                detrend=detrend)
-                    for u in units]
+                                detrend=detrend,
+                                epscat = trace,
+                                fitted_epscat = fits.get(trace.name, None))
+                    for u, trace in traces]
     
     epscats[:] = [e for e in epscats if e is not None]
     
@@ -1913,12 +2242,61 @@ def computeLSCaT(roiRange, f0Range, ca_data, ref_data=None, detrend=False, name=
     NOTE: both ca_data and ref_data (when given) must be 2D arrays with axistags
             "x" (axis 0) and "t" (axis 1)
     
+    """
+    if isinstance(ca_data, vigra.VigraArray) and ca_data.ndim != 2:
+        raise ValueError("Ca2+ data must be a 2D VigraArray")
+    
+    # NOTE: 2026-10-18 14:03:26
+    # computed as a batch of one; see computeLSCaTs
+    return computeLSCaTs([(roiRange, f0Range)], ca_data, ref_data=ref_data,
+                         detrend=detrend, names=[name], description=description,
+                         units=units, **annotations)[0]
+
+def computeLSCaTs(windows, ca_data, ref_data=None, detrend=False, names=None, description=None, units=pq.dimensionless, **annotations):
+    """
+    Generates EPSCaT traces for several analysis windows in the same line scans.
+    
+    The result is the same as calling computeLSCaT() for each window, but the 
+    data in each frame is reduced only once (by cumulative sums along the x 
+    axis) and all the traces are then obtained by vectorized differences of 
+    these sums.
+    
+    Positional parameters:
+    ======================
+    windows: sequence of (roiRange, f0Range) pairs - one pair per EPSCaT trace;
+        roiRange, f0Range are start:stop lists (in pixel coordinates) as for
+        computeLSCaT()
+        
+        When ca_data is 3D this is a sequence with one element per frame, each
+        element being a sequence of (roiRange, f0Range) pairs for that frame.
+    
+    ca_data: vigra.VigraArray with line scans (Ca2+-sensitive dye channel);
+        either 2D with axes "x" (axis 0) and "t" (axis 1), or 3D with a frame 
+        axis (axis 2) e.g. the whole linescan stack of a ScanData channel
+    
+    Named parameters:
+    =================
+    ref_data: vigra.VigraArray with line scans in the reference dye channel,
+        with same shape and axistags as ca_data, or None (default)
+    
+    detrend: boolean, default False; see computeLSCaT
+    
+    names: sequence of str (one per pair in windows) or None (default)
+    
+    description, units, annotations: as for computeLSCaT
+    
+    Returns:
+    ========
+    For 2D ca_data: a list of neo.AnalogSignal objects, one per window.
+    
+    For 3D ca_data: a list (one element per frame) of such lists.
+    
     """
     if not isinstance(ca_data, vigra.VigraArray):
         raise TypeError("Ca2+ image data must be a VigraArray")
     
-    if ca_data.ndim != 2:
-        raise ValueError("Ca2+ data must be a 2D VigraArray")
+    if ca_data.ndim not in (2, 3):
+        raise ValueError("Ca2+ data must be a 2D or 3D VigraArray")
     
     if "x" not in ca_data.axistags:
         raise TypeError("Data does not have a defined X axis")
@@ -1926,9 +2304,6 @@ def computeLSCaT(roiRange, f0Range, ca_data, ref_data=None, detrend=False, name=
     if "t" not in ca_data.axistags:
         raise TypeError("Data does not have a defined t axis")
     
-    w = ca_data.shape[0]
-    h = ca_data.shape[1]
-    
     if ref_data is not None:
         if not isinstance(ref_data, vigra.VigraArray):
             raise TypeError("Reference image data must be a vigra.VigraArray")
@@ -1939,6 +2314,58 @@ def computeLSCaT(roiRange, f0Range, ca_data, ref_data=None, detrend=False, name=
         if ref_data.axistags != ca_data.axistags:
             raise TypeError("Mismatch between indicator and reference axistags")
         
+    tresolution = axesCalibration(ca_data).getResolution("t")
+    
+    if ca_data.ndim == 3:
+        if len(windows) != ca_data.shape[2]:
+            raise ValueError("Expecting %d sequences of windows (one per frame); got %d instead" % (ca_data.shape[2], len(windows)))
+        
+        frames = [(np.asarray(ca_data[:, :, k]), 
+                   None if ref_data is None else np.asarray(ref_data[:, :, k]),
+                   windows[k]) for k in range(ca_data.shape[2])]
+        
+    else:
+        frames = [(np.asarray(ca_data), 
+                   None if ref_data is None else np.asarray(ref_data),
+                   windows)]
+        
+    result = list()
+    
+    for ca, ref, frame_windows in frames:
+        if names is None:
+            frame_names = [None] * len(frame_windows)
+        
+        else:
+            if len(names) != len(frame_windows):
+                raise ValueError("Expecting %d names (one per window); got %d instead" % (len(frame_windows), len(names)))
+            
+            frame_names = names
+        
+        traces = _lscatTraces(frame_windows, ca, ref, detrend=detrend)
+        
+        signals = list()
+        
+        for k, name in enumerate(frame_names):
+            ret = neo.AnalogSignal(traces[:, k:k+1], units=units, sampling_period=tresolution, \
+                                        name=name, description=description, **annotations)
+            
+            #ret.annotations["Date_Time"] = "%s" % datetime.datetime.now()
+            ret.annotations["Date_Time"] = datetime.datetime.now()
+            ret.annotations["EPSCaT"] = True
+            
+            signals.append(ret)
+            
+        result.append(signals)
+        
+    return result if ca_data.ndim == 3 else result[0]
+
+def _checkLSCaTWindow(roiRange, f0Range, w, h):
+    """Checks and clips (in place) the ranges of an EPSCaT window.
+    
+    roiRange, f0Range: start:stop lists (in pixel coordinates)
+    
+    w, h: the size of the line scan along the x and t axes, respectively
+    """
     #print(f0Range)
     
     if f0Range[1] <= f0Range[0]:
@@ -1981,81 +2408,93 @@ def computeLSCaT(roiRange, f0Range, ca_data, ref_data=None, detrend=False, name=
     if roiRange[0] == roiRange[1]:
         warnings.warn("ROI window range is empty: %s" % str(roiRange), RuntimeWarning)
         
-    tcal = AxesCalibration(ca_data.axistags["t"])
-    tunits = tcal.getUnits(ca_data.axistags["t"])
-    torigin = tcal.getOrigin(ca_data.axistags["t"])
-    tresolution = tcal.getResolution(ca_data.axistags["t"])
+def _roiSums(data, roiRanges):
+    """Sums and counts of the non-NaN pixels within each roi range, at each t.
     
-    # NOTE: 2018-01-28 08:54:41
-    # ATTENTION: VigraArrays are indexed with x first !
-    # roiRange[0]:roiRange[1] takes the data _COLUMNS_ within the cursor xwindow
-    # f0Range[0]:f0Range[1] takes the data _ROWS_ from f0 start to f0 end (or last row)
+    data: 2D numpy array (x, t)
     
-        
+    roiRanges: 2D numpy array of int with shape (N, 2): the start, stop of N 
+        ranges along the x axis
     
+    Returns a tuple of two 2D arrays (N, t) with the sums and the counts.
+    """
+    valid = ~np.isnan(data)
     
-    # Fluo 5F               cursor xwindow           baseline fluorescence
-    # NOTE: 2019-03-18 09:24:11 this is usually so short it doesn't need detrend
-    # and because ocurs at the beginning of the linescan series, it it less likely
-    # to be affected by intensity drift which usually kick in/is more pronounced 
-    # later in the series
-    #                    cursor xwindow           baseline fluorescence range
-    #base_fluo5 = ca_data[roiRange[0]:roiRange[1], f0Range[0]:f0Range[1]]
+    csum = np.zeros((data.shape[0] + 1, data.shape[1]))
+    np.cumsum(np.where(valid, data, 0.), axis=0, out=csum[1:])
     
-    #if detrend:
-        #base_fluo5 = signal.detrend(base_fluo5, axis=0)
+    ccount = np.zeros((data.shape[0] + 1, data.shape[1]), dtype=np.intp)
+    np.cumsum(valid, axis=0, out=ccount[1:])
     
-    # FIXME for the sake of generality do implement detreding here also!
-    f0 = np.nanmean(ca_data[roiRange[0]:roiRange[1], f0Range[0]:f0Range[1]])
+    return (csum[roiRanges[:, 1]] - csum[roiRanges[:, 0]],
+            ccount[roiRanges[:, 1]] - ccount[roiRanges[:, 0]])
 
-    # Fluo 5F               cursor xwindow           all fluorescence from start of baseline to end of data
-    f  = np.nanmean(ca_data[roiRange[0]:roiRange[1], f0Range[0]:], axis=0)
+def _lscatTraces(windows, ca, ref=None, detrend=False):
+    """EPSCaT traces for several windows in one line scan frame.
     
-    # NOTE: 2019-03-18 09:25:45
-    # THIS needs to be detrended all along, though...
+    windows: sequence of (roiRange, f0Range) pairs
     
-    #if detrend:
-        #f = signal.detrend(f, axis=0)
+    ca, ref: 2D numpy arrays (x, t) - the indicator and, optionally, the 
+        reference channel
     
-    df = f-f0
+    Returns a 2D numpy array (t, windows) with the EPSCaT traces in columns;
+    the samples before the start of the F0 range are NaN (see computeLSCaT).
+    """
+    w, h = ca.shape
     
-    ret = np.full((ca_data.shape[1], 1), np.NaN)
+    for roiRange, f0Range in windows:
+        _checkLSCaTWindow(roiRange, f0Range, w, h)
+        
+    rois = np.array([[int(r[0]), int(r[1])] for r, _ in windows], dtype=np.intp).reshape(-1, 2)
+    f0s  = np.array([[int(f[0]), int(f[1])] for _, f in windows], dtype=np.intp).reshape(-1, 2)
     
-    if ref_data is not None:
-        # NOTE: 2019-03-18 09:28:44
-        # this IS a vector!
-        # Alexa Fluor         cursor xwindow          all fluorescence from start of baseline to end of data
-        a_mean = np.nanmean(ref_data[roiRange[0]:roiRange[1], f0Range[0]:], axis=0)
+    ret = np.full((h, len(windows)), np.nan)
+    
+    if len(windows) == 0:
+        return ret
+    
+    # NOTE: 2026-10-18 14:05:48
+    # ATTENTION: VigraArrays are indexed with x first !
+    # sums along x, within each cursor xwindow, at every time point
+    sums, counts = _roiSums(ca, rois)
+    
+    # running sums along t, to get the baseline fluorescence (f0) as the mean
+    # over the cursor xwindow and the f0 range
+    tsums = np.zeros((len(windows), h + 1))
+    np.cumsum(sums, axis=1, out=tsums[:, 1:])
+    
+    tcounts = np.zeros((len(windows), h + 1), dtype=np.intp)
+    np.cumsum(counts, axis=1, out=tcounts[:, 1:])
+    
+    rows = np.arange(len(windows))
+    
+    with np.errstate(invalid="ignore", divide="ignore"):
+        f0 = (tsums[rows, f0s[:, 1]] - tsums[rows, f0s[:, 0]]) / (tcounts[rows, f0s[:, 1]] - tcounts[rows, f0s[:, 0]])
         
-        #if detrend:
-            #a_mean = signal.detrend(a_mean)
+        f = sums / counts
         
-    else:
-        # NOTE: 2019-03-18 09:28:55
-        # this IS a scalar
-        a_mean = f0
+        df = f - f0[:, np.newaxis]
         
-    epscat_signal = df/a_mean
-    
-    # NOTE: 2019-03-18 09:32:56
-    # detrend HERE, otherwise you get numerical instability on the df/a_mean operation
-    if detrend:
-        epscat_signal = signal.detrend(epscat_signal)
-        # re-correct for f0 baseline
-        #epscat_base = np.nanmean(epscat_signal[f0Range[0]:f0Range[1]])
-        #print(epscat_base)
-        #epscat_signal -= epscat_base
+        if ref is not None:
+            ref_sums, ref_counts = _roiSums(ref, rois)
+            a_mean = ref_sums / ref_counts
+            
+        else:
+            a_mean = f0[:, np.newaxis]
+            
+        epscats = df / a_mean
         
-    ret[f0Range[0]:, 0] =  epscat_signal
-    
+    for k in range(len(windows)):
+        start = f0s[k, 0]
+        epscat_signal = epscats[k, start:]
+        
+        # NOTE: 2019-03-18 09:32:56
+        # detrend HERE, otherwise you get numerical instability on the df/a_mean operation
+        if detrend:
+            epscat_signal = signal.detrend(epscat_signal)
+            
+        ret[start:, k] = epscat_signal
         
-    ret = neo.AnalogSignal(ret, units=units, sampling_period=tresolution, \
-                                name=name, description=description, **annotations)
-    
-    #ret.annotations["Date_Time"] = "%s" % datetime.datetime.now()
-    ret.annotations["Date_Time"] = datetime.datetime.now()
-    ret.annotations["EPSCaT"] = True
-    
     return ret
 
 #@safeWrapper
@@ -2457,6 +2896,279 @@ def fitEPSCaT(data, p0, bounds, fitWindow = None, integration=None):
     
     return result
 
+def _broadcastBounds(bound, p0):
+    """Flattens a lower or upper bound to the layout of the flattened p0.
+    See fit_compound_exp_rise_multi_decay in core.curvefitting.
+    """
+    if all([isinstance(p, numbers.Real) for p in p0]):
+        components = [p0]
+    else:
+        components = p0
+        
+    ret = list()
+    
+    for k, p in enumerate(components):
+        if isinstance(bound, numbers.Real):
+            ret += [bound] * len(p)
+            
+        elif all([isinstance(b, numbers.Real) for b in bound]):
+            ret += list(bound)
+            
+        else:
+            ret += list(bound[k])
+            
+    return ret
+
+def _warmStartParameters(coefficients, p0, bounds):
+    """Initial parameters for a fit, from the coefficients of a previous fit.
+    
+    coefficients: the "Coefficients" of a previous fit (see 
+        curvefitting.fit_compound_exp_rise_multi_decay)
+        
+    p0, bounds: the initial parameters and their bounds, as in fitEPSCaT
+    
+    Returns the coefficients with the layout of p0, clipped to the bounds, or 
+    None when they are incompatible with p0.
+    """
+    flat = all([isinstance(p, numbers.Real) for p in p0])
+    
+    if flat:
+        if len(coefficients) != 1 or len(coefficients[0]) != len(p0):
+            return
+        
+        components = [p0]
+        
+    else:
+        if len(coefficients) != len(p0) or any([len(c) != len(p) for c, p in zip(coefficients, p0)]):
+            return
+        
+        components = p0
+        
+    x = np.array([float(v) for c in coefficients for v in c])
+    
+    if not np.all(np.isfinite(x)):
+        return
+    
+    x = np.clip(x, _broadcastBounds(bounds[0], p0), _broadcastBounds(bounds[1], p0))
+    
+    ret = list()
+    start = 0
+    
+    for p in components:
+        ret.append(list(x[start:start+len(p)]))
+        start += len(p)
+        
+    return ret[0] if flat else ret
+
+def _fitEPSCaTSeries(item, p0=None, bounds=None, fitWindow=None, integration=None, warm_start=True):
+    """Fits a series of EPSCaTs of one analysis unit, in frame order.
+    
+    Runs in a worker process of fitEPSCaTs.
+    
+    item: tuple (name, [(frame, epscat), ...])
+    
+    When warm_start is True, each fit starts from the coefficients of the 
+    previous converged fit in the series; a warm-started fit that does not 
+    converge is repeated from p0.
+    
+    Returns a tuple (name, [(frame, fitted_epscat, error), ...]) where either 
+    fitted_epscat or error (a str) is None.
+    """
+    name, series = item
+    
+    results = list()
+    
+    previous = None
+    
+    for frame, epscat in series:
+        init = None
+        
+        if warm_start and previous is not None:
+            init = _warmStartParameters(previous, p0, bounds)
+            
+        try:
+            if init is not None:
+                fitted = fitEPSCaT(epscat, init, bounds, fitWindow = fitWindow,
+                                   integration = integration)
+                
+                fitres = fitted.annotations["FitResult"]
+                
+                if fitres.get("Converged", True):
+                    fitres["WarmStart"] = True
+                    
+                else:
+                    # NOTE: 2026-10-18 14:19:44
+                    # fall back to a cold start, but account for the time spent
+                    fitTime = fitres.get("FitTime", 0.)
+                    fitted = fitEPSCaT(epscat, p0, bounds, fitWindow = fitWindow,
+                                       integration = integration)
+                    fitres = fitted.annotations["FitResult"]
+                    fitres["WarmStart"] = False
+                    fitres["ColdRestart"] = True
+                    fitres["FitTime"] = fitres.get("FitTime", 0.) + fitTime
+                    
+            else:
+                fitted = fitEPSCaT(epscat, p0, bounds, fitWindow = fitWindow,
+                                   integration = integration)
+                fitres = fitted.annotations["FitResult"]
+                fitres["WarmStart"] = False
+                
+            previous = fitres["Coefficients"] if fitres.get("Converged", True) else None
+            
+            results.append((frame, fitted, None))
+            
+        except Exception as e:
+            previous = None
+            results.append((frame, None, "%s: %s" % (type(e).__name__, e)))
+            
+    return name, results
+
+def fitEPSCaTs(epscats, p0, bounds, fitWindow=None, integration=None, 
+               warm_start=True, max_workers=None, progressSignal=None,
+               setMaxSignal=None, loopControl=None):
+    """Fits several EPSCaTs in parallel, in a pool of worker processes.
+    
+    The EPSCaTs of each analysis unit (i.e. with the same name) are fitted in
+    frame order; when warm_start is True each fit starts from the parameters 
+    fitted in the previous frame (falling back to p0 when that fit did not 
+    converge). 
+    
+    The fits of different units run in parallel; when there are fewer units 
+    than workers, the series of frames of each unit is split in contiguous 
+    chunks, each started from p0.
+    
+    Parameters:
+    ===========
+    epscats: sequence of (frame, neo.AnalogSignal) tuples, e.g. as returned by
+        frameEPSCaTs (for several frames)
+        
+    p0, bounds, fitWindow, integration: as for fitEPSCaT
+    
+    Named parameters:
+    =================
+    warm_start: bool, default True
+    
+    max_workers: int, default is the number of CPUs; when 1, or when there is 
+        only one series of EPSCaTs to fit, the fits run in the calling process
+        
+    progressSignal: a Signal with one int argument (the number of EPSCaTs 
+        fitted so far), or None
+        
+    setMaxSignal: a Signal with one int argument (the number of EPSCaTs to fit), 
+        or None
+        
+    loopControl: dict {"break": bool}; set "break" to True to cancel the fits
+        not already started.
+        
+    Returns:
+    ========
+    A tuple (fits, stats) where:
+    
+    fits is a dict mapping (EPSCaT name, frame) to the fitted EPSCaT (see 
+        fitEPSCaT); EPSCaTs that could not be fitted are absent from fits
+    
+    stats is a dict with the fit statistics: the numbers of EPSCaTs fitted 
+    ("fits"), of converged fits ("converged"), of failed fits ("failed"), of
+    warm-started fits ("warm_started") and of warm-started fits repeated from 
+    p0 ("cold_restarts"); the total, mean and maximum fit time ("fit_time_total",
+    "fit_time_mean", "fit_time_max"), the mean number of cost function 
+    evaluations ("nfev_mean") and the duration of the whole operation 
+    ("wall_time"), all times in seconds; "errors" maps (name, frame) to the 
+    error messages of the failed fits.
+    """
+    start = time.perf_counter()
+    
+    series = collections.OrderedDict()
+    
+    for frame, epscat in sorted(epscats, key = lambda x: x[0]):
+        series.setdefault(epscat.name, list()).append((frame, epscat))
+        
+    nFits = sum([len(s) for s in series.values()])
+    
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+        
+    if warm_start:
+        nChunks = max(1, int(math.ceil(max_workers / max(len(series), 1))))
+    else:
+        nChunks = nFits
+        
+    items = list()
+    
+    for name, s in series.items():
+        chunkSize = max(1, int(math.ceil(len(s) / nChunks)))
+        items += [(name, s[k:k+chunkSize]) for k in range(0, len(s), chunkSize)]
+        
+    kwargs = dict(p0 = p0, bounds = bounds, fitWindow = fitWindow, 
+                  integration = integration, warm_start = warm_start)
+    
+    if setMaxSignal is not None:
+        setMaxSignal.emit(nFits)
+        
+    results = list()
+    
+    def _canceled():
+        return isinstance(loopControl, dict) and loopControl.get("break", False) == True
+    
+    if max_workers == 1 or len(items) < 2:
+        for item in items:
+            if _canceled():
+                break
+            
+            name, r = _fitEPSCaTSeries(item, **kwargs)
+            results.extend((name, frame, fitted, error) for frame, fitted, error in r)
+            
+            if progressSignal is not None:
+                progressSignal.emit(len(results))
+                
+    else:
+        executor = process_pool(min(max_workers, len(items)))
+        
+        try:
+            for item, future in bounded_pool_map(executor, _fitEPSCaTSeries, items,
+                                                 loopControl = loopControl,
+                                                 **kwargs):
+                try:
+                    name, r = future.result()
+                    results.extend((name, frame, fitted, error) for frame, fitted, error in r)
+                    
+                except Exception as e:
+                    results.extend((item[0], frame, None, "%s: %s" % (type(e).__name__, e)) for frame, _ in item[1])
+                    
+                if progressSignal is not None:
+                    progressSignal.emit(len(results))
+                    
+        finally:
+            executor.shutdown(wait = not _canceled(), cancel_futures = True)
+            
+    fits = dict()
+    errors = dict()
+    
+    for name, frame, fitted, error in results:
+        if fitted is None:
+            errors[(name, frame)] = error
+        else:
+            fits[(name, frame)] = fitted
+            
+    fitResults = [f.annotations["FitResult"] for f in fits.values()]
+    fitTimes = [r.get("FitTime", np.nan) for r in fitResults]
+    nfev = [r.get("nfev", np.nan) for r in fitResults]
+    
+    stats = collections.OrderedDict()
+    stats["fits"] = len(fits)
+    stats["converged"] = sum([bool(r.get("Converged", True)) for r in fitResults])
+    stats["failed"] = len(errors)
+    stats["warm_started"] = sum([bool(r.get("WarmStart", False)) for r in fitResults])
+    stats["cold_restarts"] = sum([bool(r.get("ColdRestart", False)) for r in fitResults])
+    stats["fit_time_total"] = float(np.nansum(fitTimes)) if len(fitTimes) else 0.
+    stats["fit_time_mean"] = float(np.nanmean(fitTimes)) if len(fitTimes) else np.nan
+    stats["fit_time_max"] = float(np.nanmax(fitTimes)) if len(fitTimes) else np.nan
+    stats["nfev_mean"] = float(np.nanmean(nfev)) if len(nfev) else np.nan
+    stats["wall_time"] = time.perf_counter() - start
+    stats["errors"] = errors
+    
+    return fits, stats
+
 def collateReports(data):
     """
     Concatenates several pandas DataFrame objects into one
@@ -3352,29 +4064,25 @@ def generateMirrorCursors(data):
     if len(lsc) == 0:
         raise ValueError("Data has no vertical linescan cursors")
     
-    for c in lsc:
+    # NOTE: 2026-10-18 15:12:40
+    # map all cursors at once, on the (cached) geometry of the scan region
+    geometry = imgp.pathGeometry(path)
+    
+    cursor_x = np.array([c.x for c in lsc], dtype=float)
+    
+    if len(geometry) == int(data.scans[0].width):
+        # a freehand line: one element per pixel in a scan row
+        points = geometry.vertices[np.clip(cursor_x.astype(int), 0, len(geometry) - 1)]
+        
+    else:
+        # a line, or a polyline with fewer elements than pixels in a scan row:
+        # the cursor's X coordinate is the distance along the scanline
+        points = geometry.pointsAt(np.clip(cursor_x, 0., geometry.length))
+    
+    for c, (point_x, point_y) in zip(lsc, points.tolist()):
         if c.name in data.sceneCursors.keys():
             warnings.warn("Data already has a scene cursor named %s; it will be replaced" % c.name)
             
-        if len(path) == 2:
-            dx = path[1].x - path[0].x
-            dy = path[1].y - path[0].y
-            
-            l = math.sqrt(dx ** 2 + dy ** 2)
-            
-            nx = c.x / l
-            
-            point_x = dx * nx + path[0].x
-            point_y = dy * nx + path[0].y
-                                            
-        elif len(path) == int(data.scans[0].width):
-            element = path[int(c.x)]
-            point_x = element.x
-            point_y = element.y
-            
-        else:
-            raise NotImplementedError("In %s: Mirror points can only be added on a scanline trajectory that is a line or a freehand line" % data.name)
-            
         pc = pgui.Cursor(point_x, point_y,
                          data.scene[0].shape[0], data.scene[0].shape[1],
                          1, 1, c.xwindow//2,
@@ -3566,6 +4274,9 @@ class LSCaTWindow(ScipyenFrameViewer, __UI_LSCaTWindow__):
         self._epscat_analysis_idle_ = True
         self._generic_work_idle_ = True
         
+        # statistics of the last EPSCaT fits (see fitEPSCaTs)
+        self._fit_statistics_ = None
+        
         #self._data_ = None # inherited from ScipyenViewer
         self._current_frame_scan_region_ = list() # so that its contents will be updated
         
@@ -4714,12 +5425,20 @@ class LSCaTWindow(ScipyenFrameViewer, __UI_LSCaTWindow__):
         
         self._scene_processing_idle_= True
         
+        # NOTE: 2026-10-18 17:41:05
+        # writing below loads scene data backed by a FrameStore; the viewers,
+        # which only had its shape, then get the loaded data
+        deferred = self._data_.sceneStore is not None
+        
         for k in range(len(result)):
-            #print("scene[%d]" %k)
             self._data_.scene[k][:] = result[k]
             
-        for win in self.sceneviewers:
-            win.displayFrame()
+        if deferred:
+            self._display_scene_()
+            
+        else:
+            for win in self.sceneviewers:
+                win.displayFrame()
             
         self.slot_processingDone()
         
@@ -4732,12 +5451,20 @@ class LSCaTWindow(ScipyenFrameViewer, __UI_LSCaTWindow__):
         
         self._scans_processing_idle_ = True
         
+        # NOTE: 2026-10-18 17:41:05
+        # writing below loads scans data backed by a FrameStore; the viewers,
+        # which only had its shape, then get the loaded data
+        deferred = self._data_.scansStore is not None
+        
         for k in range(len(result)):
-            #print("scans[%d]" % k)
             self._data_.scans[k][:] = result[k]
             
-        for win in self.scansviewers:
-            win.displayFrame()
+        if deferred:
+            self._display_scans_()
+            
+        else:
+            for win in self.scansviewers:
+                win.displayFrame()
             
         self.slot_processingDone()
         
@@ -5075,47 +5802,61 @@ class LSCaTWindow(ScipyenFrameViewer, __UI_LSCaTWindow__):
         pvimp.open()
         
     def _analyzeFrames_(self, frames, progressSignal=None, setMaxSignal=None, **kwargs):
-        """Calls to the module-level analyseFrame() for each frame in frames.
+        """Calls the module-level analyseFrames() for the frames in frames.
         This is meant to be executed in a separate GUI thread, (i.e. it is called 
         by a ProgressWorkerRunnable) emits progressSignal(int) Signal
         
         Parameters:
         ==========
         frames: a sequence of int: indices of the data frames to be analysed
-        progressSignal: a Signal with one int argument (the frame)
-            This signal is emitted after the processing of one frame.
-        
+        progressSignal: a Signal with one int argument
+            This signal is emitted after each fitted EPSCaT, then after the 
+            processing of each frame.
+        setMaxSignal: a Signal with one int argument; sets the maximum of the
+            progress dialog for each stage of the analysis
+            
+        Returns the fit statistics (see fitEPSCaTs)
         """
         if self._data_ is None:
             return
         
-        frames = kwargs.pop(frames)
-        
-        #print("LSCaTWindow._analyzeFrames_ progressSignal", progressSignal, "**kwargs", kwargs)
+        # NOTE: 2026-10-18 14:27:50
+        # the progress dialog is only used in the GUI thread
+        kwargs.pop("progressUI", None)
         
-        #detrend = self.detrendEPSCaTsCheckBox.isChecked()
-#         
-        for frame in frames:
-            analyseFrame(self._data_, frame, **kwargs)
-            #analyseFrame(self._data_, frame, detrend=detrend, 
-                         #gen_long_fits = self.actionPlot_long_fits.isChecked())
-            
-            if progressSignal is not None:
-                progressSignal.emit(frame)
+        # NOTE: 2026-10-18 14:28:13
+        # EPSCaTs are fitted in a pool of worker processes (see fitEPSCaTs), 
+        # so that re-analysis does not keep the GUI busy for long
+        return analyseFrames(self._data_, frames, progressSignal=progressSignal,
+                             setMaxSignal=setMaxSignal, **kwargs)
 
-    def _analyzeUnitInFrames_(self, frames, unit, progressSignal=None, **kwargs):
+    def _analyzeUnitInFrames_(self, frames, unit, progressSignal=None, setMaxSignal=None, **kwargs):
         if self._data_ is None:
             return
         
-        #detrend = self.detrendEPSCaTsCheckBox.isChecked()
+        kwargs.pop("progressUI", None)
         
-        for frame in frames:
-            analyseFrame(self._data_, frame, unit=unit, **kwargs)
-            #analyseFrame(self._data_, frame, unit=unit, detrend=detrend, 
-                         #gen_long_fits = self.actionPlot_long_fits.isChecked())
-            
-            if progressSignal is not None:
-                progressSignal.emit(frame)
+        return analyseFrames(self._data_, frames, unit=unit, 
+                             progressSignal=progressSignal,
+                             setMaxSignal=setMaxSignal, **kwargs)
+        
+    @Slot(object)
+    def slot_fitStatistics(self, stats):
+        """Shows the fit statistics returned by _analyzeFrames_
+        """
+        if not isinstance(stats, dict):
+            return
+        
+        self._fit_statistics_ = stats
+        
+        msg = "%d EPSCaTs fitted (%d converged, %d warm-started, %d failed) in %.2f s; fit time: mean %.3f s, max %.3f s" % \
+            (stats["fits"], stats["converged"], stats["warm_started"], stats["failed"], 
+             stats["wall_time"], stats["fit_time_mean"], stats["fit_time_max"])
+        
+        self.statusBar().showMessage(msg)
+        
+        for (name, frame), error in stats["errors"].items():
+            scipywarn("Fitting %s in frame %d failed: %s" % (name, frame, error))
 
     @Slot()
     def slot_analyseFramesDone(self):
@@ -5125,7 +5866,10 @@ class LSCaTWindow(ScipyenFrameViewer, __UI_LSCaTWindow__):
         self._display_scans_block_()
         
         self.displayFrame()
-        self.statusBar().showMessage("Done!")
+        
+        # NOTE: do not overwrite the fit statistics shown by slot_fitStatistics
+        if not isinstance(self._fit_statistics_, dict):
+            self.statusBar().showMessage("Done!")
         
     @Slot(object)
     def slot_concatenateLSDataDone(self, obj):
@@ -5905,15 +6649,21 @@ class LSCaTWindow(ScipyenFrameViewer, __UI_LSCaTWindow__):
         self._epscat_analysis_idle_ = False
         
         pd = QtWidgets.QProgressDialog("EPSCaT Analysis...", "Abort", 0, self._data_.scansFrames, self)
+        pd.canceled.connect(self._slot_breakLoop)
+        self.loopControl["break"] = False
         
         worker = pgui.ProgressWorkerRunnable(self._analyzeFrames_, pd,
                              frames=range(self._data_.scansFrames),
                              detrend = self.detrendEPSCaTsCheckBox.isChecked(),
-                             gen_long_fits=self.actionPlot_long_fits.isChecked())
+                             gen_long_fits=self.actionPlot_long_fits.isChecked(),
+                             loopControl = self.loopControl)
         
+        worker.signals.signal_Result[object].connect(self.slot_fitStatistics)
         worker.signals.signal_Finished.connect(pd.reset)
         worker.signals.signal_Finished.connect(self.slot_analyseFramesDone)
         
+        self._fit_statistics_ = None # set by slot_fitStatistics for this run
+        
         self.threadpool.start(worker)
         
     @Slot()
@@ -6041,13 +6791,19 @@ class LSCaTWindow(ScipyenFrameViewer, __UI_LSCaTWindow__):
         self._epscat_analysis_idle_ = False
         
         pd = QtWidgets.QProgressDialog("EPSCaT Analysis...", "Abort", 0, self._data_.scansFrames, self)
+        pd.canceled.connect(self._slot_breakLoop)
+        self.loopControl["break"] = False
         
         worker = pgui.ProgressWorkerRunnable(self._analyzeUnitInFrames_, pd,
-                             frames=frames, unit=unit)
+                             frames=frames, unit=unit, 
+                             loopControl = self.loopControl)
         
+        worker.signals.signal_Result[object].connect(self.slot_fitStatistics)
         worker.signals.signal_Finished.connect(pd.reset)
         worker.signals.signal_Finished.connect(self.slot_analyseFramesDone)
         
+        self._fit_statistics_ = None # set by slot_fitStatistics for this run
+        
         self.threadpool.start(worker)
         
     @Slot(QtWidgets.QTableWidgetItem)
@@ -10073,22 +10829,31 @@ class LSCaTWindow(ScipyenFrameViewer, __UI_LSCaTWindow__):
         if self._data_ is None:
             return
         
-        nArrays = len(self._data_.scene)
+        # NOTE: 2026-10-18 17:20:41
+        # see _display_scans_
+        scene = self._data_._imageData_("scene")
+        
+        nArrays = len(scene) if scene is not None else 0
         
         if nArrays == 0:
             return
         
         #self._setup_scene_windows_(nArrays)
         
-        for k in range(len(self._data_.scene)):
-            self.sceneviewers[k].view(self._data_.scene[k])
+        for k in range(len(scene)):
+            if len(scene) == self._data_.sceneChannels:
+                # one single-channel array per channel
+                self.sceneviewers[k].view(scene[k], frameAxis = self._data_.sceneFrameAxis,
+                                          frameReader = partial(self._data_.sceneFrame, channel = k))
+            else:
+                self.sceneviewers[k].view(scene[k])
             
-            if len(self._data_.scene) > 1:
+            if len(scene) > 1:
                 # multiple single-channel arrays
-                self.sceneviewers[k].setWindowTitle("%s %s" % ("Scene", AxesCalibration(self._data_.scene[k].axistags["c"]).channelIndicesAndNames()[0][1]))
+                self.sceneviewers[k].setWindowTitle("%s %s" % ("Scene", AxesCalibration(scene[k].axistags["c"]).channelIndicesAndNames()[0][1]))
                 
             else: # single possibly multi-channel array
-                axcal = AxesCalibration(self._data_.scene[k].axistags["c"])
+                axcal = AxesCalibration(scene[k].axistags["c"])
                 chnames = [s[1] for s in axcal.channelIndicesAndNames()]
                 chnames = "+",join(chnames)
                 
@@ -10647,21 +11412,32 @@ class LSCaTWindow(ScipyenFrameViewer, __UI_LSCaTWindow__):
         if self._data_ is None:
             return
         
-        nArrays = len(self._data_.scans)
+        # NOTE: 2026-10-18 17:20:41
+        # does not load the scans data when it is backed by a FrameStore: the 
+        # viewers only get its shape and axes from here, and read the frames
+        # they display through ScanData.scansFrame()
+        scans = self._data_._imageData_("scans")
+        
+        nArrays = len(scans) if scans is not None else 0
         #print("display raw scans : nArrays %d" % nArrays)
         if nArrays == 0:
             return
         
-        for k in range(len(self._data_.scans)):
-            self.scansviewers[k].view(self._data_.scans[k])
+        for k in range(len(scans)):
+            if len(scans) == self._data_.scansChannels:
+                # one single-channel array per channel
+                self.scansviewers[k].view(scans[k], frameAxis = self._data_.scansFrameAxis,
+                                          frameReader = partial(self._data_.scansFrame, channel = k))
+            else:
+                self.scansviewers[k].view(scans[k])
             
-            if len(self._data_.scans) > 1:
+            if len(scans) > 1:
                 # multiple single-channel arrays
-                self.scansviewers[k].setWindowTitle("%s %s" % ("Scan", AxesCalibration(self._data_.scans[k].axistags["c"]).channelIndicesAndNames()[0][1]))
+                self.scansviewers[k].setWindowTitle("%s %s" % ("Scan", AxesCalibration(scans[k].axistags["c"]).channelIndicesAndNames()[0][1]))
                 
             else:
                 # single, possibly multi-channel array
-                axcal = AxesCalibration(self._data_.scans[k].axistags["c"])
+                axcal = AxesCalibration(scans[k].axistags["c"])
                 chnames = [s[1] for s in axcal.channelIndicesAndNames()]
                 chnales = "+".join(chnames)
                 
@@ -11882,13 +12658,20 @@ class LSCaTWindow(ScipyenFrameViewer, __UI_LSCaTWindow__):
                     # the following conditions are met:
                     # len(profiles) == number of frames >>> True
                     # len(profiles[k]) == number of channels for k in range(number of frames) >>> all True
-                    profiles = [[DataSignal(getProfile(img, self._data_.scanRegion.objectForFrame(k)), 
-                                                sampling_period = getAxisResolution(img.axistags["x"]), 
-                                                name = f"{sigprefix} {axisChannelName(subarray.axistags['c'], j)}", 
-                                                domain_units = getAxisUnits(img.axistags['x']),
-                                                units = getAxisUnits(subarray.axistags['c'], j),
+                    # NOTE: 2026-10-18 15:04:37
+                    # all frames and channels are sampled together, by imgp.frameProfiles
+                    values = imgp.frameProfiles(data[0], self._data_.scanRegion, 
+                                                self._data_.sceneFrameAxis)
+                    
+                    nChannels = data[0].channels
+                    
+                    profiles = [[DataSignal(v[:, j] if nChannels > 1 else v, 
+                                                sampling_period = getAxisResolution(data[0].axistags["x"]), 
+                                                name = f"{sigprefix} {axisChannelName(data[0].axistags['c'], j)}", 
+                                                domain_units = getAxisUnits(data[0].axistags['x']),
+                                                units = getAxisUnits(data[0].axistags['c'], j),
                                                 index = j) \
-                                            for j, img in dimEnum(subarray, "c")] for k, subarray in dimEnum(data[0], self._data_.sceneFrameAxis)]
+                                            for j in range(nChannels)] for v in values]
                     
                     # NOTE: we want all channels from same frame to go into the
                     # segment corresponding to that frame
@@ -11915,10 +12698,13 @@ class LSCaTWindow(ScipyenFrameViewer, __UI_LSCaTWindow__):
                     
                     profiles = list()
                     
-                    profiles = [[DataSignal(getProfile(subarray.bindAxis(self._data_.sceneFrameAxis, k), self._data_.scanRegion.objectForFrame(k)), 
-                                                sampling_period=getAxisResolution(subarray.bindAxis(self._data_.sceneFrameAxis, k).axistags["x"]), 
+                    values = [imgp.frameProfiles(subarray, self._data_.scanRegion,
+                                                 self._data_.sceneFrameAxis) for subarray in data]
+                    
+                    profiles = [[DataSignal(values[j][k], 
+                                                sampling_period=getAxisResolution(subarray.axistags["x"]), 
                                                 name = f"{sigprefix} {axisChannelName(subarray.axistags['c'], 0)}", 
-                                                domain_units = getAxisUnits(subarray.bindAxis(self._data_.sceneFrameAxis, k).axistags["x"]),
+                                                domain_units = getAxisUnits(subarray.axistags["x"]),
                                                 units = getAxisUnits(subarray.axistags['c'], 0), 
                                                 index = j) \
                                             for j, subarray in enumerate(data)] for k in range(self._data_.sceneFrames)]
@@ -4,7 +4,7 @@
 # SPDX-License-Identifier: LGPL-2.1-or-later
 
 import numbers, operator, math
-import inspect, functools, itertools, traceback, typing, warnings
+import inspect, functools, itertools, threading, traceback, typing, warnings, weakref
 from collections import deque
 from collections.abc import Sequence
 from pprint import (pprint, pformat)
@@ -2012,6 +2012,10 @@ class AxisCalibrationData(CalibrationData):
     def fromCalibrationString(s:str) -> AxisCalibrationDataType:
         """AxisCalibrationData factory using a calibration string.
         
+        NOTE: 2026-10-18 14:52:17
+        Parsed calibration strings are memoized (see CALIBRATION_CACHE_SIZE);
+        each call returns a new AxisCalibrationData object.
+        
         For the structure of an XML-formatted calibration string see the
         documentaiton for the AxisCalibrationData.calibrationString property.
         
@@ -2035,6 +2039,15 @@ class AxisCalibrationData(CalibrationData):
             or a new, 'default' AxisCalibrationData object (as for an axis with 
             type flags UnknownAxisType).
         
+        """
+        if not isinstance(s,str) or len(s.strip()) == 0 or not s.startswith("<axis_calibration>") or not s.endswith("</axis_calibration>"):
+            raise ValueError("This is not an axis calibration string")
+        
+        return _copyCalibration(_parsedCalibrationString(s))
+    
+    @staticmethod
+    def _parseCalibrationString_(s:str) -> AxisCalibrationDataType:
+        """Parses an XML-formatted calibration string; see fromCalibrationString
         """
         import xml.etree.ElementTree as ET
         
@@ -2094,7 +2107,7 @@ class AxisCalibrationData(CalibrationData):
                             
         except Exception as e:
             traceback.print_exc()
-            print("cannot parse calibration string %s" % calibration_string)
+            print("cannot parse calibration string %s" % s)
             raise e
             
         return cal
@@ -2615,6 +2628,39 @@ class AxesCalibration(object):
     def items(self):
         yield from ((cal.key, cal) for cal in self)
     
+    def getUnits(self, key:typing.Union[str, int, vigra.AxisInfo], 
+                 channel:typing.Optional[typing.Union[int, str]] = None) -> pq.Quantity:
+        """The units of the axis with the given key (or index, or AxisInfo).
+        
+        For a Channels axis, `channel` (index or name) selects the channel.
+        """
+        if channel is not None:
+            return self[key].getChannelUnits(channel)
+        
+        return self[key].units
+    
+    def getOrigin(self, key:typing.Union[str, int, vigra.AxisInfo], 
+                  channel:typing.Optional[typing.Union[int, str]] = None) -> numbers.Number:
+        """The origin of the axis with the given key (or index, or AxisInfo).
+        
+        For a Channels axis, `channel` (index or name) selects the channel.
+        """
+        if channel is not None:
+            return self[key].getChannelMinimum(channel)
+        
+        return self[key].origin
+    
+    def getResolution(self, key:typing.Union[str, int, vigra.AxisInfo], 
+                      channel:typing.Optional[typing.Union[int, str]] = None) -> numbers.Number:
+        """The resolution of the axis with the given key (or index, or AxisInfo).
+        
+        For a Channels axis, `channel` (index or name) selects the channel.
+        """
+        if channel is not None:
+            return self[key].getChannelResolution(channel)
+        
+        return self[key].resolution
+    
     #@property
     def typeFlags(self, key):
         """Read-only
@@ -2765,6 +2811,71 @@ class AxesCalibration(object):
         for k, ax in enumerate(self._axistags_):
             self._calibration_[k].calibrateAxis(ax)
             
+# NOTE: 2026-10-18 14:50:41
+# Calibration strings are parsed once; see AxisCalibrationData.fromCalibrationString
+CALIBRATION_CACHE_SIZE = 1024
+
+@functools.lru_cache(maxsize = CALIBRATION_CACHE_SIZE)
+def _parsedCalibrationString(s:str) -> AxisCalibrationData:
+    # NOTE: the returned object is shared by the cache - do not modify it
+    return AxisCalibrationData._parseCalibrationString_(s)
+
+def _copyCalibration(cal:CalibrationData) -> CalibrationData:
+    """A copy of cal, including copies of its channel calibrations.
+    Cheaper than the CalibrationData constructors.
+    """
+    ret = cal.__class__.__new__(cal.__class__)
+    ret.__dict__.update(cal.__dict__)
+    ret._data_ = Bunch((k, _copyCalibration(v) if isinstance(v, CalibrationData) else v) for k, v in cal._data_.items())
+    return ret
+
+# AxesCalibration objects cached per VigraArray; see axesCalibration()
+# maps id(array) ↦ (weak reference to array, axistags signature, AxesCalibration)
+_arrayCalibrations = dict()
+_arrayCalibrationsLock = threading.Lock()
+
+def _axistagsSignature(axistags:vigra.AxisTags) -> tuple:
+    return tuple((axinfo.key, int(axinfo.typeFlags), axinfo.resolution, axinfo.description) for axinfo in axistags)
+
+def _discardArrayCalibration(key:int, ref:weakref.ref):
+    with _arrayCalibrationsLock:
+        entry = _arrayCalibrations.get(key, None)
+        if entry is not None and entry[0] is ref:
+            del _arrayCalibrations[key]
+
+def axesCalibration(data:vigra.VigraArray) -> AxesCalibration:
+    """The AxesCalibration of a VigraArray, cached with the array.
+    
+    The cached AxesCalibration is re-created when the axistags of the array 
+    have changed (i.e., the key, type flags, resolution or description of any 
+    of its axes), and is discarded with the array.
+    
+    CAUTION: The returned object is shared by all callers; use 
+    AxesCalibration(data) to get a private AxesCalibration that can be 
+    modified.
+    """
+    if not isinstance(data, vigra.VigraArray):
+        raise TypeError(f"Expecting a vigra.VigraArray; got {type(data).__name__} instead")
+    
+    key = id(data)
+    signature = _axistagsSignature(data.axistags)
+    
+    with _arrayCalibrationsLock:
+        entry = _arrayCalibrations.get(key, None)
+        
+        if entry is not None and entry[0]() is data and entry[1] == signature:
+            return entry[2]
+        
+    ret = AxesCalibration(data)
+    
+    ref = weakref.ref(data, functools.partial(_discardArrayCalibration, key))
+    
+    with _arrayCalibrationsLock:
+        _arrayCalibrations[key] = (ref, signature, ret)
+        
+    return ret
+
+
 def hasNameString(s):
     return AxesCalibration.hasNameString(s)
     
@@ -0,0 +1,432 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Cezar M. Tigaret <cezar.tigaret@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+"""Lazy, on-demand image frames for ScanData.
+
+A FrameStore refers to image data by its source, instead of holding it in
+memory:
+
+* TiffFrameSource: one image file per frame and channel (e.g. PrairieView
+    TSeries, ZSeries and linescan repetitions);
+
+* HDF5FrameSource: a data set in an HDF5 file;
+
+* MemmapFrameSource: a raw binary file, accessed via numpy.memmap.
+
+Individual frames are read when needed (e.g. when LSCaTWindow displays a frame,
+or when a frame is analysed) and are kept in a bounded, least-recently-used
+FrameCache shared by all FrameStore objects.
+
+Code that needs the whole data volume gets it from FrameStore.arrays() as
+VigraArray views on memory-mapped files; these are paged in from disk by the
+operating system, as they are accessed. For sources that cannot be mapped
+directly (compressed HDF5 data sets, image files) the data is first copied
+frame by frame to a temporary "spill" file.
+
+Until the whole data volume is needed, ScanData holds DeferredFrames (see
+FrameStore.deferred()): placeholder arrays with the shape, dtype and axistags
+of the data, which use no memory and read nothing from the source.
+
+All memory maps are opened in copy-on-write mode: changes made to the arrays
+are private to the process and are never written back to the source.
+
+In all sources, the data volume has the layout (d0, d1, frames, channels) where
+d0, d1 are the two axes of a frame (e.g. x, y for raster scans, or x, t for
+linescans).
+"""
+
+import abc, os, tempfile, threading, typing, uuid, weakref
+from collections import OrderedDict
+import numpy as np
+import h5py
+from core.vigra_patches import vigra
+
+# NOTE: 2026-10-18 12:04:31
+# upper bound on the memory used by frames cached by FrameStore.frame()
+FRAME_CACHE_NBYTES = 512 * 2**20
+
+class FrameCache(object):
+    """Thread-safe LRU cache of image frames, bounded by their size in bytes.
+    """
+    def __init__(self, maxbytes:int = FRAME_CACHE_NBYTES):
+        self.maxbytes = maxbytes
+        self.nbytes = 0
+        self._frames_ = OrderedDict()
+        self._lock_ = threading.Lock()
+
+    def __len__(self):
+        return len(self._frames_)
+
+    def get(self, key):
+        with self._lock_:
+            ret = self._frames_.get(key, None)
+            if ret is not None:
+                self._frames_.move_to_end(key)
+            return ret
+
+    def put(self, key, data:np.ndarray):
+        if data.nbytes > self.maxbytes:
+            return
+
+        with self._lock_:
+            old = self._frames_.pop(key, None)
+            if old is not None:
+                self.nbytes -= old.nbytes
+
+            self._frames_[key] = data
+            self.nbytes += data.nbytes
+
+            while self.nbytes > self.maxbytes and len(self._frames_):
+                _, evicted = self._frames_.popitem(last=False)
+                self.nbytes -= evicted.nbytes
+
+    def discard(self, token):
+        """Removes all frames cached for the FrameStore with the given token
+        """
+        with self._lock_:
+            for key in [k for k in self._frames_ if k[0] == token]:
+                self.nbytes -= self._frames_.pop(key).nbytes
+
+    def clear(self):
+        with self._lock_:
+            self._frames_.clear()
+            self.nbytes = 0
+
+frameCache = FrameCache()
+
+class FrameSource(abc.ABC):
+    """Abstract source of image frames; see TiffFrameSource, HDF5FrameSource,
+    MemmapFrameSource.
+
+    Subclasses define the attributes `nFrames`, `nChannels`, `frameShape`
+    (a tuple (d0, d1)) and `dtype`, and the method `readFrame()`.
+    """
+    nFrames = 0
+    nChannels = 0
+    frameShape = (0, 0)
+    dtype = np.dtype(np.float32)
+
+    @abc.abstractmethod
+    def readFrame(self, frame:int, channel:int) -> np.ndarray:
+        """Reads one frame of one channel as a 2D numpy array of frameShape.
+        """
+        pass
+
+    def memmap(self) -> typing.Optional[np.ndarray]:
+        """A copy-on-write memory map of the (d0, d1, frames, channels) data
+        volume, or None when the source cannot be mapped directly.
+        """
+        return None
+
+    def close(self):
+        """Releases the resources held by the source (e.g. open files); these
+        are acquired again when frames are read.
+        """
+        pass
+
+    @property
+    def shape(self) -> tuple:
+        return tuple(self.frameShape) + (self.nFrames, self.nChannels)
+
+class TiffFrameSource(FrameSource):
+    """Frames read from image files - one file per frame and channel.
+
+    Parameters:
+    -----------
+    fileNames: sequence (one element per frame) of sequences (one element per
+        channel) of image file names
+    """
+    def __init__(self, fileNames:typing.Sequence[typing.Sequence[str]]):
+        self.fileNames = [list(f) for f in fileNames]
+        self.nFrames = len(self.fileNames)
+        self.nChannels = len(self.fileNames[0]) if self.nFrames else 0
+
+        if any(len(f) != self.nChannels for f in self.fileNames):
+            raise ValueError("All frames must have the same number of channel files")
+
+        if self.nFrames:
+            first = self._read_(self.fileNames[0][0])
+            self.frameShape = first.shape
+            self.dtype = first.dtype
+
+    @staticmethod
+    def _read_(fileName:str) -> np.ndarray:
+        data = vigra.impex.readImage(fileName)
+        return np.asarray(data).reshape(data.shape[:2])
+
+    def readFrame(self, frame:int, channel:int) -> np.ndarray:
+        data = self._read_(self.fileNames[frame][channel])
+        if data.shape != tuple(self.frameShape):
+            raise ValueError(f"Image file {self.fileNames[frame][channel]} has shape {data.shape}; expecting {self.frameShape}")
+
+        return data
+
+class HDF5FrameSource(FrameSource):
+    """Frames read from an HDF5 data set with the layout (d0, d1, frames[, channels])
+
+    Parameters:
+    -----------
+    fileName: str - the HDF5 file
+
+    path: str - path of the data set in the file
+    """
+    def __init__(self, fileName:str, path:str):
+        self.fileName = os.path.abspath(fileName)
+        self.path = path
+        self._file_ = None
+        self._lock_ = threading.Lock()
+
+        dset = self._dataset_()
+
+        if dset.ndim not in (3, 4):
+            raise ValueError(f"Expecting a 3D or 4D data set; got {dset.ndim} dimensions instead")
+
+        self.frameShape = dset.shape[:2]
+        self.nFrames = dset.shape[2]
+        self.nChannels = dset.shape[3] if dset.ndim == 4 else 1
+        self.dtype = dset.dtype
+
+    def _dataset_(self):
+        if self._file_ is None:
+            self._file_ = h5py.File(self.fileName, "r")
+        return self._file_[self.path]
+
+    def readFrame(self, frame:int, channel:int) -> np.ndarray:
+        # NOTE: h5py objects are not safe for concurrent use
+        with self._lock_:
+            dset = self._dataset_()
+            if dset.ndim == 4:
+                return dset[:, :, frame, channel]
+            return dset[:, :, frame]
+
+    def memmap(self):
+        with self._lock_:
+            dset = self._dataset_()
+            offset = dset.id.get_offset()
+            # only contiguous, uncompressed data sets can be mapped
+            if offset is None or dset.chunks is not None or dset.compression is not None:
+                return None
+
+            mm = np.memmap(self.fileName, dtype=dset.dtype, mode="c",
+                           offset=offset, shape=dset.shape, order="C")
+
+        if mm.ndim == 3:
+            mm = mm[..., np.newaxis]
+
+        return mm
+
+    def close(self):
+        with self._lock_:
+            if self._file_ is not None:
+                self._file_.close()
+                self._file_ = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_file_"] = None
+        del state["_lock_"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock_ = threading.Lock()
+
+class MemmapFrameSource(FrameSource):
+    """Frames in a raw binary file with the layout (d0, d1, frames, channels)
+
+    Parameters:
+    -----------
+    fileName: str
+
+    dtype: numpy dtype of the data
+
+    shape: tuple (d0, d1, frames, channels)
+
+    offset: int, optional (default 0) - offset of the data in the file, in bytes
+
+    order: "F" (default) or "C" - the memory layout of the data in the file
+    """
+    def __init__(self, fileName:str, dtype, shape:tuple, offset:int = 0, order:str = "F"):
+        if len(shape) != 4:
+            raise ValueError(f"Expecting a shape (d0, d1, frames, channels); got {shape} instead")
+
+        self.fileName = os.path.abspath(fileName)
+        self.dtype = np.dtype(dtype)
+        self.frameShape = tuple(shape[:2])
+        self.nFrames = shape[2]
+        self.nChannels = shape[3]
+        self.offset = offset
+        self.order = order
+
+    def memmap(self):
+        return np.memmap(self.fileName, dtype=self.dtype, mode="c",
+                         offset=self.offset, shape=self.shape, order=self.order)
+
+    def readFrame(self, frame:int, channel:int) -> np.ndarray:
+        return np.array(self.memmap()[:, :, frame, channel])
+
+class DeferredFrames(list):
+    """Placeholder for the (not yet loaded) data volume of a FrameStore.
+
+    A list with one single-band (d0, d1, frames, channel) VigraArray per
+    channel, as FrameStore.arrays(), with the shape, dtype and axistags of the
+    data. The arrays are read-only views on a single element: their contents
+    is NOT the image data.
+
+    Pickled by reference to the FrameStore.
+    """
+    def __init__(self, store:"FrameStore"):
+        self.store = store
+        shape = tuple(store.source.frameShape) + (store.nFrames, 1)
+        empty = np.broadcast_to(np.zeros((), dtype=store.source.dtype), shape)
+        super().__init__(vigra.taggedView(empty, store.axistags[c]) for c in range(store.nChannels))
+
+    def __reduce__(self):
+        return (self.__class__, (self.store, ))
+
+class FrameStore(object):
+    """Image data referenced by its source, with frames loaded on demand.
+
+    Parameters:
+    -----------
+    source: FrameSource
+
+    axistags: sequence of vigra.AxisTags, one per channel; each describes the
+        (d0, d1, frames, channel) axes of the data volume in that channel
+
+    cache: FrameCache, optional; default is the module-level frameCache
+    """
+    def __init__(self, source:FrameSource, axistags:typing.Sequence[vigra.AxisTags],
+                 cache:typing.Optional[FrameCache] = None):
+        if len(axistags) != source.nChannels:
+            raise ValueError(f"Expecting {source.nChannels} axistags (one per channel); got {len(axistags)} instead")
+
+        if any(len(tags) != 4 for tags in axistags):
+            raise ValueError("Expecting axistags for (d0, d1, frames, channel) axes")
+
+        self.source = source
+        self.axistags = list(axistags)
+        self.cache = cache
+        self._token_ = uuid.uuid4().hex
+        self._spill_ = None
+        weakref.finalize(self, source.close)
+
+    def __len__(self):
+        return self.source.nFrames
+
+    @property
+    def nFrames(self) -> int:
+        return self.source.nFrames
+
+    @property
+    def nChannels(self) -> int:
+        return self.source.nChannels
+
+    @property
+    def frameCache(self) -> FrameCache:
+        return frameCache if self.cache is None else self.cache
+
+    def frame(self, index:int, channel:int = 0) -> vigra.VigraArray:
+        """A frame of the given channel, as a 2D (d0, d1) VigraArray.
+
+        The frame is read from the source unless it is in the frame cache.
+        The returned array is read-only (its data is shared with the cache).
+        """
+        if index < 0:
+            index += self.nFrames
+
+        if index < 0 or index >= self.nFrames:
+            raise IndexError(f"Frame index {index} out of range for {self.nFrames} frames")
+
+        key = (self._token_, channel, index)
+        data = self.frameCache.get(key)
+
+        if data is None:
+            data = np.asarray(self.source.readFrame(index, channel))
+            data.setflags(write=False)
+            self.frameCache.put(key, data)
+
+        tags = self.axistags[channel]
+        return vigra.taggedView(data, vigra.AxisTags(tags[0], tags[1]))
+
+    def frames(self, indices:typing.Iterable[int], channel:int = 0) -> typing.Generator:
+        """Generates the frames with the given indices, for the given channel.
+        """
+        for index in indices:
+            yield self.frame(index, channel)
+
+    def deferred(self) -> DeferredFrames:
+        """Placeholders for the data volume, that do not read the source.
+        """
+        return DeferredFrames(self)
+
+    def arrays(self) -> list:
+        """The data volume, as a list of (d0, d1, frames, channel) VigraArrays.
+
+        There is one single-band VigraArray for each channel, as expected by
+        ScanData for its scans and scene. The arrays are copy-on-write views
+        on memory-mapped files.
+        """
+        mm = self.source.memmap()
+
+        if mm is None:
+            mm = self._spillMemmap_()
+
+        return [vigra.taggedView(mm[:, :, :, c:c+1], self.axistags[c]) for c in range(self.nChannels)]
+
+    def close(self):
+        """Closes the source (see FrameSource.close()) and drops the frames
+        of this store from the frame cache.
+
+        The store remains usable: the source is opened again when needed.
+        """
+        self.source.close()
+        self.frameCache.discard(self._token_)
+
+    def _spillMemmap_(self):
+        """Copies the source to a temporary file, frame by frame, and maps it.
+        """
+        shape = self.source.shape
+
+        if self._spill_ is None:
+            fd, fileName = tempfile.mkstemp(prefix="scipyen-frames-", suffix=".dat")
+            os.close(fd)
+
+            try:
+                mm = np.memmap(fileName, dtype=self.source.dtype, mode="w+",
+                               shape=shape, order="F")
+
+                for c in range(self.nChannels):
+                    for k in range(self.nFrames):
+                        mm[:, :, k, c] = self.source.readFrame(k, c)
+
+                mm.flush()
+                del mm
+
+            except:
+                os.remove(fileName)
+                raise
+
+            self._spill_ = fileName
+            weakref.finalize(self, _removeFile, fileName)
+
+        return np.memmap(self._spill_, dtype=self.source.dtype, mode="c",
+                         shape=shape, order="F")
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_spill_"] = None # spill files are private to the process
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._token_ = uuid.uuid4().hex
+        weakref.finalize(self, self.source.close)
+
+def _removeFile(fileName:str):
+    try:
+        os.remove(fileName)
+    except OSError:
+        pass
@@ -10,16 +10,16 @@ Module for image processing routines
 #__all__ = ["pureDenoise", "binomialFilter1D", "gaussianFilter1D"]
 
 #### BEGIN core python modules
-import os, sys, traceback, warnings, numbers
+import os, sys, traceback, warnings, numbers, threading
 import typing
-from collections import deque
+from collections import (deque, OrderedDict)
 #### END core python modules
 
 #### BEGIN 3rd party modules
 import imreg_dft as ird
 import numpy as np
 import quantities as pq
-from scipy import optimize
+from scipy import optimize, ndimage, special
 from core.vigra_patches import vigra
 import neo
 #### END 3rd party modules
@@ -44,103 +44,509 @@ from core.datasignal import DataSignal
 #from .patchneo import neo
 #### END pict.core modules
 
-def getProfile(img, coordinates:typing.Optional[typing.Union[pgui.PlanarGraphics, typing.Sequence[typing.Sequence]]]=None, 
-               order:int=1) -> DataSignal:
-    """Retrieves interpolated pixel values at a collection of (X,Y coordinates.
+# NOTE: 2026-10-18 15:01:12
+# number of straight segments per path length unit (at unit sample spacing)
+# used to flatten Bezier curves (Cubic, Quad) before resampling them by arc length
+BEZIER_FLATTENING = 4
 
-    The (X,Y) coordinates (in the image dimension space) are floating point values, 
-    and do not necesarily fall on a pixel coordinates pairs. For this reason, 
-    the function uses a spline interpolation (in the image data domain) to get
-    an interpolated pixel VALUE at any given coordinates pair.
+def _bezierPoints(ctrl:np.ndarray, n:int) -> np.ndarray:
+    """Points on the Bezier curve with control points in `ctrl`.
+    
+    ctrl: (degree + 1, 2) array of control point coordinates, including the 
+        start and end points of the curve
+    
+    n: number of curve segments; the curve is evaluated at n + 1 equally spaced
+        values of its parameter, in the interval [0, 1]
+    
+    Returns a (n + 1, 2) array of (x, y) coordinates.
+    """
+    degree = ctrl.shape[0] - 1
+    u = np.linspace(0., 1., n + 1)[:, np.newaxis]
+    k = np.arange(degree + 1)
+    basis = special.comb(degree, k) * u ** k * (1. - u) ** (degree - k)
+    return basis @ ctrl
 
-    The spline interpolation is calculated uwing vigra.SplineImageView family of
-    functors, which supports a spline order from 1 to 5.
+def _resampleByArcLength(vertices:np.ndarray, spacing:float) -> np.ndarray:
+    """Points equally spaced by arc length along the polyline with `vertices`.
+    
+    The first and last vertices are always included; the spacing between the 
+    returned points is the closest to `spacing` that divides the polyline length
+    into an integral number of intervals.
+    """
+    arc = np.concatenate(([0.], np.cumsum(np.hypot(*np.diff(vertices, axis=0).T))))
+    
+    if arc[-1] == 0.:
+        return vertices[:1]
+    
+    s = np.linspace(0., arc[-1], max(int(round(arc[-1]/spacing)), 1) + 1)
+    
+    return np.column_stack((np.interp(s, arc, vertices[:,0]), 
+                            np.interp(s, arc, vertices[:,1])))
 
+def _stateElement(state:dict, first:bool) -> tuple:
+    """Element type and control points (as for PlanarGraphics.controlPoints 
+    with inPath True) for the state of a Move, Line, Cubic or Quad.
+    
+    States with only (x, y) descriptors are taken as Move when they are the 
+    first in a path, and as Line otherwise.
+    """
+    if all(k in state for k in pgr.Cubic._planar_descriptors_):
+        return pgr.Cubic, ((state.c1x, state.c1y), (state.c2x, state.c2y), (state.c3x, state.c3y))
+    
+    if all(k in state for k in pgr.Quad._planar_descriptors_):
+        return pgr.Quad, ((state.c1x, state.c1y), (state.c2x, state.c2y))
+    
+    if all(k in state for k in pgr.Line._planar_descriptors_):
+        return pgr.Line, ((state.x1, state.y1),)
+    
+    # older API: control points and destination point (x, y)
+    if all(k in state for k in ("c1x", "c1y", "c2x", "c2y", "x", "y")):
+        return pgr.Cubic, ((state.c1x, state.c1y), (state.c2x, state.c2y), (state.x, state.y))
+    
+    if all(k in state for k in ("cx", "cy", "x", "y")):
+        return pgr.Quad, ((state.cx, state.cy), (state.x, state.y))
+    
+    if all(k in state for k in ("x", "y")):
+        return (pgr.Move if first else pgr.Line), ((state.x, state.y),)
+    
+    raise TypeError(f"Unsupported path element state with descriptors {tuple(state.keys())}")
 
+def _pathElements(path, frame:typing.Optional[int] = None) -> list:
+    """The elements of a path, as a list of (element type, control points).
+    
+    The control points are those returned by PlanarGraphics.controlPoints with
+    inPath True, i.e. without the start point of Line, Cubic and Quad. 
+    
+    `path` is a pictgui.Path, a stand-alone Move, Line, Cubic or Quad, or a 
+    sequence of element states.
     """
-    if not isinstance(img, vigra.VigraArray):
-        raise TypeError("Expecting a 2D VigraArray; got %s instead" % (type(img).__name__))
+    if isinstance(path, pgui.Path):
+        elements = [(type(e), e.controlPoints(frame, True)) for e in path]
+        
+    elif isinstance(path, (pgr.Move, pgr.Line, pgr.Cubic, pgr.Quad)):
+        # a stand-alone element: its first point is the start of the curve
+        cp = path.controlPoints(frame)
+        elements = [(pgr.Move, cp[:1]), (type(path), cp[1:])] if len(cp) else []
+        
+    elif isinstance(path, (tuple, list, deque)) and all(isinstance(s, dict) for s in path):
+        elements = [_stateElement(s, k == 0) for k, s in enumerate(path)]
+            
+    else:
+        raise TypeError(f"Expecting a pictgui.Path, Move, Line, Cubic or Quad; got {type(path).__name__} instead")
     
-    if img.ndim != 2:
-        if img.ndim == 3:
-            if img.channelIndex >= img.ndim:
-                raise TypeError("Expecting a 2D VigraArray, or a 3D VigraArray with a channel axis; got a %d-dimensions array instead" % (img.ndim))
+    for elementType, cp in elements:
+        if issubclass(elementType, pgr.CurveElements) and not issubclass(elementType, (pgr.Cubic, pgr.Quad)):
+            raise TypeError(f"{elementType.__name__} path elements are not supported")
+        
+    return elements
+
+def pathSamplePoints(path:pgui.PlanarGraphics, spacing:float = 1., 
+                     frame:typing.Optional[int] = None) -> np.ndarray:
+    """Sample points along a path, equally spaced by arc length.
+    
+    Parameters:
+    ===========
+    path: a pictgui.Path composed of Move, Line, Cubic and Quad elements, or 
+        one such element on its own, or a sequence of the states of such 
+        elements (see PlanarGraphics.getState).
+        
+        Bezier curves (Cubic, Quad) are evaluated at BEZIER_FLATTENING points 
+        per unit of length of their control polygon, then the resulting polyline
+        is resampled by arc length, together with the linear elements.
+        
+        A Move element beyond the start of the path begins a new subpath; the 
+        subpaths are sampled separately and their sample points are returned
+        in the order of the subpaths (the "jump" between subpaths is not 
+        sampled).
+        
+    spacing: float > 0, default is 1. - the distance between consecutive sample
+        points, along the path (in the units of the path coordinates, typically
+        pixels); this is adjusted so that each subpath is divided in an integral
+        number of intervals.
+        
+    frame: int or None (default) - the frame for which the path's descriptors
+        are used (see PlanarGraphics.controlPoints)
+        
+    Returns:
+    ========
+    A (N, 2) numpy array with the (x, y) coordinates of the sample points.
+    
+    """
+    if not isinstance(spacing, numbers.Real) or spacing <= 0:
+        raise ValueError(f"spacing expected to be a real scalar > 0; got {spacing} instead")
+    
+    elements = _pathElements(path, frame)
+    
+    subpaths = list()
+    current = None
+    
+    for elementType, cp in elements:
+        if len(cp) == 0:
+            continue
+        
+        cp = np.asarray(cp, dtype=float)
+        
+        if issubclass(elementType, pgr.Move):
+            current = [cp[-1:]]
+            subpaths.append(current)
+            continue
+        
+        if current is None:
+            # a path that does not begin with Move starts at (0, 0), as in Qt
+            current = [np.zeros((1, 2))]
+            subpaths.append(current)
+        
+        if issubclass(elementType, pgr.Line):
+            current.append(cp[-1:])
+            
+        else:
+            ctrl = np.vstack((current[-1][-1:], cp))
+            polygon = np.sum(np.hypot(*np.diff(ctrl, axis=0).T))
+            n = max(int(np.ceil(polygon * BEZIER_FLATTENING / spacing)), 1)
+            current.append(_bezierPoints(ctrl, n)[1:])
+            
+    if len(subpaths) == 0:
+        return np.zeros((0, 2))
+    
+    return np.concatenate([_resampleByArcLength(np.concatenate(v), spacing) for v in subpaths])
+
+# NOTE: 2026-10-18 15:08:26
+# number of points per Bezier curve element in the arc length table of a PathGeometry
+PATH_GEOMETRY_SAMPLES = 64
+
+# number of PathGeometry objects of path element states cached by pathGeometry()
+PATH_GEOMETRY_CACHE_SIZE = 256
+
+# converts the control points of a cubic Bezier curve to the coefficients of its 
+# polynomial in the curve parameter
+_CUBIC_BEZIER_BASIS = np.array([[ 1.,  0.,  0., 0.],
+                                [-3.,  3.,  0., 0.],
+                                [ 3., -6.,  3., 0.],
+                                [-1.,  3., -3., 1.]])
+
+class PathGeometry(object):
+    """Arc length geometry of a path, for mapping distances along the path to 
+    (x, y) coordinates.
+    
+    All Line, Quad and Cubic elements are stored as cubic polynomials in their
+    curve parameter; distances along the path are mapped to the curve parameter
+    via a table of cumulative arc length, so that many distances are mapped at
+    once, in a single array operation (see pointsAt()).
+    
+    Use pathGeometry() to get the (cached) PathGeometry of a path.
+    
+    Parameters:
+    -----------
+    elements: sequence of (element type, control points) - see _pathElements()
+    
+    samples: int, the number of points per curve element in the arc length 
+        table (Line elements are always exact)
+    
+    Attributes:
+    -----------
+    vertices: (N, 2) array with the destination point of each element
+    
+    length: the length of the path (not including the "jumps" between subpaths)
+    
+    linear: True when the path is made only of Move and Line elements
+    """
+    def __init__(self, elements:typing.Sequence[tuple], samples:int = PATH_GEOMETRY_SAMPLES):
+        vertices = list()
+        coefficients = list()
+        arcs = list()
+        params = list()
+        
+        start = None
+        length = 0.
+        
+        for elementType, cp in elements:
+            if len(cp) == 0:
+                continue
+            
+            cp = np.asarray(cp, dtype=float)
+            vertices.append(cp[-1])
+            
+            if issubclass(elementType, pgr.Move):
+                start = cp[-1]
+                continue
+            
+            if start is None:
+                start = np.zeros(2) # as in Qt
+                
+            if issubclass(elementType, pgr.Line):
+                ctrl = np.array([start, (2. * start + cp[-1]) / 3., (start + 2. * cp[-1]) / 3., cp[-1]])
+                u = np.array([0., 1.])
+                
+            elif issubclass(elementType, pgr.Quad):
+                # degree elevation to a cubic Bezier
+                ctrl = np.array([start, start + 2. * (cp[0] - start) / 3., 
+                                 cp[1] + 2. * (cp[0] - cp[1]) / 3., cp[1]])
+                u = np.linspace(0., 1., samples)
+                
+            else:
+                ctrl = np.vstack((start, cp))
+                u = np.linspace(0., 1., samples)
+                
+            coeffs = _CUBIC_BEZIER_BASIS @ ctrl
+            points = np.power.outer(u, np.arange(4)) @ coeffs
+            
+            arc = length + np.concatenate(([0.], np.cumsum(np.hypot(*np.diff(points, axis=0).T))))
+            
+            params.append(len(coefficients) + u)
+            arcs.append(arc)
+            coefficients.append(coeffs)
+            
+            length = arc[-1]
+            start = cp[-1]
+            
+        self.vertices = np.array(vertices).reshape((-1, 2))
+        self.length = length
+        self.linear = all(issubclass(t, pgr.LinearElements) for t, cp in elements)
+        self._coefficients_ = np.array(coefficients).reshape((-1, 4, 2))
+        self._arc_ = np.concatenate(arcs) if len(arcs) else np.zeros((0,))
+        self._param_ = np.concatenate(params) if len(params) else np.zeros((0,))
+        
+    def __len__(self):
+        return len(self.vertices)
+        
+    def pointsAt(self, distance) -> np.ndarray:
+        """The (x, y) coordinates of the points at the given distances along the path.
+        
+        Parameters:
+        -----------
+        distance: scalar or array-like of distances from the start of the path
+        
+        Returns:
+        --------
+        A (2,) array for a scalar distance, or an array with shape 
+        distance.shape + (2,). Distances outside the interval [0, length] are 
+        mapped to NaN coordinates.
+        """
+        distance = np.asarray(distance, dtype=float)
+        s = distance.reshape(-1)
+        
+        if len(self._coefficients_) == 0:
+            # no curve elements - at most, a single point
+            ret = np.full((s.size, 2), np.nan)
+            if len(self.vertices):
+                ret[s == 0.] = self.vertices[0]
+            return ret.reshape(distance.shape + (2,))
+        
+        param = np.interp(s, self._arc_, self._param_)
+        element = np.clip(np.floor(param).astype(int), 0, len(self._coefficients_) - 1)
+        u = param - element
+        
+        ret = np.einsum("nk,nkd->nd", np.power.outer(u, np.arange(4)), self._coefficients_[element])
+        ret[(s < 0.) | (s > self.length) | np.isnan(s)] = np.nan
+        
+        return ret.reshape(distance.shape + (2,))
+
+_pathGeometries = OrderedDict()
+_pathGeometriesLock = threading.Lock()
+
+def pathGeometry(path, frame:typing.Optional[int] = None) -> PathGeometry:
+    """The PathGeometry of a path, in the given frame.
+    
+    For a pictgui.Path (or a stand-alone path element) the PathGeometry is 
+    stored with the path, and is recalculated after the path has changed (see
+    PlanarGraphics.stateVersion).
+    
+    For a sequence of element states, PathGeometry objects are cached by the
+    control points of the path elements.
+    
+    Parameters:
+    -----------
+    path: pictgui.Path, or a sequence of path element states (see pathSamplePoints)
+    
+    frame: int or None (default) - the frame for which the path's descriptors
+        are used
+    """
+    if isinstance(path, pgr.PlanarGraphics):
+        # NOTE: 2026-10-18 16:11:37
+        # changing the current frame of the path also changes its state version
+        version = path.stateVersion
+        
+        with _pathGeometriesLock:
+            cached = path.__dict__.get("_path_geometries_", None)
+            if cached is not None and cached[0] == version and frame in cached[1]:
+                return cached[1][frame]
             
-            elif img.channels > 1:
-                raise TypeError("Expecting a single-band VigraArray")
+        ret = PathGeometry(_pathElements(path, frame))
+        
+        with _pathGeometriesLock:
+            cached = path.__dict__.get("_path_geometries_", None)
+            if cached is None or cached[0] != version:
+                cached = (version, dict())
+                object.__setattr__(path, "_path_geometries_", cached)
+            cached[1][frame] = ret
+            
+        return ret
+    
+    elements = _pathElements(path, frame)
+    
+    signature = tuple((t.__name__, tuple(tuple(float(v) for v in p) for p in cp)) for t, cp in elements)
+    
+    with _pathGeometriesLock:
+        ret = _pathGeometries.get(signature, None)
+        if ret is not None:
+            _pathGeometries.move_to_end(signature)
+            return ret
+        
+    ret = PathGeometry(elements)
+    
+    with _pathGeometriesLock:
+        _pathGeometries[signature] = ret
+        while len(_pathGeometries) > PATH_GEOMETRY_CACHE_SIZE:
+            _pathGeometries.popitem(last=False)
+            
+    return ret
+
+def _axisIndex(img:vigra.VigraArray, key) -> int:
+    """Index of the axis with the given key (str, int or vigra.AxisInfo) in `img`
+    """
+    if isinstance(key, str):
+        ndx = img.axistags.index(key)
+        
+    elif isinstance(key, vigra.AxisInfo):
+        ndx = img.axistags.index(key.key)
+        
+    elif isinstance(key, int):
+        ndx = key if key >= 0 else key + img.ndim
+        
+    else:
+        raise TypeError(f"Axis expected to be a str, int or a vigra.AxisInfo; instead, got {type(key).__name__}")
+    
+    if ndx < 0 or ndx >= img.ndim:
+        raise ValueError(f"Axis {key} not found in {repr(img.axistags)}")
+    
+    return ndx
+
+def sampleProfile(img:vigra.VigraArray, xy, order:int = 1, 
+                  frameAxis:typing.Optional[typing.Union[str, int, vigra.AxisInfo]] = None) -> np.ndarray:
+    """Interpolated pixel values at (x, y) coordinates, for all channels and frames.
+    
+    All values are sampled with scipy.ndimage.map_coordinates, in a single call
+    for spline orders 0 and 1; for higher orders, the spline coefficients are 
+    calculated once for the whole data and are then sampled frame by frame 
+    (this avoids mixing pixel values across frames).
+    
+    Parameters:
+    ===========
+    img: VigraArray with two non-channel axes (the image plane) and, optionally,
+        a channel axis and a frame axis (see `frameAxis`).
+        
+        The (x, y) coordinates refer, respectively, to the first and second 
+        non-channel axis of the image plane, in vigra order (as for 
+        vigra.sampling.SplineImageView).
+        
+    xy: sequence of (x, y) coordinate pairs, or a (N, 2) array (e.g. as 
+        returned by pathSamplePoints())
+        
+    order: int in the closed interval [0, 5]: the order of the interpolating
+        spline (default is 1, i.e. linear interpolation)
+        
+    frameAxis: str, int, vigra.AxisInfo or None (default) - the axis of `img`
+        along which frames are stacked (e.g. "t" for a time series, or "z"); 
+        must be given when `img` has three non-channel axes.
+        
+    Returns:
+    ========
+    A numpy array with shape (N[, frames][, channels]), where N is the number of
+    (x, y) coordinate pairs; the frames axis is present only when `frameAxis` is
+    given, and the channels axis is present only when `img` has more than one
+    channel.
+    
+    """
+    if not isinstance(img, vigra.VigraArray):
+        raise TypeError(f"Expecting a VigraArray; got {type(img).__name__} instead")
     
     if not isinstance(order, int):
         raise TypeError("Spline order expected to be an int; got %s instead" % (type(order).__name__))
     
     elif order < 0 or order > 5:
         raise ValueError("Invalid spline order specified (%d); must be between 0 and 5" % (order))
+    
+    xy = np.asarray(xy, dtype=float).reshape((-1, 2))
+    
+    view = img.transposeToVigraOrder()
+    
+    frameNdx = _axisIndex(view, frameAxis) if frameAxis is not None else None
+    channelNdx = view.channelIndex if view.channelIndex < view.ndim else None
+    
+    if frameNdx is not None and frameNdx == channelNdx:
+        raise ValueError("The frame axis cannot be the channel axis")
+    
+    planeAxes = [k for k in range(view.ndim) if k not in (frameNdx, channelNdx)]
+    
+    if len(planeAxes) != 2:
+        raise TypeError(f"Expecting an image with two non-channel axes besides the frame axis; got {repr(img.axistags)}")
+    
+    extraAxes = [k for k in (frameNdx, channelNdx) if k is not None]
+    extraShape = tuple(view.shape[k] for k in extraAxes)
+    
+    # (d0, d1, planes), where a plane is a channel in a frame
+    data = np.moveaxis(np.asarray(view), planeAxes + extraAxes, range(view.ndim))
+    data = data.reshape(data.shape[:2] + (-1,))
+    
+    if not np.issubdtype(data.dtype, np.floating):
+        data = data.astype(np.float64)
+        
+    nPlanes = data.shape[2]
+    
+    if order <= 1:
+        # linear interpolation at integral plane coordinates never mixes planes
+        coords = np.empty((3, xy.shape[0], nPlanes))
+        coords[0] = xy[:, 0, np.newaxis]
+        coords[1] = xy[:, 1, np.newaxis]
+        coords[2] = np.arange(nPlanes)
+        values = ndimage.map_coordinates(data, coords, order=order, mode="mirror")
+        
+    else:
+        coeffs = ndimage.spline_filter1d(data, order=order, axis=0, mode="mirror")
+        coeffs = ndimage.spline_filter1d(coeffs, order=order, axis=1, mode="mirror")
+        values = np.stack([ndimage.map_coordinates(coeffs[:, :, k], xy.T, order=order, 
+                                                   mode="mirror", prefilter=False) 
+                           for k in range(nPlanes)], axis=-1)
+        
+    values = values.reshape((xy.shape[0],) + extraShape)
+    
+    if channelNdx is not None and view.shape[channelNdx] == 1:
+        values = values[..., 0]
+        
+    return values
+
+def getProfile(img, coordinates:typing.Optional[typing.Union[pgui.PlanarGraphics, typing.Sequence[typing.Sequence]]]=None, 
+               order:int=1, spacing:float=1.) -> np.ndarray:
+    """Retrieves interpolated pixel values at a collection of (X,Y coordinates.
+
+    The (X,Y) coordinates (in the image dimension space) are floating point values, 
+    and do not necesarily fall on a pixel coordinates pairs. For this reason, 
+    the function uses a spline interpolation (in the image data domain) to get
+    an interpolated pixel VALUE at any given coordinates pair.
 
-    interpolators = (vigra.sampling.SplineImageView0, vigra.sampling.SplineImageView1, \
-                    vigra.sampling.SplineImageView2, vigra.sampling.SplineImageView3, \
-                    vigra.sampling.SplineImageView4, vigra.sampling.SplineImageView5)
+    The spline interpolation is calculated by sampleProfile(), which supports 
+    a spline order from 0 to 5.
     
-    spl = interpolators[order](img)
+    When `coordinates` is a PlanarGraphics path (or a Line, Cubic or Quad), the 
+    pixel values are sampled at points equally spaced by `spacing` along the
+    path (see pathSamplePoints()).
     
-    if isinstance(coordinates, pgui.PlanarGraphics):
-        # NOTE: 2024-08-22 09:37:53 new algorithm:
-        # 1) treat the object as a 1D function y = f(x)
-        # 2) for linear and curve planargraphics call their curveLength() method
-        #   (which implictly uses the approach stated at point (1) above)
-        # 3) for path objects (most cases)
-        # 3.1) composed entirely of linear elements (move, line):
-        #   these MIGHT need interpolation: e.g. a line (path) is composed of two 
-        #       elements (Move and Line) therefore I need a set of intermediate 
-        #       coordinates between these points — I apply the principle stated
-        #       at point (1) above, and use linear interpolation
-        #   the potential problem is with a polyline path where the number of 
-        #   segments is very large —
-        
-        if isinstance(coordinates, pgui.Path):
-            if all([isinstance(c, pgr.LinearElements) for c in coordinates]):
-                # NOTE: pgui.Path inherits from list so this checks True for pgui.Path objects, too
-                # BUG: 2024-08-21 16:34:54 FIXME
-                # the below could return only two points -- we need to interpolate
-                # the coordinates!
-                
-                # NOTE: 2024-08-21 21:37:42
-                # here, `coordinates` may be a line (two points) or a polyline (> 2 points)
-                #
-                # we want to interpolate BETWEEN these points; to keep things simple,
-                # we use linear interpolation
-                #
-                # this produces two numpy arrays, respectively, with the x and y cordinates
-                # of the roi's points
-                # roi_x, roi_y = map(lambda x: np.array(x), zip(*[(p.x, p.y) for p in coordinates]))
-                
-                # the total length (in pixels) of the line or polyline is the sum of
-                # the length of each segment; in turn the length of each segment is the Euclidean
-                # distance between its end points
-                #
-                # ATTENTION: do NOT confuse with the Euclidean distance between roi_x, roi_y
-                # vectors !!! That one applies to 𝑵-dimensional vectors, which roi_x, roi_y are NOT!
-                
-                density = coordinates.density
-                
-                if np.isclose(density, 1., atol=1e-1):
-                    # there are approximately as many points as "pixels" in the Path obj
-                    # ⇒ no need to interpolate
-                    domain, values = map(lambda x: np.array(x), zip(*[(p.x, spl(p.x, p.y)) for p in coordinates]))
-                
-                else:
-                    if density < 1:
-                        # need linear interpolation across the points
-                        pass
-                
+    Multi-channel images are supported; the result has a second axis, for the 
+    channels (see sampleProfile()).
+
+    """
+    if not isinstance(img, vigra.VigraArray):
+        raise TypeError("Expecting a 2D VigraArray; got %s instead" % (type(img).__name__))
+    
+    if img.ndim != 2:
+        if img.ndim != 3 or img.channelIndex >= img.ndim:
+            raise TypeError("Expecting a 2D VigraArray, or a 3D VigraArray with a channel axis; got a %d-dimensions array instead" % (img.ndim))
             
-            else:
-                if any(isinstance(c, pgui.CurveElements) for c in coordinates):
-                    raise TypeError("Curvilinear path elements are not supported")
-                
-                else:
-                    raise TypeError("Unexpected coordinates type (%s)" % (type(coordinates).__name__))
+    if isinstance(coordinates, pgui.PlanarGraphics):
+        return sampleProfile(img, pathSamplePoints(coordinates, spacing), order=order)
                 
     elif isinstance(coordinates, (list, tuple, deque)) and all([isinstance(c, (tuple, list)) and len(c)==2 for c in coordinates]):
-        return np.array([spl(c[0], c[1]) for c in coordinates])
+        return sampleProfile(img, coordinates, order=order)
 
     elif coordinates is None:
         return np.full((1,1), np.nan)
@@ -148,6 +554,93 @@ def getProfile(img, coordinates:typing.Optional[typing.Union[pgui.PlanarGraphics
     else:
         raise TypeError("Unexpected coordinates type (%s)" % (type(coordinates).__name__))
         
+def kymograph(img:vigra.VigraArray, path:pgui.PlanarGraphics, 
+              frameAxis:typing.Union[str, int, vigra.AxisInfo] = "t",
+              order:int = 1, spacing:float = 1.) -> vigra.VigraArray:
+    """Pixel values along a path, in all frames of an image stack.
+    
+    Parameters:
+    ===========
+    img: VigraArray - the image stack (see sampleProfile())
+    
+    path: PlanarGraphics path (see pathSamplePoints()); its current descriptors
+        are used for all frames
+        
+    frameAxis: str, int or vigra.AxisInfo - the frame axis of `img` (default is "t")
+    
+    order, spacing: see getProfile()
+    
+    Returns:
+    ========
+    A VigraArray with axes (x, frames[, c]): "x" is the distance along the path,
+    in samples; the frame and channel axes have the axis info of the 
+    corresponding axes in `img`.
+    
+    """
+    values = sampleProfile(img, pathSamplePoints(path, spacing), order=order,
+                           frameAxis=frameAxis)
+    
+    view = img.transposeToVigraOrder()
+    tags = [vigra.AxisInfo("x", vigra.AxisType.Space), view.axistags[_axisIndex(view, frameAxis)]]
+    
+    if values.ndim == 3:
+        tags.append(view.axistags[view.channelIndex])
+        
+    return vigra.VigraArray(values, axistags=vigra.AxisTags(*tags), order="V")
+
+def frameProfiles(img:vigra.VigraArray, path:pgui.PlanarGraphics,
+                  frameAxis:typing.Union[str, int, vigra.AxisInfo],
+                  order:int = 1, spacing:float = 1.) -> list:
+    """Pixel values along a path in each frame of an image stack.
+    
+    Unlike kymograph(), this function uses the frame-specific descriptors of 
+    `path` (if any). Frames where the path has the same sample points are 
+    sampled together, in a single call to sampleProfile().
+    
+    Returns:
+    ========
+    A list with a numpy array (N[, channels]) for each frame, where N is the
+    number of sample points in that frame; frames where `path` is not defined 
+    get a single NaN sample.
+    
+    """
+    view = img.transposeToVigraOrder()
+    frameNdx = _axisIndex(view, frameAxis)
+    nFrames = view.shape[frameNdx]
+    
+    groups = list() # of (points, frame indices)
+    
+    for k in range(nFrames):
+        obj = path.objectForFrame(k)
+        points = pathSamplePoints(obj, spacing) if obj is not None else np.zeros((0, 2))
+        
+        group = next((g for g in groups if np.array_equal(g[0], points)), None)
+        
+        if group is None:
+            groups.append((points, [k]))
+        else:
+            group[1].append(k)
+            
+    nanShape = (1, view.channels) if view.channels > 1 else (1,)
+    
+    ret = [None] * nFrames
+    
+    for points, frames in groups:
+        if len(points) == 0:
+            for k in frames:
+                ret[k] = np.full(nanShape, np.nan)
+            continue
+        
+        if len(frames) == nFrames:
+            values = sampleProfile(view, points, order=order, frameAxis=frameNdx)
+            for k in frames:
+                ret[k] = values[:, k]
+                
+        else:
+            for k in frames:
+                ret[k] = sampleProfile(view.bindAxis(frameNdx, k), points, order=order)
+            
+    return ret
 
 def pureDenoise(image, levels=0, threshold=0, alpha=1, beta=0, sigma2=0):
     #print("pureDenoise levels",levels,"thr", threshold, "a", alpha, "b", beta, "s2", sigma2)
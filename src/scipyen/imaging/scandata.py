@@ -65,10 +65,12 @@ from imaging.vigrautils import (proposeLayout, concatenateImages, croppedView,
                                 imageIndexTuple, resampleImage, resampleImageAxis,
                                 removeSlice, padToShape, padAxis,)# nFrames)
 
-from imaging.axiscalibration import (AxesCalibration, 
+from imaging.axiscalibration import (AxesCalibration, axesCalibration,
                                      AxisCalibrationData,
                                      ChannelCalibrationData)
 
+from imaging.framestore import (FrameStore, DeferredFrames)
+
 from gui import pictgui as pgui
 from gui.planargraphics import (PlanarGraphics, Cursor)
 
@@ -1312,7 +1314,8 @@ class ScanDataFramesMapUpdater(AttributeAdapter):
         
         framesMap = getattr(obj, "framesMap", None)
         
-        field = getattr(obj, self.fieldname)
+        # NOTE: 2026-10-18 16:02:17 does not load FrameStore-backed image data
+        field = getattr(obj, ScanDataComponentDescriptor.make_private_name(self.fieldname), None)
         
         if framesMap is None:
             field_frames = dict((c[0], 0) for c in obj._data_children_)
@@ -1470,6 +1473,22 @@ class ScanDataComponentDescriptor(BaseDescriptorValidator):
         else:
             self.accept_none = accept_none
             
+    def __get__(self, obj, objtype=None):
+        value = super().__get__(obj, objtype)
+        
+        if obj is not None and isinstance(value, DeferredFrames):
+            # NOTE: 2026-10-18 16:02:17
+            # first access to image data backed by a FrameStore: load it as
+            # memory-mapped arrays; from now on the data is held here, and may
+            # be changed (see ScanData.scansStore)
+            store = value.store
+            value = store.arrays()
+            setattr(obj, self.private_name, value)
+            # the arrays do not need the open source, nor the cached frames
+            store.close()
+            
+        return value
+    
     def validate(self, value):
         if value is None:
             if not self.accept_none:
@@ -1763,6 +1782,10 @@ class ScanData(BaseScipyenData):
         if component not in (a[0] for a in self._data_children_):
             raise ValueError(f"Unknown data child component: {component}")
         
+        if component in ("scans", "scene"):
+            # NOTE: does not load deferred image data (see fromFrameStores)
+            return self._imageData_(component)
+        
         return getattr(self, component, None)
     
     def _get_component_nFrames_(self, component:str):
@@ -1811,7 +1834,13 @@ class ScanData(BaseScipyenData):
         kw = dict((f.name, getattr(self, f.name)) for f in dataclasses.fields(self) if f.name not in ("scene", "scans", "electrophysiology"))
         # kw = dict((f.name, getattr(self, f.name)) for f in dataclasses.fields(self))
         
-        return (_new_ScanData, (self.scans, self.scene, self.electrophysiology, 
+        # NOTE: 2026-10-18 12:23:40
+        # image data backed by a FrameStore, not yet loaded, is pickled by 
+        # reference to its source
+        scans = self._imageData_("scans")
+        scene = self._imageData_("scene")
+        
+        return (_new_ScanData, (scans, scene, self.electrophysiology, 
                                 kw))
         # return (_new_ScanData, (kw, ))
         
@@ -1901,7 +1930,7 @@ class ScanData(BaseScipyenData):
             p.breakable()
             p.text("With components:\n")
             for c in ("scene", "scans", "electrophysiology"):
-                attr = getattr(self, c)
+                attr = self._get_data_child_component_(c)
                 if attr is None:
                     continue
                 frames = getattr(self, f"{c}Frames")
@@ -2434,8 +2463,19 @@ class ScanData(BaseScipyenData):
 
         from functools import partial as partial
         
-        new_scene = [img.copy() for img in self.scene]
-        new_scans = [img.copy() for img in self.scans]
+        # NOTE: 2026-10-18 12:25:02
+        # image data backed by a FrameStore, not yet loaded, is shared by 
+        # reference to the FrameStore; each object loads its own copy-on-write
+        # memory maps when needed
+        if self.sceneStore is not None:
+            new_scene = self.sceneStore.deferred()
+        else:
+            new_scene = [img.copy() for img in self.scene]
+            
+        if self.scansStore is not None:
+            new_scans = self.scansStore.deferred()
+        else:
+            new_scans = [img.copy() for img in self.scans]
         
         
         # FIXME -- WHAT'S WRONG???? this is a reference; 
@@ -2465,18 +2505,10 @@ class ScanData(BaseScipyenData):
             result._scans_filters_ = copy.deepcopy(self._scans_filters_)
         
         # neo.Block does not have a copy() method so we need to use our own
-        result._scene_block_ = copy.deepcopy(self._scene_block_)
-        result._scans_block_ = copy.deepcopy(self._scans_block_)
-        #result._scene_block_ = neo_copy(self._scene_block_)
-        #result._scans_block_ = neo_copy(self._scans_block_)
-        
-        result._scan_region_scans_profiles_ = copy.deepcopy(self._scan_region_scans_profiles_)
-        result._scan_region_scene_profiles_ = copy.deepcopy(self._scan_region_scene_profiles_)
-        #result._scan_region_scans_profiles_ = neo_copy(self._scan_region_scans_profiles_)
-        #result._scan_region_scene_profiles_ = neo_copy(self._scan_region_scene_profiles_)
-        
-        #result._scan_region_scans_profiles_ = copy.deepcopy(self._scan_region_scans_profiles_)
-        #result._scan_region_scene_profiles_ = copy.deepcopy(self._scan_region_scene_profiles_)
+        for component in ("scansBlock", "sceneBlock", "scansProfiles", "sceneProfiles"):
+            block = getattr(self, component, None)
+            if isinstance(block, neo.Block):
+                setattr(result, component, copy.deepcopy(block))
         
         if isinstance(self._scan_region_, PlanarGraphics):
             result._scan_region_ = self._scan_region_.copy()
@@ -2818,16 +2850,16 @@ class ScanData(BaseScipyenData):
         """Call this to keep axis calibration in sync with the image array data.
         """
         if isinstance(self.scene, vigra.VigraArray):
-            self._scene_axes_calibrations_ = [AxesCalibration(self.scene)]
+            self._scene_axes_calibrations_ = [axesCalibration(self.scene)]
             
         elif isinstance(self.scene, (tuple, list)) and  len(self.scene) > 0:
-            self._scene_axes_calibrations_ = [AxesCalibration(img) for img in self.scene]
+            self._scene_axes_calibrations_ = [axesCalibration(img) for img in self.scene]
             
         if isinstance(self.scans, vigra.VigraArray):
-            self._scans_axes_calibrations_ = [AxesCalibration(self.scans)]
+            self._scans_axes_calibrations_ = [axesCalibration(self.scans)]
             
         elif isinstance(self.scans, (tuple, list)) and len(self.scans) > 0:
-            self._scans_axes_calibrations_ = [AxesCalibration(img) for img in self.scans]
+            self._scans_axes_calibrations_ = [axesCalibration(img) for img in self.scans]
             
     #@safeWrapper
     def concatenate(self, source, strict = False, pad_value = None, scanregions=False):#, resample=False, alignment=0):#, src_slice = None, other_slice = None, axis=None):
@@ -8107,7 +8139,7 @@ class ScanData(BaseScipyenData):
                     raise ValueError("channel %d not found in self.scene[0] with %d channels" % (channel, self.scene[0].channels))
                 
                 else:
-                    return self._scene_axes_calibrations_[0] # because there is only one VigraArray here
+                    return axesCalibration(self.scene[0]) # because there is only one VigraArray here
                 
             else:
                 raise ValueError("channel %d not found in self.scene with %d channels" % (channel, len(self.scene)))
@@ -8115,7 +8147,10 @@ class ScanData(BaseScipyenData):
                 
         else:
             # self.scene is a list of single-channel VigraArrays
-            return self._scene_axes_calibrations_[channel]
+            # NOTE: 2026-10-18 14:57:39
+            # axesCalibration() is cached with the image array and is 
+            # re-created when the array's axistags change
+            return axesCalibration(self.scene[channel])
             
         
     def getScansAxesCalibration(self, channel=0):
@@ -8130,7 +8165,7 @@ class ScanData(BaseScipyenData):
         multi-channel VigraArray
         
         """
-        if len(self.scene) == 0:
+        if len(self.scans) == 0:
             return
         
         if not isinstance(channel, int):
@@ -8146,7 +8181,7 @@ class ScanData(BaseScipyenData):
                     raise ValueError("channel %d not found in self.scans[0] with %d channels" % (channel, self.scans[0].channels))
                 
                 else:
-                    return self._scans_axes_calibrations_[0] # because there is only one VigraArray here
+                    return axesCalibration(self.scans[0]) # because there is only one VigraArray here
                 
             else:
                 raise ValueError("channel %d not found in self.scans with %d channels" % (channel, len(self.scans)))
@@ -8154,7 +8189,10 @@ class ScanData(BaseScipyenData):
                 
         else:
             # self.scene is a list of single-channel VigraArrays
-            return self._scans_axes_calibrations_[channel]
+            # NOTE: 2026-10-18 14:57:39
+            # axesCalibration() is cached with the image array and is 
+            # re-created when the array's axistags change
+            return axesCalibration(self.scans[channel])
             
         
         
@@ -8569,17 +8607,19 @@ class ScanData(BaseScipyenData):
         FIXME/TODO adapt to a new scenario where all scene image data is a single
         multi-channel VigraArray
         """
-        if self.scene is None:
+        scene = self._imageData_("scene") # does not load deferred data
+        
+        if scene is None:
             return
         
-        if len(self.scene) == 0:
+        if len(scene) == 0:
             return 0
         
-        if len(self.scene) == 1:
-            return self.scene[0].channels
+        if len(scene) == 1:
+            return scene[0].channels
         
         else:
-            return len(self.scene)
+            return len(scene)
 
     @property
     def sceneChannelNames(self):
@@ -8588,16 +8628,18 @@ class ScanData(BaseScipyenData):
         multi-channel VigraArray
         
         """
-        if self.scene is None:
+        scene = self._imageData_("scene")
+        
+        if scene is None:
             return tuple()
         
-        if len(self.scene) == 0:
+        if len(scene) == 0:
             return tuple()
         
-        if len(self.scene) == 1:
-            return (AxesCalibration(self.scene[0])["c"].channelNames, )
+        if len(scene) == 1:
+            return (AxesCalibration(scene[0])["c"].channelNames, )
         
-        return tuple(itertools.chain.from_iterable((AxesCalibration(self.scene[k])["c"].channelNames for k in range(len(self.scene)))))
+        return tuple(itertools.chain.from_iterable((AxesCalibration(scene[k])["c"].channelNames for k in range(len(scene)))))
         
     @sceneChannelNames.setter
     def sceneChannelNames(self, value:typing.Union[tuple, list, str]):
@@ -8662,32 +8704,36 @@ class ScanData(BaseScipyenData):
         multi-channel VigraArray
         
         """
-        if self.scans is None:
+        scans = self._imageData_("scans") # does not load deferred data
+        
+        if scans is None:
             return 0
         
-        if len(self.scans) == 0:
+        if len(scans) == 0:
             return 0
         
-        if len(self.scans) == 1:
-            return self.scans[0].channels
+        if len(scans) == 1:
+            return scans[0].channels
         
         else:
-            return len(self.scans)
+            return len(scans)
     
     @property
     def scansChannelNames(self):
         """
         """
-        if self.scans is None:
+        scans = self._imageData_("scans")
+        
+        if scans is None:
             return tuple()
         
-        if len(self.scans) == 0:
+        if len(scans) == 0:
             return tuple()
         
-        if len(self.scans) == 1: # this may be a multi-band image
-            return AxesCalibration(self.scans[0])["c"].channelNames # to ensure we get a virtual channel if needed
+        if len(scans) == 1: # this may be a multi-band image
+            return AxesCalibration(scans[0])["c"].channelNames # to ensure we get a virtual channel if needed
 
-        return tuple(itertools.chain.from_iterable((AxesCalibration(self.scans[k])["c"].channelNames for k in range(len(self.scans)))))
+        return tuple(itertools.chain.from_iterable((AxesCalibration(scans[k])["c"].channelNames for k in range(len(scans)))))
         
     @scansChannelNames.setter
     def scansChannelNames(self, value):
@@ -8774,6 +8820,88 @@ class ScanData(BaseScipyenData):
             else:
                 return max(self._get_component_nFrames_(c[0]) for c in self._data_children_)
                 
+    @classmethod
+    def fromFrameStores(cls, scans:FrameStore, scene:typing.Optional[FrameStore]=None, **kwargs):
+        """Creates a ScanData with lazy, on-demand image data.
+        
+        Parameters:
+        -----------
+        scans: imaging.framestore.FrameStore for the scans data
+        
+        scene: imaging.framestore.FrameStore for the scene data, or None
+        
+        **kwargs: passed to the ScanData constructor
+        
+        Nothing is read from the image sources here. Individual frames for 
+        display and analysis are best obtained with self.scansFrame() and
+        self.sceneFrame(), which read them through a bounded frame cache.
+        
+        The whole data volume is loaded (as VigraArray views on memory-mapped 
+        files, see FrameStore.arrays()) on first access to the `scans` or 
+        `scene` attributes.
+        """
+        return cls(scans = scans.deferred(), 
+                   scene = scene.deferred() if scene is not None else None,
+                   **kwargs)
+    
+    def _imageData_(self, component:str):
+        """The image data in "scans" or "scene", without loading it from its
+        FrameStore: when not yet loaded, this is a DeferredFrames object,
+        suitable for inspecting the shape, dtype and axistags of the data,
+        but not its contents.
+        """
+        return getattr(self, ScanDataComponentDescriptor.make_private_name(component), None)
+    
+    @property
+    def scansStore(self) -> typing.Optional[FrameStore]:
+        """The FrameStore of the scans data, while the data has not been
+        loaded (see ScanData.fromFrameStores), or None.
+        
+        Once loaded - or assigned new data - the scans data is held in the
+        `scans` attribute (and may be changed there).
+        """
+        data = self._imageData_("scans")
+        return data.store if isinstance(data, DeferredFrames) else None
+    
+    @property
+    def sceneStore(self) -> typing.Optional[FrameStore]:
+        """The FrameStore of the scene data; see self.scansStore
+        """
+        data = self._imageData_("scene")
+        return data.store if isinstance(data, DeferredFrames) else None
+    
+    def _get_component_frame_(self, component:str, frame:int, channel:int = 0) -> vigra.VigraArray:
+        store = getattr(self, f"{component}Store", None)
+        
+        if isinstance(store, FrameStore):
+            return store.frame(frame, channel)
+        
+        data = getattr(self, component)
+        frameAxis = getattr(self, f"{component}FrameAxis")
+        
+        if len(data) == getattr(self, f"{component}Channels"):
+            # array of possibily several single-band images
+            return data[channel].bindAxis("c", 0).bindAxis(frameAxis, frame).squeeze()
+        
+        # array with one multi-band image
+        return data[0].bindAxis("c", channel).bindAxis(frameAxis, frame).squeeze()
+    
+    def scansFrame(self, frame:int, channel:int = 0) -> vigra.VigraArray:
+        """A 2D frame of the scans data, in the given channel.
+        
+        When the scans are backed by a FrameStore and have not been loaded, 
+        the frame is read on demand through the frame cache; otherwise, it is a
+        view of the scans data (including any changes made to it).
+        """
+        return self._get_component_frame_("scans", frame, channel)
+    
+    def sceneFrame(self, frame:int, channel:int = 0) -> vigra.VigraArray:
+        """A 2D frame of the scene data, in the given channel.
+        
+        See also self.scansFrame()
+        """
+        return self._get_component_frame_("scene", frame, channel)
+    
     def toHDF5(self, group, name, oname, compression, chunks, track_order,
                        entity_cache):
         
@@ -99,14 +99,14 @@ mammal lion     80.5     run
 #   
 
 
-import os, sys, tempfile, traceback, warnings, numbers, datetime, enum
+import os, sys, tempfile, traceback, warnings, numbers, datetime, enum, time
 import types, typing, inspect, functools, itertools, importlib
 from functools import (partial, singledispatch)
 from pprint import (pprint, pformat)
 import collections, collections.abc
 from collections import (deque, namedtuple)
 from uuid import uuid4
-import json, pickle
+import json, pickle, hashlib
 import h5py
 import numpy as np
 import nixio as nix 
@@ -199,6 +199,34 @@ from gui.pictgui import (Arc, ArcMove, CrosshairCursor, Cubic, Ellipse,
 # 'if __DEBUG__:' clause
 __DEBUG__=False
 
+# NOTE: 2026-10-18 09:12:40
+# Content-addressed storage of large numeric arrays (see makeContentAddressedDataset)
+# 
+# When True, numeric array data of np.ndarray, VigraArray and neo DataObject 
+# (and derived types) at least BLOB_MIN_NBYTES large are written once, in a 
+# shared group named BLOB_GROUP_NAME at the root of the HDF5 file, under the 
+# hex digest of their contents; the entity that would normally hold the data
+# is then created as a virtual data set mapped onto the shared blob.
+CONTENT_DEDUPLICATION = True
+BLOB_GROUP_NAME = "__scipyen_blobs__"
+BLOB_MIN_NBYTES = 65536 # 64 kB; below this the blob bookkeeping costs more than it saves
+
+# NOTE: 2026-10-18 10:02:17
+# Filter presets accepted as the `compression` parameter of toHDF5 & co.
+# Any other str (or an int gzip level) is passed on to h5py unchanged.
+COMPRESSION_PRESETS = {
+    "gzip":         {"compression": "gzip"},
+    "gzip-fast":    {"compression": "gzip", "compression_opts": 1},
+    "shuffle+gzip": {"compression": "gzip", "shuffle": True},
+    "lzf":          {"compression": "lzf"},
+    "shuffle+lzf":  {"compression": "lzf", "shuffle": True},
+    "none":         {"compression": None},
+    }
+
+# Target size of a chunk for the time-contiguous and row chunking policies 
+# (see datasetChunks); the default HDF5 chunk cache is 1 MiB per data set
+CHUNK_TARGET_NBYTES = 1048576
+
 class HDFDataError(Exception):
     pass
 
@@ -416,6 +444,258 @@ def getCachedEntity(cache:dict, obj:typing.Any):
     
     return cache.get(id(obj), None)
     
+def contentDigest(data:np.ndarray) -> str:
+    """Content fingerprint (blake2b hex digest) of a numeric array.
+    
+    The digest covers the array's dtype, shape and data buffer, so arrays with 
+    the same bytes but different layout have different digests.
+    
+    Non-contiguous arrays are copied to a C-contiguous buffer first.
+    """
+    data = np.ascontiguousarray(data)
+    h = hashlib.blake2b(digest_size=20)
+    h.update(data.dtype.str.encode())
+    h.update(repr(data.shape).encode())
+    h.update(memoryview(data).cast("B"))
+    return h.hexdigest()
+
+def makeContentAddressedDataset(data:np.ndarray, group:h5py.Group, name:str,
+                                compression:typing.Optional[str]="gzip",
+                                chunks:typing.Optional[bool]=None,
+                                entity_cache:typing.Optional[dict]=None) -> typing.Optional[h5py.Dataset]:
+    """Stores numeric array data once per file, as a content-addressed blob.
+    
+    The array data is written (only if not already present) to a data set named 
+    after its content digest, in the BLOB_GROUP_NAME group at the root of the 
+    file. A virtual data set named `name`, mapped onto the blob, is then created 
+    in `group`. 
+    
+    Unlike a hard link, the virtual data set has its own `attrs` and dimension 
+    scales, so several objects (e.g., VigraArrays with distinct axistags) can 
+    share the same data buffer in the file.
+    
+    Identical arrays stored under different names, or in subsequent calls to
+    toHDF5 on the same file, are therefore written only once.
+    
+    Parameters:
+    -----------
+    data: numpy array (NOT a Quantity, VigraArray or neo object - pass their 
+        magnitude, or a plain ndarray view)
+    group: the parent h5py.Group where the virtual data set is created
+    name: name of the virtual data set
+    compression, chunks: used when writing the blob data set
+    entity_cache: dict; blobs created during the current call of toHDF5 are
+        remembered here under the key ("blake2b", digest)
+    
+    Returns:
+    --------
+    The virtual h5py.Dataset, or None when `data` does not qualify for 
+    content-addressed storage (see CONTENT_DEDUPLICATION, BLOB_MIN_NBYTES); 
+    in the latter case the caller should create a regular data set.
+    
+    """
+    if not CONTENT_DEDUPLICATION:
+        return
+    
+    if not isinstance(data, np.ndarray) or data.dtype.kind not in "biufc":
+        return
+    
+    if data.ndim == 0 or data.nbytes < BLOB_MIN_NBYTES:
+        return
+    
+    data = np.asarray(data) # strip Quantity/VigraArray subclasses, if any
+    
+    digest = contentDigest(data)
+    
+    if not isinstance(entity_cache, dict):
+        entity_cache = dict()
+        
+    blob = entity_cache.get(("blake2b", digest), None)
+    
+    if not isinstance(blob, h5py.Dataset):
+        blobs = group.file.require_group(BLOB_GROUP_NAME)
+        blob = blobs.get(digest, None)
+        if not isinstance(blob, h5py.Dataset):
+            blob = blobs.create_dataset(digest, data = data, chunks = chunks,
+                                        **datasetFilters(compression))
+            blob.attrs["digest_algorithm"] = "blake2b"
+            
+        entity_cache[("blake2b", digest)] = blob
+        
+    # NOTE: the "." source file name maps the blob in the SAME file, so the 
+    # virtual data set survives renaming/moving the file
+    layout = h5py.VirtualLayout(shape = blob.shape, dtype = blob.dtype)
+    layout[...] = h5py.VirtualSource(".", blob.name, shape = blob.shape, dtype = blob.dtype)
+    
+    return group.create_virtual_dataset(name, layout)
+    
+def datasetFilters(compression:typing.Optional[typing.Union[str, int]]="gzip") -> dict:
+    """Keyword parameters for h5py.Group.create_dataset, for a filter preset.
+    
+    Parameters:
+    -----------
+    compression: str, int or None. 
+        Either one of the keys in COMPRESSION_PRESETS:
+        "gzip", "gzip-fast", "shuffle+gzip", "lzf", "shuffle+lzf", "none"
+        
+        or anything else accepted by h5py as 'compression' (e.g. an int for 
+        the gzip level).
+        
+        None is the same as "none" (i.e., no compression).
+        
+    Returns:
+    --------
+    dict with some or all of the keys: "compression", "compression_opts", "shuffle"
+    
+    """
+    if isinstance(compression, str):
+        return dict(COMPRESSION_PRESETS.get(compression.lower(), {"compression": compression}))
+    
+    return {"compression": compression}
+
+def _rowChunks(shape:tuple, itemsize:int, axis:int=0) -> tuple:
+    """Chunks spanning whole 'rows' along `axis` (helper for datasetChunks).
+    
+    Returns a chunk shape which is the full extent on all axes except `axis`, 
+    with as many rows along `axis` as fit in CHUNK_TARGET_NBYTES.
+    """
+    row_nbytes = max(1, int(np.prod([n for k, n in enumerate(shape) if k != axis])) * itemsize)
+    nrows = max(1, min(shape[axis], CHUNK_TARGET_NBYTES // row_nbytes))
+    ret = list(shape)
+    ret[axis] = nrows
+    return tuple(ret)
+
+def datasetChunks(obj, data:np.ndarray, chunks:typing.Optional[typing.Union[bool, tuple]]=None):
+    """Chunking policy for the HDF5 data set storing array data of `obj`.
+    
+    Chunk shapes follow the way Scipyen reads back these data:
+    
+    • neo signals, DataSignal and IrregularlySampledDataSignal: time-contiguous 
+        chunks, each holding all channels for as many consecutive samples as fit
+        in CHUNK_TARGET_NBYTES
+        
+    • VigraArray with 'frames' axis or axes (see vigrautils.proposeLayout): one
+        frame per chunk
+        
+    • 1D and structured arrays (e.g. pandas objects after pandas2Structarray):
+        row chunks sized as above
+        
+    Parameters:
+    -----------
+    obj: the Python object being stored
+    data: numpy array; the data to be written (e.g., obj.magnitude for neo
+        objects, or the structured array for pandas objects)
+    chunks: when not None it is returned unchanged (i.e. the caller's choice 
+        takes precedence, including True for h5py's own chunk guess)
+        
+    Returns:
+    --------
+    A tuple (chunk shape) or None (let h5py decide)
+    """
+    if chunks is not None:
+        return chunks
+    
+    if not isinstance(data, np.ndarray) or data.ndim == 0 or data.size < 2:
+        return
+    
+    shape = data.shape
+    
+    if isinstance(obj, neo.core.basesignal.BaseSignal):
+        ret = _rowChunks(shape, data.itemsize, 0)
+        
+    elif isinstance(obj, vigra.VigraArray) and obj.ndim > 2:
+        framesAxis = vu.proposeLayout(obj, indices=True).framesAxis
+        if isinstance(framesAxis, int):
+            framesAxis = (framesAxis,)
+            
+        if not isinstance(framesAxis, tuple) or len(framesAxis) == 0:
+            return
+        
+        ret = tuple(1 if k in framesAxis else n for k, n in enumerate(shape))
+        
+    elif data.ndim == 1 or data.dtype.names is not None:
+        ret = _rowChunks(shape, data.itemsize, 0)
+        
+    else:
+        return
+    
+    # HDF5 chunks must be smaller than 4 GiB; let h5py deal with huge frames
+    if np.prod(ret) * data.itemsize >= 2**32:
+        return True
+    
+    return ret
+    
+def benchmarkStoragePolicies(obj, policies:typing.Optional[typing.Sequence]=None,
+                             repeats:int=3, 
+                             filename:typing.Optional[str]=None):
+    """Write/read throughput of HDF5 filter and chunking policies for `obj`.
+    
+    Parameters:
+    -----------
+    obj: the object to store (e.g., a neo.Block, AnalogSignal, VigraArray, DataFrame)
+    
+    policies: sequence of (compression, chunks) tuples, optional.
+        When None (default), all COMPRESSION_PRESETS are tested both with the
+        Scipyen chunking policy (chunks = None, see datasetChunks) and with 
+        h5py's own chunk guess (chunks = True).
+        
+    repeats:int, default is 3; the best time of `repeats` runs is reported
+    
+    filename: str, optional; the HDF5 file used for the benchmark (will be 
+        overwritten). By default, a temporary file is used, then removed.
+        
+    Returns:
+    --------
+    pandas.DataFrame with one row per policy, and columns:
+        compression, chunks, file size (MiB), write (MiB/s), read (MiB/s)
+        
+    Throughput is computed relative to the size of the array data in `obj`
+    (see core.memoryaccounting.memory_size).
+        
+    """
+    from core.memoryaccounting import memory_size
+    
+    if policies is None:
+        policies = [(c, ch) for c in COMPRESSION_PRESETS for ch in (None, True)]
+        
+    remove_file = filename is None
+    
+    if remove_file:
+        fd, filename = tempfile.mkstemp(suffix=".h5")
+        os.close(fd)
+        
+    mib = 2**20
+    nbytes = max(1, memory_size(obj))
+    
+    rows = list()
+    
+    try:
+        for compression, chunks in policies:
+            write_times = list()
+            read_times = list()
+            for k in range(repeats):
+                start = time.perf_counter()
+                with h5py.File(filename, mode="w") as h5file:
+                    toHDF5(obj, h5file, name="benchmark", 
+                           compression=compression, chunks=chunks)
+                write_times.append(time.perf_counter() - start)
+                
+                start = time.perf_counter()
+                with h5py.File(filename, mode="r") as h5file:
+                    read_hdf5(h5file)
+                read_times.append(time.perf_counter() - start)
+                
+            rows.append({"compression": str(compression),
+                         "chunks": "scipyen" if chunks is None else "h5py" if chunks is True else str(chunks),
+                         "file size (MiB)": os.path.getsize(filename) / mib,
+                         "write (MiB/s)": nbytes / mib / min(write_times),
+                         "read (MiB/s)": nbytes / mib / min(read_times)})
+    finally:
+        if remove_file and os.path.isfile(filename):
+            os.remove(filename)
+            
+    return pd.DataFrame(rows)
+    
 def printHdf(v):
     return v if isinstance(v, str) else v.decode() if isinstance(v, bytes) else v[()]
 
@@ -2412,6 +2692,15 @@ def toHDF5(obj, group:h5py.Group, name:typing.Optional[str]=None,
     compression: str, chunks: bool - parameters passed on to code that 
         creates HDF5 Dataset entities; both optional with default being None
         
+        compression can be one of the filter presets in COMPRESSION_PRESETS
+        ("gzip", "gzip-fast", "shuffle+gzip", "lzf", "shuffle+lzf", "none"),
+        see datasetFilters.
+        
+        When chunks is None, array data is chunked according to its type
+        (time-contiguous for signals, one frame per chunk for image stacks,
+        row chunks for tables), see datasetChunks; pass chunks=True to let h5py 
+        guess the chunk shape instead.
+        
     track_order:bool - flags passed on the code creating HDF5 Group entities
         optional, default is True
         
@@ -2656,8 +2945,8 @@ def toHDF5(obj, group:h5py.Group, name:typing.Optional[str]=None,
         data = vu.kernel2array(obj, True) # need to pass compact=True to get an array!!!
         
         entity = group.create_dataset(target_name, data = data, 
-                                      compression = compression, 
-                                      chunks = chunks)
+                                      chunks = chunks,
+                                      **datasetFilters(compression))
         
         entity.attrs.update(obj_attrs)
         
@@ -2910,8 +3199,9 @@ def makeDataset(obj, group:h5py.Group, attrs:dict, name:str,
             compression = None
             chunks = None
             
-        dset = group.create_dataset(name, data = obj, compression=compression,
-                                    chunks=chunks, track_order=track_order)
+        dset = group.create_dataset(name, data = obj, chunks=chunks, 
+                                    track_order=track_order,
+                                    **datasetFilters(compression))
         
     dset.attrs.update(attrs)
     storeEntityInCache(entity_cache, obj, dset)
@@ -2978,8 +3268,9 @@ def _(obj, group, attrs, name, compression, chunks, track_order, entity_cache):
             dset = group.create_dataset(name, data = data, track_order=track_order)
             
         else:
-            dset = group.create_dataset(name, data = data, compression=compression,
-                                        chunks = chunks, track_order=track_order)
+            dset = group.create_dataset(name, data = data, chunks = chunks, 
+                                        track_order=track_order,
+                                        **datasetFilters(compression))
         
     except:
         print(f"makeDataset<{type(obj).__name__}> offending object: {obj} (len: {len(obj)}) converted to {data}")
@@ -2992,8 +3283,9 @@ def _(obj, group, attrs, name, compression, chunks, track_order, entity_cache):
                 dset = group.create_dataset(name, data = data, track_order=track_order)
                 
             else:
-                dset = group.create_dataset(name, data = data, compression=compression,
-                                            chunks = chunks, track_order=track_order)
+                dset = group.create_dataset(name, data = data, chunks = chunks, 
+                                            track_order=track_order,
+                                            **datasetFilters(compression))
         except:
             raise
         
@@ -3052,8 +3344,13 @@ def _(obj, group:h5py.Group, attrs:dict, name:str, compression=None,
     if data.size == 1:
         dset = group.create_dataset(dset_name, data = data)
     else:
-        dset = group.create_dataset(dset_name, data = data, track_order=track_order, 
-                                    compression = compression, chunks=chunks)
+        data_chunks = datasetChunks(obj, data.view(np.ndarray), chunks)
+        dset = makeContentAddressedDataset(data.view(np.ndarray), group, dset_name,
+                                           compression = compression, chunks = data_chunks,
+                                           entity_cache = entity_cache)
+        if dset is None:
+            dset = group.create_dataset(dset_name, data = data, track_order=track_order, 
+                                        chunks=data_chunks, **datasetFilters(compression))
     
     axesgroup = group.create_group(axgrp_name, track_order = track_order)
     
@@ -3091,8 +3388,13 @@ def _(obj, group, attrs, name, compression, chunks, track_order, entity_cache):
     if obj.size == 1:
         dset = group.create_dataset(dset_name, data = obj.magnitude, track_order=track_order)
     else:
-        dset = group.create_dataset(dset_name, data = obj.magnitude, track_order=track_order,
-                                    compression = compression, chunks = chunks)
+        data_chunks = datasetChunks(obj, obj.magnitude, chunks)
+        dset = makeContentAddressedDataset(obj.magnitude, group, dset_name,
+                                           compression = compression, chunks = data_chunks,
+                                           entity_cache = entity_cache)
+        if dset is None:
+            dset = group.create_dataset(dset_name, data = obj.magnitude, track_order=track_order,
+                                        chunks = data_chunks, **datasetFilters(compression))
         
     # 2. create a child axes Group in group
     axgroup = group.create_group(axgrp_name, track_order=track_order)
@@ -3195,8 +3497,13 @@ def _(obj, group, attrs, name, compression, chunks, track_order, entity_cache):
     if obj.size == 1:
         dset = group.create_dataset(name, data = obj.magnitude, track_order=track_order)
     else:
-        dset = group.create_dataset(name, data = obj.magnitude, track_order=track_order, 
-                                    compression = compression, chunks = chunks)
+        data_chunks = datasetChunks(obj, obj.magnitude, chunks)
+        dset = makeContentAddressedDataset(obj.magnitude, group, name,
+                                           compression = compression, chunks = data_chunks,
+                                           entity_cache = entity_cache)
+        if dset is None:
+            dset = group.create_dataset(name, data = obj.magnitude, track_order=track_order, 
+                                        chunks = data_chunks, **datasetFilters(compression))
         
     dset.attrs.update(attrs)
     storeEntityInCache(entity_cache, obj, dset)
@@ -3218,10 +3525,16 @@ def _(obj, group, attrs, name, compression, chunks, track_order, entity_cache):
         data = obj
         
     if obj.size == 1:
-        dset = group.create_dataset(name, data = data, track_order=track_order, compression = compression)
+        dset = group.create_dataset(name, data = data, track_order=track_order, 
+                                    **datasetFilters(compression))
     else:
-        dset = group.create_dataset(name, data = data, track_order=track_order, compression = compression, 
-                                    chunks = chunks)
+        data_chunks = datasetChunks(obj, data, chunks)
+        dset = makeContentAddressedDataset(data, group, name, 
+                                           compression = compression, chunks = data_chunks,
+                                           entity_cache = entity_cache)
+        if dset is None:
+            dset = group.create_dataset(name, data = data, track_order=track_order, 
+                                        chunks = data_chunks, **datasetFilters(compression))
     dset.attrs.update(attrs)
     storeEntityInCache(entity_cache, obj, dset)
     return dset
@@ -3381,7 +3694,8 @@ def _(obj, group, attrs, name, compression, chunks, track_order, entity_cache):
     return grp
     
 def read_hdf5(h5file:h5py.File):
-    ret = dict((k, fromHDF5(i)) for k,i in h5file.items())
+    # NOTE: the shared blobs group is only reached via virtual data sets
+    ret = dict((k, fromHDF5(i)) for k,i in h5file.items() if k != BLOB_GROUP_NAME)
     # print(f"\nread_hdf5: ret = {ret}\n")
     if len(ret)==1:
         return [v for v in ret.values()][0]
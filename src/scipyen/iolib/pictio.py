@@ -17,10 +17,10 @@ Add signature annotations to file loaders to help file data handling
 from __future__ import print_function
 
 import inspect, os, sys, traceback, typing, warnings, io
-import contextlib, pathlib, urllib
+import contextlib, pathlib, urllib, struct, mmap
 import ctypes
 
-# import  threading
+import threading
 import csv, numbers, mimetypes
 if sys.version_info.major >= 3 and sys.version_info.minor < 10:
     # NOTE: 2022-03-06 13:05:46
@@ -66,7 +66,8 @@ from core import pyabfbridge as pab
 
 from core import (xmlutils, strutils, datasignal)#, neoepoch, neoevent)
 
-from core.prog import (ContextExecutor, safeWrapper,)
+from core.prog import (ContextExecutor, safeWrapper, 
+                       process_pool, bounded_pool_map, atomic_write,)
 
 from core.monkey import (check_neo_patch, 
                        identify_neo_patch,  import_relocated_module)
@@ -164,6 +165,50 @@ mimetypes.add_type("application/x-matlab", ".mat")
 mimetypes.add_type("application/x-octave", ".oct")
 mimetypes.add_type("text/plain", ".cfg") # adds to already known extensions
 
+# NOTE: 2026-10-18 12:40:10
+# Container for pickle protocol 5 with out-of-band buffers (see savePickleFile)
+#
+# Layout (all integers are little-endian uint64):
+#   magic (16 bytes)
+#   pickle stream size, number of buffers
+#   buffer table: (offset, size) for each buffer; offset from the start of the file
+#   pickle stream
+#   buffers, each starting at an offset aligned to PICKLE_BUFFER_ALIGNMENT
+__pickle_oob_magic__ = b"\x93SCIPYEN-PKL5\x00\x00\x00"
+PICKLE_BUFFER_ALIGNMENT = 64
+# contiguous buffers smaller than this are kept inside the pickle stream
+PICKLE_OOB_MIN_NBYTES = 65536
+# default for savePickleFile(…, outOfBand=None)
+PICKLE_OUT_OF_BAND = False
+
+# NOTE: 2026-10-18 11:52:33
+# Fast file type detection (see getMimeAndFileType) for the formats loaded by 
+# Scipyen: (magic bytes at offset 0, mime type, libmagic-like file type).
+# For files with these signatures libmagic is never called.
+__file_signatures__ = ((__pickle_oob_magic__, "application/x-pickle", "Scipyen pickle data with out-of-band buffers"),
+                       (b"ABF2", "application/axon-binary-file", "Axon Binary File (version 2)"),
+                       (b"ABF ", "application/axon-binary-file", "Axon Binary File (version 1)"),
+                       (b"\x89HDF\r\n\x1a\n", "application/x-hdf", "Hierarchical Data Format (version 5) data"),
+                       (b"II*\x00", "image/tiff", "TIFF image data, little-endian"),
+                       (b"MM\x00*", "image/tiff", "TIFF image data, big-endian"),
+                       (b"II+\x00", "image/tiff", "Big TIFF image data, little-endian"),
+                       (b"<?xml", "text/xml", "XML document text"),
+                       (b"\xef\xbb\xbf<?xml", "text/xml", "XML document text (with BOM)"),
+                       (b"ATF", "application/axon-text-file", "Axon Text File"),
+                       )
+
+# file extension ↦ (mime type, file type) for formats without magic bytes
+__file_extension_types__ = {".pkl": ("application/x-pickle", "data"), # libmagic does not know pickles
+                            ".csv": ("text/csv", "CSV text"),
+                            ".tsv": ("text/tab-separated-values", "TSV text"),
+                            }
+
+# cache of getMimeAndFileType results: 
+# (real path, size, mtime in ns) ↦ (mime_type, file_type, encoding)
+__file_type_cache__ = collections.OrderedDict()
+__file_type_cache_lock__ = threading.Lock()
+FILE_TYPE_CACHE_SIZE = 8192
+
 def __ndArray2csv__(data, writer):
     for l in data:
         writer.writerow(l)
@@ -1099,6 +1144,74 @@ def importDataFrame(fileName):
     else:
         warnings.warn("Unsupported file type: %s" % fileType)
         
+def _unpickleFile(fileName):
+    """Unpickles data from either a plain pickle file, or a pickle container 
+    with out-of-band buffers (see savePickleFile).
+    
+    With out-of-band buffers, the file is memory-mapped copy-on-write and 
+    numpy arrays are reconstructed as views of the mapped buffers: no data is 
+    copied until an array is modified, and the file itself is never modified.
+    """
+    with open(fileName, mode="rb") as fileSrc:
+        magic = fileSrc.read(len(__pickle_oob_magic__))
+        
+        if magic != __pickle_oob_magic__:
+            fileSrc.seek(0)
+            return pickle.load(fileSrc)
+        
+        stream_size, nbuffers = struct.unpack("<QQ", fileSrc.read(16))
+        table = [struct.unpack("<QQ", fileSrc.read(16)) for k in range(nbuffers)]
+        stream = fileSrc.read(stream_size)
+        
+        if nbuffers == 0:
+            return pickle.loads(stream)
+        
+        # NOTE: the views created by pickle keep the mapping alive; it is 
+        # released when the last array using it is garbage collected
+        mapped = memoryview(mmap.mmap(fileSrc.fileno(), 0, access=mmap.ACCESS_COPY))
+        
+    return pickle.loads(stream, buffers = [mapped[offset:offset+size] for offset, size in table])
+
+def _pickleOutOfBand(val, fileName):
+    """Writes val as pickle protocol 5 with out-of-band buffers.
+    See savePickleFile.
+    
+    NOTE: The file is written atomically (see core.prog.atomic_write): arrays
+    loaded from a previous version of the file are views of its memory 
+    mapping (see _unpickleFile), which must not be truncated.
+    """
+    buffers = list()
+    
+    def _buffer_callback(buf):
+        # NOTE: returning a true value keeps the buffer in-band
+        if buf.raw().nbytes < PICKLE_OOB_MIN_NBYTES:
+            return True
+        buffers.append(buf)
+        
+    stream = pickle.dumps(val, protocol=5, buffer_callback=_buffer_callback)
+    
+    raws = [b.raw() for b in buffers]
+    
+    header_size = len(__pickle_oob_magic__) + 16 + 16 * len(raws)
+    offset = header_size + len(stream)
+    
+    table = list()
+    for raw in raws:
+        offset += -offset % PICKLE_BUFFER_ALIGNMENT
+        table.append((offset, raw.nbytes))
+        offset += raw.nbytes
+        
+    with atomic_write(fileName, "wb") as fileDest:
+        fileDest.write(__pickle_oob_magic__)
+        fileDest.write(struct.pack("<QQ", len(stream), len(raws)))
+        for entry in table:
+            fileDest.write(struct.pack("<QQ", *entry))
+        fileDest.write(stream)
+        
+        for (offset, size), raw in zip(table, raws):
+            fileDest.write(b"\x00" * (offset - fileDest.tell()))
+            fileDest.write(raw)
+            
 @safeWrapper
 def loadPickleFile(fileName):
     """Loads pickled data.
@@ -1127,16 +1240,13 @@ def loadPickleFile(fileName):
     
     
     try:
-        with open(fileName, mode="rb") as fileSrc:
-            ret = pickle.load(fileSrc)
-        return ret
+        return _unpickleFile(fileName)
     except Exception as e:
         # print(f"loadPickleFile exception {type(e).__name__}:\n {str(e)}")
         if isinstance(e, (ModuleNotFoundError, TypeError, ValueError)):
             try:
                 pneo.patch_neo_new()
-                with open(fileName, mode="rb") as fileSrc:
-                    ret = pickle.load(fileSrc)
+                ret = _unpickleFile(fileName)
                 pneo.restore_neo_new()
             except Exception as e1:
                 # print(f"loadPickleFile exception {type(e1).__name__}:\n {str(e1)}")
@@ -1148,12 +1258,35 @@ def loadPickleFile(fileName):
         
     
 @safeWrapper            
-def savePickleFile(val, fileName, protocol=None):
+def savePickleFile(val, fileName, protocol=None, outOfBand:typing.Optional[bool]=None):
+    """Pickles val to fileName (the ".pkl" extension is added if missing).
+    
+    Parameters:
+    -----------
+    val: object to pickle
+    fileName: str
+    protocol: int, the pickle protocol; default is pickle.HIGHEST_PROTOCOL
+    
+    outOfBand: bool, optional; default is None (use PICKLE_OUT_OF_BAND)
+        When True, the file is written with pickle protocol 5 and contiguous
+        data buffers (e.g. of numpy arrays, VigraArrays, neo signals) of at 
+        least PICKLE_OOB_MIN_NBYTES are written "out-of-band", after the 
+        pickle stream, instead of being copied into it. 
+        
+        loadPickleFile then memory-maps these buffers, so arrays are 
+        reconstructed without copying their data.
+        
+        CAUTION: Such files can only be read with loadPickleFile, NOT with 
+        pickle.load. The 'protocol' parameter is ignored.
+    """
     #if inspect.isfunction(val): # DO NOT attempt to pickle unbound functions
         #return
     
     if protocol is None:
         protocol = pickle.HIGHEST_PROTOCOL
+        
+    if outOfBand is None:
+        outOfBand = PICKLE_OUT_OF_BAND
     
     (name,extn) = os.path.splitext(fileName)
     
@@ -1161,8 +1294,15 @@ def savePickleFile(val, fileName, protocol=None):
         fileName += ".pkl"
 
     # print(f"pickling {type(val).__name__}")
+    
+    if outOfBand:
+        _pickleOutOfBand(val, fileName)
+        return
         
-    with open(fileName, mode="wb") as fileDest:
+    # NOTE: 2026-10-18 16:31:50
+    # the file may have been saved with out-of-band buffers, and be mapped by
+    # the arrays loaded from it (see _pickleOutOfBand)
+    with atomic_write(fileName, "wb") as fileDest:
         #print("Writing %s" % fileName)
         pickle.dump(val, fileDest, protocol=protocol)
     
@@ -1699,41 +1839,42 @@ def getLoaderForFile(fName):
                                     
     return ret
 
-def getMimeAndFileType(fileName):
-    """Returns the mime type and the file type for the file specified by fileName.
+def clearFileTypeCache():
+    """Empties the cache used by getMimeAndFileType"""
+    with __file_type_cache_lock__:
+        __file_type_cache__.clear()
+        
+def _sniffFileType(fileName:str) -> typing.Optional[tuple]:
+    """Fast path of getMimeAndFileType.
     
-    Parameters:
-    -----------
-    fileName : str; the name of a file (can be relative or absolute path)
+    Identifies the file formats loaded by Scipyen from their magic bytes or, 
+    for formats without a signature, from their file extension.
     
-    Returns:
-    --------
-    mime_type: str or None; 
-        the mime type of the file as defined in the system's mime-type utilities 
-        (mime.magic or desktop environments aware of freedesktop.org standards)
-        
-        Will be set to None when the mime type could not be determined
+    Returns (mime_type, file_type, encoding), or None for any other file.
+    """
+    try:
+        with open(fileName, mode="rb") as file_object:
+            header = file_object.read(16)
+    except OSError:
+        return
+    
+    for signature, mime_type, file_type in __file_signatures__:
+        if header.startswith(signature):
+            return mime_type, file_type, None
         
-    file_type: str or None; 
-        the type of the file (ASCII, binary, etc) as returned by libmagic
+    ext = os.path.splitext(fileName)[-1].lower()
+    
+    if ext in __file_extension_types__:
+        mime_type, file_type = __file_extension_types__[ext]
         
-        Will be set to None if the file type could not be determined
+        # pickle protocols >= 2 start with the PROTO opcode b"\x80"
+        if ext == ".pkl" and len(header) and header[0:1] != b"\x80":
+            return
         
-    encoding: str or None; 
-        the encoding of the file as reported by the system's mime-type utilities 
-    """
-    
-    # TODO/FIXME: 2023-05-12 08:44:27
-    # Not sure why on the same machine xdgmime reports some abf files as 
-    # MIMEtype('text', 'plain')
-    # and others as 
-    # MIMEtype('application', 'executable')
-    # whereas, in both cases libmagic reports Axon Binary correctly.
-    # This appears to be machine-specific, as it does not occur everywhere
-    #
-    # NOTE: 2023-05-12 08:50:39
-    # As a workaround, check file_type first, THEN mime_type
+        return mime_type, file_type, None
 
+def _guessMimeAndFileType(fileName:str) -> tuple:
+    """Slow path of getMimeAndFileType: libmagic, pyxdg and mimetypes."""
     file_type = None
     mime_type = None
     encoding = None
@@ -1753,21 +1894,10 @@ def getMimeAndFileType(fileName):
         except Exception as e:
             traceback.print_exc()
 
-    # 1.2) try the system "file" command - only available on Linux/UNIX
-    if file_type is None:
-        if sys.platform == "linux":
-            try:
-                if os.path.isfile(fileName):
-                    file_type = os.popen("file %s" % fileName).read()
-
-            except Exception as e:
-                traceback.print_exc()
-                
-    # finally, try python's mimetypes
-    # if file_type is None:
-    #     mime_type, encoding = mimetypes.guess_type(fileName)
-    #     mime_type = file_type
-
+    # NOTE: 2026-10-18 11:58:20
+    # 1.2) spawning the system "file" command for each file (previously, when 
+    # libmagic was not available) is too slow for browsing large data 
+    # directories; we now fall back on the mime type (see below)
             
     # 2) DETERMINE THE MIME TYPE
     # 2.1) try python's mimetypes
@@ -1785,20 +1915,81 @@ def getMimeAndFileType(fileName):
     if file_type is None:
         file_type = mime_type
         
-    # print(f"in getMimeAndFileType: mime_type: {mime_type} file_type: {file_type}")
+    return mime_type, file_type, encoding
 
-    # # 2.2) try the mimetypes module
-    # # NOTE: 2021-04-12 11:31:29
-    # # this is in case the actual file type and mime type are not registered
-    # # with either the global or the user mime data base(s)
-    # if mime_type in ["application/executable", None] or file_type == "data":
-    #     _mime_type, encoding = mimetypes.guess_type(fileName)
-    #     if _mime_type is not None:
-    #         # NOTE: 2021-04-12 11:31:24
-    #         # if mimetypes report None for type, revert to what xdgmime returned
-    #         mime_type = _mime_type
+def getMimeAndFileType(fileName):
+    """Returns the mime type and the file type for the file specified by fileName.
+    
+    Parameters:
+    -----------
+    fileName : str; the name of a file (can be relative or absolute path)
+    
+    Returns:
+    --------
+    mime_type: str or None; 
+        the mime type of the file as defined in the system's mime-type utilities 
+        (mime.magic or desktop environments aware of freedesktop.org standards)
         
-    return mime_type, file_type, encoding
+        Will be set to None when the mime type could not be determined
+        
+    file_type: str or None; 
+        the type of the file (ASCII, binary, etc) as returned by libmagic
+        
+        Will be set to None if the file type could not be determined
+        
+    encoding: str or None; 
+        the encoding of the file as reported by the system's mime-type utilities 
+        
+    NOTE: 2026-10-18 12:03:11
+    Results are cached by (path, size, modification time), therefore repeated
+    queries for an unchanged file are free (see clearFileTypeCache).
+    
+    Files in the formats loaded by Scipyen (ABF, ATF, HDF5, pickle, TIFF, XML, 
+    CSV/TSV) are identified by their magic bytes or file extension; libmagic 
+    is only used for other files.
+    
+    For strings that are not the name of an existing file (e.g. file name 
+    patterns such as "*.abf") only the mime type database is queried.
+    """
+    
+    # TODO/FIXME: 2023-05-12 08:44:27
+    # Not sure why on the same machine xdgmime reports some abf files as 
+    # MIMEtype('text', 'plain')
+    # and others as 
+    # MIMEtype('application', 'executable')
+    # whereas, in both cases libmagic reports Axon Binary correctly.
+    # This appears to be machine-specific, as it does not occur everywhere
+    #
+    # NOTE: 2023-05-12 08:50:39
+    # As a workaround, check file_type first, THEN mime_type
+    
+    try:
+        st = os.stat(fileName)
+    except (OSError, TypeError, ValueError):
+        st = None
+        
+    if st is None or not os.path.isfile(fileName):
+        return _guessMimeAndFileType(fileName)
+    
+    key = (os.path.realpath(fileName), st.st_size, st.st_mtime_ns)
+    
+    with __file_type_cache_lock__:
+        ret = __file_type_cache__.get(key, None)
+        if ret is not None:
+            __file_type_cache__.move_to_end(key)
+            return ret
+        
+    ret = _sniffFileType(fileName)
+    
+    if ret is None:
+        ret = _guessMimeAndFileType(fileName)
+        
+    with __file_type_cache_lock__:
+        __file_type_cache__[key] = ret
+        while len(__file_type_cache__) > FILE_TYPE_CACHE_SIZE:
+            __file_type_cache__.popitem(last=False)
+        
+    return ret
 
 def is_python_source(fileName:str):
     mime_type, file_type, encoding = getMimeAndFileType(fileName)
@@ -1819,6 +2010,76 @@ def loadFile(fName):
     fileLoader = getLoaderForFile(fName)
     value = fileLoader(fName)
     return value
+
+def _loadFileForPipeline(fName:str, fileReader:typing.Optional[typing.Callable]=None):
+    """Runs in a worker process of iterLoadFiles.
+    Returns the data read from fName, or None if no loader was found.
+    """
+    if fileReader is None:
+        fileReader = getLoaderForFile(fName)
+        
+    if fileReader is None:
+        return
+    
+    return fileReader(fName)
+
+def iterLoadFiles(fileNames:typing.Sequence[str], 
+                  fileReader:typing.Optional[typing.Callable]=None,
+                  max_workers:typing.Optional[int]=None,
+                  max_in_flight_bytes:int=2**30,
+                  loopControl:typing.Optional[dict]=None) -> typing.Generator:
+    """Reads data files in parallel, in a pool of worker processes.
+    
+    Generator yielding (fileName, data, exception) tuples in the order in which 
+    files finished loading. When loading failed, data is None and exception 
+    is the exception raised by the file loader (otherwise, exception is None).
+    
+    Parameters:
+    -----------
+    fileNames: sequence of file names
+    
+    fileReader: a loader function in this module (e.g., loadAxonFile) or None 
+        (default) in which case a loader is chosen for each file with 
+        getLoaderForFile. 
+        
+        NOTE: The file reader must be picklable (i.e., a module-level function).
+        
+    max_workers: int, default is the number of CPUs
+    
+    max_in_flight_bytes: int, default is 1 GiB. Upper bound on the total size 
+        of the files being decoded (or decoded, but not yet consumed by the 
+        caller), see core.prog.bounded_pool_map. At least one file is always 
+        loaded, whatever its size.
+        
+    loopControl: dict {"break": bool}; set "break" to True (e.g. from the 
+        `canceled` signal of a progress dialog) to cancel loading the files 
+        not already being read.
+        
+    """
+    fileNames = [f for f in fileNames if os.path.isfile(f)]
+    
+    if len(fileNames) == 0:
+        return
+    
+    if max_workers is None:
+        max_workers = min(len(fileNames), os.cpu_count() or 1)
+        
+    executor = process_pool(max_workers)
+    
+    try:
+        for fName, future in bounded_pool_map(executor, _loadFileForPipeline, fileNames,
+                                              weight = os.path.getsize,
+                                              max_weight = max_in_flight_bytes,
+                                              loopControl = loopControl,
+                                              fileReader = fileReader):
+            try:
+                yield fName, future.result(), None
+            except Exception as e:
+                yield fName, None, e
+    finally:
+        # NOTE: do not wait for files still being read when loading was aborted
+        canceled = isinstance(loopControl, dict) and loopControl.get("break", False) == True
+        executor.shutdown(wait = not canceled, cancel_futures = True)
     
 @safeWrapper
 def saveHDF5(data, fileName):
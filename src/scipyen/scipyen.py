@@ -13,7 +13,7 @@
 
 import sys, os, platform, pathlib
 
-import atexit, re, inspect, gc, io, traceback
+import atexit, re, inspect, gc, io, traceback, multiprocessing
 import faulthandler, warnings
 
 # NOTE: 2024-05-02 10:22:39
@@ -51,6 +51,16 @@ if len(sys.argv) > 1:
         os.environ["QT_API"] = "pyqt5"
         os.environ["PYQTGRAPH_QT_LIB"] = "PyQt5"
         
+# NOTE: 2026-10-18 15:55:41
+# `--profile-startup`: report the time spent importing each module, from here
+# until the main window is shown (see core.lazyimport.ImportProfiler)
+startup_profiler = None
+
+if "--profile-startup" in sys.argv:
+    sys.argv.remove("--profile-startup")
+    from core.lazyimport import ImportProfiler
+    startup_profiler = ImportProfiler()
+    startup_profiler.install()
 
 
 #import cProfile
@@ -87,154 +97,110 @@ else:
 
 #### BEGIN 3rd party modules
 
-if os.environ["QT_API"] in ("pyqt5", "pyqt6"):
-    from qtpy import sip
-    has_sip = True
-else:
-    has_sip = False
-    
-# import sip
-
-
-# NOTE: 2024-05-02 09:46:11
-# you still need the QT_API in the environment
-from qtpy import (QtCore, QtWidgets, QtGui, )
-# from PyQt5 import (QtCore, QtWidgets, QtGui, )
-hasQDarkTheme = False
-try:
-    import qdarktheme
-    hasQDarkTheme = True
-except:
-    pass
-
-# if hasattr(QtCore.Qt, "AA_EnableHighDpiScaling"):
-#     QtCore.QCoreApplication.setAttribute(QtCore.Qt.AA_EnableHighDpiScaling)
-# if hasattr(QtCore.Qt, "AA_UseHighDpiPixmaps"):
-#     QtGui.QGuiApplication.setAttribute(QtCore.Qt.AA_UseHighDpiPixmaps)
-
-
-# NOTE: 2023-09-28 22:12:25 
-# this does the trick on windows -  now my local breeze icons are available
-# so we keep with those (they're too nice, anyway!)
-#
-# works in conjunction with code at NOTE: 2023-09-28 22:06:54
-#
-#
-# on linux, we rely on platform-level modules, which get packed by pyinstaller
-# when building the bundle
-#
-mpath = pathlib.Path(__module_path__)
-
-# iconsdir = mpath / "gui" / "resources" / "icons"
-iconsdir = mpath / "gui" / "resources" 
-
-themePaths = QtGui.QIcon.themeSearchPaths()
-fbPaths = QtGui.QIcon.fallbackSearchPaths()
-# NOTE: 2023-09-30 15:49:27 
-# this below is ALWAYS added by default in the Qt resource system
-# themePaths.append(":/icons") 
+# NOTE: 2026-10-18 17:02:15
+# Qt (and everything that uses it) is imported in main() and setupIconTheme(),
+# NOT at module level: worker processes started with the 'spawn' method (see
+# core.prog.process_pool) re-run this module's top level (as '__mp_main__', or
+# as '__main__' in the PyInstaller bundle, until freeze_support() takes over)
 
-# if iconsdir.is_dir():
-#     themePaths.append(str(iconsdir))
-#     fbPaths.append(str(iconsdir))
+def setupIconTheme(hasQDarkTheme:bool=False):
+    """Sets up the icon theme search paths and, on win32 and darwin, the icon theme.
     
-QtGui.QIcon.setThemeSearchPaths(themePaths)
-QtGui.QIcon.setFallbackSearchPaths(fbPaths)
+    Called by main(), once the QApplication exists (the icon theme on win32
+    and darwin depends on the application palette).
     
-# NOTE: 2023-09-28 22:06:54
-# this should be necessary only on windows platform
-# see also NOTE: 2023-09-28 22:12:25
-#
-# On linux we rely on platform plugins (which also get bundled when
-# building a pyinstaller bundle, as per scipyen.spec)
-if sys.platform == "win32":
-    if hasQDarkTheme:
-        # qdarktheme.setup_theme("auto")
-        qdarktheme.enable_hi_dpi()
-        QtGui.QIcon.setThemeName("breeze-dark")
-    else:
-        windowColor = QtWidgets.QApplication.palette().color(QtGui.QPalette.Window)
-        _,_,v,_ = windowColor.getHsv()
-        if v > 128:
-            QtGui.QIcon.setThemeName("breeze")
-        else:
-            QtGui.QIcon.setThemeName("breeze-dark")
-            
-        # FIXME 2023-09-28 23:22:31 BUG
-        # github merry-go-round replaces svg symbolic links (linux) with 
-        # simple text files containing the name of the target - this causes 
-        # the qt-svg plugin to sill out tons of error messages
-        # TODO: either
-        # 1) figure out how to ignore these symbolic links on Windows
-        # 2) figure out how to ignore the qt-svg error messages
-        #
-        # I prefer the first option; a contrived solution is to store on git hub
-        # an archive of the icon directories, and ignore the icons directories in 
-        # .gitignore
-        # unfortunately, this means that after each git pull we'd have to manually
-        # expand these directory, onse something has changed
-        #
-        # 3) incorporate these icons in qrc and resources.py files
-        # the problem with that is that the py and qrc files sizes easily 
-        # get over the file size limit in github, unless I somehow break down
-        # these into a qrc/py resource files for each subdirectory - brrr...
-        #
-        # until then, on Windows we will have to put up with the qt-svg messages
-        # for now...
-        
-elif sys.platform == "darwin":
-    windowColor = QtWidgets.QApplication.palette().color(QtGui.QPalette.Window)
-    _,_,v,_ = windowColor.getHsv()
-    if v > 128:
-        QtGui.QIcon.setThemeName("breeze")
-    else:
-        QtGui.QIcon.setThemeName("breeze-dark")
+    hasQDarkTheme: whether the qdarktheme package is available
+    """
+    # NOTE: 2024-05-02 09:46:11
+    # you still need the QT_API in the environment
+    from qtpy import (QtCore, QtWidgets, QtGui, )
     
-        
-#### END 3rd party modules
-
-#### BEGIN Scipyen modules
-from core import scipyen_config
-#### END Scipyen modules
-
-
-# else:
-#     print('Running in a normal Python process\n\n')
+    # NOTE: 2023-09-28 22:12:25 
+    # this does the trick on windows -  now my local breeze icons are available
+    # so we keep with those (they're too nice, anyway!)
+    #
+    # works in conjunction with code at NOTE: 2023-09-28 22:06:54
+    #
+    #
+    # on linux, we rely on platform-level modules, which get packed by pyinstaller
+    # when building the bundle
+    #
+    mpath = pathlib.Path(__module_path__)
+
+    # iconsdir = mpath / "gui" / "resources" / "icons"
+    iconsdir = mpath / "gui" / "resources" 
+
+    themePaths = QtGui.QIcon.themeSearchPaths()
+    fbPaths = QtGui.QIcon.fallbackSearchPaths()
+    # NOTE: 2023-09-30 15:49:27 
+    # this below is ALWAYS added by default in the Qt resource system
+    # themePaths.append(":/icons") 
+
+    # if iconsdir.is_dir():
+    #     themePaths.append(str(iconsdir))
+    #     fbPaths.append(str(iconsdir))
+
+    QtGui.QIcon.setThemeSearchPaths(themePaths)
+    QtGui.QIcon.setFallbackSearchPaths(fbPaths)
+
+    # NOTE: 2023-09-28 22:06:54
+    # this should be necessary only on windows platform
+    # see also NOTE: 2023-09-28 22:12:25
+    #
+    # On linux we rely on platform plugins (which also get bundled when
+    # building a pyinstaller bundle, as per scipyen.spec)
+    #
+    # NOTE: 2026-10-18 18:02:37
+    # the themes are registered (from the .rcc files in gui/resources) by
+    # core.icontheme, which does not import the gui package; the icon theme set
+    # by the platform is recorded first (see core.icontheme.systemIconTheme)
+    #
+    # FIXME 2023-09-28 23:22:31 BUG
+    # github merry-go-round replaces svg symbolic links (linux) with 
+    # simple text files containing the name of the target - this causes 
+    # the qt-svg plugin to sill out tons of error messages
+    # TODO: either
+    # 1) figure out how to ignore these symbolic links on Windows
+    # 2) figure out how to ignore the qt-svg error messages
+    #
+    # I prefer the first option; a contrived solution is to store on git hub
+    # an archive of the icon directories, and ignore the icons directories in 
+    # .gitignore
+    # unfortunately, this means that after each git pull we'd have to manually
+    # expand these directory, onse something has changed
+    #
+    # 3) incorporate these icons in qrc and resources.py files
+    # the problem with that is that the py and qrc files sizes easily 
+    # get over the file size limit in github, unless I somehow break down
+    # these into a qrc/py resource files for each subdirectory - brrr...
+    #
+    # until then, on Windows we will have to put up with the qt-svg messages
+    # for now...
+    from core import icontheme
     
-# NOTE: 2021-01-10 13:19:20
-# the same Configuration object holds/merges both the user options and the 
-# package defaults (therefore there is no need for two Configuration objects)
-#scipyen_defaults = confuse.LazyConfig("Scipyen", "scipyen_defaults")
-
-if hasattr(QtCore, "QLoggingCategory"):
-    QtCore.QLoggingCategory.setFilterRules("qt.qpa.xcb=false")
-
+    icontheme.setDefaultIconTheme(darkStyle = hasQDarkTheme)
+    
+#### END 3rd party modules
 
-class MyProxyStyle(QtWidgets.QProxyStyle):
-    """To prevent repeats of valueChanged in QSpinBox controls for frame navigation.
+def main():
+    from qtpy import (QtCore, QtWidgets, QtGui, )
     
-    This raises the spin box SH_SpinBox_ClickAutoRepeatThreshold so that
-    valueChanged is not repetedly called when frame navigation takes too long time.
+    hasQDarkTheme = False
+    try:
+        import qdarktheme
+        hasQDarkTheme = True
+    except:
+        pass
     
-    See https://bugreports.qt.io/browse/QTBUG-33128.
+    # NOTE: 2021-01-10 13:19:20
+    # the same Configuration object holds/merges both the user options and the 
+    # package defaults (therefore there is no need for two Configuration objects)
+    from core import scipyen_config
+    import gui.mainwindow as mainwindow
     
-    """
-    # NOTE: 2021-08-17 10:01:32 FIXME
-    # not really used? TODO DEPRECATED
-    def __init__(self, *args):
-        super().__init__(*args)
-        
-    def styleHint(self, hint, *args, **kwargs):
-        if hint == QtWidgets.QStyle.SH_SpinBox_ClickAutoRepeatRate:
-            return 0
+    if hasattr(QtCore, "QLoggingCategory"):
+        QtCore.QLoggingCategory.setFilterRules("qt.qpa.xcb=false")
         
-        elif hint == QtWidgets.QStyle.SH_SpinBox_ClickAutoRepeatThreshold:
-            return 1000000
-        
-        return super().styleHint(hint, *args, **kwargs)
-
-def main():
-    import gui.mainwindow as mainwindow
     # print(f"Using {os.environ['QT_API']} for GUI and {os.environ['PYQTGRAPH_QT_LIB']} for PyQtGraph\n")
     faulthandler.enable()
     
@@ -250,8 +216,13 @@ def main():
     try:
         # BEGIN 
         # 1. create the pyqt5 app
+        if sys.platform == "win32" and hasQDarkTheme:
+            qdarktheme.enable_hi_dpi() # must be called before the app is created
+            
         app = QtWidgets.QApplication(sys.argv)
         
+        setupIconTheme(hasQDarkTheme)
+        
             
         if sys.platform == "win32":
             if hasQDarkTheme:
@@ -305,6 +276,15 @@ def main():
         # 3. show the main window
         mainWindow.show()
         
+        if startup_profiler is not None:
+            # NOTE: 2026-10-18 15:55:41
+            # report once the event loop has started (after the plugins are loaded)
+            def _report_startup():
+                startup_profiler.uninstall()
+                startup_profiler.report()
+                
+            QtCore.QTimer.singleShot(0, _report_startup)
+            
         # 4. start the main GUI app (pyqt5) event loop
         app.exec()
         
@@ -313,6 +293,11 @@ def main():
         traceback.print_exc()
         
 if __name__ == '__main__':
+    # NOTE: 2026-10-18 17:02:15
+    # in the PyInstaller bundle, this is where worker processes started by
+    # core.prog.process_pool take over (and exit)
+    multiprocessing.freeze_support()
+    
     if sys.version_info.major < 3 or sys.version_info.minor < 9:
         raise OSError(f"Scipyen requires Python >= 3.9 but the script is using {sys.version}")
     main()
@@ -11,8 +11,10 @@ import os, sys, traceback, warnings, mimetypes, io, typing
 import  datetime, time, dateutil
 from enum import Enum, IntEnum #, unique
 from collections import OrderedDict
+import collections.abc
 import concurrent.futures
 import threading
+import weakref
 #import xml
 #### END core python modules
 
@@ -65,6 +67,7 @@ from imaging import (imageprocessing as imgp, axisutils, axiscalibration,)
 from imaging.scandata import (ScanData, ScanDataOptions, scanDataOptions,)
 
 from imaging.vigrautils import (concatenateImages, insertAxis)
+from imaging.framestore import (FrameStore, TiffFrameSource, )
 
 from imaging.axisutils import (axisTypeFromString, axisTypeName, 
                                axisTypeSymbol, axisTypeUnits,)
@@ -89,6 +92,13 @@ if os.environ["QT_API"] in ("pyqt5", "pyside2"):
 else:
     __UI_PrairieImporter, __QDialog__ = __loadUiType__(__ui_path__)
 
+# NOTE: 2026-10-18 10:12:40
+# Number of threads used to read the per-channel image files of TSeries and
+# ZSeries sequences into a preallocated volume (see PVSequence.readVolume).
+# TIFF decoding in vigra impex is mostly I/O bound, so it pays to have more 
+# readers than CPU cores; set to 1 to read the files sequentially.
+FRAME_READER_THREADS = min(32, (os.cpu_count() or 1) + 4)
+
 
 """ NOTE: 2017-09-22 09:28:23
 Image file organization with respect to (hyper-)volume data (hereafter I describe 
@@ -475,6 +485,23 @@ class PVStateShard(object):
             except:
                 self.__attributes__[n.getAttribute("key")] = n.getAttribute("value")
                 
+    @classmethod
+    def fromAttributes(cls, attributes, parent=None):
+        """Creates a PVStateShard around an already parsed attributes DataBag.
+        
+        Used by the streaming parser (see PVScan.fromXMLFile) where identical
+        state shards are parsed once and shared by all the frames that have 
+        them; the attributes DataBag is NOT copied.
+        """
+        if parent is not None and not isinstance(parent, PVFrame):
+            raise TypeError("Parent of a PVStateShard can only be None or a PVFrame object")
+        
+        ret = cls.__new__(cls)
+        ret.__parent__ = parent
+        ret.__attributes__ = attributes
+        
+        return ret
+    
     @property
     def parent(self):
         """The parent PVFrame object, or None
@@ -618,6 +645,25 @@ class PVFrame(object):
         
         self.__mergeChannelsOnOutput__ = False
         
+    @classmethod
+    def fromTable(cls, table, index, parent=None):
+        """Creates the PVFrame for the frame at `index` in a PVFrameTable.
+        
+        The state shard is shared with the other frames in the table that have
+        the same state (see PVStateShard.fromAttributes).
+        """
+        if parent is not None and not isinstance(parent, PVSequence):
+            raise TypeError("Parent of a PVFrame can only be None or a PVSequence")
+        
+        ret = cls.__new__(cls)
+        ret.__parent__ = parent
+        ret.__attributes__ = DataBag(table.frameAttributes(index))
+        ret.__files__ = [DataBag(f) for f in table.frameFiles(index)]
+        ret.ExtraParameters = table.frameExtraParameters(index)
+        ret.__stateshard__ = PVStateShard.fromAttributes(table.frameState(index), parent=ret)
+        ret.__mergeChannelsOnOutput__ = False
+        
+        return ret
         
     @property
     def parent(self):
@@ -1039,18 +1085,7 @@ class PVFrame(object):
     def metadata(self):
         """Returns metadata associated with this frame.
         """
-        
-        channelIndex = [f["channel"] for f in self.files]
-        orderedIndex = np.argsort(channelIndex)
-        metadata = dict()
-        metadata["frame"] = self.attributes
-        metadata["acq"] = self.state.attributes
-        metadata["channels"] = self.channels
-        metadata["channel_names"] = {int(self.files[k]["channel"]): self.files[k]["channelName"] for k in orderedIndex}
-        metadata["files"] = [self.files[k] for k in orderedIndex]
-        metadata["type"] = self.__class__.__name__
-        
-        return DataBag(metadata)
+        return _frameMetadata(self.attributes, self.state.attributes, self.files)
         
         
     def __repr__(self):
@@ -1078,6 +1113,257 @@ class PVFrame(object):
         return "".join(ret)
         
         
+def _frameMetadata(attributes:DataBag, state:DataBag, files:list) -> DataBag:
+    """Metadata of a frame; see PVFrame.metadata and PVFrameTable.frameMetadata
+    """
+    channelIndex = [f["channel"] for f in files]
+    orderedIndex = np.argsort(channelIndex)
+    metadata = dict()
+    metadata["frame"] = attributes
+    metadata["acq"] = state
+    metadata["channels"] = len(files)
+    metadata["channel_names"] = {int(files[k]["channel"]): files[k]["channelName"] for k in orderedIndex}
+    metadata["files"] = [files[k] for k in orderedIndex]
+    metadata["type"] = PVFrame.__name__
+    
+    return DataBag(metadata)
+
+def _frameColumn(values:list) -> np.ndarray:
+    """Packs a list of parsed XML attribute values into a NumPy column.
+    
+    Columns of numbers are stored with a numeric dtype; anything else 
+    (including columns with missing values, stored as None) goes into an
+    object array.
+    """
+    if len(values) and all(isinstance(v, bool) for v in values):
+        return np.array(values, dtype=np.bool_)
+    
+    if len(values) and all(isinstance(v, int) and not isinstance(v, bool) for v in values):
+        try:
+            return np.array(values, dtype=np.int64)
+        except OverflowError:
+            pass
+        
+    elif len(values) and all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values):
+        return np.array(values, dtype=np.float64)
+    
+    ret = np.empty(len(values), dtype=object)
+    ret[:] = values
+    return ret
+
+def _columnValue(column:np.ndarray, index:int):
+    """Inverse of _frameColumn for one element; returns None for missing values
+    """
+    value = column[index]
+    
+    if column.dtype == object:
+        return value
+    
+    return value.item()
+    
+class PVFrameTable(object):
+    """Column-oriented storage for the Frame elements of a PVSequence.
+    
+    Created by the streaming parser (see PVScan.fromXMLFile) instead of one
+    PVFrame object per Frame element:
+    
+    * frame attributes are stored as NumPy columns, one element per frame;
+    
+    * File attributes are stored as NumPy columns with one element per file; 
+        the files of frame k are at fileOffsets[k]:fileOffsets[k+1];
+        
+    * state shards, which in long TSeries are mostly identical from one frame
+        to the next, are stored once (in `shards`) and indexed per frame (in 
+        `shardIndex`); ExtraParameters are stored likewise.
+        
+    PVFrame objects are created on demand by PVFrameList.
+    """
+    def __init__(self, attributes:dict, files:dict, fileOffsets:np.ndarray,
+                 shards:list, shardIndex:np.ndarray, 
+                 extraParameters:list, extraIndex:np.ndarray):
+        self.attributes = attributes
+        self.files = files
+        self.fileOffsets = fileOffsets
+        self.shards = shards
+        self.shardIndex = shardIndex
+        self.extraParameters = extraParameters
+        self.extraIndex = extraIndex
+        
+    def __len__(self):
+        return len(self.shardIndex)
+    
+    def frameAttributes(self, index:int) -> dict:
+        ret = dict()
+        for name, column in self.attributes.items():
+            value = _columnValue(column, index)
+            if value is not None:
+                ret[name] = value
+                
+        return ret
+    
+    def frameFiles(self, index:int) -> list:
+        ret = list()
+        for k in range(self.fileOffsets[index], self.fileOffsets[index+1]):
+            f = dict()
+            for name, column in self.files.items():
+                value = _columnValue(column, k)
+                if value is not None:
+                    f[name] = value
+            ret.append(f)
+            
+        return ret
+    
+    def frameState(self, index:int) -> DataBag:
+        return self.shards[self.shardIndex[index]]
+    
+    def frameExtraParameters(self, index:int):
+        k = self.extraIndex[index]
+        if k < 0:
+            return None
+        
+        return [DataBag(ep) for ep in self.extraParameters[k]]
+    
+    def frameMetadata(self, index:int) -> DataBag:
+        """The metadata of the frame at `index`, as PVFrame.metadata(), 
+        without creating the PVFrame.
+        """
+        return _frameMetadata(DataBag(self.frameAttributes(index)),
+                              self.frameState(index),
+                              [DataBag(f) for f in self.frameFiles(index)])
+    
+    def column(self, name:str) -> np.ndarray:
+        """The values of the frame attribute `name`, for all frames.
+        """
+        return self.attributes[name]
+    
+    def stateColumn(self, name:str, default=None) -> np.ndarray:
+        """The values of the state shard key `name`, for all frames.
+        """
+        return _frameColumn([s.get(name, default) for s in self.shards])[self.shardIndex]
+    
+class PVFrameList(collections.abc.Sequence):
+    """Read-only sequence of PVFrame objects backed by a PVFrameTable.
+    
+    PVFrame objects are created when accessed, and kept only for as long as
+    they are referenced elsewhere.
+    """
+    def __init__(self, table:PVFrameTable, sequence=None):
+        self.table = table
+        self.sequence = sequence
+        self._frames_ = weakref.WeakValueDictionary()
+        
+    def __len__(self):
+        return len(self.table)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[k] for k in range(*index.indices(len(self)))]
+        
+        if index < 0:
+            index += len(self)
+            
+        if index < 0 or index >= len(self):
+            raise IndexError("frame index out of range")
+        
+        frame = self._frames_.get(index, None)
+        
+        if frame is None:
+            frame = PVFrame.fromTable(self.table, index, parent=self.sequence)
+            self._frames_[index] = frame
+            
+        return frame
+    
+    def __getstate__(self):
+        return {"table": self.table, "sequence": self.sequence}
+    
+    def __setstate__(self, state):
+        self.table = state["table"]
+        self.sequence = state["sequence"]
+        self._frames_ = weakref.WeakValueDictionary()
+        
+class _PVFrameTableBuilder(object):
+    """Accumulates the Frame elements of a Sequence while streaming the XML.
+    """
+    def __init__(self, evaluate):
+        self.evaluate = evaluate # callable that parses attribute value strings
+        self.nframes = 0
+        self.nfiles = 0
+        self.attributes = dict()
+        self.files = dict()
+        self.fileOffsets = [0]
+        self.shards = list()
+        self.shardKeys = dict()
+        self.shardIndex = list()
+        self.extraParameters = list()
+        self.extraKeys = dict()
+        self.extraIndex = list()
+        
+    @staticmethod
+    def _setValue(columns:dict, name:str, position:int, value):
+        column = columns.get(name, None)
+        if column is None:
+            column = columns[name] = list()
+        
+        if len(column) < position:
+            column.extend([None] * (position - len(column)))
+            
+        column.append(value)
+        
+    def addFrame(self, element):
+        """Adds a Frame element (xml.etree.ElementTree.Element)
+        """
+        for name, value in element.attrib.items():
+            self._setValue(self.attributes, name, self.nframes, self.evaluate(value))
+            
+        for f in element.iter("File"):
+            for name, value in f.attrib.items():
+                self._setValue(self.files, name, self.nfiles, self.evaluate(value))
+            self.nfiles += 1
+            
+        self.fileOffsets.append(self.nfiles)
+        
+        shard = element.find("PVStateShard")
+        
+        if shard is None:
+            key = tuple()
+        else:
+            key = tuple((k.get("key"), k.get("value")) for k in shard.iter("Key"))
+            
+        index = self.shardKeys.get(key, None)
+        
+        if index is None:
+            index = self.shardKeys[key] = len(self.shards)
+            self.shards.append(DataBag(dict((k, self.evaluate(v)) for k, v in key)))
+            
+        self.shardIndex.append(index)
+        
+        ep = tuple(tuple(e.attrib.items()) for e in element.iter("ExtraParameters"))
+        
+        if len(ep):
+            index = self.extraKeys.get(ep, None)
+            if index is None:
+                index = self.extraKeys[ep] = len(self.extraParameters)
+                self.extraParameters.append([dict((k, self.evaluate(v)) for k, v in e) for e in ep])
+                
+        else:
+            index = -1
+            
+        self.extraIndex.append(index)
+        
+        self.nframes += 1
+        
+    def table(self) -> PVFrameTable:
+        for columns, size in ((self.attributes, self.nframes), (self.files, self.nfiles)):
+            for name, column in columns.items():
+                if len(column) < size:
+                    column.extend([None] * (size - len(column)))
+                columns[name] = _frameColumn(column)
+            
+        return PVFrameTable(self.attributes, self.files, 
+                            np.array(self.fileOffsets, dtype=np.intp),
+                            self.shards, np.array(self.shardIndex, dtype=np.intp),
+                            self.extraParameters, np.array(self.extraIndex, dtype=np.intp))
+        
 # NOTE: 2017-08-03 09:24:20
 # TODO: make the instances sortable by cycle number (found in attributes
 class PVSequence (object):
@@ -1101,18 +1387,7 @@ class PVSequence (object):
         self.__attributes__ = DataBag(dict())
         
         if node.attributes is not None:
-            for k in node.attributes.values():
-                try:
-                    val=eval(k.value)
-                except:
-                    val = k.value
-                    
-                if k.name == "type": 
-                    self.__attributes__["sequencetype"] = PVSequenceType[val.split()[0]].value
-                else:
-                    self.__attributes__[k.name] = val
-                    
-            self.__attributes__["sequencetypename"] = PVSequenceType(self.__attributes__["sequencetype"]).name
+            self._setAttributes_((k.name, k.value) for k in node.attributes.values())
         
         if self.__attributes__["sequencetype"] == PVSequenceType.Linescan:
             self.__definition__ = PVLinescanDefinition(node.getElementsByTagName("PVLinescanDefinition")[0], \
@@ -1126,9 +1401,70 @@ class PVSequence (object):
                 
         self.frames = [PVFrame(n, parent=self) for n in node.getElementsByTagName("Frame")]
         
+    @classmethod
+    def _fromAttributes_(cls, attributes, parent=None):
+        """Creates an empty PVSequence; used by the streaming parser.
+        
+        Parameters:
+        -----------
+        attributes: iterable of (name, value) str pairs - the XML attributes 
+            of the Sequence element
+        
+        parent: PVScan or None
+        
+        The definition, Z axis synchronization and frames are filled in by the
+        streaming parser (see PVScan.fromXMLFile)
+        """
+        if parent is not None and not isinstance(parent, PVScan):
+            raise TypeError("Parent of a PVSequence can only be None or a PVScan object")
+        
+        ret = cls.__new__(cls)
+        ret.__mergeChannelsOnOutput__ = False
+        ret.__parent__ = parent
+        ret.__attributes__ = DataBag(dict())
+        ret._setAttributes_(attributes)
+        ret.__definition__ = None
+        ret.__syncZAxis__ = None
+        ret.frames = list()
+        
+        return ret
+        
+    def _setAttributes_(self, attributes):
+        for name, value in attributes:
+            try:
+                val=eval(value)
+            except:
+                val = value
+                
+            if name == "type": 
+                self.__attributes__["sequencetype"] = PVSequenceType[val.split()[0]].value
+            else:
+                self.__attributes__[name] = val
+                
+        self.__attributes__["sequencetypename"] = PVSequenceType(self.__attributes__["sequencetype"]).name
+        
     def __len__(self):
         return len(self.frames)
     
+    def frameAttribute(self, name:str) -> np.ndarray:
+        """The values of the attribute `name` for all frames in this sequence.
+        
+        When the sequence was created by the streaming parser this is read 
+        directly from the frames table, without creating PVFrame objects.
+        """
+        if isinstance(self.frames, PVFrameList):
+            return self.frames.table.column(name)
+        
+        return _frameColumn([f.attributes.get(name, None) for f in self.frames])
+    
+    def frameStateAttribute(self, name:str) -> np.ndarray:
+        """The values of the state key `name` for all frames in this sequence.
+        """
+        if isinstance(self.frames, PVFrameList):
+            return self.frames.table.stateColumn(name)
+        
+        return _frameColumn([f.state.attributes.get(name, None) for f in self.frames])
+    
     def __call__(self, filepath=None):
         """Load the images from the file(s) define in its frames attribute
         
@@ -1275,178 +1611,16 @@ class PVSequence (object):
         elif self.sequencetype in (PVSequenceType.TSeries, PVSequenceType.ZSeries): 
             # there are at least one frame per sequence (but at least one)
             # parent PVScan should only have one such sequence
-            if self.__mergeChannelsOnOutput__:
-                data = [f.mergeChannels(filepath=filepath) for f in self.frames]# a tuple of frameData, sourceData
-                
-                # NOTE: 2017-10-25 00:34:44
-                # be mindful that frames __call__() return a TUPLE of
-                # frame data and source data; except for Linescan frames, source data
-                # is None so we drop this out here
-                sources = [d[1] for d in data]
-                
-                data = [d[0] for d in data]
-                
-                # NOTE: 2017-10-25 00:51:06 source data is None here
-                # so we just return None for it
-                
-                # each frame has already been concatenated into a
-                # multi-band image; what we have to do here is to 
-                # create a new time or Z axis accordingly, on the highest
-                # dimension, then concatenate along it
-                
-                #newAxisDim = data[0].ndim
-                
-                if self.type == PVSequenceType.TSeries:
-                    frameTimes = [float(f.attributes["absoluteTime"]) for f in self.frames]
-
-                    diffTimes = np.diff(frameTimes) # there will be some jitter
-
-                    framePeriod = float(diffTimes.mean())# * pq.s
-                
-                    newAxisInfo = vigra.AxisInfo(key="t", 
-                                                 typeFlags=vigra.AxisType.Time, 
-                                                 resolution=framePeriod, 
-                                                 description=axisTypeName(axisTypeFromString["t"]))
-                    
-                    newAxisCal = AxisCalibrationData(newAxisInfo)
-                    newAxisCal.units = pq.s,
-                    newAxisCal.origin = float(self.frames[0].attributes["absoluteTime"])
-                    newAxisCal.resolution = framePeriod
-                    
-                    newAxisInfo = newAxisCal.calibrateAxis(newAxisInfo)
-                    
-                else: # Z series
-                    # get the Z axis resolution from the frames state
-                    z_pos = [float(f.state.attributes["positionCurrent_ZAxis"]) for f in self.frames]
-                    z_steps = np.diff(z_pos)
-                    
-                    if len(z_steps) > 1:
-                        if not all(z == z_steps[0] for z in z_steps):
-                            raise ValueError("Irregular Z axis sampling not supported")
-                        
-                    zres = z_steps[0]
-                    
-                    newAxisInfo = vigra.AxisInfo(key="z", 
-                                                 typeFlags=vigra.AxisType.Space,
-                                                 resolution=zres,
-                                                 description=axisTypeName(axisTypeFromString["z"]))
-                    
-                    newAxisCal = AxisCalibrationData(newAxisInfo)
-                    newAxisCal.units = pq.um
-                    newAxisCal.origin = float(self.frames[0].state.attributes["positionCurrent_ZAxis"])
-                    newAxisCal.resolution = zres
-                    
-                    newAxisInfo = newAxisCal.calibrateAxis(newAxisInfo)
-                
-                # NOTE: 2018-08-01 17:03:52
-                # see NOTE: 2018-08-01 17:04:06
-                channelAxisDim = data[0].axistags.channelIndex
-                
-                if channelAxisDim == data[0].ndim-1:
-                    newAxisDim = channelAxisDim
-                    
-                else:
-                    newAxisDim = data[0].ndim
-                    
-                images = [imgp.insertAxis(img, newAxisInfo, newAxisDim) for img in data]
             
-                # NOTE: 2017-10-25 00:51:06 source data is None here
-                # so we just return None for it
-                return concatenateImages(images, axis=newAxisInfo), None
-            
-            else: # separate channels
-                data = [f(filepath=filepath) for f in self.frames] # for each frame: a tuple of frame data & src data if linescan
-                
-                # NOTE: 2017-10-25 00:34:44
-                # be mindful that frames __call__() return a TUPLE of
-                # frame data and source data; except for Linescan frames, source data
-                # is None
-                sources = [d[1] for d in data]
-                
-                data = [d[0] for d in data]
-                
-                # each frame outputs a list of single-band images with as many 
-                # images per frame as channes were defined in the acquisition)
-                
-                # importantly, they all should have ndim == 3, with a singleton 
-                # channel axis on the highest dimension (2)
-                
-                # we will have to keep these channels separate, and concatenate
-                # along each corresponding channel
-                
-                # the result will therefore have to be a list of concatenated
-                # data (3D); with as many elements as channels;
-                
-                # these will have ndim=4 (three non-channel axis + one channel
-                # axis on the highest dimension)
-                
-                # the concatenation axis needs to be placed BEFORE the (singleton)
-                # channel axis, such that channels are always on the highest dimension
-                
-                # this should "push" the channel axis to a higher dimension in the 
-                # result
-                channelAxisDim = data[0][0].axistags.channelIndex
-                
-                if channelAxisDim == data[0][0].ndim-1: # channel axis on highest dimension
-                    newAxisDim = data[0][0].ndim-1 # use the dim immediately below channel axis, for concatenation axis
-                    
-                else: # either no channel axis, or channel axis is on an inner dimension:
-                    # if on an inner dimension we assume there is a good reason for this
-                    # do we concatenateon the highest (outer) dimension regardless
-                    newAxisDim = data[0][0].ndim # use highest dimension for concatenation axis
-                    
-                if self.sequencetype == PVSequenceType.TSeries:
-                    framePeriods = [float(f.attributes["absoluteTime"]) for f in self.frames]
-                    
-                    diffTimes = np.diff(frameTimes) # there will be some jitter
-
-                    framePeriod = float(diffTimes.mean())#framePeriods[0]
-                
-                    newAxisInfo = vigra.AxisInfo(key="t", 
-                                                 typeFlags = vigra.AxisType.Time,
-                                                 resolution=framePeriod,
-                                                 description=axisTypeName(axisTypeFromString["t"]))
-                    
-                    newAxisCal = AxisCalibrationData(units = pq.s, 
-                                                     origin = float(self.frames[0].attributes["absoluteTime"]), 
-                                                     resolution = framePeriod,
-                                                     name = axisTypeName(newAxisInfo))
-                    
-                    newAxisInfo = newAxisCal.calibrateAxis(newAxisInfo)
-                    
-                else: # ZSeries
-                    # get the Z axis resolution from the frames state
-                    z_pos = [float(f.state.attributes["positionCurrent_ZAxis"]) for f in self.frames]
-                    z_steps = np.diff(z_pos)
-
-                    zres = abs(z_steps[0])
-                    
-                    newAxisInfo = vigra.AxisInfo(key="z", 
-                                                 typeFlags=vigra.AxisType.Space,
-                                                 resolution=zres,
-                                                 description=axisTypeName(axisTypeFromString["z"]))
-                    
-                    newAxisCal = AxisCalibrationData(newAxisInfo)
-                    newAxisCal.units=pq.um
-                    newAxisCal.origin=float(self.frames[0].state.attributes["positionCurrent_ZAxis"])
-                    newAxisCal.resolution=zres
-                    
-                    newAxisInfo = newAxisCal.calibrateAxis(newAxisInfo)
-                    
-                # NOTE: 2018-08-01 17:03:52
-                # see NOTE: 2018-08-01 17:04:06
-                channelAxisDim = data[0][0].axistags.channelIndex
-                
-                if channelAxisDim == data[0][0].ndim-1:
-                    newAxisDim = channelAxisDim
-                    
-                else:
-                    newAxisDim = data[0][0].ndim
-                    
-                return [concatenateImages([insertAxis(data[frame][channel], newAxisInfo, newAxisDim) 
-                                                        for frame in range(len(self.frames))], 
-                                                        axis=newAxisInfo) 
-                                                    for channel in range(len(data[0]))], None
+            # NOTE: 2026-10-18 10:14:05
+            # frames are no longer read one at a time and then concatenated
+            # along a new time or Z axis (which copied the growing volume for 
+            # every frame); instead, readVolume() preallocates the entire data 
+            # volume and fills it from a pool of image file readers
+            #
+            # NOTE: 2017-10-25 00:51:06 source data is None here
+            # so we just return None for it
+            return self.readVolume(filepath=filepath), None
                 
         elif self.sequencetype == PVSequenceType.Single:
             # one sequence, one frame
@@ -1492,6 +1666,173 @@ class PVSequence (object):
             raise e
         self.__mergeChannelsOnOutput__ = v
         return data
+
+    def frameAxisInfo(self):
+        """Calibrated vigra.AxisInfo for the axis along which frames are stacked.
+        
+        For a TSeries this is a Time axis ("t") with the resolution given by the
+        mean interval between frames; for a ZSeries this is a Space axis ("z") 
+        with the resolution given by the Z step of the acquisition.
+        """
+        if self.sequencetype == PVSequenceType.TSeries:
+            frameTimes = self.frameAttribute("absoluteTime").astype(float)
+            
+            if len(frameTimes) > 1:
+                framePeriod = float(np.diff(frameTimes).mean()) # there will be some jitter
+                
+            else:
+                framePeriod = 1.0
+                
+            newAxisInfo = vigra.AxisInfo(key="t", 
+                                         typeFlags=vigra.AxisType.Time, 
+                                         resolution=framePeriod, 
+                                         description=axisTypeName(vigra.AxisType.Time))
+            
+            newAxisCal = AxisCalibrationData(newAxisInfo)
+            newAxisCal.units = pq.s
+            newAxisCal.origin = float(frameTimes[0])
+            newAxisCal.resolution = framePeriod
+            
+        else: # Z series
+            # get the Z axis resolution from the frames state
+            z_pos = self.frameStateAttribute("positionCurrent_ZAxis").astype(float)
+            
+            if len(z_pos) > 1:
+                zres = abs(float(np.diff(z_pos)[0]))
+                
+            else:
+                zres = 1.0
+            
+            newAxisInfo = vigra.AxisInfo(key="z", 
+                                         typeFlags=vigra.AxisType.Space,
+                                         resolution=zres,
+                                         description=axisTypeName(vigra.AxisType.Space))
+            
+            newAxisCal = AxisCalibrationData(newAxisInfo)
+            newAxisCal.units = pq.um
+            newAxisCal.origin = float(z_pos[0])
+            newAxisCal.resolution = zres
+            
+        return newAxisCal.calibrateAxis(newAxisInfo)
+    
+    def readVolume(self, filepath=None, max_workers=None):
+        """Reads all frames of a TSeries or ZSeries into preallocated volume(s).
+        
+        The files of the first frame are read (and their axes calibrated) by 
+        the first PVFrame; this gives the shape, dtype and axistags of each 
+        channel image. The complete (x, y, frame, channel) VigraArray is then 
+        allocated once, and the remaining image files are read concurrently by
+        a pool of threads, each writing its image directly into its slot in 
+        the volume. 
+        
+        Keyword parameters:
+        ===================
+        filepath: str or None (default); when given, it is prepended to the 
+            image file names (see PVFrame.__call__)
+            
+        max_workers: int or None (default); the number of reader threads; when
+            None, uses the module-level FRAME_READER_THREADS
+            
+        Returns:
+        ========
+        When channels are merged (see mergeChannels()) and the frames have 
+        between 2 and 4 channels: a single multi-band VigraArray with axes
+        (x, y, t or z, c).
+        
+        Otherwise, a list of single-band VigraArray objects with axes 
+        (x, y, t or z, c) - one per channel.
+        
+        """
+        if len(self.frames) == 0:
+            return
+        
+        if filepath is None:
+            filepath = self.filepath # may be None
+            
+        if max_workers is None:
+            max_workers = FRAME_READER_THREADS
+            
+        nChannels = len(self.frames[0].files)
+        
+        merge = self.__mergeChannelsOnOutput__ and nChannels > 1 and nChannels <= 4
+        
+        newAxisInfo = self.frameAxisInfo()
+        
+        # STEP 1: read the first frame; this takes care of axes calibrations
+        # for the image files and (if requested) the channel merging
+        if merge:
+            firstFrame = self.frames[0].mergeChannels(filepath=filepath)[0]
+            templates = [firstFrame]
+            
+        else:
+            templates = self.frames[0](filepath=filepath)[0]
+            
+        # STEP 2: preallocate the volume(s)
+        # NOTE: 2018-08-01 17:04:06 the channel axis is always on the highest 
+        # dimension of the frame data, and the frame axis is inserted right 
+        # before it
+        volumes = list()
+        
+        for img in templates:
+            if img.ndim != 3 or img.channelIndex != img.ndim - 1:
+                raise ValueError(f"Expecting 2D frame images with a channel axis on the highest dimension; got {img.axistags} instead")
+            
+            axistags = vigra.AxisTags(img.axistags[0], img.axistags[1], 
+                                      newAxisInfo, img.axistags[2])
+            
+            volume = vigra.VigraArray(img.shape[:2] + (len(self.frames),) + img.shape[2:],
+                                      dtype = img.dtype, axistags = axistags, 
+                                      init = False)
+            
+            np.asarray(volume)[:, :, 0, :] = np.asarray(img)
+            
+            volumes.append(volume)
+            
+        frameShape = templates[0].shape[:2]
+        
+        # STEP 3: read the remaining frames; each (frame, file) pair goes into
+        # a distinct slot of the preallocated volume(s), so the readers need 
+        # no locking
+        def _readFile(frameIndex, fileIndex, fileName):
+            if filepath is not None:
+                fileName = os.path.join(filepath, fileName)
+                
+            data = pio.loadImageFile(fileName)
+            
+            if data.shape[:2] != frameShape:
+                raise ValueError(f"Image file {fileName} has shape {data.shape[:2]}; expecting {frameShape}")
+            
+            if merge:
+                np.asarray(volumes[0])[:, :, frameIndex, fileIndex] = np.asarray(data).reshape(frameShape)
+                
+            else:
+                np.asarray(volumes[fileIndex])[:, :, frameIndex, 0] = np.asarray(data).reshape(frameShape)
+                
+        jobs = [(kf, k, f.files[k]["filename"]) for kf, f in enumerate(self.frames[1:], start=1) 
+                for k in range(len(f.files))]
+        
+        if max_workers > 1 and len(jobs) > 1:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(_readFile, *job) for job in jobs]
+                
+                try:
+                    for future in concurrent.futures.as_completed(futures):
+                        future.result() # raises exceptions from the reader threads
+                        
+                except:
+                    for future in futures:
+                        future.cancel()
+                    raise
+                
+        else:
+            for job in jobs:
+                _readFile(*job)
+                
+        if merge:
+            return volumes[0]
+        
+        return volumes
+    
     
     def metadata(self):
         """Returns metadata for this sequence.
@@ -1539,7 +1880,7 @@ class PVSequence (object):
             
         elif self.type in (PVSequenceType.TSeries, PVSequenceType.ZSeries, PVSequenceType.Single):
             if self.type == PVSequenceType.TSeries:
-                frameTimes = [f.attributes["absoluteTime"] for f in self.frames]
+                frameTimes = self.frameAttribute("absoluteTime").astype(float)
 
                 diffTimes = np.diff(frameTimes) # there will be some jitter
 
@@ -1547,7 +1888,7 @@ class PVSequence (object):
         
             elif self.type == PVSequenceType.ZSeries:
                 # get the Z axis resolution from the frames state
-                z_pos = [f.state.attributes["positionCurrent_ZAxis"] for f in self.frames]
+                z_pos = self.frameStateAttribute("positionCurrent_ZAxis").astype(float)
                 z_steps = np.diff(z_pos)
                 #if len(z_steps) > 1:
                     #if not all(z == z_steps[0] for z in z_steps):
@@ -1560,11 +1901,14 @@ class PVSequence (object):
                     
             metadata["frame_period"] = framePeriod
                 
-            if len(self.frames) > 1:
-                metadata["frames"] = [f.metadata() for f in self.frames]
+            if isinstance(self.frames, PVFrameList):
+                # NOTE: 2026-10-18 17:55:12
+                # straight from the frame table, without creating the PVFrames
+                table = self.frames.table
+                metadata["frames"] = [table.frameMetadata(k) for k in range(len(table))]
                 
             else:
-                metadata["frames"] = [self.frames[0].metadata()]
+                metadata["frames"] = [f.metadata() for f in self.frames]
                 
         elif self.type == PVSequenceType.Point: # TODO implement me!
             raise NotImplementedError("Point scan sequence parsing not implemented yet")
@@ -1727,36 +2071,11 @@ class PVScan(object):
         if doc.documentElement is None or doc.documentElement.nodeName != "PVScan":
             raise ValueError("Expecting a valid PVScan XML data")
         
-        # FIXME DO NOT store the documentElement attributes, directly in __dict__
-        # NOTE:2017-10-31 08:37:19
-        # storing attributed in __dict__ will result in infinite recursions in __str__()
-        # at various places in the code, unless you write code to manage it.
-        # -- too work for little benefit
-        self.__version__ = tuple() # major, minor, micro, dot
-        self.__rec_datetime__ = datetime.datetime.now()
-        
         if doc.documentElement.attributes is not None:
-            self.__attributes__ = DataBag(xmlutils.attributesToDict(doc.documentElement))
-            v = self.__attributes__.get("version", None)
-            if isinstance(v, str) and len(v.strip()):
-                try:
-                    self.__version__ = tuple(map(lambda x: eval(x), v.split('.')))
-                except:
-                    scipywarn(f"Could not parse the Prairie version data {v})")
-            
-            d = self.__attributes__.get("date", None)
-            if isinstance(d, str) and len(d.strip()):
-                try:
-                    self.__rec_datetime__ = dateutil.parser.parse(d)
-                except:
-                    traceback.print_exc()
-                    scipywarn(f"Due to the above caught exception, rec_datetime will be set to `datetime.now()`")
-            else:
-                scipywarn(f"No suitable date string found; rec_datetime will be set to `datetime.now()")
-                    
+            self._setAttributes_(xmlutils.attributesToDict(doc.documentElement))
                 
         else:
-            self.__attributes__ = DataBag(dict())
+            self._setAttributes_(None)
             
         # print(f"{self.__class__.__name__} attributes: {self.__attributes__}")
             
@@ -1795,12 +2114,7 @@ class PVScan(object):
             #     self.__filename__ = os.path.basename(self.__path__)
             self.__filename__ = None
             
-        if isinstance(name, str):
-            self.__name__ = name
-            
-        else:
-            if self.__filename__ is not None:
-                self.__name__ = os.path.splitext(self.__filename__)[0]
+        self._setName_(name)
                 
         # NOTE: 2017-08-03 09:22:43
         # there should be only ONE SystemConfiguration element node
@@ -1811,18 +2125,183 @@ class PVScan(object):
         if len(sysconfig):
             self.__systemConfiguration__ = PVSystemConfiguration(sysconfig[0], parent=self)
         else:
-            if os.path.isdir(self.__path__) and os.path.isfile(self.__filename__):
-                print(f"dirname: {self.__path__}, filename: {self.__filename__}")
-                base = os.path.splitext(self.__filename__)[0]
-                env_filename = os.path.join(self.__path__, base+".env")
-                envDoc = pio.loadXMLFile(env_filename)
-                pvEnviron = envDoc.documentElement.getElementsByTagName("Environment")
-                if len(pvEnviron):
-                    self.__systemConfiguration__ = PVSystemConfiguration(pvEnviron[0], parent=self)
+            self._loadEnvironment_()
 
         self.sequences = [PVSequence(n, parent=self) for n in doc.documentElement.getElementsByTagName("Sequence")]
         
+    @classmethod
+    def fromXMLFile(cls, fileName:str, name=None):
+        """Creates a PVScan by streaming through a PrairieView XML file.
+        
+        Unlike the PVScan constructor, this does not need a DOM of the entire
+        XML document (see iolib.pictio.loadXMLFile). The file is read with 
+        xml.etree.ElementTree.iterparse; each Frame element is consumed into 
+        the columns of a PVFrameTable as soon as it has been parsed, then 
+        discarded. Repeated attribute values and state shards are parsed once
+        and shared.
+        
+        The frames of each PVSequence are then available as a PVFrameList,
+        which creates PVFrame objects on demand.
+        
+        Parameters:
+        -----------
+        fileName: str - path to the PrairieView XML file
+        
+        name: str (optional, default is None) - the name of the PVScan; by 
+            default, this is the file name without the extension.
+        
+        """
+        # NOTE: 2026-10-18 11:02:47
+        # attribute values repeat a lot across frames (channel names, numbers,
+        # boolean flags); memoize their parsing; the cache is local to this call
+        values = dict()
+        
+        def _evaluate(value:str):
+            ret = values.get(value, values)
+            if ret is not values:
+                return ret
+            try:
+                ret = eval(value)
+            except:
+                ret = sys.intern(value)
+                
+            if isinstance(ret, (bool, int, float, str, type(None))) and len(values) < 65536:
+                values[value] = ret
+                
+            return ret
+        
+        def _toDOM(element):
+            # small subtrees that are handled by the DOM-based constructors
+            return xmlutils.xml.dom.minidom.parseString(xmlutils.ET.tostring(element)).documentElement
+        
+        ret = None
+        sequence = None
+        builder = None
+        elements = list()
+        
+        for event, element in xmlutils.ET.iterparse(fileName, events=("start", "end")):
+            if event == "start":
+                elements.append(element)
+                
+                if len(elements) == 1:
+                    if element.tag != "PVScan":
+                        raise ValueError("Expecting a valid PVScan XML data")
+                    
+                    ret = cls.__new__(cls)
+                    ret._setAttributes_(dict((k, _evaluate(v)) for k, v in element.attrib.items()))
+                    ret.__mergeChannelsOnOutput__ = False
+                    ret.__path__ = os.path.dirname(fileName)
+                    ret.__filename__ = os.path.basename(fileName)
+                    ret.__systemConfiguration__ = None
+                    ret._setName_(name)
+                    ret.sequences = list()
+                    
+                elif element.tag == "Sequence" and len(elements) == 2:
+                    sequence = PVSequence._fromAttributes_(element.attrib.items(), parent=ret)
+                    builder = _PVFrameTableBuilder(_evaluate)
+                    
+                continue
+            
+            elements.pop()
+            
+            if len(elements) == 0: # end of PVScan
+                break
+            
+            parent = elements[-1]
+            
+            if len(elements) == 1:
+                if element.tag == "SystemConfiguration":
+                    ret.__systemConfiguration__ = PVSystemConfiguration(_toDOM(element), parent=ret)
+                    
+                elif element.tag == "Sequence":
+                    sequence.frames = PVFrameList(builder.table(), sequence=sequence)
+                    ret.sequences.append(sequence)
+                    sequence = None
+                    builder = None
+                    
+            elif sequence is not None and parent.tag == "Sequence":
+                if element.tag == "Frame":
+                    builder.addFrame(element)
+                    
+                elif element.tag == "PVLinescanDefinition" and sequence.sequencetype == PVSequenceType.Linescan:
+                    sequence.__definition__ = PVLinescanDefinition(_toDOM(element), parent=sequence)
+                    
+                elif element.tag == "PVLinescanSynchZ":
+                    sequence.__syncZAxis__ = DataBag(dict((k, _evaluate(v)) for k, v in element.attrib.items()))
+                    
+            else:
+                continue # keep the subtree until its enclosing element ends
+                
+            # discard what has been consumed
+            element.clear()
+            parent.remove(element)
+            
+        if ret is None:
+            raise ValueError("PVScan XML data is empty!")
+        
+        if ret.__systemConfiguration__ is None:
+            ret._loadEnvironment_()
+            
+        return ret
+    
+    def _setAttributes_(self, attributes):
+        # FIXME DO NOT store the documentElement attributes, directly in __dict__
+        # NOTE:2017-10-31 08:37:19
+        # storing attributed in __dict__ will result in infinite recursions in __str__()
+        # at various places in the code, unless you write code to manage it.
+        # -- too work for little benefit
+        self.__version__ = tuple() # major, minor, micro, dot
+        self.__rec_datetime__ = datetime.datetime.now()
+        
+        if attributes is not None:
+            self.__attributes__ = DataBag(attributes)
+            v = self.__attributes__.get("version", None)
+            if isinstance(v, str) and len(v.strip()):
+                try:
+                    self.__version__ = tuple(map(lambda x: eval(x), v.split('.')))
+                except:
+                    scipywarn(f"Could not parse the Prairie version data {v})")
             
+            d = self.__attributes__.get("date", None)
+            if isinstance(d, str) and len(d.strip()):
+                try:
+                    self.__rec_datetime__ = dateutil.parser.parse(d)
+                except:
+                    traceback.print_exc()
+                    scipywarn(f"Due to the above caught exception, rec_datetime will be set to `datetime.now()`")
+            else:
+                scipywarn(f"No suitable date string found; rec_datetime will be set to `datetime.now()")
+                    
+                
+        else:
+            self.__attributes__ = DataBag(dict())
+
+    def _setName_(self, name):
+        if isinstance(name, str):
+            self.__name__ = name
+            
+        else:
+            if self.__filename__ is not None:
+                self.__name__ = os.path.splitext(self.__filename__)[0]
+                
+    def _loadEnvironment_(self):
+        # NOTE: 2024-08-28 09:07:55
+        # the SystemConfiguration element was removed around PV version 5.5; 
+        # instead there is a *.env file with a single node "Envronment" node
+        self.__systemConfiguration__ = None
+        
+        if self.__path__ is None or self.__filename__ is None:
+            return
+        
+        base = os.path.splitext(self.__filename__)[0]
+        env_filename = os.path.join(self.__path__, base+".env")
+        
+        if os.path.isfile(env_filename):
+            envDoc = pio.loadXMLFile(env_filename)
+            pvEnviron = envDoc.documentElement.getElementsByTagName("Environment")
+            if len(pvEnviron):
+                self.__systemConfiguration__ = PVSystemConfiguration(pvEnviron[0], parent=self)
+
     def __len__(self):
         return len(self.sequences)
     
@@ -1891,26 +2370,7 @@ class PVScan(object):
                 # parse the state shard for frame period in the first frame  of each 
                 # sequence
                 
-                frameTimes = [float(s.frames[0].attributes["absoluteTime"]) for s in self.sequences]
-                
-                if len(frameTimes) > 1:
-                    diffTimes = np.diff(frameTimes) # there will be some jitter
-                    
-                    framePeriod = float(diffTimes.mean())
-                    
-                else:
-                    framePeriod = 1.0
-                    
-                newAxisInfo = vigra.AxisInfo(key="t1", 
-                                             typeFlags=vigra.AxisType.Time, 
-                                             resolution=framePeriod)
-                
-                newAxisCal = AxisCalibrationData(newAxisInfo)
-                newAxisCal.units = pq.s
-                newAxisCal.origin = float(self.sequences[0].frames[0].attributes["absoluteTime"])
-                newAxisCal.resolution = framePeriod
-                
-                newAxisInfo = newAxisCal.calibrateAxis(newAxisInfo)
+                newAxisInfo = self._linescanFrameAxisInfo_()
                 
                 if self.__mergeChannelsOnOutput__:
                     data = [s.mergeChannels(filepath=filepath) for s in self.sequences]
@@ -2050,10 +2510,112 @@ class PVScan(object):
             raise ValueError("Unknown sequence type %d" % self.sequencetype)
             
 
-    def scanData(self, mergeChannels=False, analysisOptions=None, electrophysiology=None, name=None):
+    def _linescanFrameAxisInfo_(self):
+        """Calibrated AxisInfo ("t1") for the axis of linescan repetitions.
+        
+        Each linescan sequence contributes one frame.
+        """
+        frameTimes = [float(s.frames[0].attributes["absoluteTime"]) for s in self.sequences]
+        
+        if len(frameTimes) > 1:
+            diffTimes = np.diff(frameTimes) # there will be some jitter
+            
+            framePeriod = float(diffTimes.mean())
+            
+        else:
+            framePeriod = 1.0
+            
+        newAxisInfo = vigra.AxisInfo(key="t1", 
+                                     typeFlags=vigra.AxisType.Time, 
+                                     resolution=framePeriod)
+        
+        newAxisCal = AxisCalibrationData(newAxisInfo)
+        newAxisCal.units = pq.s
+        newAxisCal.origin = frameTimes[0]
+        newAxisCal.resolution = framePeriod
+        
+        return newAxisCal.calibrateAxis(newAxisInfo)
+    
+    def frameStores(self, filepath=None):
+        """Lazy, on-demand access to the image data of this scan.
+        
+        Instead of reading the image files, returns FrameStore objects that 
+        refer to them (see imaging.framestore). Only the files of the first
+        frame are read, to set up the axes calibrations.
+        
+        Supported for Linescan (where each sequence is a frame), TSeries and
+        ZSeries.
+        
+        Returns:
+        --------
+        A tuple (scans, scene) of imaging.framestore.FrameStore objects; scene
+        is None unless this is a Linescan with source (scene) image files.
+        """
+        if filepath is None:
+            filepath = self.filepath
+            
+        def _path(fileName):
+            return os.path.join(filepath, fileName) if filepath is not None else fileName
+        
+        sequence = self.sequences[0]
+        
+        if sequence.sequencetype == PVSequenceType.Linescan:
+            frames = [s.frames[0] for s in self.sequences]
+            newAxisInfo = self._linescanFrameAxisInfo_()
+            
+        elif sequence.sequencetype in (PVSequenceType.TSeries, PVSequenceType.ZSeries):
+            frames = sequence.frames
+            newAxisInfo = sequence.frameAxisInfo()
+            
+        else:
+            raise NotImplementedError(f"Lazy loading of {sequence.sequencetypename} sequences is not supported")
+        
+        # calibrated axes of each channel, from the first frame
+        scansImages, sceneImages = frames[0](filepath=filepath)
+        
+        def _axistags(images):
+            return [vigra.AxisTags(img.axistags[0], img.axistags[1], newAxisInfo, img.axistags[2]) 
+                    for img in images]
+        
+        scans = FrameStore(TiffFrameSource([[_path(f["filename"]) for f in frame.files] for frame in frames]),
+                           _axistags(scansImages))
+        
+        if sceneImages is not None:
+            scene = FrameStore(TiffFrameSource([[_path(f["source"]) for f in frame.files] for frame in frames]),
+                               _axistags(sceneImages))
+        else:
+            scene = None
+            
+        return scans, scene
+    
+    def scanData(self, mergeChannels=False, analysisOptions=None, electrophysiology=None, name=None, lazy=True):
         """Returns a datatypes.ScanData object
+        
+        When lazy is True (the default), the image data is not read into 
+        memory; instead, the ScanData refers to the image files (see 
+        self.frameStores() and ScanData.fromFrameStores()). The image files are
+        read into memory when lazy is False, when mergeChannels is True, or
+        for sequence types that do not support lazy loading.
         """
         
+        if lazy and not mergeChannels:
+            try:
+                scans, scene = self.frameStores()
+                
+            except NotImplementedError:
+                scans = None
+                
+        else:
+            scans = None
+            
+        if scans is not None:
+            return ScanData.fromFrameStores(scans, scene, name=self.name,
+                                            electrophysiology=electrophysiology,
+                                            analysisOptions=analysisOptions,
+                                            file_origin=self.filepath,
+                                            rec_datetime=self.__rec_datetime__,
+                                            metadata=self.metadata())
+        
         if mergeChannels:
             caller = self.mergeChannels
             
@@ -2061,12 +2623,11 @@ class PVScan(object):
             caller = self.__call__
             
             
-        # read scans and scene vigra arrays concurrently
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            futures = [executor.submit(caller)]
-            
-        for future in concurrent.futures.as_completed(futures):
-            (scans, scene) = future.result()
+        # NOTE: 2026-10-18 10:31:22
+        # the single-worker executor that used to wrap this call gave no
+        # parallelism; image files are now read concurrently further down, by
+        # PVSequence.readVolume() (TSeries and ZSeries)
+        (scans, scene) = caller()
         
         meta = self.metadata()
         
@@ -2854,7 +3415,7 @@ class PrairieViewImporter(WorkspaceGuiMixin, __QDialog__, __UI_PrairieImporter,
             mime_type, file_type, encoding = pio.getMimeAndFileType(fileName)
             
             if "xml" in mime_type:
-                self._pvscan_ = PVScan(pio.loadXMLFile(fileName))
+                self._pvscan_ = PVScan.fromXMLFile(fileName)
                 
             # elif "pickle" in mime_type:
             #     self._pvscan_ = pio.loadPickleFile(fileName)